@@ -0,0 +1,126 @@
+"""add hourly and daily test metric rollups
+
+Revision ID: a6b7c8d9e0f1
+Revises: f5a6b7c8d9e0
+Create Date: 2026-10-16 22:30:00.000000
+
+Creates test_metric_rollups_hourly and test_metric_rollups_daily (count,
+sum, min, max and a quantile sketch per metric_type, bucket and dimension
+set), backfills them from test_metrics, and indexes test_metrics for
+SQL-side bucketing with JSONB dimension predicates.
+
+The backfill builds the sketch JSON of services/quantile_sketch.py
+(relative accuracy 0.01) in SQL.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6b7c8d9e0f1'
+down_revision: Union[str, Sequence[str], None] = 'f5a6b7c8d9e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLLUP_TABLES = {
+    'test_metric_rollups_hourly': 'hour',
+    'test_metric_rollups_daily': 'day',
+}
+
+SKETCH_ALPHA = 0.01
+
+
+def _create_rollup_table(table_name: str) -> None:
+    op.create_table(
+        table_name,
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False, comment='Primary identifier for the rollup bucket'),
+        sa.Column('metric_type', sa.String(length=100), nullable=False, comment='Metric name such as execution_time or pass_rate'),
+        sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False, comment="Start of the UTC hour or day the bucket covers"),
+        sa.Column('dimensions', postgresql.JSONB(astext_type=sa.Text()), nullable=False, comment='Dimension key/value pairs, without high-cardinality keys'),
+        sa.Column('count', sa.BigInteger(), nullable=False, comment='Number of metric points in the bucket'),
+        sa.Column('value_sum', sa.Numeric(precision=20, scale=2), nullable=False, comment='Sum of metric values in the bucket'),
+        sa.Column('value_min', sa.Numeric(precision=10, scale=2), nullable=True, comment='Smallest metric value in the bucket'),
+        sa.Column('value_max', sa.Numeric(precision=10, scale=2), nullable=True, comment='Largest metric value in the bucket'),
+        sa.Column('sketch', postgresql.JSONB(astext_type=sa.Text()), nullable=True, comment="Mergeable quantile sketch of the bucket's values"),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False, comment='When the bucket was last updated'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('metric_type', 'bucket_start', 'dimensions', name=f'uq_{table_name}_bucket'),
+    )
+    op.create_index(f'ix_{table_name}_type_bucket', table_name, ['metric_type', 'bucket_start'])
+    op.create_index(
+        f'ix_{table_name}_dimensions', table_name, ['dimensions'],
+        postgresql_using='gin', postgresql_ops={'dimensions': 'jsonb_path_ops'},
+    )
+
+
+def _backfill_rollup_table(table_name: str, granularity: str) -> None:
+    log_gamma = f"ln({(1 + SKETCH_ALPHA) / (1 - SKETCH_ALPHA)!r})"
+    op.execute(sa.text(f"""
+        INSERT INTO {table_name}
+            (id, metric_type, bucket_start, dimensions, count, value_sum, value_min, value_max, sketch)
+        WITH points AS (
+            SELECT
+                metric_type,
+                date_trunc('{granularity}', timezone('UTC', "timestamp")) AT TIME ZONE 'UTC' AS bucket_start,
+                dimensions - 'execution_id' AS dimensions,
+                metric_value AS value
+            FROM test_metrics
+        ),
+        bins AS (
+            SELECT
+                metric_type,
+                bucket_start,
+                dimensions,
+                CASE
+                    WHEN value > 0 THEN 'p' || ceil(ln(value) / {log_gamma})::int
+                    WHEN value < 0 THEN 'n' || ceil(ln(-value) / {log_gamma})::int
+                    ELSE 'z'
+                END AS bin,
+                count(*) AS bin_count,
+                sum(value) AS bin_sum,
+                min(value) AS bin_min,
+                max(value) AS bin_max
+            FROM points
+            GROUP BY 1, 2, 3, 4
+        )
+        SELECT
+            gen_random_uuid(),
+            metric_type,
+            bucket_start,
+            dimensions,
+            sum(bin_count),
+            sum(bin_sum),
+            min(bin_min),
+            max(bin_max),
+            jsonb_build_object('alpha', {SKETCH_ALPHA!r}, 'bins', jsonb_object_agg(bin, bin_count))
+        FROM bins
+        GROUP BY metric_type, bucket_start, dimensions
+    """))
+
+
+def upgrade() -> None:
+    """Create and backfill metric rollup tables; index test_metrics."""
+    op.create_index('ix_test_metrics_type_timestamp', 'test_metrics', ['metric_type', 'timestamp'])
+    op.create_index(
+        'ix_test_metrics_dimensions', 'test_metrics', ['dimensions'],
+        postgresql_using='gin', postgresql_ops={'dimensions': 'jsonb_path_ops'},
+    )
+
+    for table_name, granularity in ROLLUP_TABLES.items():
+        _create_rollup_table(table_name)
+        _backfill_rollup_table(table_name, granularity)
+
+
+def downgrade() -> None:
+    """Drop metric rollup tables and test_metrics indexes."""
+    for table_name in reversed(list(ROLLUP_TABLES)):
+        op.drop_index(f'ix_{table_name}_dimensions', table_name=table_name)
+        op.drop_index(f'ix_{table_name}_type_bucket', table_name=table_name)
+        op.drop_table(table_name)
+
+    op.drop_index('ix_test_metrics_dimensions', table_name='test_metrics')
+    op.drop_index('ix_test_metrics_type_timestamp', table_name='test_metrics')
@@ -0,0 +1,76 @@
+"""add dashboard counter buckets
+
+Revision ID: b7c8d9e0f1a2
+Revises: a6b7c8d9e0f1
+Create Date: 2026-10-16 23:40:00.000000
+
+Creates dashboard_counter_buckets (per-hour counts of executions,
+validation results and suite runs by state) and backfills it from the source tables. From then on the counters are
+maintained on flush (models/dashboard_counter.py).
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c8d9e0f1a2'
+down_revision: Union[str, Sequence[str], None] = 'a6b7c8d9e0f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (counter prefix, state columns); mirrors TRACKED_MODELS
+TRACKED_TABLES = {
+    'multi_turn_executions': ('executions', ('status',)),
+    'validation_results': ('validations', ('final_decision', 'review_status')),
+    'suite_runs': ('suite_runs', ('status',)),
+}
+
+HOUR_BUCKET = "date_trunc('hour', timezone('UTC', created_at)) AT TIME ZONE 'UTC'"
+
+
+def _backfill_selects() -> list:
+    selects = []
+    for table_name, (prefix, columns) in TRACKED_TABLES.items():
+        selects.append(
+            f"SELECT '{prefix}' AS counter, {HOUR_BUCKET} AS bucket_start "
+            f"FROM {table_name} WHERE created_at IS NOT NULL"
+        )
+        for column in columns:
+            selects.append(
+                f"SELECT '{prefix}.{column}.' || {column} AS counter, {HOUR_BUCKET} AS bucket_start "
+                f"FROM {table_name} WHERE {column} IS NOT NULL AND created_at IS NOT NULL"
+            )
+    return selects
+
+
+def upgrade() -> None:
+    """Create and backfill dashboard_counter_buckets."""
+    op.create_table(
+        'dashboard_counter_buckets',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False, comment='Primary identifier for the counter bucket'),
+        sa.Column('counter', sa.String(length=100), nullable=False, comment='Counter name such as executions or executions.status.completed'),
+        sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False, comment='Start of the UTC hour the bucket covers'),
+        sa.Column('value', sa.BigInteger(), nullable=False, comment='Counter value for the bucket'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False, comment='When the bucket was last updated'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('counter', 'bucket_start', name='uq_dashboard_counter_buckets_bucket'),
+    )
+
+    union = "\n            UNION ALL ".join(_backfill_selects())
+    op.execute(sa.text(f"""
+        INSERT INTO dashboard_counter_buckets (id, counter, bucket_start, value)
+        SELECT gen_random_uuid(), counter, bucket_start, count(*)
+        FROM (
+            {union}
+        ) AS tracked
+        GROUP BY counter, bucket_start
+    """))
+
+
+def downgrade() -> None:
+    """Drop dashboard_counter_buckets."""
+    op.drop_table('dashboard_counter_buckets')
@@ -0,0 +1,38 @@
+"""add partial index for pending validation queue claims
+
+Revision ID: c8d9e0f1a2b3
+Revises: b7c8d9e0f1a2
+Create Date: 2026-10-17 09:15:00.000000
+
+Serves the claim order of ValidationQueueService.claim_next
+(priority, created_at over pending rows) without scanning claimed and
+completed history.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d9e0f1a2b3'
+down_revision: Union[str, Sequence[str], None] = 'b7c8d9e0f1a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the partial pending-claim index."""
+    op.create_index(
+        'ix_validation_queue_pending_priority',
+        'validation_queue',
+        ['priority', 'created_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'")
+    )
+
+
+def downgrade() -> None:
+    """Drop the partial pending-claim index."""
+    op.drop_index('ix_validation_queue_pending_priority', table_name='validation_queue')
@@ -0,0 +1,41 @@
+"""add edge_case_embeddings table
+
+Revision ID: d3e4f5a6b7c8
+Revises: c2d3e4f5g6h7
+Create Date: 2026-10-16 12:00:00.000000
+
+Caches one sentence-transformer embedding per edge case so pattern
+analysis encodes each utterance once instead of once per comparison.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3e4f5a6b7c8'
+down_revision: Union[str, Sequence[str], None] = 'c2d3e4f5g6h7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create edge_case_embeddings table."""
+    op.create_table(
+        'edge_case_embeddings',
+        sa.Column('edge_case_id', sa.UUID(), nullable=False, comment='Edge case the embedding belongs to'),
+        sa.Column('model_name', sa.String(length=255), nullable=False, comment='Sentence transformer model used to compute the embedding'),
+        sa.Column('content_hash', sa.String(length=64), nullable=False, comment='SHA-256 of model name and utterance; mismatch invalidates the row'),
+        sa.Column('dimensions', sa.Integer(), nullable=False, comment='Number of float32 components in the embedding'),
+        sa.Column('embedding', sa.LargeBinary(), nullable=False, comment='L2-normalised float32 embedding (little-endian bytes)'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False, comment='Timestamp when the embedding was last computed'),
+        sa.ForeignKeyConstraint(['edge_case_id'], ['edge_cases.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('edge_case_id')
+    )
+
+
+def downgrade() -> None:
+    """Drop edge_case_embeddings table."""
+    op.drop_table('edge_case_embeddings')
@@ -0,0 +1,51 @@
+"""add llm_evaluation_cache table
+
+Revision ID: e4f5a6b7c8d9
+Revises: d3e4f5a6b7c8
+Create Date: 2026-10-16 18:00:00.000000
+
+Durable tier of the LLM evaluation cache: one row per cached evaluator or
+curator call, keyed by a hash of the exact provider request.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4f5a6b7c8d9'
+down_revision: Union[str, Sequence[str], None] = 'd3e4f5a6b7c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create llm_evaluation_cache table."""
+    op.create_table(
+        'llm_evaluation_cache',
+        sa.Column('cache_key', sa.String(length=64), nullable=False, comment='SHA-256 of provider, model, sampling settings and prompts'),
+        sa.Column('provider', sa.String(length=50), nullable=False, comment='API provider that produced the evaluation'),
+        sa.Column('model', sa.String(length=100), nullable=False, comment='LLM model that produced the evaluation'),
+        sa.Column('prompt_version', sa.String(length=16), nullable=False, comment='Fingerprint of the prompt template and system prompt used'),
+        sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=False, comment='Parsed evaluation (scores, overall_score, decision, reasoning)'),
+        sa.Column('prompt_tokens', sa.Integer(), nullable=False, comment='Prompt tokens used by the original call'),
+        sa.Column('completion_tokens', sa.Integer(), nullable=False, comment='Completion tokens used by the original call'),
+        sa.Column('cost_usd', sa.Numeric(precision=10, scale=6), nullable=False, comment='Estimated cost in USD of the original call'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False, comment='When the evaluation was cached'),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False, comment='When the entry stops being served'),
+        sa.PrimaryKeyConstraint('cache_key')
+    )
+    op.create_index('ix_llm_evaluation_cache_model', 'llm_evaluation_cache', ['model'])
+    op.create_index('ix_llm_evaluation_cache_prompt_version', 'llm_evaluation_cache', ['prompt_version'])
+    op.create_index('ix_llm_evaluation_cache_expires_at', 'llm_evaluation_cache', ['expires_at'])
+
+
+def downgrade() -> None:
+    """Drop llm_evaluation_cache table."""
+    op.drop_index('ix_llm_evaluation_cache_expires_at', table_name='llm_evaluation_cache')
+    op.drop_index('ix_llm_evaluation_cache_prompt_version', table_name='llm_evaluation_cache')
+    op.drop_index('ix_llm_evaluation_cache_model', table_name='llm_evaluation_cache')
+    op.drop_table('llm_evaluation_cache')
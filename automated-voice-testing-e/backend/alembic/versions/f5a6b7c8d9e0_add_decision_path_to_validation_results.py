@@ -0,0 +1,47 @@
+"""add decision_path to validation_results
+
+Revision ID: f5a6b7c8d9e0
+Revises: e4f5a6b7c8d9
+Create Date: 2026-10-16 20:00:00.000000
+
+Records which validation path produced each decision (deterministic
+early exit, single LLM evaluator or full dual-evaluator pipeline) so LLM
+cost and latency savings can be reported per suite run.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5a6b7c8d9e0'
+down_revision: Union[str, Sequence[str], None] = 'e4f5a6b7c8d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add decision_path column to validation_results."""
+    op.add_column(
+        'validation_results',
+        sa.Column(
+            'decision_path',
+            sa.String(length=32),
+            nullable=True,
+            comment='Validation path: deterministic_pass, deterministic_fail, single_evaluator, dual_evaluator, houndify_only',
+        ),
+    )
+    op.create_index(
+        op.f('ix_validation_results_decision_path'),
+        'validation_results',
+        ['decision_path'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove decision_path column from validation_results."""
+    op.drop_index(op.f('ix_validation_results_decision_path'), table_name='validation_results')
+    op.drop_column('validation_results', 'decision_path')
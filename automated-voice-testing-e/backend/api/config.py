@@ -3,7 +3,7 @@ Voice AI Testing Framework - Application Configuration
 Centralized configuration management using Pydantic Settings
 """
 
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import Field, field_validator, ValidationInfo, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
@@ -270,6 +270,21 @@ class Settings(BaseSettings):
         description="Audio sample rate for Houndify (8000 or 16000 Hz)"
     )
 
+    HOUNDIFY_EXECUTOR_WORKERS: int = Field(
+        default=8,
+        description="Threads in the dedicated pool running blocking Houndify SDK calls"
+    )
+
+    HOUNDIFY_CHUNK_SIZE: int = Field(
+        default=8192,
+        description="Bytes of PCM audio sent per streaming fill() call"
+    )
+
+    HOUNDIFY_CHUNK_PACING: str = Field(
+        default="fast",
+        description="Audio chunk pacing for voice queries: 'fast' or 'realtime' (playback speed)"
+    )
+
     # ========================================================================
     # AWS Configuration
     # ========================================================================
@@ -333,6 +348,44 @@ class Settings(BaseSettings):
         description="MinIO bucket name for audio files"
     )
 
+    # ========================================================================
+    # Text-to-Speech Configuration
+    # ========================================================================
+
+    TTS_EXECUTOR_WORKERS: int = Field(
+        default=4,
+        description="Threads in the dedicated pool used for blocking TTS synthesis and cache I/O"
+    )
+
+    TTS_MEMORY_CACHE_SIZE: int = Field(
+        default=256,
+        description="Maximum TTS clips kept in the in-process LRU cache (0 to disable)"
+    )
+
+    TTS_SHARED_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Share TTS audio across workers via content-addressed objects in the audio bucket"
+    )
+
+    TTS_SHARED_CACHE_PREFIX: str = Field(
+        default="tts-cache",
+        description="Object key prefix for the shared TTS cache"
+    )
+
+    # ========================================================================
+    # Noise Injection Configuration
+    # ========================================================================
+
+    NOISE_BANK_SECONDS: float = Field(
+        default=30.0,
+        description="Length of each precomputed noise loop per profile and sample rate"
+    )
+
+    NOISE_BANK_DIR: Optional[str] = Field(
+        default=None,
+        description="Directory for memory-mapped noise banks (.npy); unset keeps banks in memory only"
+    )
+
     # ========================================================================
     # Reporting Configuration
     # ========================================================================
@@ -377,6 +430,40 @@ class Settings(BaseSettings):
         description="Timeout in seconds for sending scheduled report emails",
     )
 
+    # ========================================================================
+    # Metric Ingestion Configuration
+    # ========================================================================
+
+    LATENCY_SKETCH_RELATIVE_ACCURACY: float = Field(
+        default=0.01,
+        description="Relative accuracy of per-suite-run latency percentile sketches"
+    )
+
+    LATENCY_SKETCH_TTL_SECONDS: int = Field(
+        default=7 * 24 * 3600,
+        description="Lifetime in Redis of per-suite-run latency percentile sketches"
+    )
+
+    VALIDATION_QUEUE_STATS_CACHE_TTL_SECONDS: int = Field(
+        default=5,
+        description="Lifetime of shared cached validation queue statistics in seconds (0 disables)"
+    )
+
+    SOCKETIO_EVENT_BUS_ENABLED: bool = Field(
+        default=True,
+        description="Deliver Socket.IO events across API and worker processes through Redis pub/sub"
+    )
+
+    SOCKETIO_COALESCE_WINDOW_SECONDS: float = Field(
+        default=0.5,
+        description="Window in which only the latest progress event per room and key is delivered"
+    )
+
+    SOCKETIO_ROOM_STATE_TTL_SECONDS: int = Field(
+        default=24 * 3600,
+        description="Lifetime of a room's last state replayed to newly subscribed clients"
+    )
+
     # ========================================================================
     # Application Configuration
     # ========================================================================
@@ -492,6 +579,22 @@ class Settings(BaseSettings):
         description="Maximum memory usage in MB for execution tasks (None to disable)"
     )
 
+    EXECUTION_VARIANT_CONCURRENCY: int = Field(
+        default=4,
+        description=(
+            "Maximum number of language variants of a step processed concurrently "
+            "per execution (1 = sequential)"
+        )
+    )
+
+    EXECUTION_INLINE_CONCURRENCY: int = Field(
+        default=4,
+        description=(
+            "Maximum number of scenario executions run concurrently by one worker "
+            "for inline batches (1 = sequential)"
+        )
+    )
+
     # ========================================================================
     # GitHub OAuth Configuration
     # ========================================================================
@@ -612,6 +715,26 @@ class Settings(BaseSettings):
         description="Enable human validation for low confidence results"
     )
 
+    VALIDATION_EARLY_EXIT_ENABLED: bool = Field(
+        default=True,
+        description="In hybrid mode, skip LLM evaluation when the deterministic Houndify checks are conclusive"
+    )
+
+    VALIDATION_EARLY_EXIT_MIN_ASR_CONFIDENCE: float = Field(
+        default=0.95,
+        description="ASR confidence at or above which a passing deterministic validation skips LLM evaluation"
+    )
+
+    LLM_SEQUENTIAL_EVALUATORS: bool = Field(
+        default=True,
+        description="Run LLM evaluator A first and only add evaluator B when A's score is borderline"
+    )
+
+    LLM_BORDERLINE_MARGIN: float = Field(
+        default=0.15,
+        description="Distance from LLM_PASS_THRESHOLD within which evaluator A's score is borderline (0.0 - 1.0)"
+    )
+
     # ========================================================================
     # Houndify Validation Configuration
     # ========================================================================
@@ -735,6 +858,102 @@ class Settings(BaseSettings):
         description="Sentence transformer model for semantic similarity matching in edge case clustering"
     )
 
+    EDGE_CASE_EMBEDDING_BATCH_SIZE: int = Field(
+        default=64,
+        description="Number of edge case utterances encoded per embedding model batch"
+    )
+
+    EDGE_CASE_ANN_ENABLED: bool = Field(
+        default=True,
+        description="Use per-tenant approximate nearest-neighbour indexes for edge case and pattern matching"
+    )
+
+    EDGE_CASE_ANN_MIN_SIZE: int = Field(
+        default=2000,
+        description="Indexed edge cases per tenant below which similarity search scans the corpus exactly"
+    )
+
+    EDGE_CASE_ANN_NPROBE: int = Field(
+        default=8,
+        description="Index lists scanned per query (higher improves recall, lowers speed)"
+    )
+
+    EDGE_CASE_ANN_CANDIDATES: int = Field(
+        default=200,
+        description="Nearest edge cases retrieved from the index before full similarity scoring"
+    )
+
+    EDGE_CASE_ANN_INDEX_DIR: Optional[str] = Field(
+        default=None,
+        description="Directory for persisted per-tenant vector indexes (.npz); unset keeps indexes in memory only"
+    )
+
+    PATTERN_CENTROID_MATCH_THRESHOLD: float = Field(
+        default=0.90,
+        description="Minimum cosine similarity between a new group and an existing pattern centroid to reuse the pattern"
+    )
+
+    # ========================================================================
+    # LLM Evaluation Cache Configuration
+    # ========================================================================
+
+    LLM_EVAL_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Reuse LLM judge evaluations for identical prompts instead of calling the provider again"
+    )
+
+    LLM_EVAL_CACHE_TTL_SECONDS: int = Field(
+        default=30 * 24 * 3600,
+        description="Lifetime of durable (Postgres) evaluation cache entries in seconds"
+    )
+
+    LLM_EVAL_CACHE_REDIS_TTL_SECONDS: int = Field(
+        default=24 * 3600,
+        description="Lifetime of hot (Redis) evaluation cache entries in seconds"
+    )
+
+    # ========================================================================
+    # LLM Admission Control Configuration
+    # ========================================================================
+
+    LLM_ADMISSION_ENABLED: bool = Field(
+        default=True,
+        description="Queue LLM provider calls behind per-provider/model rate limits and adaptive concurrency"
+    )
+
+    LLM_RATE_LIMIT_REQUESTS_PER_MINUTE: int = Field(
+        default=500,
+        description="Requests per minute admitted to each LLM provider/model"
+    )
+
+    LLM_RATE_LIMIT_TOKENS_PER_MINUTE: int = Field(
+        default=200000,
+        description="Estimated prompt plus completion tokens per minute admitted to each LLM provider/model"
+    )
+
+    LLM_MAX_CONCURRENCY: int = Field(
+        default=16,
+        description="Upper bound of the adaptive number of in-flight calls per LLM provider/model"
+    )
+
+    LLM_MIN_CONCURRENCY: int = Field(
+        default=1,
+        description="Lower bound the adaptive concurrency backs off to after rate limits"
+    )
+
+    LLM_LATENCY_TARGET_MS: int = Field(
+        default=10000,
+        description="LLM call latency above which concurrency is reduced"
+    )
+
+    LLM_PROVIDER_RATE_LIMITS: Dict[str, Dict[str, int]] = Field(
+        default_factory=dict,
+        description=(
+            "Per-provider or per-model limit overrides as JSON keyed by 'provider' or 'provider:model', "
+            "e.g. {\"openrouter:openai/gpt-4.1-mini\": {\"requests_per_minute\": 60}}"
+        )
+    )
+
     # ========================================================================
     # Validators
     # ========================================================================
@@ -813,6 +1032,130 @@ class Settings(BaseSettings):
             raise ValueError('EXECUTION_MEMORY_LIMIT_MB must be positive when set')
         return v
 
+    @field_validator('EXECUTION_VARIANT_CONCURRENCY')
+    @classmethod
+    def validate_variant_concurrency(cls, v):
+        """Ensure at least one language variant can run at a time"""
+        if v < 1:
+            raise ValueError('EXECUTION_VARIANT_CONCURRENCY must be at least 1')
+        return v
+
+    @field_validator('EXECUTION_INLINE_CONCURRENCY')
+    @classmethod
+    def validate_inline_concurrency(cls, v):
+        """Ensure at least one inline execution can run at a time"""
+        if v < 1:
+            raise ValueError('EXECUTION_INLINE_CONCURRENCY must be at least 1')
+        return v
+
+    @field_validator('HOUNDIFY_EXECUTOR_WORKERS', 'HOUNDIFY_CHUNK_SIZE')
+    @classmethod
+    def validate_houndify_positive(cls, v, info):
+        """Ensure Houndify pool and chunk sizes are positive"""
+        if v < 1:
+            raise ValueError(f'{info.field_name} must be at least 1')
+        return v
+
+    @field_validator('EDGE_CASE_EMBEDDING_BATCH_SIZE', 'EDGE_CASE_ANN_NPROBE', 'EDGE_CASE_ANN_CANDIDATES')
+    @classmethod
+    def validate_edge_case_positive(cls, v, info):
+        """Ensure edge case embedding and index sizes are positive"""
+        if v < 1:
+            raise ValueError(f'{info.field_name} must be at least 1')
+        return v
+
+    @field_validator('PATTERN_CENTROID_MATCH_THRESHOLD')
+    @classmethod
+    def validate_pattern_centroid_threshold(cls, v):
+        """Ensure the centroid threshold is a cosine similarity"""
+        if not -1.0 <= v <= 1.0:
+            raise ValueError('PATTERN_CENTROID_MATCH_THRESHOLD must be between -1.0 and 1.0')
+        return v
+
+    @field_validator('LATENCY_SKETCH_RELATIVE_ACCURACY')
+    @classmethod
+    def validate_latency_sketch_accuracy(cls, v):
+        """Ensure the sketch relative accuracy is a fraction"""
+        if not 0.0 < v < 1.0:
+            raise ValueError('LATENCY_SKETCH_RELATIVE_ACCURACY must be between 0 and 1')
+        return v
+
+    @field_validator('LATENCY_SKETCH_TTL_SECONDS')
+    @classmethod
+    def validate_latency_sketch_ttl(cls, v):
+        """Ensure the sketch lifetime is positive"""
+        if v < 1:
+            raise ValueError('LATENCY_SKETCH_TTL_SECONDS must be at least 1')
+        return v
+
+    @field_validator('VALIDATION_QUEUE_STATS_CACHE_TTL_SECONDS')
+    @classmethod
+    def validate_validation_queue_stats_cache_ttl(cls, v):
+        """Ensure the statistics cache lifetime is not negative"""
+        if v < 0:
+            raise ValueError('VALIDATION_QUEUE_STATS_CACHE_TTL_SECONDS must be 0 or greater')
+        return v
+
+    @field_validator('SOCKETIO_COALESCE_WINDOW_SECONDS')
+    @classmethod
+    def validate_socketio_coalesce_window(cls, v):
+        """Ensure the coalescing window is positive"""
+        if v <= 0:
+            raise ValueError('SOCKETIO_COALESCE_WINDOW_SECONDS must be greater than 0')
+        return v
+
+    @field_validator('SOCKETIO_ROOM_STATE_TTL_SECONDS')
+    @classmethod
+    def validate_socketio_room_state_ttl(cls, v):
+        """Ensure the room state lifetime is positive"""
+        if v < 1:
+            raise ValueError('SOCKETIO_ROOM_STATE_TTL_SECONDS must be at least 1')
+        return v
+
+    @field_validator('LLM_EVAL_CACHE_TTL_SECONDS', 'LLM_EVAL_CACHE_REDIS_TTL_SECONDS')
+    @classmethod
+    def validate_llm_eval_cache_ttl(cls, v, info):
+        """Ensure evaluation cache lifetimes are positive"""
+        if v < 1:
+            raise ValueError(f'{info.field_name} must be at least 1')
+        return v
+
+    @field_validator(
+        'LLM_RATE_LIMIT_REQUESTS_PER_MINUTE', 'LLM_RATE_LIMIT_TOKENS_PER_MINUTE',
+        'LLM_MAX_CONCURRENCY', 'LLM_MIN_CONCURRENCY', 'LLM_LATENCY_TARGET_MS'
+    )
+    @classmethod
+    def validate_llm_admission_limit(cls, v, info):
+        """Ensure LLM admission limits are positive"""
+        if v < 1:
+            raise ValueError(f'{info.field_name} must be at least 1')
+        return v
+
+    @field_validator('LLM_PROVIDER_RATE_LIMITS')
+    @classmethod
+    def validate_llm_provider_rate_limits(cls, v):
+        """Ensure overrides only set known, positive limits"""
+        allowed = {
+            'requests_per_minute', 'tokens_per_minute', 'max_concurrency',
+            'min_concurrency', 'latency_target_ms',
+        }
+        for key, limits in v.items():
+            unknown = set(limits) - allowed
+            if unknown:
+                raise ValueError(f'LLM_PROVIDER_RATE_LIMITS[{key}] has unknown limits {sorted(unknown)}')
+            if any(value < 1 for value in limits.values()):
+                raise ValueError(f'LLM_PROVIDER_RATE_LIMITS[{key}] limits must be at least 1')
+        return v
+
+    @field_validator('HOUNDIFY_CHUNK_PACING')
+    @classmethod
+    def validate_houndify_chunk_pacing(cls, v):
+        """Validate Houndify chunk pacing mode"""
+        allowed_modes = ['fast', 'realtime']
+        if v.lower() not in allowed_modes:
+            raise ValueError(f'HOUNDIFY_CHUNK_PACING must be one of {allowed_modes}')
+        return v.lower()
+
     @field_validator('JWT_SECRET_KEY')
     @classmethod
     def validate_jwt_secret_key(cls, v):
@@ -831,7 +1174,9 @@ class Settings(BaseSettings):
         'DEFAULT_CER_THRESHOLD',
         'DEFAULT_CONFIDENCE_AUTO_PASS',
         'DEFAULT_CONFIDENCE_NEEDS_REVIEW',
-        'DEFAULT_ASR_CONFIDENCE_MIN'
+        'DEFAULT_ASR_CONFIDENCE_MIN',
+        'VALIDATION_EARLY_EXIT_MIN_ASR_CONFIDENCE',
+        'LLM_BORDERLINE_MARGIN'
     )
     @classmethod
     def validate_threshold(cls, v):
@@ -60,6 +60,7 @@ from sqlalchemy.ext.asyncio import (
 
 from api.config import get_settings
 from sqlalchemy.orm import Session
+from models.dashboard_counter import track_dashboard_counters
 
 
 # Configure logging
@@ -166,6 +167,9 @@ class RoutingSession(Session):
         return _replica_sync_engine if use_replica else _primary_sync_engine
 
 
+# Keep dashboard counter buckets in step with execution/validation/queue state
+track_dashboard_counters(RoutingSession)
+
 # Create async session factory
 SessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
     bind=primary_engine,
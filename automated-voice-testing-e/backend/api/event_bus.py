@@ -0,0 +1,310 @@
+"""
+Cross-process Socket.IO event bus backed by Redis pub/sub.
+
+The Socket.IO server (api.websocket.sio) only reaches clients connected to
+its own process, but events are produced in API workers and Celery
+workers alike. Every emit helper therefore publishes to one Redis channel
+instead of calling sio.emit; each API process runs a subscriber (started
+in the application lifespan) that delivers the messages to its own
+clients. Celery workers only publish.
+
+High-frequency progress events are coalesced by the subscriber: messages
+published with a coalesce_key are held for SOCKETIO_COALESCE_WINDOW_SECONDS
+and only the latest per (room, event, coalesce_key) is emitted. Any other
+event for the same room flushes the held messages first, so clients see
+progress before the state change that follows it. A 500-execution suite
+run produces at most one progress event per room and key per window
+rather than one per step.
+
+Messages published with retain=True are also stored as the room's last
+state and replayed to a client when it subscribes to the room:
+
+    socketio:events                 pub/sub channel
+    socketio:room_state:{room}      hash of "{event}:{coalesce_key}" -> message
+
+When the bus is disabled (SOCKETIO_EVENT_BUS_ENABLED) or Redis is
+unavailable, events are delivered to this process's clients directly
+(after a publish error, Redis is skipped for REDIS_RETRY_SECONDS).
+
+Example:
+    >>> bus = get_event_bus()
+    >>> await bus.publish('suite_run_update', data, room='suite_run_123',
+    ...                   coalesce_key='suite_run', retain=True)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from api.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "socketio:events"
+ROOM_STATE_PREFIX = "socketio:room_state:"
+
+# Seconds to wait before resubscribing after the subscriber loses Redis
+RESUBSCRIBE_DELAY_SECONDS = 1.0
+
+# Seconds to deliver locally without trying Redis after a publish error
+REDIS_RETRY_SECONDS = 30.0
+
+# KEYS[1] = channel, KEYS[2] = room state hash
+# ARGV[1] = message JSON, ARGV[2] = state field ('' to not retain), ARGV[3] = state TTL
+PUBLISH_SCRIPT = """
+redis.call('PUBLISH', KEYS[1], ARGV[1])
+if ARGV[2] ~= '' then
+    redis.call('HSET', KEYS[2], ARGV[2], ARGV[1])
+    redis.call('EXPIRE', KEYS[2], ARGV[3])
+end
+return 1
+"""
+
+_PendingKey = Tuple[Optional[str], str, str]
+
+
+class SocketEventBus:
+    """
+    Publishes Socket.IO events through Redis and delivers them locally.
+
+    Attributes:
+        enabled: Whether events go through Redis (False: local delivery only)
+        coalesce_window_seconds: How long coalescable events are held
+        state_ttl_seconds: Lifetime of a room's retained state
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        enabled: bool = True,
+        coalesce_window_seconds: float = 0.5,
+        state_ttl_seconds: int = 24 * 3600,
+    ):
+        """
+        Initialize the event bus.
+
+        Args:
+            redis_client: RedisClient-compatible client (defaults to the global client)
+            enabled: Whether events go through Redis (False: local delivery only)
+            coalesce_window_seconds: How long coalescable events are held
+            state_ttl_seconds: Lifetime of a room's retained state
+        """
+        self._redis_client = redis_client
+        self.enabled = enabled
+        self.coalesce_window_seconds = coalesce_window_seconds
+        self.state_ttl_seconds = state_ttl_seconds
+        self._server: Optional[Any] = None
+        self._pending: Dict[_PendingKey, Dict[str, Any]] = {}
+        self._tasks: list = []
+        self._redis_retry_at = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether this process delivers events to its own Socket.IO clients."""
+        return self._server is not None
+
+    async def publish(
+        self,
+        event: str,
+        data: Dict[str, Any],
+        room: Optional[str] = None,
+        coalesce_key: Optional[str] = None,
+        retain: bool = False,
+        skip_sid: Optional[str] = None,
+    ) -> None:
+        """
+        Publish an event to the clients of every API process.
+
+        Args:
+            event: Socket.IO event name
+            data: Event payload (JSON-serializable)
+            room: Room to emit to (None broadcasts to all clients)
+            coalesce_key: Key under which only the latest event per window is
+                delivered (None delivers every event)
+            retain: Store the event as the room's last state for replay
+            skip_sid: Session ID to exclude from delivery
+        """
+        message = {
+            'event': event,
+            'data': data,
+            'room': room,
+            'coalesce_key': coalesce_key,
+            'skip_sid': skip_sid,
+        }
+        if self.enabled and time.monotonic() >= self._redis_retry_at:
+            try:
+                client = await self._get_client()
+                state_field = self._state_field(event, coalesce_key) if retain and room else ''
+                await client.eval(
+                    PUBLISH_SCRIPT,
+                    [CHANNEL, self._state_key(room)],
+                    [json.dumps(message, default=str), state_field, self.state_ttl_seconds],
+                )
+                return
+            except Exception as e:
+                logger.warning(f"Event bus publish of {event} failed, delivering locally: {e}")
+                self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+
+        await self._dispatch(json.loads(json.dumps(message, default=str)))
+
+    async def replay(self, sid: str, room: str) -> int:
+        """
+        Send a room's retained state to a client that just subscribed.
+
+        Returns:
+            Number of events replayed
+        """
+        if not self.enabled:
+            return 0
+        try:
+            client = await self._get_client()
+            state = await client.hgetall(self._state_key(room))
+        except Exception as e:
+            logger.warning(f"Event bus replay for {room} failed: {e}")
+            return 0
+
+        for value in state.values():
+            message = json.loads(value)
+            await self._get_server().emit(message['event'], message['data'], room=sid)
+        return len(state)
+
+    async def start(self, server: Any) -> None:
+        """
+        Deliver published events to the clients of server (a socketio.AsyncServer).
+
+        Called once per API process on startup.
+        """
+        if self.running:
+            return
+        self._server = server
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._flush_loop())]
+        if self.enabled:
+            self._tasks.append(loop.create_task(self._subscribe_loop()))
+
+    async def stop(self) -> None:
+        """Stop delivering events, emitting any coalesced events still held."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._server is not None:
+            await self._flush()
+        self._server = None
+
+    async def _subscribe_loop(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                client = await self._get_client()
+                if client.client is None:
+                    await client.connect()
+                pubsub = client.client.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(CHANNEL)
+                async for raw in pubsub.listen():
+                    if raw.get('type') != 'message':
+                        continue
+                    try:
+                        await self._dispatch(json.loads(raw['data']))
+                    except Exception as e:
+                        logger.error(f"Failed to deliver event bus message: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Event bus subscriber lost Redis, resubscribing: {e}")
+                await asyncio.sleep(RESUBSCRIBE_DELAY_SECONDS)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.coalesce_window_seconds)
+            await self._flush()
+
+    async def _dispatch(self, message: Dict[str, Any]) -> None:
+        """Deliver a message locally, holding coalescable ones for the window."""
+        coalesce_key = message.get('coalesce_key')
+        if coalesce_key is not None and self.running:
+            self._pending[(message.get('room'), message['event'], coalesce_key)] = message
+            return
+
+        await self._flush(message.get('room'))
+        await self._emit(message)
+
+    async def _flush(self, room: Optional[str] = None) -> None:
+        """Emit held messages (only those for room, when given)."""
+        if room is None:
+            pending, self._pending = self._pending, {}
+        else:
+            keys = [key for key in self._pending if key[0] == room]
+            pending = {key: self._pending.pop(key) for key in keys}
+        for message in pending.values():
+            await self._emit(message)
+
+    async def _emit(self, message: Dict[str, Any]) -> None:
+        try:
+            await self._get_server().emit(
+                message['event'],
+                message['data'],
+                room=message.get('room'),
+                skip_sid=message.get('skip_sid'),
+            )
+        except Exception as e:
+            logger.error(f"Failed to emit {message['event']} to {message.get('room')}: {e}")
+
+    def _get_server(self) -> Any:
+        if self._server is None:
+            from api.websocket import sio
+            return sio
+        return self._server
+
+    @staticmethod
+    def _state_key(room: Optional[str]) -> str:
+        return f"{ROOM_STATE_PREFIX}{room or '*'}"
+
+    @staticmethod
+    def _state_field(event: str, coalesce_key: Optional[str]) -> str:
+        return f"{event}:{coalesce_key or ''}"
+
+    async def _get_client(self) -> Any:
+        if self._redis_client is None:
+            from api.redis_client import get_redis
+            self._redis_client = await get_redis().__anext__()
+        return self._redis_client
+
+
+_event_bus: Optional[SocketEventBus] = None
+
+
+def get_event_bus() -> SocketEventBus:
+    """
+    Return the process-wide event bus.
+
+    Configured by SOCKETIO_EVENT_BUS_ENABLED, SOCKETIO_COALESCE_WINDOW_SECONDS
+    and SOCKETIO_ROOM_STATE_TTL_SECONDS.
+    """
+    global _event_bus
+    if _event_bus is None:
+        settings = get_settings()
+        _event_bus = SocketEventBus(
+            enabled=settings.SOCKETIO_EVENT_BUS_ENABLED,
+            coalesce_window_seconds=settings.SOCKETIO_COALESCE_WINDOW_SECONDS,
+            state_ttl_seconds=settings.SOCKETIO_ROOM_STATE_TTL_SECONDS,
+        )
+    return _event_bus
+
+
+async def shutdown_event_bus() -> None:
+    """Stop the process-wide event bus, if one was created."""
+    global _event_bus
+    bus, _event_bus = _event_bus, None
+    if bus is not None:
+        await bus.stop()
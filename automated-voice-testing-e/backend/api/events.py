@@ -7,12 +7,17 @@ updates about suite runs, test executions, and validations.
 
 All events are emitted to specific rooms based on resource IDs, allowing clients
 to subscribe only to updates for resources they're interested in.
+
+Events are published through the Redis event bus (api.event_bus), so they
+reach clients of every API process whether emitted from an API worker or
+a Celery worker. Suite run progress is coalesced per room and replayed to
+clients when they subscribe.
 """
 
 from uuid import UUID
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
-from api.websocket import sio
+from api.event_bus import get_event_bus
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +64,13 @@ async def emit_suite_run_update(suite_run_id: UUID, data: Dict[str, Any]) -> Non
     }
 
     try:
-        await sio.emit('suite_run_update', event_data, room=room_name)
+        await get_event_bus().publish(
+            'suite_run_update',
+            event_data,
+            room=room_name,
+            coalesce_key='suite_run',
+            retain=True,
+        )
         logger.debug(f"Emitted suite_run_update to {room_name}: {event_data}")
     except Exception as e:
         logger.error(f"Failed to emit suite_run_update to {room_name}: {e}")
@@ -119,7 +130,7 @@ async def emit_test_completed(test_execution_id: UUID, data: Dict[str, Any]) ->
     }
 
     try:
-        await sio.emit('test_completed', event_data, room=room_name)
+        await get_event_bus().publish('test_completed', event_data, room=room_name)
         logger.debug(f"Emitted test_completed to {room_name}: {event_data}")
     except Exception as e:
         logger.error(f"Failed to emit test_completed to {room_name}: {e}")
@@ -174,7 +185,7 @@ async def emit_validation_update(validation_id: UUID, data: Dict[str, Any]) -> N
     }
 
     try:
-        await sio.emit('validation_update', event_data, room=room_name)
+        await get_event_bus().publish('validation_update', event_data, room=room_name)
         logger.debug(f"Emitted validation_update to {room_name}: {event_data}")
     except Exception as e:
         logger.error(f"Failed to emit validation_update to {room_name}: {e}")
@@ -182,7 +193,12 @@ async def emit_validation_update(validation_id: UUID, data: Dict[str, Any]) -> N
 
 # Additional utility functions for broadcasting to multiple rooms
 
-async def emit_to_room(room: str, event: str, data: Dict[str, Any]) -> None:
+async def emit_to_room(
+    room: str,
+    event: str,
+    data: Dict[str, Any],
+    coalesce_key: Optional[str] = None,
+) -> None:
     """
     Generic utility to emit an event to a specific room.
 
@@ -190,9 +206,11 @@ async def emit_to_room(room: str, event: str, data: Dict[str, Any]) -> None:
         room: Room name to emit to
         event: Event name
         data: Event data payload
+        coalesce_key: For progress events, key under which only the latest
+            event per coalescing window is delivered
     """
     try:
-        await sio.emit(event, data, room=room)
+        await get_event_bus().publish(event, data, room=room, coalesce_key=coalesce_key)
         logger.debug(f"Emitted {event} to {room}")
     except Exception as e:
         logger.error(f"Failed to emit {event} to {room}: {e}")
@@ -209,7 +227,7 @@ async def emit_to_all(event: str, data: Dict[str, Any]) -> None:
         data: Event data payload
     """
     try:
-        await sio.emit(event, data)
+        await get_event_bus().publish(event, data)
         logger.debug(f"Broadcasted {event} to all clients")
     except Exception as e:
         logger.error(f"Failed to broadcast {event}: {e}")
@@ -21,6 +21,7 @@ from api.exceptions import register_exception_handlers
 from api.logging_config import setup_logging
 from api.config import get_settings
 from api.sentry_config import initialize_sentry
+from api.event_bus import get_event_bus, shutdown_event_bus
 
 # Route imports
 from api.routes import auth
@@ -172,6 +173,7 @@ async def lifespan(app: FastAPI):
     - Initialize logging with environment-aware configuration
     - Initialize Sentry error tracking
     - Set up Redis connections
+    - Start the Socket.IO event bus subscriber
     - Load ML models
 
     Note: Database seeding is handled by docker-entrypoint.sh via seed_all.py
@@ -207,12 +209,16 @@ async def lifespan(app: FastAPI):
         release=APP_VERSION,
     )
 
+    # Deliver Socket.IO events published by any process to this process's clients
+    await get_event_bus().start(sio)
+
     print(f"Starting {APP_TITLE} v{APP_VERSION}")
 
     yield  # Application runs here
 
     # === SHUTDOWN ===
     print(f"Shutting down {APP_TITLE} v{APP_VERSION}")
+    await shutdown_event_bus()
     # TODO: Add actual shutdown tasks
     # - Close database connection pool
     # - Disconnect from Redis
@@ -59,6 +59,35 @@ houndify_latency_seconds = Histogram(
     registry=registry,
 )
 
+llm_admission_queue_depth = Gauge(
+    "llm_admission_queue_depth",
+    "LLM calls waiting for admission per provider, model and priority.",
+    labelnames=("provider", "model", "priority"),
+    registry=registry,
+)
+
+llm_admission_wait_seconds = Histogram(
+    "llm_admission_wait_seconds",
+    "Time LLM calls waited for admission in seconds.",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2, 5, 10, 30, 60),
+    labelnames=("provider", "model", "priority"),
+    registry=registry,
+)
+
+llm_concurrency_limit = Gauge(
+    "llm_concurrency_limit",
+    "Current adaptive concurrency limit per LLM provider and model.",
+    labelnames=("provider", "model"),
+    registry=registry,
+)
+
+llm_rate_limited_total = Counter(
+    "llm_rate_limited_total",
+    "Total number of LLM calls rejected by the provider with a rate limit.",
+    labelnames=("provider", "model"),
+    registry=registry,
+)
+
 __all__ = (
     "registry",
     "test_executions_total",
@@ -69,4 +98,8 @@ __all__ = (
     "houndify_requests_total",
     "houndify_errors_total",
     "houndify_latency_seconds",
+    "llm_admission_queue_depth",
+    "llm_admission_wait_seconds",
+    "llm_concurrency_limit",
+    "llm_rate_limited_total",
 )
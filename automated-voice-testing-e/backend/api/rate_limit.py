@@ -3,24 +3,71 @@ Request rate limiting utilities.
 
 Provides per-identifier (user/IP) throttling using Redis as backing store.
 Supports per-endpoint rate limits and trusted proxy validation.
+
+Limits are enforced with a sliding window counter: each identifier has one
+counter per fixed window, and a request is allowed while
+
+    current + previous * (time left in the current window / window)
+
+is below the limit. This avoids the burst of up to twice the limit that a
+plain fixed window lets through at a window boundary, using two small keys
+per identifier:
+
+    rate-limit:{auth|default}:{identifier}:{window index}  -> request count
+
+Reading both counters, deciding and incrementing happen in one Lua script,
+so each request costs a single EVALSHA round trip and concurrent requests
+cannot both take the last slot. When Redis is unavailable, the same
+algorithm runs on in-process counters (limits then apply per worker) and
+Redis is skipped for REDIS_RETRY_SECONDS.
 """
 
 from __future__ import annotations
 
 import hashlib
 import ipaddress
-import json
+import logging
+import math
 import time
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from fastapi import Request
 
 from api.redis_client import get_redis
 from api.config import get_settings
 
+logger = logging.getLogger(__name__)
+
 KEY_PREFIX = "rate-limit"
 DETAIL_MESSAGE = "Rate limit exceeded. Try again later."
 
+# Seconds to use the in-process limiter without trying Redis after an error
+REDIS_RETRY_SECONDS = 5.0
+
+# Identifiers tracked by the in-process limiter before stale ones are dropped
+MAX_LOCAL_KEYS = 10000
+
+# KEYS[1] = current window counter, KEYS[2] = previous window counter
+# ARGV[1] = limit, ARGV[2] = window (ms), ARGV[3] = ms elapsed in the current window
+# Returns {allowed (0/1), retry after (ms)}; mirrors _sliding_window_decision
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local elapsed = tonumber(ARGV[3])
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local remaining = window - elapsed
+if current + previous * remaining / window < limit then
+    redis.call('INCR', KEYS[1])
+    redis.call('PEXPIRE', KEYS[1], window * 2)
+    return {1, 0}
+end
+if current >= limit or previous == 0 then
+    return {0, remaining}
+end
+return {0, math.ceil(remaining - (limit - current) * window / previous)}
+"""
+
 
 def _get_rate_limit_config(path: str) -> tuple[int, int]:
     """
@@ -88,6 +135,107 @@ class RateLimitExceeded(Exception):
         self.retry_after = max(retry_after, 0)
 
 
+def _sliding_window_decision(
+    current: int,
+    previous: int,
+    limit: int,
+    window_ms: int,
+    elapsed_ms: int,
+) -> Tuple[bool, int]:
+    """
+    Decide whether one more request fits in the sliding window.
+
+    Args:
+        current: Requests counted in the current fixed window
+        previous: Requests counted in the previous fixed window
+        limit: Requests allowed per window
+        window_ms: Window length in milliseconds
+        elapsed_ms: Milliseconds elapsed in the current fixed window
+
+    Returns:
+        tuple: (allowed, milliseconds until a request would be allowed)
+    """
+    remaining = window_ms - elapsed_ms
+    if current + previous * remaining / window_ms < limit:
+        return True, 0
+    if current >= limit or previous == 0:
+        return False, remaining
+    # Wait until the previous window's weight has decayed enough
+    return False, math.ceil(remaining - (limit - current) * window_ms / previous)
+
+
+class LocalRateLimiter:
+    """
+    In-process sliding window counters, used while Redis is unavailable.
+
+    Counts only the requests this process handles, so the effective limit
+    across N workers is up to N times the configured one.
+    """
+
+    def __init__(self, max_keys: int = MAX_LOCAL_KEYS):
+        self.max_keys = max_keys
+        # key -> (window_ms, window index, current count, previous count)
+        self._windows: Dict[str, Tuple[int, int, int, int]] = {}
+
+    def hit(self, key: str, limit: int, window_ms: int, now_ms: int) -> Tuple[bool, int]:
+        """
+        Count a request for key if it fits in the window.
+
+        Returns:
+            tuple: (allowed, milliseconds until a request would be allowed)
+        """
+        index = now_ms // window_ms
+        _, stored_index, current, previous = self._windows.get(key, (window_ms, index, 0, 0))
+        if stored_index == index - 1:
+            current, previous = 0, current
+        elif stored_index != index:
+            current, previous = 0, 0
+
+        allowed, retry_after_ms = _sliding_window_decision(
+            current, previous, limit, window_ms, now_ms - index * window_ms
+        )
+        if allowed:
+            current += 1
+        if key not in self._windows and len(self._windows) >= self.max_keys:
+            self._prune(now_ms)
+        self._windows[key] = (window_ms, index, current, previous)
+        return allowed, retry_after_ms
+
+    def _prune(self, now_ms: int) -> None:
+        """Drop identifiers idle for more than two windows (everything, if none are)."""
+        self._windows = {
+            key: value
+            for key, value in self._windows.items()
+            if value[1] >= now_ms // value[0] - 1
+        }
+        if len(self._windows) >= self.max_keys:
+            self._windows.clear()
+
+
+_local_limiter = LocalRateLimiter()
+_redis_retry_at = 0.0
+
+
+async def _redis_hit(cache_key: str, limit: int, window_ms: int, now_ms: int) -> Tuple[bool, int]:
+    """Run the sliding window script for cache_key (one Redis round trip)."""
+    index = now_ms // window_ms
+    redis_gen = get_redis()
+    redis = await redis_gen.__anext__()
+
+    try:
+        allowed, retry_after_ms = await redis.eval(
+            SLIDING_WINDOW_SCRIPT,
+            [f"{cache_key}:{index}", f"{cache_key}:{index - 1}"],
+            [limit, window_ms, now_ms - index * window_ms],
+        )
+        return bool(int(allowed)), int(retry_after_ms)
+    finally:
+        try:
+            await redis_gen.aclose()
+        except StopAsyncIteration:  # pragma: no cover - defensive cleanup
+            pass
+
+
 async def enforce_rate_limit(request: Request) -> None:
     """
     Enforce per-user (or per-client) rate limiting.
@@ -112,42 +260,34 @@ async def enforce_rate_limit(request: Request) -> None:
     path_prefix = "auth" if request.url.path.startswith("/api/v1/auth/") else "default"
     cache_key = f"{KEY_PREFIX}:{path_prefix}:{identifier}"
 
-    now = int(time.time())
-    redis_gen = get_redis()
-    redis = await redis_gen.__anext__()
-
-    try:
-        existing = await redis.get(cache_key)
-        if existing is None:
-            payload = {"count": 1, "reset": now + window_seconds}
-            await redis.set(cache_key, json.dumps(payload), ttl=window_seconds)
-            return
+    await _check_rate_limit(cache_key, rate_limit_requests, window_seconds)
 
-        try:
-            data = json.loads(existing)
-        except json.JSONDecodeError:
-            data = {"count": 0, "reset": now}
 
-        count = int(data.get("count", 0))
-        reset_ts = int(data.get("reset", now + window_seconds))
+async def _check_rate_limit(cache_key: str, limit: int, window_seconds: int) -> None:
+    """
+    Count a request against cache_key's sliding window.
 
-        if now >= reset_ts:
-            new_payload = {"count": 1, "reset": now + window_seconds}
-            await redis.set(cache_key, json.dumps(new_payload), ttl=window_seconds)
-            return
+    Raises:
+        RateLimitExceeded: When the window already holds limit requests.
+    """
+    global _redis_retry_at
 
-        if count >= rate_limit_requests:
-            raise RateLimitExceeded(retry_after=reset_ts - now)
+    now_ms = int(time.time() * 1000)
+    window_ms = window_seconds * 1000
 
-        count += 1
-        remaining_window = max(1, reset_ts - now)
-        updated_payload = {"count": count, "reset": reset_ts}
-        await redis.set(cache_key, json.dumps(updated_payload), ttl=remaining_window)
-    finally:
+    result = None
+    if time.monotonic() >= _redis_retry_at:
         try:
-            await redis_gen.aclose()
-        except StopAsyncIteration:  # pragma: no cover - defensive cleanup
-            pass
+            result = await _redis_hit(cache_key, limit, window_ms, now_ms)
+        except Exception as e:
+            logger.warning(f"Rate limit check in Redis failed, limiting in-process: {e}")
+            _redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+    if result is None:
+        result = _local_limiter.hit(cache_key, limit, window_ms, now_ms)
+
+    allowed, retry_after_ms = result
+    if not allowed:
+        raise RateLimitExceeded(retry_after=max(1, math.ceil(retry_after_ms / 1000)))
 
 
 def _resolve_identifier(request: Request) -> Optional[str]:
@@ -6,7 +6,8 @@ It manages connection pooling and provides convenient helper methods for cache o
 
 The RedisClient class wraps the async Redis client and provides:
     - Automatic connection pooling with configurable max connections
-    - Helper methods for common operations: get, set, delete, exists
+    - Helper methods for common operations: get, set, delete, exists,
+      hgetall, eval
     - Async context manager support for proper resource cleanup
     - Integration with FastAPI dependency injection via get_redis()
 
@@ -42,11 +43,13 @@ Direct usage:
     >>> await client.disconnect()
 """
 
-from typing import Optional, AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, List, Optional
+import hashlib
 import logging
 
 from redis import asyncio as aioredis
 from redis.asyncio import ConnectionPool
+from redis.exceptions import NoScriptError
 
 from api.config import get_settings
 
@@ -117,6 +120,7 @@ class RedisClient:
         self.max_connections = max_connections
         self.pool: Optional[ConnectionPool] = None
         self.client: Optional[aioredis.Redis] = None
+        self._script_shas: Dict[str, str] = {}
         logger.info(f"RedisClient initialized with max_connections={max_connections}")
 
     async def connect(self) -> None:
@@ -299,6 +303,63 @@ class RedisClient:
         logger.debug(f"EXISTS {key}: {result}")
         return bool(result)
 
+    async def hgetall(self, key: str) -> Dict[str, str]:
+        """
+        Get every field of a Redis hash.
+
+        Args:
+            key: Redis key of the hash
+
+        Returns:
+            Field/value mapping (empty if the key doesn't exist)
+
+        Example:
+            >>> fields = await client.hgetall("latency_sketch:run:*:*")
+        """
+        if self.client is None:
+            await self.connect()
+
+        result = await self.client.hgetall(key)
+        logger.debug(f"HGETALL {key}: {len(result)} fields")
+        return result
+
+    async def eval(self, script: str, keys: List[str], args: List[Any]) -> Any:
+        """
+        Run a Lua script atomically on the server.
+
+        Args:
+            script: Lua source
+            keys: Keys the script touches (KEYS in Lua)
+            args: Additional arguments (ARGV in Lua)
+
+        Returns:
+            The script's return value
+
+        Example:
+            >>> await client.eval("return redis.call('INCR', KEYS[1])", ["counter"], [])
+
+        Note:
+            - The script runs without interleaving other commands
+            - Returned Lua numbers are truncated to integers by Redis
+            - Sent as EVALSHA (only the script's SHA1 digest); the full source
+              is sent only when the server's script cache doesn't have it yet
+        """
+        if self.client is None:
+            await self.connect()
+
+        sha = self._script_shas.get(script)
+        if sha is None:
+            sha = hashlib.sha1(script.encode("utf-8")).hexdigest()
+            self._script_shas[script] = sha
+
+        try:
+            result = await self.client.evalsha(sha, len(keys), *keys, *args)
+        except NoScriptError:
+            # EVAL also adds the script to the server's cache
+            result = await self.client.eval(script, len(keys), *keys, *args)
+        logger.debug(f"EVALSHA {keys}: {result}")
+        return result
+
 
 # Global Redis client instance
 _redis_client: Optional[RedisClient] = None
@@ -6,6 +6,7 @@ task claiming, validation submission, and performance tracking.
 
 Endpoints:
     GET /api/v1/validation/queue - Get next validation task from queue
+    POST /api/v1/validation/claim-next - Atomically claim the next validation task(s)
     POST /api/v1/validation/{queue_id}/claim - Claim a validation task
     POST /api/v1/validation/{queue_id}/submit - Submit validation decision
     POST /api/v1/validation/{queue_id}/release - Release a claimed task back to queue
@@ -78,6 +79,22 @@ def _ensure_can_validate(user: UserResponse) -> None:
 # Use centralized get_current_user_with_db from api.dependencies
 
 
+def _serialize_queue_item(task) -> dict:
+    """Convert a ValidationQueue item to the queue response shape."""
+    return {
+        "id": str(task.id),
+        "validation_result_id": str(task.validation_result_id),
+        "priority": task.priority,
+        "confidence_score": float(task.confidence_score) if task.confidence_score else None,
+        "language_code": task.language_code,
+        "status": task.status,
+        "requires_native_speaker": task.requires_native_speaker,
+        "created_at": task.created_at.isoformat() if task.created_at else None,
+        "claimed_by": str(task.claimed_by) if task.claimed_by else None,
+        "claimed_at": task.claimed_at.isoformat() if task.claimed_at else None
+    }
+
+
 # =============================================================================
 # Get Next Validation Task Endpoint
 # =============================================================================
@@ -145,21 +162,7 @@ async def get_validation_queue(
         )
 
         # Convert to response schema
-        tasks_data = [
-            {
-                "id": str(task.id),
-                "validation_result_id": str(task.validation_result_id),
-                "priority": task.priority,
-                "confidence_score": float(task.confidence_score) if task.confidence_score else None,
-                "language_code": task.language_code,
-                "status": task.status,
-                "requires_native_speaker": task.requires_native_speaker,
-                "created_at": task.created_at.isoformat() if task.created_at else None,
-                "claimed_by": str(task.claimed_by) if task.claimed_by else None,
-                "claimed_at": task.claimed_at.isoformat() if task.claimed_at else None
-            }
-            for task in tasks
-        ]
+        tasks_data = [_serialize_queue_item(task) for task in tasks]
 
         return SuccessResponse(
             data=tasks_data,
@@ -181,18 +184,7 @@ async def get_validation_queue(
         )
 
     # Convert to response schema and return as array
-    task_data = {
-        "id": str(task.id),
-        "validation_result_id": str(task.validation_result_id),
-        "priority": task.priority,
-        "confidence_score": float(task.confidence_score) if task.confidence_score else None,
-        "language_code": task.language_code,
-        "status": task.status,
-        "requires_native_speaker": task.requires_native_speaker,
-        "created_at": task.created_at.isoformat() if task.created_at else None,
-        "claimed_by": str(task.claimed_by) if task.claimed_by else None,
-        "claimed_at": task.claimed_at.isoformat() if task.claimed_at else None
-    }
+    task_data = _serialize_queue_item(task)
 
     return SuccessResponse(
         data=[task_data],  # Return as array for frontend compatibility
@@ -200,6 +192,71 @@ async def get_validation_queue(
     )
 
 
+# =============================================================================
+# Claim Next Validation Task Endpoint
+# =============================================================================
+
+@router.post(
+    "/claim-next",
+    response_model=SuccessResponse,
+    summary="Claim next validation task",
+    description="Atomically claim the next pending validation task(s) from the queue"
+)
+async def claim_next_validation_tasks(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserResponse, Depends(get_current_user_with_db)],
+    language_code: Optional[str] = Query(
+        None,
+        description="Optional language code; matching tasks are claimed first (e.g., 'es-MX')"
+    ),
+    count: int = Query(
+        1,
+        ge=1,
+        le=validation_queue_service.MAX_CLAIM_BATCH_SIZE,
+        description="Number of tasks to claim"
+    )
+) -> SuccessResponse:
+    """
+    Claim the next pending validation task(s) for the current validator.
+
+    Selects and claims in one round trip, so concurrent validators never
+    receive the same task. Tasks are taken in queue order: language match
+    first, then priority, then creation time.
+
+    Args:
+        db: Database session
+        current_user: Current authenticated user (validator)
+        language_code: Optional preferred language code
+        count: Number of tasks to claim
+
+    Returns:
+        SuccessResponse: Array of claimed ValidationQueueItems (empty if none pending)
+
+    Raises:
+        HTTPException:
+            - 401 if authentication fails
+            - 403 if user lacks required role
+    """
+    _ensure_can_validate(current_user)
+
+    service = validation_queue_service.ValidationQueueService()
+    tasks = await service.claim_next(
+        db=db,
+        validator_id=current_user.id,
+        language_code=language_code,
+        tenant_id=current_user.tenant_id,
+        limit=count,
+    )
+
+    return SuccessResponse(
+        data=[_serialize_queue_item(task) for task in tasks],
+        message=(
+            f"Claimed {len(tasks)} validation tasks"
+            if tasks else "No validation tasks available in queue"
+        )
+    )
+
+
 # =============================================================================
 # Get Queue Statistics Endpoint
 # =============================================================================
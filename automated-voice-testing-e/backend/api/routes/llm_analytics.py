@@ -7,6 +7,7 @@ Provides cost breakdowns, usage trends, and budget monitoring.
 
 from datetime import datetime, timedelta
 from typing import Optional
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy import select, func, and_
@@ -16,8 +17,12 @@ from api.database import get_db
 from api.dependencies import get_current_user_with_db
 from api.schemas.auth import UserResponse
 from api.schemas.llm_analytics import (
+    CacheSavingsBreakdown,
+    CacheSavingsResponse,
     DailyCostsResponse,
     DailyCostSummary,
+    DecisionPathBreakdown,
+    DecisionPathsResponse,
     OperationBreakdownResponse,
     OperationCostBreakdown,
     ModelBreakdownResponse,
@@ -27,6 +32,12 @@ from api.schemas.llm_analytics import (
     RecentCallLog,
 )
 from models.llm_usage_log import LLMUsageLog
+from models.validation_result import ValidationResult
+from services.validation_decision_policy import (
+    DECISION_PATH_DUAL_EVALUATOR,
+    DECISION_PATH_HOUNDIFY_ONLY,
+    EVALUATOR_CALLS_BY_PATH,
+)
 
 
 router = APIRouter(
@@ -378,3 +389,135 @@ async def get_recent_calls(
     ]
 
     return RecentCallsResponse(calls=calls, total_count=total_count or 0)
+
+
+@router.get("/cache-savings", response_model=CacheSavingsResponse)
+async def get_cache_savings(
+    days: int = Query(default=30, ge=1, le=365, description="Number of days to analyze"),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserResponse = Depends(get_current_user_with_db),
+) -> CacheSavingsResponse:
+    """
+    Get savings from the LLM evaluation cache.
+
+    Cache hits are logged as zero-cost calls whose request_metadata records
+    the tokens and cost the original evaluation incurred.
+    """
+    period_end = datetime.utcnow()
+    period_start = period_end - timedelta(days=days)
+
+    saved_cost = LLMUsageLog.request_metadata["saved_cost_usd"].as_float()
+    saved_tokens = LLMUsageLog.request_metadata["saved_tokens"].as_integer()
+
+    savings_query = (
+        select(
+            LLMUsageLog.operation,
+            func.count().label("cache_hits"),
+            func.sum(saved_tokens).label("saved_tokens"),
+            func.sum(saved_cost).label("saved_cost"),
+        )
+        .where(
+            and_(
+                LLMUsageLog.tenant_id == current_user.tenant_id,
+                LLMUsageLog.service_name == "llm_pipeline",
+                LLMUsageLog.operation.like("%_cache_hit"),
+                LLMUsageLog.created_at >= period_start,
+                LLMUsageLog.created_at <= period_end,
+            )
+        )
+        .group_by(LLMUsageLog.operation)
+        .order_by(func.sum(saved_cost).desc())
+    )
+
+    result = await db.execute(savings_query)
+    operations = [
+        CacheSavingsBreakdown(
+            operation=row.operation,
+            cache_hits=row.cache_hits or 0,
+            saved_tokens=row.saved_tokens or 0,
+            saved_cost_usd=round(float(row.saved_cost or 0), 6),
+        )
+        for row in result.all()
+    ]
+
+    return CacheSavingsResponse(
+        cache_hits=sum(op.cache_hits for op in operations),
+        saved_tokens=sum(op.saved_tokens for op in operations),
+        saved_cost_usd=round(sum(op.saved_cost_usd for op in operations), 6),
+        operations=operations,
+        period_start=period_start.strftime("%Y-%m-%d"),
+        period_end=period_end.strftime("%Y-%m-%d"),
+    )
+
+
+@router.get("/decision-paths", response_model=DecisionPathsResponse)
+async def get_decision_paths(
+    suite_run_id: Optional[UUID] = Query(default=None, description="Limit to one suite run"),
+    days: int = Query(default=30, ge=1, le=365, description="Number of days to analyze"),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserResponse = Depends(get_current_user_with_db),
+) -> DecisionPathsResponse:
+    """
+    Get LLM evaluator calls saved by the validation decision policy.
+
+    Groups validations by the decision path they took (deterministic exit,
+    single evaluator, or both evaluators) and compares evaluator calls made
+    against running both evaluators on every LLM-eligible validation.
+    """
+    period_end = datetime.utcnow()
+    period_start = period_end - timedelta(days=days)
+
+    latency_ms = func.coalesce(
+        ValidationResult.houndify_result["total_validation_latency_ms"].as_float(),
+        ValidationResult.ensemble_result["total_validation_latency_ms"].as_float(),
+    )
+
+    filters = [
+        ValidationResult.tenant_id == current_user.tenant_id,
+        ValidationResult.decision_path.isnot(None),
+        ValidationResult.created_at >= period_start,
+        ValidationResult.created_at <= period_end,
+    ]
+    if suite_run_id is not None:
+        filters.append(ValidationResult.suite_run_id == suite_run_id)
+
+    paths_query = (
+        select(
+            ValidationResult.decision_path,
+            func.count().label("validations"),
+            func.avg(latency_ms).label("avg_latency"),
+        )
+        .where(and_(*filters))
+        .group_by(ValidationResult.decision_path)
+        .order_by(func.count().desc())
+    )
+
+    result = await db.execute(paths_query)
+    paths = [
+        DecisionPathBreakdown(
+            decision_path=row.decision_path,
+            validations=row.validations or 0,
+            llm_evaluator_calls=EVALUATOR_CALLS_BY_PATH.get(row.decision_path, 0) * (row.validations or 0),
+            avg_validation_latency_ms=(
+                round(float(row.avg_latency), 2) if row.avg_latency is not None else None
+            ),
+        )
+        for row in result.all()
+    ]
+
+    evaluator_calls = sum(path.llm_evaluator_calls for path in paths)
+    llm_eligible = sum(
+        path.validations for path in paths
+        if path.decision_path != DECISION_PATH_HOUNDIFY_ONLY
+    )
+    full_pipeline_calls = EVALUATOR_CALLS_BY_PATH[DECISION_PATH_DUAL_EVALUATOR] * llm_eligible
+
+    return DecisionPathsResponse(
+        total_validations=sum(path.validations for path in paths),
+        llm_evaluator_calls=evaluator_calls,
+        llm_evaluator_calls_saved=max(full_pipeline_calls - evaluator_calls, 0),
+        paths=paths,
+        suite_run_id=suite_run_id,
+        period_start=period_start.strftime("%Y-%m-%d"),
+        period_end=period_end.strftime("%Y-%m-%d"),
+    )
@@ -259,7 +259,7 @@ async def synthesize_speech(
     try:
         from services.tts_service import TTSService
         tts = TTSService()
-        audio_bytes = tts.text_to_speech(request.text, lang=request.language)
+        audio_bytes = await tts.text_to_speech_async(request.text, lang=request.language)
         return Response(
             content=audio_bytes,
             media_type="audio/mpeg",
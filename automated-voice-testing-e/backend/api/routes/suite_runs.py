@@ -11,6 +11,7 @@ Endpoints:
     PUT /api/v1/suite-runs/{id}/cancel - Cancel a running suite run
     POST /api/v1/suite-runs/{id}/retry - Retry failed tests from a suite run
     GET /api/v1/suite-runs/{id}/executions - Get test executions for a suite run
+    GET /api/v1/suite-runs/{id}/latency-percentiles - Step latency percentiles
 
 All endpoints require authentication via JWT token and use Pydantic schemas
 for validation and return standard responses.
@@ -35,6 +36,7 @@ from api.schemas.suite_run import (
 from api.schemas.enums import SuiteRunStatus
 from api.schemas.auth import UserResponse
 from services import orchestration_service
+from services.latency_sketch_store import get_latency_sketch_store
 from api.auth.roles import Role
 
 
@@ -758,6 +760,68 @@ async def get_test_executions(
         )
 
 
+# =============================================================================
+# Get Latency Percentiles Endpoint
+# =============================================================================
+
+@router.get(
+    "/{suite_run_id}/latency-percentiles",
+    response_model=Dict[str, Any],
+    summary="Get step latency percentiles",
+    description="Houndify step latency count, mean, min, max and p50/p90/p95/p99 for a suite run"
+)
+async def get_latency_percentiles(
+    suite_run_id: UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserResponse, Depends(get_current_user_with_db)],
+    language_code: Optional[str] = Query(None, description="Only latencies for this language"),
+    command_kind: Optional[str] = Query(None, description="Only latencies for this CommandKind"),
+) -> Dict[str, Any]:
+    """
+    Get step latency percentiles for a suite run.
+
+    Served from the mergeable sketches workers publish while executing the
+    run (see services.latency_sketch_store); no raw latencies are read.
+
+    Args:
+        suite_run_id: UUID of the suite run
+        db: Database session
+        current_user: Current authenticated user
+        language_code: Optional language filter
+        command_kind: Optional CommandKind filter
+
+    Returns:
+        Dict with count, mean, min, max, p50, p90, p95 and p99 in milliseconds
+
+    Raises:
+        HTTPException: 404 if suite run not found
+        HTTPException: 500 if retrieval fails
+    """
+    try:
+        from models.suite_run import SuiteRun
+        suite_run = await db.get(SuiteRun, suite_run_id)
+        if not suite_run:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Suite run with ID {suite_run_id} not found"
+            )
+
+        # Verify user has access to this suite run (tenant isolation)
+        _check_suite_run_tenant_access(current_user, suite_run)
+
+        return await get_latency_sketch_store().get_percentiles(
+            suite_run_id, language_code=language_code, command_kind=command_kind,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get latency percentiles: {str(e)}"
+        )
+
+
 # =============================================================================
 # GET /api/v1/test-runs/validation-results/{id}
 # =============================================================================
@@ -103,3 +103,48 @@ class RecentCallsResponse(BaseModel):
 
     calls: List[RecentCallLog]
     total_count: int
+
+
+class CacheSavingsBreakdown(BaseModel):
+    """LLM evaluation cache savings for one pipeline stage."""
+
+    operation: str = Field(description="Cache hit operation (e.g. evaluator_a_cache_hit)")
+    cache_hits: int = Field(description="Calls served from the cache")
+    saved_tokens: int = Field(description="Tokens the cached calls would have used")
+    saved_cost_usd: float = Field(description="Estimated cost avoided in USD")
+
+
+class CacheSavingsResponse(BaseModel):
+    """Response for LLM evaluation cache savings endpoint."""
+
+    cache_hits: int = Field(description="Total calls served from the cache")
+    saved_tokens: int = Field(description="Total tokens avoided")
+    saved_cost_usd: float = Field(description="Total estimated cost avoided in USD")
+    operations: List[CacheSavingsBreakdown]
+    period_start: str = Field(description="Start of analysis period")
+    period_end: str = Field(description="End of analysis period")
+
+
+class DecisionPathBreakdown(BaseModel):
+    """Validation count and cost for one validation decision path."""
+
+    decision_path: str = Field(description="Path taken (e.g. deterministic_fail, single_evaluator)")
+    validations: int = Field(description="Validations that took this path")
+    llm_evaluator_calls: int = Field(description="LLM evaluator calls made on this path")
+    avg_validation_latency_ms: Optional[float] = Field(
+        default=None, description="Average wall-clock validation latency in milliseconds"
+    )
+
+
+class DecisionPathsResponse(BaseModel):
+    """Response for validation decision path endpoint."""
+
+    total_validations: int = Field(description="Validations with a recorded decision path")
+    llm_evaluator_calls: int = Field(description="LLM evaluator calls made")
+    llm_evaluator_calls_saved: int = Field(
+        description="Evaluator calls avoided compared to always running both evaluators"
+    )
+    paths: List[DecisionPathBreakdown]
+    suite_run_id: Optional[UUID] = Field(default=None, description="Suite run filter, if any")
+    period_start: str = Field(description="Start of analysis period")
+    period_end: str = Field(description="End of analysis period")
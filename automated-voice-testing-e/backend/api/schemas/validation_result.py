@@ -99,6 +99,13 @@ class ValidationResultBase(BaseModel):
         None,
         description="Language code for the validation (e.g., en-US, es-ES)"
     )
+    decision_path: Optional[str] = Field(
+        None,
+        description=(
+            "Validation path: deterministic_pass, deterministic_fail, "
+            "single_evaluator, dual_evaluator, or houndify_only"
+        )
+    )
 
 
 class ValidationResultCreate(ValidationResultBase):
@@ -136,6 +143,7 @@ class ValidationResultUpdate(BaseModel):
     final_decision: Optional[str] = None
     review_status: Optional[str] = None
     language_code: Optional[str] = None
+    decision_path: Optional[str] = None
 
 
 class ValidationResultSchema(ValidationResultBase):
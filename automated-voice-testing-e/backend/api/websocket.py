@@ -8,12 +8,16 @@ communication between the backend and frontend clients. It enables:
 - Real-time updates for test execution progress
 
 The WebSocket manager uses Socket.IO with ASGI mode for integration with FastAPI.
+Broadcasts go through the Redis event bus (api.event_bus) so they reach the
+clients of every API process; replies to a single client are emitted directly.
 """
 
 import socketio
 from typing import Dict, Any, Optional
 import logging
 
+from api.event_bus import get_event_bus
+
 logger = logging.getLogger(__name__)
 
 # Create Socket.IO AsyncServer with ASGI mode for FastAPI integration
@@ -207,6 +211,9 @@ async def subscribe_test_run(sid: str, data: Dict[str, Any]):
         'room': room_name
     }, room=sid)
 
+    # Send the suite run's last known state so the client starts up to date
+    await get_event_bus().replay(sid, room_name)
+
 
 @sio.event
 async def unsubscribe_test_run(sid: str, data: Dict[str, Any]):
@@ -252,7 +259,13 @@ async def emit_test_execution_update(suite_run_id: str, update_data: Dict[str, A
         )
     """
     room_name = f"suite_run_{suite_run_id}"
-    await sio.emit('test_run_update', update_data, room=room_name)
+    await get_event_bus().publish(
+        'test_run_update',
+        update_data,
+        room=room_name,
+        coalesce_key='test_run',
+        retain=True,
+    )
     logger.debug(f"Emitted update to {room_name}: {update_data}")
 
 
@@ -277,7 +290,7 @@ async def emit_test_case_update(suite_run_id: str, test_case_data: Dict[str, Any
         )
     """
     room_name = f"suite_run_{suite_run_id}"
-    await sio.emit('test_case_update', test_case_data, room=room_name)
+    await get_event_bus().publish('test_case_update', test_case_data, room=room_name)
     logger.debug(f"Emitted test case update to {room_name}")
 
 
@@ -301,7 +314,7 @@ async def emit_dashboard_metrics_update(metrics_data: Dict[str, Any]):
             'active_test_runs': 3
         })
     """
-    await sio.emit('dashboard:metrics_update', metrics_data)
+    await get_event_bus().publish('dashboard:metrics_update', metrics_data, coalesce_key='dashboard')
     logger.debug("Broadcast dashboard metrics update to all clients")
 
 
@@ -347,7 +360,7 @@ async def validation_claimed(sid: str, data: Dict[str, Any]):
     queue_id = data.get('queueId')
     if queue_id:
         # Broadcast to all subscribers except the sender
-        await sio.emit('validation_claimed', {
+        await get_event_bus().publish('validation_claimed', {
             'queue_id': queue_id,
             'claimed_by_sid': sid
         }, room=VALIDATION_QUEUE_ROOM, skip_sid=sid)
@@ -368,7 +381,7 @@ async def validation_completed(sid: str, data: Dict[str, Any]):
     """
     queue_id = data.get('queueId')
     if queue_id:
-        await sio.emit('validation_completed', {
+        await get_event_bus().publish('validation_completed', {
             'queue_id': queue_id,
             'completed_by_sid': sid
         }, room=VALIDATION_QUEUE_ROOM, skip_sid=sid)
@@ -390,7 +403,7 @@ async def emit_validation_queue_update(queue_data: Dict[str, Any]):
             'completed_today': 42
         })
     """
-    await sio.emit('validation:queue_update', queue_data)
+    await get_event_bus().publish('validation:queue_update', queue_data, coalesce_key='validation_queue')
     logger.debug("Broadcast validation queue update to all clients")
 
 
@@ -405,7 +418,7 @@ async def emit_validation_claimed(queue_id: str):
     Args:
         queue_id: UUID of the claimed validation queue item
     """
-    await sio.emit('validation_claimed', {
+    await get_event_bus().publish('validation_claimed', {
         'queue_id': queue_id
     }, room=VALIDATION_QUEUE_ROOM)
     logger.info(f"Emitted validation_claimed for {queue_id} to {VALIDATION_QUEUE_ROOM}")
@@ -90,6 +90,10 @@ celery.conf.beat_schedule = {
         'task': 'tasks.reporting.send_scheduled_reports',
         'schedule': crontab(hour=7, minute=0),  # 07:00 UTC daily
     },
+    'purge-llm-evaluation-cache': {
+        'task': 'tasks.validation.purge_llm_evaluation_cache',
+        'schedule': crontab(hour=3, minute=30),  # 03:30 UTC daily
+    },
 }
 
 
@@ -14,7 +14,7 @@ import logging
 import os
 from typing import Optional, Union
 
-from .client import HoundifyClient
+from .client import HoundifyClient, get_houndify_executor
 from .mock_client import MockHoundifyClient, MockHoundifyError
 from .llm_mock_client import LLMMockClient
 
@@ -121,10 +121,26 @@ def create_houndify_client(
             "when USE_HOUNDIFY_MOCK is False"
         )
 
+    client_options = {}
+    try:
+        from api.config import get_settings
+        settings = get_settings()
+        client_options = {
+            "executor": get_houndify_executor(settings.HOUNDIFY_EXECUTOR_WORKERS),
+            "chunk_size": settings.HOUNDIFY_CHUNK_SIZE,
+            "chunk_pacing": settings.HOUNDIFY_CHUNK_PACING,
+            "sample_rate": settings.HOUNDIFY_SAMPLE_RATE,
+            "timeout": settings.SOUNDHOUND_TIMEOUT,
+        }
+    except Exception:
+        # Fall back to client defaults if config unavailable
+        pass
+
     logger.info("[HOUNDIFY] Using real HoundifyClient")
     return HoundifyClient(
         client_id=client_id,
         client_key=client_key,
+        **client_options,
     )
 
 
@@ -134,6 +150,7 @@ __all__ = [
     'LLMMockClient',
     'MockHoundifyError',
     'create_houndify_client',
+    'get_houndify_executor',
     'MOCK_TYPE_PATTERN',
     'MOCK_TYPE_LLM',
 ]
@@ -9,20 +9,89 @@ The client supports:
 - Voice queries for audio-based interactions
 - Conversation state management for multi-turn dialogs
 - Proper authentication using Client ID and Client Key
+- A dedicated, bounded thread pool for blocking SDK calls (kept separate
+  from the event loop's default executor used by boto3 uploads)
+- Reuse of idle StreamingHoundClient objects across requests
+- Configurable chunk pacing (real-time or as fast as possible)
+- Per-request timing breakdown (connect, fill, first partial, final)
+
+Note: the SDK opens a new HTTP connection on every start(), so reuse is
+limited to the client objects themselves; the TCP connection is not kept
+alive between requests.
 
 API Documentation: https://docs.houndify.com
 Developer Platform: https://www.houndify.com/developers
 """
 
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+import asyncio
 import logging
 import os
+import threading
+import time
 import houndify
 
 from .models import HoundifyError
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_EXECUTOR_WORKERS = 8
+DEFAULT_CHUNK_SIZE = 8192  # bytes per fill() call
+DEFAULT_MAX_IDLE_CLIENTS = 8
+
+CHUNK_PACING_FAST = "fast"          # feed audio as fast as the socket accepts it
+CHUNK_PACING_REALTIME = "realtime"  # feed audio at playback speed, like a microphone
+CHUNK_PACING_MODES = (CHUNK_PACING_FAST, CHUNK_PACING_REALTIME)
+
+_houndify_executor: Optional[ThreadPoolExecutor] = None
+_houndify_executor_lock = threading.Lock()
+
+
+def get_houndify_executor(max_workers: Optional[int] = None) -> ThreadPoolExecutor:
+    """
+    Return the process-wide thread pool used for blocking Houndify SDK calls.
+
+    The pool is created on first use and shared by every HoundifyClient in
+    the process. ``max_workers`` only applies to the call that creates it.
+
+    Args:
+        max_workers: Pool size (default: DEFAULT_EXECUTOR_WORKERS)
+
+    Returns:
+        ThreadPoolExecutor: Shared Houndify executor
+    """
+    global _houndify_executor
+    if _houndify_executor is None:
+        with _houndify_executor_lock:
+            if _houndify_executor is None:
+                _houndify_executor = ThreadPoolExecutor(
+                    max_workers=max_workers or DEFAULT_EXECUTOR_WORKERS,
+                    thread_name_prefix="houndify",
+                )
+    return _houndify_executor
+
+
+class _TimedResultListener(houndify.HoundListener):
+    """HoundListener that captures the final result and callback timings."""
+
+    def __init__(self) -> None:
+        self.result = None
+        self.error = None
+        self.first_partial_at: Optional[float] = None
+        self.final_at: Optional[float] = None
+
+    def onPartialTranscript(self, transcript):
+        if self.first_partial_at is None:
+            self.first_partial_at = time.perf_counter()
+
+    def onFinalResponse(self, response):
+        self.final_at = time.perf_counter()
+        self.result = response
+
+    def onError(self, error):
+        self.error = error
+
 
 class HoundifyClient:
     """
@@ -51,17 +120,47 @@ class HoundifyClient:
         )
     """
 
-    def __init__(self, client_id: str, client_key: str):
+    def __init__(
+        self,
+        client_id: str,
+        client_key: str,
+        executor: Optional[ThreadPoolExecutor] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_pacing: str = CHUNK_PACING_FAST,
+        sample_rate: int = 16000,
+        timeout: Optional[float] = None,
+        max_idle_clients: int = DEFAULT_MAX_IDLE_CLIENTS,
+    ):
         """
         Initialize the Houndify client using the official SDK.
 
         Args:
             client_id: Houndify client ID (from developer account)
             client_key: Houndify client key (from developer account)
+            executor: Thread pool for blocking SDK calls (default: shared
+                     pool from get_houndify_executor)
+            chunk_size: Bytes of PCM sent per fill() call
+            chunk_pacing: "fast" (no delay) or "realtime" (playback speed)
+            sample_rate: PCM sample rate (8000 or 16000), used for pacing
+            timeout: Socket timeout in seconds for streaming requests
+            max_idle_clients: Maximum idle streaming clients kept for reuse
         """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        if chunk_pacing not in CHUNK_PACING_MODES:
+            raise ValueError(f"chunk_pacing must be one of {CHUNK_PACING_MODES}")
+
         self.client_id = client_id
         self.client_key = client_key
         self.user_id = "voiceai_test_user"  # Default user ID
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.chunk_pacing = chunk_pacing
+        self.sample_rate = sample_rate
+        self.timeout = timeout
+        self.max_idle_clients = max_idle_clients
+        self._idle_streaming_clients: List[houndify.StreamingHoundClient] = []
+        self._idle_lock = threading.Lock()
 
         # Create official SDK client for text queries
         # Note: SDK uses positional arguments (clientID, clientKey, userID)
@@ -121,10 +220,9 @@ class HoundifyClient:
         try:
             # Use official SDK's query method (synchronous)
             # Note: The official SDK is synchronous, so we run it in executor
-            import asyncio
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
-                None,
+                self.executor or get_houndify_executor(),
                 self._text_client.query,
                 query
             )
@@ -147,13 +245,16 @@ class HoundifyClient:
         user_id: str,
         request_id: str,
         request_info: Optional[Dict[str, Any]] = None,
-        enable_partial_transcripts: bool = False
+        enable_partial_transcripts: bool = False,
+        chunk_pacing: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Send a voice query to Houndify API using the official SDK.
 
         This method sends audio data to the Houndify platform for speech recognition
-        and natural language understanding.
+        and natural language understanding. The blocking SDK call runs on the
+        dedicated Houndify executor, reusing an idle streaming client if one
+        is available.
 
         Args:
             audio_data: Raw audio data in bytes (must be pre-encoded to Houndify
@@ -163,11 +264,16 @@ class HoundifyClient:
             request_info: Optional dictionary with additional context
             enable_partial_transcripts: If True, request partial transcripts during
                                        processing (useful for real-time UI updates)
+            chunk_pacing: Override the client's chunk pacing for this request
+                         ("fast" or "realtime")
 
         Returns:
             Dictionary containing the Houndify response including:
                 - AllResults: List containing transcription and command results
                 - Status: Response status information
+                - ClientTiming: Timing breakdown measured by this client
+                  (connect_ms, fill_ms, time_to_first_partial_ms,
+                  time_to_final_ms, total_ms, chunk_pacing, chunk_size)
 
         Raises:
             HoundifyError: If the API request fails
@@ -183,6 +289,7 @@ class HoundifyClient:
                 request_id="req456",
                 enable_partial_transcripts=True
             )
+            print(response["ClientTiming"]["time_to_final_ms"])
         """
         if not audio_data:
             raise ValueError("Audio data is required")
@@ -191,6 +298,10 @@ class HoundifyClient:
         if not request_id:
             raise ValueError("Request ID is required")
 
+        pacing = chunk_pacing or self.chunk_pacing
+        if pacing not in CHUNK_PACING_MODES:
+            raise ValueError(f"chunk_pacing must be one of {CHUNK_PACING_MODES}")
+
         logger.info(
             f"[HOUNDIFY_CLIENT] Sending voice query - "
             f"audio_size={len(audio_data)} bytes, "
@@ -199,70 +310,28 @@ class HoundifyClient:
 
         try:
             # Build request info
-            if request_info is None:
-                request_info = {}
+            request_info = dict(request_info or {})
 
             # Add partial transcripts setting
             if enable_partial_transcripts:
                 request_info["PartialTranscriptsDesired"] = True
 
             # Use official SDK's StreamingHoundClient (synchronous)
-            # Run in executor to avoid blocking the event loop
-            import asyncio
-            import io
-
+            # Run in the dedicated executor to avoid blocking the event loop
             loop = asyncio.get_event_loop()
+            response = await loop.run_in_executor(
+                self.executor or get_houndify_executor(),
+                self._run_streaming_query,
+                audio_data,
+                user_id,
+                request_info,
+                pacing,
+            )
 
-            def _run_streaming_query():
-                """Run streaming query in synchronous context"""
-                # Create listener to capture results
-                class ResultListener(houndify.HoundListener):
-                    def __init__(self):
-                        self.result = None
-                        self.error = None
-
-                    def onFinalResponse(self, response):
-                        self.result = response
-
-                    def onError(self, error):
-                        self.error = error
-
-                listener = ResultListener()
-
-                # Create streaming client
-                streaming_client = houndify.StreamingHoundClient(
-                    self.client_id,
-                    self.client_key,
-                    user_id,
-                    requestInfo=request_info
-                )
-
-                # Start streaming
-                streaming_client.start(listener)
-
-                # Feed audio data in chunks (SDK expects streaming)
-                chunk_size = 8192  # 8KB chunks
-                audio_stream = io.BytesIO(audio_data)
-
-                while True:
-                    chunk = audio_stream.read(chunk_size)
-                    if not chunk:
-                        break
-                    streaming_client.fill(chunk)
-
-                # Finish streaming
-                streaming_client.finish()
-
-                # Return result or raise error
-                if listener.error:
-                    raise Exception(f"Houndify streaming error: {listener.error}")
-
-                return listener.result
-
-            # Run in executor
-            response = await loop.run_in_executor(None, _run_streaming_query)
-
-            logger.info(f"[HOUNDIFY_CLIENT] Voice query successful")
+            logger.info(
+                f"[HOUNDIFY_CLIENT] Voice query successful - "
+                f"timing={response.get('ClientTiming') if isinstance(response, dict) else None}"
+            )
             return response
 
         except Exception as e:
@@ -274,4 +343,101 @@ class HoundifyClient:
                 response=None
             ) from e
 
+    def _run_streaming_query(
+        self,
+        audio_data: bytes,
+        user_id: str,
+        request_info: Dict[str, Any],
+        chunk_pacing: str,
+    ) -> Dict[str, Any]:
+        """Run a streaming voice query synchronously (executor thread)."""
+        listener = _TimedResultListener()
+        streaming_client = self._acquire_streaming_client(user_id, request_info)
+        reusable = False
+
+        try:
+            request_start = time.perf_counter()
+
+            # Start streaming (opens the HTTP connection)
+            streaming_client.start(listener)
+            connected_at = time.perf_counter()
+
+            # Feed audio data in chunks (SDK expects streaming)
+            bytes_per_second = self.sample_rate * 2  # 16-bit mono
+            for offset in range(0, len(audio_data), self.chunk_size):
+                if chunk_pacing == CHUNK_PACING_REALTIME:
+                    # Sleep until this chunk's position in the audio timeline
+                    due_at = connected_at + offset / bytes_per_second
+                    delay = due_at - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                if streaming_client.fill(audio_data[offset:offset + self.chunk_size]):
+                    # Server detected end of speech; remaining audio is ignored
+                    break
+            filled_at = time.perf_counter()
+
+            # Finish streaming
+            streaming_client.finish()
+            finished_at = time.perf_counter()
+
+            # Return result or raise error
+            if listener.error:
+                raise Exception(f"Houndify streaming error: {listener.error}")
+            reusable = True
+
+            def elapsed_ms(since: float, until: Optional[float]) -> Optional[int]:
+                return None if until is None else int((until - since) * 1000)
+
+            response = dict(listener.result or {})
+            response["ClientTiming"] = {
+                "connect_ms": elapsed_ms(request_start, connected_at),
+                "fill_ms": elapsed_ms(connected_at, filled_at),
+                "time_to_first_partial_ms": elapsed_ms(request_start, listener.first_partial_at),
+                "time_to_final_ms": elapsed_ms(request_start, listener.final_at),
+                "total_ms": elapsed_ms(request_start, finished_at),
+                "chunk_pacing": chunk_pacing,
+                "chunk_size": self.chunk_size,
+            }
+            return response
+
+        finally:
+            if reusable:
+                self._release_streaming_client(streaming_client)
+
+    def _acquire_streaming_client(
+        self,
+        user_id: str,
+        request_info: Dict[str, Any],
+    ) -> houndify.StreamingHoundClient:
+        """Take an idle streaming client (or create one) configured for this request."""
+        with self._idle_lock:
+            streaming_client = (
+                self._idle_streaming_clients.pop() if self._idle_streaming_clients else None
+            )
+
+        if streaming_client is None:
+            streaming_client = houndify.StreamingHoundClient(
+                self.client_id,
+                self.client_key,
+                user_id,
+                requestInfo={},
+                sampleRate=self.sample_rate,
+                timeout=self.timeout,
+            )
+            streaming_client._base_request_info = dict(streaming_client.HoundRequestInfo)
+
+        # Reset per-request state left over from any previous request
+        streaming_client.userID = user_id
+        streaming_client.HoundRequestInfo = {
+            **streaming_client._base_request_info,
+            "UserID": user_id,
+            **request_info,
+        }
+        return streaming_client
+
+    def _release_streaming_client(self, streaming_client: houndify.StreamingHoundClient) -> None:
+        """Return a streaming client to the idle pool if there is room."""
+        with self._idle_lock:
+            if len(self._idle_streaming_clients) < self.max_idle_clients:
+                self._idle_streaming_clients.append(streaming_client)
 
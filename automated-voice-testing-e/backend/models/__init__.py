@@ -26,6 +26,7 @@ from models import (
     activity_log,  # noqa: F401
     comment,  # noqa: F401
     test_metric,  # noqa: F401
+    test_metric_rollup,  # noqa: F401 - hourly/daily metric rollups
     test_execution_queue,  # noqa: F401
     device_test_execution,  # noqa: F401
     escalation_policy,  # noqa: F401
@@ -40,6 +41,9 @@ from models import (
     integration_config,  # noqa: F401 - external service integrations (GitHub, Jira)
     category,  # noqa: F401 - scenario categories for organization
     pattern_analysis_config,  # noqa: F401 - pattern analysis configuration per tenant
+    edge_case_embedding,  # noqa: F401 - cached edge case utterance embeddings
+    llm_evaluation_cache,  # noqa: F401 - cached LLM judge evaluations
+    dashboard_counter,  # noqa: F401 - incrementally maintained dashboard counters
 )
 
 __version__ = "0.1.0"
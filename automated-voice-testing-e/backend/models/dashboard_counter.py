@@ -0,0 +1,263 @@
+"""
+SQLAlchemy model and flush hooks for incrementally maintained dashboard counters.
+
+The dashboard snapshot used to re-count executions, validation results,
+suite runs and queue items on every request. Instead, every ORM flush that
+inserts, deletes or changes the state of one of those rows applies +1/-1
+deltas to per-hour counter buckets, keyed by the hour the row was created
+in. Counting rows created in a window then becomes a sum over at most one
+bucket per hour of the window, independent of how much history exists.
+
+Counter names:
+    "<prefix>"                     rows created in the bucket
+    "<prefix>.<field>.<value>"     ...of which currently have field == value
+
+The validation queue is not tracked: every enqueue, claim and completion
+would upsert the same few gauge rows and serialise validators on them, so
+the dashboard counts pending items directly instead.
+
+Deltas are written in the flushing transaction, so they commit or roll
+back with the change itself. Bulk Core UPDATE/DELETE statements bypass the
+ORM and therefore the counters; so do database-level ON DELETE CASCADE
+deletes, except the ones listed in CASCADE_DELETES, whose child rows are
+counted down when the ORM deletes their parent. Anything else that removes
+tracked rows (e.g. scripts/cleanup_executions.py) must clear or adjust
+dashboard_counter_buckets itself.
+
+Call track_dashboard_counters(session_class) once to enable the hooks; the
+application's session class is registered in api.database.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+import sqlalchemy as sa
+from sqlalchemy import event, inspect
+from sqlalchemy.dialects import postgresql, sqlite
+
+from models.base import Base, GUID
+from models.multi_turn_execution import MultiTurnExecution
+from models.suite_run import SuiteRun
+from models.user import User
+from models.validation_result import ValidationResult
+
+# model -> (counter prefix, tracked state fields)
+TRACKED_MODELS: Dict[Type[Any], Tuple[str, Tuple[str, ...]]] = {
+    MultiTurnExecution: ("executions", ("status",)),
+    ValidationResult: ("validations", ("final_decision", "review_status")),
+    SuiteRun: ("suite_runs", ("status",)),
+}
+
+# parent model -> tracked (child model, foreign key attribute) pairs the
+# database deletes with the parent (ON DELETE CASCADE)
+CASCADE_DELETES: Dict[Type[Any], Tuple[Tuple[Type[Any], str], ...]] = {
+    User: ((MultiTurnExecution, "tenant_id"),),
+}
+
+_PENDING_DELTAS = "dashboard_counter_deltas"
+
+CounterKey = Tuple[str, datetime]
+
+
+class DashboardCounterBucket(Base):
+    """Count of rows created in one UTC hour, by counter name."""
+
+    __tablename__ = "dashboard_counter_buckets"
+    __table_args__ = (
+        sa.UniqueConstraint("counter", "bucket_start", name="uq_dashboard_counter_buckets_bucket"),
+    )
+
+    id = sa.Column(
+        GUID(),
+        primary_key=True,
+        default=uuid.uuid4,
+        nullable=False,
+        comment="Primary identifier for the counter bucket",
+    )
+
+    counter = sa.Column(
+        sa.String(length=100),
+        nullable=False,
+        comment="Counter name such as executions or executions.status.completed",
+    )
+
+    bucket_start = sa.Column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        comment="Start of the UTC hour the bucket covers",
+    )
+
+    value = sa.Column(
+        sa.BigInteger(),
+        nullable=False,
+        default=0,
+        comment="Counter value for the bucket",
+    )
+
+    updated_at = sa.Column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.func.now(),
+        onupdate=sa.func.now(),
+        comment="When the bucket was last updated",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<DashboardCounterBucket(counter='{self.counter}', "
+            f"bucket_start={self.bucket_start}, value={self.value})>"
+        )
+
+
+def counter_name(prefix: str, field: str, value: Any) -> str:
+    """Return the counter name for rows whose field has the given value."""
+    return f"{prefix}.{field}.{value}"
+
+
+def hour_bucket(value: datetime) -> datetime:
+    """Start of the UTC hour containing value (naive values are UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def track_dashboard_counters(session_class: Type[Any]) -> None:
+    """Maintain dashboard counters on every flush of sessions of session_class."""
+    if not event.contains(session_class, "before_flush", _before_flush):
+        event.listen(session_class, "before_flush", _before_flush)
+        event.listen(session_class, "after_flush", _after_flush)
+
+
+def _row_deltas(
+    model: Type[Any],
+    row: Any,
+    sign: int,
+    fields: Optional[Iterable[str]] = None,
+) -> List[Tuple[CounterKey, int]]:
+    """+sign deltas for the total and each state field of a stored row."""
+    prefix, tracked_fields = TRACKED_MODELS[model]
+    if row.created_at is None:
+        return []
+    bucket = hour_bucket(row.created_at)
+
+    deltas = [] if fields is not None else [((prefix, bucket), sign)]
+    for field in tracked_fields if fields is None else fields:
+        value = getattr(row, field)
+        if value is not None:
+            deltas.append(((counter_name(prefix, field, value), bucket), sign))
+    return deltas
+
+
+class _Values:
+    """Attribute access over a column-name mapping."""
+
+    def __init__(self, values: Dict[str, Any]):
+        self.__dict__.update(values)
+
+
+def _load_rows(connection: Any, model: Type[Any], ids: Iterable[Any]) -> Dict[Any, Any]:
+    _, fields = TRACKED_MODELS[model]
+    columns = [model.id, model.created_at] + [getattr(model, field) for field in fields]
+    result = connection.execute(sa.select(*columns).where(model.id.in_(list(ids))))
+    return {row.id: row for row in result}
+
+
+def _before_flush(session: Any, flush_context: Any, instances: Any) -> None:
+    """Capture the stored state of rows the flush will change or delete."""
+    changed: Dict[Type[Any], Dict[Any, Dict[str, Any]]] = defaultdict(dict)
+    deleted: Dict[Type[Any], set] = defaultdict(set)
+
+    for obj in session.dirty:
+        model = type(obj)
+        if model not in TRACKED_MODELS or obj in session.deleted:
+            continue
+        state = inspect(obj)
+        new_values = {
+            field: state.attrs[field].history.added[0]
+            for field in TRACKED_MODELS[model][1]
+            if state.attrs[field].history.added
+        }
+        if new_values and state.identity:
+            changed[model][state.identity[0]] = new_values
+
+    cascade_parents: Dict[Type[Any], List[Any]] = defaultdict(list)
+    for obj in session.deleted:
+        state = inspect(obj)
+        if type(obj) in TRACKED_MODELS and state.identity:
+            deleted[type(obj)].add(state.identity[0])
+        elif type(obj) in CASCADE_DELETES and state.identity:
+            cascade_parents[type(obj)].append(state.identity[0])
+
+    if not changed and not deleted and not cascade_parents:
+        return
+
+    connection = session.connection()
+    for parent, parent_ids in cascade_parents.items():
+        for model, foreign_key in CASCADE_DELETES[parent]:
+            result = connection.execute(sa.select(model.id).where(getattr(model, foreign_key).in_(parent_ids)))
+            deleted[model].update(result.scalars())
+
+    deltas = session.info.setdefault(_PENDING_DELTAS, [])
+    for model in set(changed) | set(deleted):
+        rows = _load_rows(connection, model, set(changed[model]) | deleted[model])
+        for row_id, new_values in changed[model].items():
+            row = rows.get(row_id)
+            if row is None or row_id in deleted[model]:
+                continue
+            fields = [field for field, value in new_values.items() if getattr(row, field) != value]
+            deltas.extend(_row_deltas(model, row, -1, fields))
+            updated = row._asdict()
+            updated.update(new_values)
+            deltas.extend(_row_deltas(model, _Values(updated), 1, fields))
+        for row_id in deleted[model]:
+            if row_id in rows:
+                deltas.extend(_row_deltas(model, rows[row_id], -1))
+
+
+def _after_flush(session: Any, flush_context: Any) -> None:
+    """Count inserted rows and write all pending deltas in this transaction."""
+    deltas = session.info.pop(_PENDING_DELTAS, [])
+    connection = session.connection()
+
+    inserted: Dict[Type[Any], List[Any]] = defaultdict(list)
+    for obj in session.new:
+        if type(obj) in TRACKED_MODELS and obj.id is not None:
+            inserted[type(obj)].append(obj.id)
+    for model, ids in inserted.items():
+        for row in _load_rows(connection, model, ids).values():
+            deltas.extend(_row_deltas(model, row, 1))
+
+    apply_counter_deltas(connection, deltas)
+
+
+def apply_counter_deltas(connection: Any, deltas: Iterable[Tuple[CounterKey, int]]) -> None:
+    """
+    Add deltas to their counter buckets with one upsert statement.
+
+    Deltas for the same bucket are combined first, and buckets are written
+    in key order so concurrent transactions lock them in the same order.
+    """
+    totals: Dict[CounterKey, int] = defaultdict(int)
+    for key, delta in deltas:
+        totals[key] += delta
+    rows = [
+        {"id": uuid.uuid4(), "counter": counter, "bucket_start": bucket, "value": value}
+        for (counter, bucket), value in sorted(totals.items())
+        if value
+    ]
+    if not rows:
+        return
+
+    dialect = connection.dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    table = DashboardCounterBucket.__table__
+    statement = insert(table).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.counter, table.c.bucket_start],
+        set_={"value": table.c.value + statement.excluded.value, "updated_at": sa.func.now()},
+    )
+    connection.execute(statement)
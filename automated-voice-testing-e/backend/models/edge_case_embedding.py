@@ -0,0 +1,81 @@
+"""
+EdgeCaseEmbedding SQLAlchemy model for cached utterance embeddings.
+
+Stores one sentence-transformer embedding per edge case so similarity
+lookups do not re-encode the corpus. Each row records a hash of the model
+name and utterance it was computed from; a mismatch means the utterance
+(or model) changed and the embedding must be recomputed.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import sqlalchemy as sa
+
+from models.base import Base, GUID
+
+
+class EdgeCaseEmbedding(Base):
+    """ORM representation of a cached edge case utterance embedding."""
+
+    __test__ = False  # Prevent pytest auto-discovery
+    __tablename__ = "edge_case_embeddings"
+
+    edge_case_id = sa.Column(
+        GUID(),
+        sa.ForeignKey("edge_cases.id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        comment="Edge case the embedding belongs to",
+    )
+
+    model_name = sa.Column(
+        sa.String(length=255),
+        nullable=False,
+        comment="Sentence transformer model used to compute the embedding",
+    )
+
+    content_hash = sa.Column(
+        sa.String(length=64),
+        nullable=False,
+        comment="SHA-256 of model name and utterance; mismatch invalidates the row",
+    )
+
+    dimensions = sa.Column(
+        sa.Integer(),
+        nullable=False,
+        comment="Number of float32 components in the embedding",
+    )
+
+    embedding = sa.Column(
+        sa.LargeBinary(),
+        nullable=False,
+        comment="L2-normalised float32 embedding (little-endian bytes)",
+    )
+
+    updated_at = sa.Column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.func.now(),
+        onupdate=sa.func.now(),
+        comment="Timestamp when the embedding was last computed",
+    )
+
+    def __repr__(self) -> str:
+        """Readable representation useful for debugging."""
+        return f"<EdgeCaseEmbedding(edge_case_id={self.edge_case_id}, dims={self.dimensions})>"
+
+    @property
+    def vector(self) -> Optional[np.ndarray]:
+        """Embedding as a float32 array (None if the stored bytes are malformed)."""
+        if not self.embedding:
+            return None
+        vector = np.frombuffer(self.embedding, dtype="<f4")
+        return vector if len(vector) == self.dimensions else None
+
+    @staticmethod
+    def encode_vector(vector: np.ndarray) -> bytes:
+        """Serialise a vector for the embedding column."""
+        return np.asarray(vector, dtype="<f4").tobytes()
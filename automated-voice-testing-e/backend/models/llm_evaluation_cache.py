@@ -0,0 +1,99 @@
+"""
+LLMEvaluationCacheEntry SQLAlchemy model for cached LLM judge evaluations.
+
+Durable tier of the LLM evaluation cache (see services/llm_evaluation_cache.py).
+Each row holds the parsed result of one evaluator or curator call, keyed by a
+SHA-256 of the exact request sent to the provider, together with the token
+usage and cost the original call incurred. The prompt-template version and
+model are stored so entries can be invalidated when either changes.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+from models.base import Base
+
+# Use JSONB for PostgreSQL, JSON for SQLite (testing)
+JSONB_TYPE = JSONB().with_variant(JSON(), "sqlite")
+
+
+class LLMEvaluationCacheEntry(Base):
+    """ORM representation of one cached LLM evaluation."""
+
+    __test__ = False  # Prevent pytest auto-discovery
+    __tablename__ = "llm_evaluation_cache"
+
+    cache_key = sa.Column(
+        sa.String(length=64),
+        primary_key=True,
+        nullable=False,
+        comment="SHA-256 of provider, model, sampling settings and prompts",
+    )
+
+    provider = sa.Column(
+        sa.String(length=50),
+        nullable=False,
+        comment="API provider that produced the evaluation",
+    )
+
+    model = sa.Column(
+        sa.String(length=100),
+        nullable=False,
+        index=True,
+        comment="LLM model that produced the evaluation",
+    )
+
+    prompt_version = sa.Column(
+        sa.String(length=16),
+        nullable=False,
+        index=True,
+        comment="Fingerprint of the prompt template and system prompt used",
+    )
+
+    result = sa.Column(
+        JSONB_TYPE,
+        nullable=False,
+        comment="Parsed evaluation (scores, overall_score, decision, reasoning)",
+    )
+
+    prompt_tokens = sa.Column(
+        sa.Integer(),
+        nullable=False,
+        default=0,
+        comment="Prompt tokens used by the original call",
+    )
+
+    completion_tokens = sa.Column(
+        sa.Integer(),
+        nullable=False,
+        default=0,
+        comment="Completion tokens used by the original call",
+    )
+
+    cost_usd = sa.Column(
+        sa.Numeric(precision=10, scale=6),
+        nullable=False,
+        default=0,
+        comment="Estimated cost in USD of the original call",
+    )
+
+    created_at = sa.Column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.func.now(),
+        comment="When the evaluation was cached",
+    )
+
+    expires_at = sa.Column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        index=True,
+        comment="When the entry stops being served",
+    )
+
+    def __repr__(self) -> str:
+        """Readable representation useful for debugging."""
+        return f"<LLMEvaluationCacheEntry(cache_key={self.cache_key[:12]}, model={self.model})>"
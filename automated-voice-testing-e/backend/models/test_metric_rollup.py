@@ -0,0 +1,131 @@
+"""
+SQLAlchemy models for hourly and daily rollups of test metrics.
+
+Each rollup row summarises every TestMetric point of one metric_type and
+dimension set inside one hour or day bucket: count, sum, min, max and a
+mergeable quantile sketch (services/quantile_sketch.py). Rollups are kept
+up to date by MetricsService.record_metric and let get_metrics answer long
+windows without scanning raw points.
+
+High-cardinality dimensions (execution_id) are dropped before rolling up,
+so queries filtering on them are served from test_metrics.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any, Dict
+
+import sqlalchemy as sa
+from sqlalchemy.orm import declared_attr
+
+from models.base import Base, GUID
+from models.test_metric import DIMENSIONS_TYPE
+
+
+class _MetricRollupMixin:
+    """Columns shared by the hourly and daily rollup tables."""
+
+    __test__ = False  # Prevent pytest from collecting as a test case
+
+    id = sa.Column(
+        GUID(),
+        primary_key=True,
+        default=uuid.uuid4,
+        nullable=False,
+        comment="Primary identifier for the rollup bucket",
+    )
+
+    metric_type = sa.Column(
+        sa.String(length=100),
+        nullable=False,
+        comment="Metric name such as execution_time or pass_rate",
+    )
+
+    bucket_start = sa.Column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        comment="Start of the UTC hour or day the bucket covers",
+    )
+
+    dimensions = sa.Column(
+        DIMENSIONS_TYPE,
+        nullable=False,
+        default=dict,
+        comment="Dimension key/value pairs, without high-cardinality keys",
+    )
+
+    count = sa.Column(
+        sa.BigInteger(),
+        nullable=False,
+        default=0,
+        comment="Number of metric points in the bucket",
+    )
+
+    value_sum = sa.Column(
+        sa.Numeric(precision=20, scale=2),
+        nullable=False,
+        default=0,
+        comment="Sum of metric values in the bucket",
+    )
+
+    value_min = sa.Column(
+        sa.Numeric(precision=10, scale=2),
+        nullable=True,
+        comment="Smallest metric value in the bucket",
+    )
+
+    value_max = sa.Column(
+        sa.Numeric(precision=10, scale=2),
+        nullable=True,
+        comment="Largest metric value in the bucket",
+    )
+
+    sketch = sa.Column(
+        DIMENSIONS_TYPE,
+        nullable=True,
+        comment="Mergeable quantile sketch of the bucket's values",
+    )
+
+    updated_at = sa.Column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.func.now(),
+        onupdate=sa.func.now(),
+        comment="When the bucket was last updated",
+    )
+
+    @declared_attr.directive
+    def __table_args__(cls):
+        return (
+            sa.UniqueConstraint(
+                "metric_type", "bucket_start", "dimensions",
+                name=f"uq_{cls.__tablename__}_bucket",
+            ),
+            sa.Index(f"ix_{cls.__tablename__}_type_bucket", "metric_type", "bucket_start"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a serialisable representation of the rollup bucket."""
+        return {
+            "id": str(self.id),
+            "metric_type": self.metric_type,
+            "bucket_start": self.bucket_start.isoformat() if self.bucket_start else None,
+            "dimensions": dict(self.dimensions or {}),
+            "count": int(self.count or 0),
+            "value_sum": float(self.value_sum or 0),
+            "value_min": float(self.value_min) if self.value_min is not None else None,
+            "value_max": float(self.value_max) if self.value_max is not None else None,
+        }
+
+
+class TestMetricHourlyRollup(_MetricRollupMixin, Base):
+    """Per-hour rollup of test metric points."""
+
+    __tablename__ = "test_metric_rollups_hourly"
+
+
+class TestMetricDailyRollup(_MetricRollupMixin, Base):
+    """Per-day rollup of test metric points."""
+
+    __tablename__ = "test_metric_rollups_daily"
@@ -41,7 +41,7 @@ Example:
 
 from typing import Optional
 
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Numeric, Index
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Numeric, Index, text
 
 from sqlalchemy.orm import relationship
 
@@ -97,6 +97,14 @@ class ValidationQueue(Base, BaseModel):
 
     __table_args__ = (
         Index('ix_validation_queue_validation_result_id_status', 'validation_result_id', 'status'),
+        # Claim order of pending tasks (ValidationQueueService.claim_next)
+        Index(
+            'ix_validation_queue_pending_priority',
+            'priority',
+            'created_at',
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
     )
 
     # Foreign key to validation result
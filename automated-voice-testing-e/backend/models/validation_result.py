@@ -19,6 +19,8 @@ Validation Architecture:
     3. Combined Decision:
        - final_decision: pass, fail, or uncertain
        - review_status: auto_pass, auto_fail, or needs_review
+       - decision_path: how much LLM evaluation the decision needed
+         (see services/validation_decision_policy.py)
 
 Example:
     >>> result = ValidationResult(
@@ -184,6 +186,13 @@ class ValidationResult(Base, BaseModel):
         comment="Language code validated (e.g., en-US, es-ES, fr-FR)"
     )
 
+    decision_path = Column(
+        String(32),
+        nullable=True,
+        index=True,
+        comment="Validation path: deterministic_pass, deterministic_fail, single_evaluator, dual_evaluator, houndify_only"
+    )
+
     # Relationships
     suite_run = relationship(
         'SuiteRun',
@@ -255,6 +264,7 @@ class ValidationResult(Base, BaseModel):
             'llm_passed': self.llm_passed,
             'final_decision': self.final_decision,
             'review_status': self.review_status,
+            'decision_path': self.decision_path,
             'command_kind_match_score': self.command_kind_match_score,
             'asr_confidence_score': self.asr_confidence_score,
         }
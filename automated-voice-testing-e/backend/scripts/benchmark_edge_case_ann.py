@@ -0,0 +1,140 @@
+"""
+Edge Case ANN Index Benchmark
+
+Compares the IVF vector index used for edge case and pattern-group
+matching against the exact brute-force scan it replaces:
+
+- build:  time to add the corpus (including k-means training)
+- exact:  full matrix-vector scan per query (previous behaviour)
+- ann:    IVF search at several nprobe values, with recall@k against exact
+
+The corpus is synthetic: unit vectors drawn around cluster centres, which
+mimics sentence embeddings of utterances that share failure patterns.
+No database or embedding model is needed.
+
+Usage:
+    python -m scripts.benchmark_edge_case_ann
+    python -m scripts.benchmark_edge_case_ann --corpus 200000 --nprobe 4 8 16 32
+"""
+
+import argparse
+import statistics
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from services.edge_case_vector_index import VectorIndex
+
+
+def _normalise(vectors: np.ndarray) -> np.ndarray:
+    return (vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)).astype(np.float32)
+
+
+def make_corpus(size: int, dimensions: int, clusters: int, seed: int = 0) -> np.ndarray:
+    """Unit vectors scattered around random cluster centres."""
+    rng = np.random.default_rng(seed)
+    centres = _normalise(rng.standard_normal((clusters, dimensions)))
+    labels = rng.integers(0, clusters, size)
+    noise = rng.standard_normal((size, dimensions)).astype(np.float32) * 0.06
+    return _normalise(centres[labels] + noise)
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "mean_ms": statistics.mean(samples),
+        "p95_ms": ordered[int(0.95 * (len(ordered) - 1))],
+    }
+
+
+def run_benchmark(
+    corpus_size: int = 50000,
+    dimensions: int = 384,
+    clusters: int = 500,
+    queries: int = 200,
+    k: int = 20,
+    nprobes: List[int] = (1, 4, 8, 16, 32)
+) -> Dict[str, Dict[str, float]]:
+    """
+    Run the exact vs IVF comparison.
+
+    Args:
+        corpus_size: Number of indexed vectors
+        dimensions: Embedding dimensionality (384 = all-MiniLM-L6-v2)
+        clusters: Number of synthetic utterance clusters
+        queries: Number of timed queries
+        k: Neighbours requested per query
+        nprobes: nprobe values to evaluate
+
+    Returns:
+        Dictionary of results keyed by scenario
+    """
+    corpus = make_corpus(corpus_size, dimensions, clusters)
+    rng = np.random.default_rng(1)
+    query_vectors = _normalise(
+        corpus[rng.integers(0, corpus_size, queries)]
+        + rng.standard_normal((queries, dimensions)).astype(np.float32) * 0.03
+    )
+
+    index = VectorIndex(dimensions)
+    start = time.perf_counter()
+    # Add in batches, as new edge cases arrive
+    for offset in range(0, corpus_size, 5000):
+        ids = [f"case-{i}" for i in range(offset, min(offset + 5000, corpus_size))]
+        index.add(ids, corpus[offset:offset + len(ids)])
+    results: Dict[str, Dict[str, float]] = {
+        "build": {"seconds": time.perf_counter() - start, "lists": index.nlist}
+    }
+
+    truth = []
+    samples = []
+    for query in query_vectors:
+        start = time.perf_counter()
+        truth.append({item_id for item_id, _ in index.search_exact(query, k)})
+        samples.append((time.perf_counter() - start) * 1000)
+    results["exact"] = {**_summarize(samples), "recall": 1.0}
+
+    for nprobe in nprobes:
+        samples = []
+        hits = 0
+        for query, expected in zip(query_vectors, truth):
+            start = time.perf_counter()
+            found = index.search(query, k, nprobe=nprobe)
+            samples.append((time.perf_counter() - start) * 1000)
+            hits += len(expected & {item_id for item_id, _ in found})
+        results[f"ann_nprobe_{nprobe}"] = {**_summarize(samples), "recall": hits / (k * queries)}
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", type=int, default=50000, help="indexed vectors (default: 50000)")
+    parser.add_argument("--dimensions", type=int, default=384, help="vector dimensions (default: 384)")
+    parser.add_argument("--queries", type=int, default=200, help="timed queries (default: 200)")
+    parser.add_argument("--k", type=int, default=20, help="neighbours per query (default: 20)")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32], help="nprobe values")
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        corpus_size=args.corpus,
+        dimensions=args.dimensions,
+        queries=args.queries,
+        k=args.k,
+        nprobes=args.nprobe,
+    )
+
+    build = results.pop("build")
+    print(f"Corpus: {args.corpus} x {args.dimensions}, k={args.k}")
+    print(f"Build:  {build['seconds']:.2f}s ({build['lists']} lists)\n")
+    print(f"{'scenario':<16}{'mean ms':>10}{'p95 ms':>10}{'recall':>10}")
+    for scenario, summary in results.items():
+        print(
+            f"{scenario:<16}{summary['mean_ms']:>10.3f}"
+            f"{summary['p95_ms']:>10.3f}{summary['recall']:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Metric Ingestion Benchmark
+
+Compares metric ingestion throughput (metrics per second) of:
+
+- per_point: MetricsService.record_metric, one transaction per datapoint
+  (previous behaviour)
+- writer:    MetricWriter, buffered and written in batches with
+  MetricsService.record_metrics
+
+Producers emit the dimension sets ExecutionMetricsRecorder uses (a raw
+point per execution plus hour/day aggregation points). Both scenarios
+include the hourly/daily rollup updates.
+
+Runs against an in-memory SQLite database by default; pass --database-url
+(e.g. postgresql+asyncpg://...) to measure a real server. The tables are
+created if missing and the rows written by the benchmark are deleted.
+
+Usage:
+    python -m scripts.benchmark_metric_ingestion
+    python -m scripts.benchmark_metric_ingestion --points 20000 --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from models.base import Base
+from models.test_metric import TestMetric
+from models.test_metric_rollup import TestMetricDailyRollup, TestMetricHourlyRollup
+from services.metric_writer import MetricWriter
+from services.metrics_service import MetricsService
+
+METRIC_TABLES = [
+    TestMetric.__table__,
+    TestMetricHourlyRollup.__table__,
+    TestMetricDailyRollup.__table__,
+]
+
+METRIC_TYPES = ("execution_time", "response_time", "validation_confidence", "validation_pass")
+
+
+def _point(index: int, run_tag: str, start: datetime) -> Dict:
+    execution = index // len(METRIC_TYPES)
+    return {
+        "metric_type": METRIC_TYPES[index % len(METRIC_TYPES)],
+        "metric_value": (index * 37 % 1000) / 100.0,
+        "dimensions": {
+            "aggregation": "raw",
+            "benchmark_run": run_tag,
+            "suite_run_id": f"suite-{execution // 50}",
+            "execution_id": f"execution-{execution}",
+        },
+        "timestamp": start + timedelta(seconds=execution),
+    }
+
+
+async def _per_point(session_factory, points: int, run_tag: str, start: datetime) -> float:
+    begin = time.perf_counter()
+    async with session_factory() as session:
+        service = MetricsService(session)
+        for index in range(points):
+            await service.record_metric(**_point(index, run_tag, start))
+    return time.perf_counter() - begin
+
+
+async def _writer(
+    session_factory,
+    points: int,
+    run_tag: str,
+    start: datetime,
+    batch_size: int,
+    producers: int,
+) -> float:
+    writer = MetricWriter(
+        session_factory=session_factory,
+        max_batch_size=batch_size,
+        flush_interval_seconds=0.05,
+        max_queue_size=batch_size * 4,
+    )
+
+    async def produce(offset: int) -> None:
+        for index in range(offset, points, producers):
+            await writer.record_metric(**_point(index, run_tag, start))
+
+    begin = time.perf_counter()
+    await asyncio.gather(*(produce(offset) for offset in range(producers)))
+    await writer.close()
+    return time.perf_counter() - begin
+
+
+async def run_benchmark(
+    database_url: str = "sqlite+aiosqlite:///:memory:",
+    points: int = 5000,
+    batch_size: int = 500,
+    producers: int = 8,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Run the per-point vs batched ingestion comparison.
+
+    Args:
+        database_url: Async SQLAlchemy URL of the target database
+        points: Metric points written per scenario
+        batch_size: MetricWriter batch size
+        producers: Concurrent producer coroutines feeding the writer
+
+    Returns:
+        Dictionary of results keyed by scenario
+    """
+    engine_kwargs = {"poolclass": sa.pool.StaticPool} if database_url.startswith("sqlite") else {}
+    engine = create_async_engine(database_url, **engine_kwargs)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=METRIC_TABLES)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    run_tag = uuid.uuid4().hex
+    start = datetime.now(timezone.utc).replace(microsecond=0)
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        for scenario in ("per_point", "writer"):
+            tag = f"{run_tag}-{scenario}"
+            if scenario == "per_point":
+                seconds = await _per_point(session_factory, points, tag, start)
+            else:
+                seconds = await _writer(session_factory, points, tag, start, batch_size, producers)
+            results[scenario] = {"seconds": seconds, "metrics_per_second": points / seconds}
+    finally:
+        await _cleanup(session_factory, run_tag)
+        await engine.dispose()
+
+    return results
+
+
+async def _cleanup(session_factory, run_tag: str) -> None:
+    async with session_factory() as session:
+        await session.execute(
+            sa.delete(TestMetric).where(
+                TestMetric.dimensions["benchmark_run"].as_string().like(f"{run_tag}%")
+            )
+        )
+        for model in (TestMetricHourlyRollup, TestMetricDailyRollup):
+            await session.execute(
+                sa.delete(model).where(model.dimensions["benchmark_run"].as_string().like(f"{run_tag}%"))
+            )
+        await session.commit()
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///:memory:", help="async database URL")
+    parser.add_argument("--points", type=int, default=5000, help="metric points per scenario (default: 5000)")
+    parser.add_argument("--batch-size", type=int, default=500, help="writer batch size (default: 500)")
+    parser.add_argument("--producers", type=int, default=8, help="concurrent producers (default: 8)")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run_benchmark(
+        database_url=args.database_url,
+        points=args.points,
+        batch_size=args.batch_size,
+        producers=args.producers,
+    ))
+
+    print(f"Points: {args.points}, batch size: {args.batch_size}, producers: {args.producers}\n")
+    print(f"{'scenario':<12}{'seconds':>10}{'metrics/s':>12}")
+    for scenario, summary in results.items():
+        print(f"{scenario:<12}{summary['seconds']:>10.2f}{summary['metrics_per_second']:>12.0f}")
+    speedup = results["writer"]["metrics_per_second"] / results["per_point"]["metrics_per_second"]
+    print(f"\nSpeedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
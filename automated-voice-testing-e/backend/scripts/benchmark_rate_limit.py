@@ -0,0 +1,172 @@
+"""
+Rate Limit Middleware Overhead Benchmark
+
+Times the rate limit check that runs before every /api/ request and
+compares:
+
+- fixed_window:   previous behaviour; GET of a JSON counter, then SET
+  (two round trips, and concurrent requests can both read the same count)
+- sliding_window: enforce_rate_limit, one EVALSHA of the sliding window
+  script per request
+- in_process:     enforce_rate_limit's fallback while Redis is unavailable
+
+For each scenario it reports mean and p99 overhead per request over
+sequential requests, then fires a concurrent burst from one caller and
+reports how many requests were admitted against the limit (the fixed
+window admits more than the limit when requests race).
+
+Needs a running Redis; keys are written under rate-limit-benchmark:* and
+expire after the window.
+
+Usage:
+    python -m scripts.benchmark_rate_limit --redis-url redis://localhost:6379/0
+    python -m scripts.benchmark_rate_limit --redis-url ... --requests 5000 --burst 500 --limit 100
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from api import rate_limit
+from api.redis_client import RedisClient
+from api.rate_limit import LocalRateLimiter, RateLimitExceeded
+
+KEY_PREFIX = "rate-limit-benchmark"
+
+
+async def _fixed_window(redis: RedisClient, cache_key: str, limit: int, window_seconds: int) -> None:
+    """The GET/SET fixed window check enforce_rate_limit used previously."""
+    now = int(time.time())
+    existing = await redis.get(cache_key)
+    if existing is None:
+        await redis.set(cache_key, json.dumps({"count": 1, "reset": now + window_seconds}), ttl=window_seconds)
+        return
+
+    data = json.loads(existing)
+    count, reset_ts = int(data["count"]), int(data["reset"])
+    if now >= reset_ts:
+        await redis.set(cache_key, json.dumps({"count": 1, "reset": now + window_seconds}), ttl=window_seconds)
+        return
+    if count >= limit:
+        raise RateLimitExceeded(retry_after=reset_ts - now)
+    await redis.set(
+        cache_key, json.dumps({"count": count + 1, "reset": reset_ts}), ttl=max(1, reset_ts - now)
+    )
+
+
+async def _sliding_window(redis: RedisClient, cache_key: str, limit: int, window_seconds: int) -> None:
+    allowed, _ = await rate_limit._redis_hit(cache_key, limit, window_seconds * 1000, int(time.time() * 1000))
+    if not allowed:
+        raise RateLimitExceeded(retry_after=1)
+
+
+async def _in_process(redis: RedisClient, cache_key: str, limit: int, window_seconds: int) -> None:
+    allowed, _ = rate_limit._local_limiter.hit(cache_key, limit, window_seconds * 1000, int(time.time() * 1000))
+    if not allowed:
+        raise RateLimitExceeded(retry_after=1)
+
+
+SCENARIOS = {
+    "fixed_window": _fixed_window,
+    "sliding_window": _sliding_window,
+    "in_process": _in_process,
+}
+
+
+async def _attempt(check, redis: RedisClient, cache_key: str, limit: int, window_seconds: int) -> bool:
+    try:
+        await check(redis, cache_key, limit, window_seconds)
+        return True
+    except RateLimitExceeded:
+        return False
+
+
+async def run_benchmark(
+    redis_url: str,
+    requests: int = 2000,
+    burst: int = 200,
+    limit: int = 50,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Run the rate limit overhead and burst comparison.
+
+    Args:
+        redis_url: Redis connection URL
+        requests: Sequential requests timed per scenario (distinct callers,
+            so none are limited)
+        burst: Concurrent requests from one caller per scenario
+        limit: Requests per window for the burst
+
+    Returns:
+        Dictionary of results keyed by scenario
+    """
+    redis = RedisClient(redis_url=redis_url, max_connections=max(burst, 10))
+    await redis.connect()
+
+    async def benchmark_get_redis():
+        yield redis
+
+    rate_limit.get_redis = benchmark_get_redis
+    rate_limit._local_limiter = LocalRateLimiter()
+    run_id = uuid.uuid4().hex
+    window_seconds = 60
+
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        for scenario, check in SCENARIOS.items():
+            # Warm up connections and the server's script cache
+            await _attempt(check, redis, f"{KEY_PREFIX}:{run_id}:{scenario}:warmup", limit, window_seconds)
+
+            timings: List[float] = []
+            for index in range(requests):
+                cache_key = f"{KEY_PREFIX}:{run_id}:{scenario}:caller-{index}"
+                begin = time.perf_counter()
+                await _attempt(check, redis, cache_key, requests, window_seconds)
+                timings.append((time.perf_counter() - begin) * 1000)
+
+            burst_key = f"{KEY_PREFIX}:{run_id}:{scenario}:burst"
+            admitted = await asyncio.gather(*[
+                _attempt(check, redis, burst_key, limit, window_seconds) for _ in range(burst)
+            ])
+
+            results[scenario] = {
+                "mean_ms": statistics.fmean(timings),
+                "p99_ms": statistics.quantiles(timings, n=100)[98],
+                "admitted": sum(admitted),
+            }
+    finally:
+        await redis.disconnect()
+
+    return results
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--redis-url", required=True, help="Redis URL (redis://host:port/db)")
+    parser.add_argument("--requests", type=int, default=2000, help="sequential requests per scenario (default: 2000)")
+    parser.add_argument("--burst", type=int, default=200, help="concurrent requests from one caller (default: 200)")
+    parser.add_argument("--limit", type=int, default=50, help="requests per window for the burst (default: 50)")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run_benchmark(
+        redis_url=args.redis_url,
+        requests=args.requests,
+        burst=args.burst,
+        limit=args.limit,
+    ))
+
+    print(f"Requests: {args.requests}, burst: {args.burst}, limit: {args.limit}\n")
+    print(f"{'scenario':<16}{'mean ms':>10}{'p99 ms':>10}{'admitted':>10}")
+    for scenario, summary in results.items():
+        print(
+            f"{scenario:<16}{summary['mean_ms']:>10.3f}{summary['p99_ms']:>10.3f}"
+            f"{summary['admitted']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+TTS/PCM Cache Benchmark
+
+Measures the audio preparation part of a multi-turn step (TTS + raw PCM
+conversion for Houndify) in three situations:
+
+- cold:   empty cache, gTTS synthesis plus ffmpeg decode
+- legacy: MP3 served from the TTS cache but re-decoded through
+          convert_to_pcm on every run (behaviour before the PCM cache)
+- warm:   decoded PCM served from the derived-artifact cache
+
+Requires network access for gTTS and ffmpeg for pydub, the same as a
+real execution worker.
+
+Usage:
+    python -m scripts.benchmark_tts_pcm_cache
+    python -m scripts.benchmark_tts_pcm_cache --iterations 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from services.audio_utils import convert_to_pcm
+from services.tts_service import TTSService
+
+
+# Representative step utterances (language code, text)
+BENCHMARK_UTTERANCES: List[Tuple[str, str]] = [
+    ("en", "What's the weather like in San Francisco tomorrow?"),
+    ("fr", "Quel temps fera-t-il demain à Paris ?"),
+    ("es", "Pon la temperatura a veintidós grados"),
+    ("de", "Navigiere zum nächsten Parkhaus"),
+    ("it", "Chiama la mamma sul cellulare"),
+    ("ja", "次のガソリンスタンドはどこですか"),
+]
+
+
+async def _prepare_step_legacy(tts: TTSService) -> None:
+    for lang, text in BENCHMARK_UTTERANCES:
+        mp3 = await tts.text_to_speech_async(text, lang)
+        await asyncio.to_thread(convert_to_pcm, mp3, target_rate=16000, raw=True)
+
+
+async def _prepare_step_cached(tts: TTSService) -> None:
+    for lang, text in BENCHMARK_UTTERANCES:
+        await tts.synthesize_pcm_async(text, lang, target_rate=16000)
+
+
+async def _time_ms(coro) -> float:
+    start = time.perf_counter()
+    await coro
+    return (time.perf_counter() - start) * 1000
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "mean_ms": statistics.mean(samples),
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "max_ms": max(samples),
+    }
+
+
+async def run_benchmark(iterations: int = 5) -> Dict[str, Dict[str, float]]:
+    """
+    Run the cold/legacy/warm comparison.
+
+    Each iteration uses a fresh TTSService so the in-process LRU is empty and
+    only the on-disk caches carry over, matching a new worker process.
+
+    Args:
+        iterations: Number of timed legacy and warm runs
+
+    Returns:
+        Dictionary of timing summaries keyed by scenario
+    """
+    with tempfile.TemporaryDirectory(prefix="tts_bench_") as cache_dir:
+        cache_path = Path(cache_dir)
+
+        cold = await _time_ms(_prepare_step_cached(TTSService(cache_dir=cache_path)))
+
+        legacy = [
+            await _time_ms(_prepare_step_legacy(TTSService(cache_dir=cache_path)))
+            for _ in range(iterations)
+        ]
+        warm = [
+            await _time_ms(_prepare_step_cached(TTSService(cache_dir=cache_path)))
+            for _ in range(iterations)
+        ]
+
+    return {
+        "cold": _summarize([cold]),
+        "legacy": _summarize(legacy),
+        "warm": _summarize(warm),
+    }
+
+
+def print_report(results: Dict[str, Dict[str, float]]) -> None:
+    """Print benchmark results as a table."""
+    print(f"\nStep audio preparation ({len(BENCHMARK_UTTERANCES)} language variants)")
+    print(f"{'scenario':<10}{'mean':>12}{'median':>12}{'min':>12}{'max':>12}")
+    for name, summary in results.items():
+        print(
+            f"{name:<10}"
+            f"{summary['mean_ms']:>10.1f}ms"
+            f"{summary['median_ms']:>10.1f}ms"
+            f"{summary['min_ms']:>10.1f}ms"
+            f"{summary['max_ms']:>10.1f}ms"
+        )
+
+    legacy_mean = results["legacy"]["mean_ms"]
+    warm_mean = results["warm"]["mean_ms"]
+    if warm_mean > 0:
+        print(f"\nWarm PCM cache speedup over re-decoding: {legacy_mean / warm_mean:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5, help="Timed runs per scenario")
+    args = parser.parse_args()
+
+    print_report(asyncio.run(run_benchmark(args.iterations)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Validation Queue Claim Contention Benchmark
+
+Drains a seeded validation queue with many concurrent validators and
+compares:
+
+- two_step:   get_next_validation then claim_validation (previous
+  behaviour); validators polling at once receive the same task and all
+  but one claim fails
+- claim_next: ValidationQueueService.claim_next, one SELECT ... FOR UPDATE
+  SKIP LOCKED transaction per claim
+
+For each scenario it reports wall time, claims per second, failed claim
+attempts and tasks claimed more than once (must be 0).
+
+Row locking is what is being measured, so this needs a PostgreSQL
+database with the schema migrated (alembic upgrade head). The queue items
+and validation results created by the benchmark are deleted afterwards.
+
+Usage:
+    python -m scripts.benchmark_validation_queue_claims --database-url postgresql+asyncpg://...
+    python -m scripts.benchmark_validation_queue_claims --database-url ... --validators 100 --tasks 2000 --batch-size 5
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections import Counter
+from typing import Dict, List, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from models.validation_queue import ValidationQueue
+from models.validation_result import ValidationResult
+from services.validation_queue_service import ValidationQueueService
+
+
+async def _seed(session_factory, tasks: int) -> List[uuid.UUID]:
+    result_ids = [uuid.uuid4() for _ in range(tasks)]
+    async with session_factory() as session:
+        await session.execute(sa.insert(ValidationResult), [
+            {"id": result_id, "final_decision": "uncertain", "review_status": "needs_review"}
+            for result_id in result_ids
+        ])
+        await session.execute(sa.insert(ValidationQueue), [
+            {
+                "id": uuid.uuid4(),
+                "validation_result_id": result_id,
+                "priority": index % 10 + 1,
+                "language_code": "en-US" if index % 2 else "es-MX",
+                "status": "pending",
+                "requires_native_speaker": False,
+            }
+            for index, result_id in enumerate(result_ids)
+        ])
+        await session.commit()
+    return result_ids
+
+
+async def _two_step(session_factory, validator_id: uuid.UUID, claims: List, stats: Counter) -> None:
+    service = ValidationQueueService()
+    async with session_factory() as session:
+        while True:
+            task = await service.get_next_validation(session, validator_id)
+            if task is None:
+                return
+            task_id = task.id
+            if await service.claim_validation(session, task_id, validator_id):
+                claims.append(task_id)
+            else:
+                stats["failed_claims"] += 1
+
+
+async def _claim_next(
+    session_factory,
+    validator_id: uuid.UUID,
+    claims: List,
+    batch_size: int,
+) -> None:
+    service = ValidationQueueService()
+    language_code = "es" if validator_id.int % 2 else "en"
+    async with session_factory() as session:
+        while True:
+            tasks = await service.claim_next(session, validator_id, language_code=language_code, limit=batch_size)
+            if not tasks:
+                return
+            claims.extend(task.id for task in tasks)
+
+
+async def _reset(session_factory, result_ids: List[uuid.UUID]) -> None:
+    async with session_factory() as session:
+        await session.execute(
+            sa.update(ValidationQueue)
+            .where(ValidationQueue.validation_result_id.in_(result_ids))
+            .values(status="pending", claimed_by=None, claimed_at=None)
+        )
+        await session.commit()
+
+
+async def run_benchmark(
+    database_url: str,
+    validators: int = 100,
+    tasks: int = 2000,
+    batch_size: int = 1,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Run the two-step vs claim_next contention comparison.
+
+    Args:
+        database_url: Async SQLAlchemy URL of a migrated PostgreSQL database
+        validators: Concurrent validators draining the queue
+        tasks: Queue items seeded per scenario
+        batch_size: Tasks taken per claim_next call
+
+    Returns:
+        Dictionary of results keyed by scenario
+    """
+    engine = create_async_engine(database_url, pool_size=validators, max_overflow=0)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    result_ids = await _seed(session_factory, tasks)
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        for scenario in ("two_step", "claim_next"):
+            await _reset(session_factory, result_ids)
+            claims: List[uuid.UUID] = []
+            stats: Counter = Counter()
+            begin = time.perf_counter()
+            if scenario == "two_step":
+                workers = [_two_step(session_factory, uuid.uuid4(), claims, stats) for _ in range(validators)]
+            else:
+                workers = [
+                    _claim_next(session_factory, uuid.uuid4(), claims, batch_size)
+                    for _ in range(validators)
+                ]
+            await asyncio.gather(*workers)
+            seconds = time.perf_counter() - begin
+
+            results[scenario] = {
+                "seconds": seconds,
+                "claims_per_second": len(claims) / seconds,
+                "claimed": len(set(claims)),
+                "failed_claims": stats["failed_claims"],
+                "duplicates": len(claims) - len(set(claims)),
+            }
+    finally:
+        await _cleanup(session_factory, result_ids)
+        await engine.dispose()
+
+    return results
+
+
+async def _cleanup(session_factory, result_ids: List[uuid.UUID]) -> None:
+    async with session_factory() as session:
+        await session.execute(
+            sa.delete(ValidationQueue).where(ValidationQueue.validation_result_id.in_(result_ids))
+        )
+        await session.execute(sa.delete(ValidationResult).where(ValidationResult.id.in_(result_ids)))
+        await session.commit()
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", required=True, help="async PostgreSQL URL (postgresql+asyncpg://...)")
+    parser.add_argument("--validators", type=int, default=100, help="concurrent validators (default: 100)")
+    parser.add_argument("--tasks", type=int, default=2000, help="queue items per scenario (default: 2000)")
+    parser.add_argument("--batch-size", type=int, default=1, help="tasks per claim_next call (default: 1)")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run_benchmark(
+        database_url=args.database_url,
+        validators=args.validators,
+        tasks=args.tasks,
+        batch_size=args.batch_size,
+    ))
+
+    print(f"Validators: {args.validators}, tasks: {args.tasks}, batch size: {args.batch_size}\n")
+    print(f"{'scenario':<12}{'seconds':>10}{'claims/s':>11}{'claimed':>9}{'failed':>8}{'dupes':>7}")
+    for scenario, summary in results.items():
+        print(
+            f"{scenario:<12}{summary['seconds']:>10.2f}{summary['claims_per_second']:>11.0f}"
+            f"{summary['claimed']:>9}{summary['failed_claims']:>8}{summary['duplicates']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,10 @@ This script removes:
 - Step executions
 - Multi-turn executions
 - Suite runs
+- Dashboard counters (all of the rows they count are removed)
 - Test execution queue items
 - Related activity logs
-- Related test metrics
+- Related test metrics and their hourly/daily rollups
 
 Usage:
     cd backend
@@ -48,9 +49,12 @@ def cleanup_executions():
         "step_executions",
         "multi_turn_executions",
         "suite_runs",
+        "dashboard_counter_buckets",
         "test_execution_queue",
         "validator_performance",
         "test_metrics",
+        "test_metric_rollups_hourly",
+        "test_metric_rollups_daily",
     ]
 
     # Use raw connection for each delete to avoid transaction issues
@@ -80,13 +84,14 @@ if __name__ == "__main__":
     print("=" * 60)
     print("\nThis includes:")
     print("  - All suite runs")
+    print("  - All dashboard counters")
     print("  - All multi-turn executions")
     print("  - All step executions")
     print("  - All validation results")
     print("  - All validation queue items")
     print("  - All human validations")
     print("  - All validator performance records")
-    print("  - All test metrics")
+    print("  - All test metrics and metric rollups")
     print("  - Related activity logs")
     print("\nScenarios, test suites, and configuration will NOT be deleted.")
     print("")
@@ -67,7 +67,13 @@ class AudioUtils:
         return normalize_audio_peak(audio_bytes, target_db)
 
 
-def convert_to_pcm(audio_bytes: bytes, target_rate: int = 16000, raw: bool = False) -> bytes:
+def convert_to_pcm(
+    audio_bytes: bytes,
+    target_rate: int = 16000,
+    raw: bool = False,
+    channels: int = 1,
+    sample_width: int = 2,
+) -> bytes:
     """
     Convert audio to PCM format at specified sample rate.
 
@@ -82,6 +88,10 @@ def convert_to_pcm(audio_bytes: bytes, target_rate: int = 16000, raw: bool = Fal
         raw: If True, return raw PCM samples (16-bit little-endian, no headers).
              If False, return WAV format with headers. Default: False.
              Use raw=True for streaming APIs like Houndify that expect raw samples.
+        channels: Output channel count (default: 1, mono). Only mono is
+                  supported for non-MP3 input.
+        sample_width: Output bytes per sample (default: 2, 16-bit). Only
+                  16-bit is supported for non-MP3 input.
 
     Returns:
         bytes: Audio data in PCM format at target sample rate
@@ -121,15 +131,15 @@ def convert_to_pcm(audio_bytes: bytes, target_rate: int = 16000, raw: bool = Fal
             audio_buffer = io.BytesIO(audio_bytes)
             audio = AudioSegment.from_mp3(audio_buffer)
 
-            # Convert to mono if stereo
-            if audio.channels > 1:
-                audio = audio.set_channels(1)
+            # Convert to requested channel count (mono by default)
+            if audio.channels != channels:
+                audio = audio.set_channels(channels)
 
             # Resample to target rate
             audio = audio.set_frame_rate(target_rate)
 
-            # Set sample width to 16-bit
-            audio = audio.set_sample_width(2)
+            # Set sample width (16-bit by default)
+            audio = audio.set_sample_width(sample_width)
 
             if raw:
                 # Return raw PCM samples (no headers)
@@ -151,6 +161,9 @@ def convert_to_pcm(audio_bytes: bytes, target_rate: int = 16000, raw: bool = Fal
             logger.warning(f"pydub conversion failed: {e}, falling back to soundfile")
 
     # Use soundfile for non-MP3 formats (WAV, FLAC, OGG, etc.)
+    if channels != 1 or sample_width != 2:
+        raise ValueError("Only mono 16-bit output is supported for non-MP3 audio")
+
     try:
         # Read audio from bytes
         audio_buffer = io.BytesIO(audio_bytes)
@@ -3,28 +3,41 @@ Dashboard aggregation service with caching support.
 
 Provides helpers to construct the executive dashboard response while caching
 aggregated results for five minutes to reduce database load.
+
+Execution, validation and suite run counts come from the incrementally
+maintained hourly counters in dashboard_counter_buckets
+(models/dashboard_counter.py): a window is the sum of its full-hour buckets
+plus a direct count of the partial hour at its start, so the cost stays
+flat as history grows. Pending reviews are counted directly from the
+partial index over pending validation queue items.
 """
 
 from __future__ import annotations
 
 import json
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Iterable, Optional
 
-from sqlalchemy import select, func, case, and_
+from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.redis_client import get_redis
 from services.metrics_service import MetricsService
-from models.multi_turn_execution import MultiTurnExecution, StepExecution
-from models.validation_result import ValidationResult
+from models.multi_turn_execution import StepExecution
 from models.validation_queue import ValidationQueue
+from models.validation_result import ValidationResult
 from models.human_validation import HumanValidation
 from models.scenario_script import ScenarioScript
 from models.defect import Defect
 from models.test_suite import TestSuite
-from models.suite_run import SuiteRun
 from models.edge_case import EdgeCase
+from models.dashboard_counter import (
+    TRACKED_MODELS,
+    DashboardCounterBucket,
+    counter_name,
+    hour_bucket,
+)
 
 TIME_RANGE_WINDOWS = {
     "1h": timedelta(hours=1),
@@ -222,62 +235,33 @@ async def _compute_dashboard_snapshot(
     window = TIME_RANGE_WINDOWS.get(time_range, TIME_RANGE_WINDOWS["24h"])
     start_time = now - window
 
-    # Count scenario executions from multi_turn_executions
-    # Count by status: completed, failed, in_progress, pending
-    execution_stmt = select(
-        func.count(MultiTurnExecution.id),
-        func.sum(case((MultiTurnExecution.status == 'completed', 1), else_=0)),
-        func.sum(case((MultiTurnExecution.status == 'failed', 1), else_=0)),
-        func.sum(case((MultiTurnExecution.status == 'in_progress', 1), else_=0)),
-        func.sum(case((MultiTurnExecution.status == 'pending', 1), else_=0)),
-    ).where(
-        MultiTurnExecution.created_at >= start_time,
-        MultiTurnExecution.created_at < now
-    )
-    execution_result = await db.execute(execution_stmt)
-    total_executions, completed, failed, in_progress, pending = execution_result.one()
-
-    # Convert to int (handle None values)
-    tests_executed = int(total_executions or 0)
-    executions_completed = int(completed or 0)
-    executions_failed = int(failed or 0)
-    tests_pending = int(pending or 0)
-    tests_running = int(in_progress or 0)
-
-    # Count actual validation pass/fail by final_decision (not execution status)
-    # This gives us the real pass/fail based on validation outcomes
-    validation_decision_stmt = select(
-        func.count(ValidationResult.id),
-        func.sum(case((ValidationResult.final_decision == 'pass', 1), else_=0)),
-        func.sum(case((ValidationResult.final_decision == 'fail', 1), else_=0)),
-        func.sum(case((ValidationResult.final_decision == 'uncertain', 1), else_=0)),
-    ).where(
-        ValidationResult.created_at >= start_time,
-        ValidationResult.created_at < now
-    )
-    validation_decision_result = await db.execute(validation_decision_stmt)
-    total_validations_checked, validations_passed, validations_failed, validations_uncertain = validation_decision_result.one()
+    # Execution and validation counts from the hourly dashboard counters
+    counters = await _load_window_counters(db, start_time, now)
+
+    tests_executed = counters["executions"]
+    tests_pending = counters["executions.status.pending"]
 
-    # Use actual validation results for pass/fail counts
-    tests_passed = int(validations_passed or 0)
-    tests_failed = int(validations_failed or 0)
-    tests_uncertain = int(validations_uncertain or 0)
+    # Actual validation pass/fail by final_decision (not execution status)
+    tests_passed = counters["validations.final_decision.pass"]
+    tests_failed = counters["validations.final_decision.fail"]
+    tests_uncertain = counters["validations.final_decision.uncertain"]
 
     # Get metrics for performance data (response time, confidence, etc.)
+    # Daily buckets are served from metric rollups; only the summary is used
     metrics = MetricsService(db)
 
     response_time_data = await metrics.get_metrics(
         metric_type="response_time",
         start_time=start_time,
         end_time=now,
-        granularity="raw",
+        granularity="day",
         dimensions={"aggregation": "raw"},
     )
     validation_confidence_data = await metrics.get_metrics(
         metric_type="validation_confidence",
         start_time=start_time,
         end_time=now,
-        granularity="raw",
+        granularity="day",
         dimensions={"aggregation": "raw"},
     )
 
@@ -301,7 +285,7 @@ async def _compute_dashboard_snapshot(
         if avg_response_ms is not None:
             avg_response_seconds = float(avg_response_ms) / 1000.0  # Convert ms to seconds
 
-    # Count pending validation queue items
+    # Count pending validation queue items (ix_validation_queue_pending_priority)
     pending_queue_stmt = select(func.count(ValidationQueue.id)).where(
         ValidationQueue.status == "pending"
     )
@@ -312,24 +296,10 @@ async def _compute_dashboard_snapshot(
     total_completed = tests_passed + tests_failed
     pass_rate = (tests_passed / total_completed) if total_completed > 0 else None
 
-    # Count actual validation results
-    validation_count_stmt = select(func.count(ValidationResult.id)).where(
-        ValidationResult.created_at >= start_time,
-        ValidationResult.created_at < now
-    )
-    validation_count_result = await db.execute(validation_count_stmt)
-    total_validation_results = validation_count_result.scalar() or 0
-
-    # Count auto-approved validations (didn't need human review)
-    auto_approved_stmt = select(func.count(ValidationResult.id)).where(
-        and_(
-            ValidationResult.created_at >= start_time,
-            ValidationResult.created_at < now,
-            ValidationResult.review_status == "auto_pass",
-        )
-    )
-    auto_approved_result = await db.execute(auto_approved_stmt)
-    auto_approved_count = auto_approved_result.scalar() or 0
+    total_validation_results = counters["validations"]
+
+    # Auto-approved validations (didn't need human review)
+    auto_approved_count = counters["validations.review_status.auto_pass"]
 
     # Calculate human agreement rate
     human_agreement = await _calculate_human_agreement_rate(db, start_time, now)
@@ -344,22 +314,10 @@ async def _compute_dashboard_snapshot(
     suite_count_result = await db.execute(suite_count_stmt)
     total_suites = suite_count_result.scalar() or 0
 
-    # Get suite run counts
-    suite_run_count_stmt = select(
-        func.count(SuiteRun.id),
-        func.sum(case((SuiteRun.status == 'completed', 1), else_=0)),
-        func.sum(case((SuiteRun.status == 'failed', 1), else_=0)),
-        func.sum(case((SuiteRun.status == 'running', 1), else_=0)),
-    ).where(
-        SuiteRun.created_at >= start_time,
-        SuiteRun.created_at < now
-    )
-    suite_run_result = await db.execute(suite_run_count_stmt)
-    total_suite_runs, suite_runs_completed, suite_runs_failed, suite_runs_running = suite_run_result.one()
-    total_suite_runs = int(total_suite_runs or 0)
-    suite_runs_completed = int(suite_runs_completed or 0)
-    suite_runs_failed = int(suite_runs_failed or 0)
-    suite_runs_running = int(suite_runs_running or 0)
+    total_suite_runs = counters["suite_runs"]
+    suite_runs_completed = counters["suite_runs.status.completed"]
+    suite_runs_failed = counters["suite_runs.status.failed"]
+    suite_runs_running = counters["suite_runs.status.running"]
 
     # Get defect counts by severity and status
     defect_stmt = select(
@@ -466,6 +424,64 @@ async def _compute_dashboard_snapshot(
     }
 
 
+async def _load_window_counters(
+    db: AsyncSession,
+    start_time: datetime,
+    end_time: datetime,
+) -> Dict[str, int]:
+    """
+    Dashboard counters for rows created in [start_time, end_time).
+
+    Full hours come from dashboard_counter_buckets; the partial hour at the
+    start of the window is counted from the source tables.
+    """
+    first_full_hour = hour_bucket(start_time)
+    if first_full_hour < start_time:
+        first_full_hour += timedelta(hours=1)
+
+    stmt = (
+        select(DashboardCounterBucket.counter, func.sum(DashboardCounterBucket.value))
+        .where(
+            DashboardCounterBucket.bucket_start >= first_full_hour,
+            DashboardCounterBucket.bucket_start < end_time,
+        )
+        .group_by(DashboardCounterBucket.counter)
+    )
+    result = await db.execute(stmt)
+    counters: Dict[str, int] = defaultdict(int)
+    for name, total in result.all():
+        counters[name] += int(total or 0)
+
+    if start_time < first_full_hour:
+        edge = await _count_created_rows(db, start_time, min(first_full_hour, end_time))
+        for name, total in edge.items():
+            counters[name] += total
+    return counters
+
+
+async def _count_created_rows(
+    db: AsyncSession,
+    start_time: datetime,
+    end_time: datetime,
+) -> Dict[str, int]:
+    """Count tracked rows created in [start_time, end_time) by state."""
+    counts: Dict[str, int] = defaultdict(int)
+    for model, (prefix, fields) in TRACKED_MODELS.items():
+        columns = [getattr(model, field) for field in fields]
+        stmt = (
+            select(*columns, func.count(model.id))
+            .where(model.created_at >= start_time, model.created_at < end_time)
+            .group_by(*columns)
+        )
+        result = await db.execute(stmt)
+        for *values, total in result.all():
+            counts[prefix] += total
+            for field, value in zip(fields, values):
+                if value is not None:
+                    counts[counter_name(prefix, field, value)] += total
+    return counts
+
+
 class _MetricSummary:
     """Holds aggregated metric totals."""
 
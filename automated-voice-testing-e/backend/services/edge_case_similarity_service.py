@@ -6,9 +6,11 @@ Uses semantic similarity, category matching, and failure pattern analysis
 to identify related edge cases.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from datetime import datetime, timedelta
 from uuid import UUID
+import asyncio
+import hashlib
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func
@@ -16,8 +18,10 @@ from sentence_transformers import SentenceTransformer
 import numpy as np
 
 from models.edge_case import EdgeCase
+from models.edge_case_embedding import EdgeCaseEmbedding
 from models.pattern_group import PatternGroup, EdgeCasePatternLink
 from api.config import get_settings
+from services.edge_case_vector_index import VectorIndex, get_vector_index, vector_index_path
 from services.llm_pattern_analysis_service import (
     LLMPatternAnalysisService,
     PatternAnalysis,
@@ -27,6 +31,19 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Maximum ids per IN (...) clause when loading stored embeddings
+EMBEDDING_LOOKUP_CHUNK_SIZE = 1000
+
+# Names of the per-tenant vector indexes
+EDGE_CASE_INDEX = "edge_cases"
+PATTERN_GROUP_INDEX = "pattern_groups"
+
+# Nearest pattern-group centroids checked when matching a new group
+PATTERN_CENTROID_CANDIDATES = 5
+
+# Growth of the index search when too few neighbours fall in the time window
+ANN_SEARCH_WIDEN_FACTOR = 4
+
 
 class EdgeCaseSimilarityService:
     """
@@ -38,8 +55,24 @@ class EdgeCaseSimilarityService:
     - Language code matching
     - Confidence score similarity
     - Tag overlap
+
+    Utterance embeddings are encoded in batches and cached per edge case,
+    both in-process and in the edge_case_embeddings table, so each
+    utterance is encoded once until it changes.
+
+    For large tenants, candidates and pattern-group centroids are retrieved
+    from per-tenant approximate nearest-neighbour indexes instead of
+    scanning the whole corpus (see services.edge_case_vector_index).
     """
 
+    SIMILARITY_WEIGHTS: Dict[str, float] = {
+        'semantic': 0.40,
+        'category': 0.20,
+        'language': 0.15,
+        'confidence': 0.10,
+        'tags': 0.15
+    }
+
     def __init__(self, db: AsyncSession, use_llm: bool = True):
         """
         Initialize the similarity service.
@@ -51,6 +84,10 @@ class EdgeCaseSimilarityService:
         self.db = db
         self.settings = get_settings()
         self._model: Optional[SentenceTransformer] = None
+        # edge_case_id -> (content_hash, normalised embedding)
+        self._embedding_cache: Dict[UUID, Tuple[str, np.ndarray]] = {}
+        # (tenant_id, index name) pairs synced with the database by this instance
+        self._synced_indexes: set = set()
 
         # Initialize LLM service if requested and API key is available
         # Note: tenant_id will be extracted from edge_case when needed
@@ -94,10 +131,46 @@ class EdgeCaseSimilarityService:
         Returns:
             List of dicts with 'edge_case' and 'similarity_score'
         """
-        # Build query for candidate edge cases
+        candidates = None
+        if self.settings.EDGE_CASE_ANN_ENABLED:
+            try:
+                candidates = await self._find_ann_candidates(edge_case, time_window_days)
+            except Exception as e:
+                logger.warning(f"Vector index lookup failed, using exact scan: {e}")
+
+        if candidates is None:
+            # Exact path: score every candidate in the window
+            query = self._candidate_query(edge_case, time_window_days)
+            result = await self.db.execute(query)
+            candidates = result.scalars().all()
+
+        if not candidates or limit <= 0:
+            return []
+
+        # Score all candidates at once (one matrix-vector product for semantics)
+        scores = await self.score_candidates(edge_case, candidates)
+
+        # Top-k above threshold, highest first (ties keep candidate order)
+        eligible = np.flatnonzero(scores >= threshold)
+        if len(eligible) > limit:
+            eligible = eligible[np.argpartition(-scores[eligible], limit - 1)[:limit]]
+            eligible.sort()
+        ranked = eligible[np.argsort(-scores[eligible], kind='stable')]
+
+        return [
+            {
+                'edge_case': candidates[index],
+                'similarity_score': float(scores[index])
+            }
+            for index in ranked
+        ]
+
+    def _candidate_query(self, edge_case: EdgeCase, time_window_days: Optional[int]):
+        """Build the query for candidate edge cases of the same tenant."""
         query = select(EdgeCase).where(
             and_(
                 EdgeCase.id != edge_case.id,  # Exclude self
+                EdgeCase.tenant_id == edge_case.tenant_id,
                 EdgeCase.auto_created == True  # Only auto-created cases
             )
         )
@@ -107,33 +180,402 @@ class EdgeCaseSimilarityService:
             cutoff_date = datetime.utcnow() - timedelta(days=time_window_days)
             query = query.where(EdgeCase.created_at >= cutoff_date)
 
-        # Execute query
+        return query
+
+    async def _find_ann_candidates(
+        self,
+        edge_case: EdgeCase,
+        time_window_days: Optional[int]
+    ) -> Optional[List[EdgeCase]]:
+        """
+        Retrieve candidates from the tenant's edge case vector index.
+
+        The index returns the EDGE_CASE_ANN_CANDIDATES semantically nearest
+        cases, which are then filtered and scored like the exact path. The
+        index holds every case of the tenant, so when the time window filters
+        out too many neighbours the search is widened until enough remain or
+        the index is exhausted. Candidates without an utterance are not
+        indexed; their score is capped at the non-semantic weight (0.6).
+
+        Returns:
+            Candidate edge cases, or None to fall back to the exact scan
+            (small corpus or no utterance to search with)
+        """
+        query_vector = (await self.get_embeddings([edge_case])).get(edge_case.id)
+        if query_vector is None:
+            return None
+
+        index = await self._get_edge_case_index(edge_case.tenant_id, len(query_vector))
+        if str(edge_case.id) not in index:
+            index.add([str(edge_case.id)], query_vector[np.newaxis])
+        if len(index) < self.settings.EDGE_CASE_ANN_MIN_SIZE:
+            return None
+
+        wanted = self.settings.EDGE_CASE_ANN_CANDIDATES
+        k = wanted + 1  # The case itself is indexed
+        searched = {str(edge_case.id)}
+        candidate_ids: List[UUID] = []
+        candidates: List[EdgeCase] = []
+        while True:
+            matches = index.search(query_vector, k)
+            new_ids = [UUID(item_id) for item_id, _ in matches if item_id not in searched]
+            searched.update(str(case_id) for case_id in new_ids)
+            candidate_ids.extend(new_ids)
+            for start in range(0, len(new_ids), EMBEDDING_LOOKUP_CHUNK_SIZE):
+                chunk = new_ids[start:start + EMBEDDING_LOOKUP_CHUNK_SIZE]
+                result = await self.db.execute(
+                    self._candidate_query(edge_case, time_window_days).where(EdgeCase.id.in_(chunk))
+                )
+                candidates.extend(result.scalars().all())
+            if len(candidates) >= wanted or len(matches) < k or k >= len(index):
+                break
+            k *= ANN_SEARCH_WIDEN_FACTOR
+
+        # Keep the nearest in-window cases
+        rank = {case_id: position for position, case_id in enumerate(candidate_ids)}
+        candidates.sort(key=lambda case: rank[case.id])
+        return candidates[:wanted]
+
+    async def _get_edge_case_index(self, tenant_id: UUID, dimensions: int) -> VectorIndex:
+        """Return the tenant's edge case index, synced once per service instance."""
+        index = self._get_index(tenant_id, EDGE_CASE_INDEX, dimensions)
+        key = (str(tenant_id), EDGE_CASE_INDEX)
+        if key not in self._synced_indexes:
+            await self._sync_edge_case_index(index, tenant_id)
+            self._synced_indexes.add(key)
+        return index
+
+    async def _sync_edge_case_index(self, index: VectorIndex, tenant_id: UUID) -> None:
+        """Add edge cases created or changed since the index was last synced."""
+        query = select(EdgeCase).where(
+            and_(
+                EdgeCase.tenant_id == tenant_id,
+                EdgeCase.auto_created == True
+            )
+        )
+        if index.synced_at is not None:
+            query = query.where(EdgeCase.updated_at >= index.synced_at)
+
         result = await self.db.execute(query)
-        candidates = result.scalars().all()
+        cases = result.scalars().all()
+        if not cases:
+            return
 
-        if not candidates:
-            return []
+        embeddings = await self.get_embeddings(cases)
+        ids = [case.id for case in cases if case.id in embeddings]
+        if ids:
+            index.add([str(case_id) for case_id in ids], np.stack([embeddings[i] for i in ids]))
+        index.synced_at = max(case.updated_at for case in cases)
+        logger.info(f"Synced {len(ids)} edge cases into vector index for tenant {tenant_id}")
+        await self._save_index(index, tenant_id, EDGE_CASE_INDEX)
+
+    async def _get_pattern_index(self, tenant_id: UUID, dimensions: int) -> VectorIndex:
+        """Return the tenant's pattern-group centroid index, synced once per instance."""
+        index = self._get_index(tenant_id, PATTERN_GROUP_INDEX, dimensions)
+        key = (str(tenant_id), PATTERN_GROUP_INDEX)
+        if key not in self._synced_indexes:
+            await self._sync_pattern_index(index, tenant_id)
+            self._synced_indexes.add(key)
+        return index
+
+    async def _sync_pattern_index(self, index: VectorIndex, tenant_id: UUID) -> None:
+        """Recompute centroids of the tenant's pattern groups changed since the last sync."""
+        # Pattern groups belong to a tenant through their member edge cases
+        tenant_patterns = (
+            select(EdgeCasePatternLink.pattern_group_id)
+            .join(EdgeCase, EdgeCase.id == EdgeCasePatternLink.edge_case_id)
+            .where(EdgeCase.tenant_id == tenant_id)
+        )
+        query = select(PatternGroup.id, PatternGroup.status, PatternGroup.updated_at).where(
+            PatternGroup.id.in_(tenant_patterns)
+        )
+        if index.synced_at is not None:
+            query = query.where(PatternGroup.updated_at >= index.synced_at)
+        result = await self.db.execute(query)
+        changed = result.all()
+        if not changed:
+            return
+
+        index.remove([str(row.id) for row in changed if row.status != 'active'])
+        active_ids = [row.id for row in changed if row.status == 'active']
+
+        members: Dict[UUID, List[EdgeCase]] = {}
+        for start in range(0, len(active_ids), EMBEDDING_LOOKUP_CHUNK_SIZE):
+            chunk = active_ids[start:start + EMBEDDING_LOOKUP_CHUNK_SIZE]
+            result = await self.db.execute(
+                select(EdgeCasePatternLink.pattern_group_id, EdgeCase)
+                .join(EdgeCase, EdgeCase.id == EdgeCasePatternLink.edge_case_id)
+                .where(
+                    EdgeCasePatternLink.pattern_group_id.in_(chunk),
+                    EdgeCase.tenant_id == tenant_id
+                )
+            )
+            for pattern_id, case in result.all():
+                members.setdefault(pattern_id, []).append(case)
+
+        embeddings = await self.get_embeddings(
+            [case for cases in members.values() for case in cases]
+        )
+        centroids = {
+            pattern_id: self._centroid([embeddings[c.id] for c in cases if c.id in embeddings])
+            for pattern_id, cases in members.items()
+        }
+        centroids = {pattern_id: c for pattern_id, c in centroids.items() if c is not None}
+        if centroids:
+            index.add([str(pattern_id) for pattern_id in centroids], np.stack(list(centroids.values())))
+
+        index.synced_at = max(row.updated_at for row in changed)
+        await self._save_index(index, tenant_id, PATTERN_GROUP_INDEX)
+
+    async def _find_pattern_by_centroid(
+        self,
+        edge_cases: List[EdgeCase]
+    ) -> Optional[PatternGroup]:
+        """Find the active pattern group whose centroid is nearest to the given cases."""
+        embeddings = await self.get_embeddings(edge_cases)
+        centroid = self._centroid([embeddings[c.id] for c in edge_cases if c.id in embeddings])
+        if centroid is None:
+            return None
+
+        index = await self._get_pattern_index(edge_cases[0].tenant_id, len(centroid))
+        threshold = self.settings.PATTERN_CENTROID_MATCH_THRESHOLD
+        for pattern_id, score in index.search(centroid, PATTERN_CENTROID_CANDIDATES):
+            if score < threshold:
+                break
+            pattern = await self._get_pattern_by_id(pattern_id)
+            if pattern and pattern.status == 'active':
+                logger.info(f"Matched pattern {pattern_id} by centroid similarity {score:.3f}")
+                return pattern
+        return None
+
+    async def _update_pattern_centroid(
+        self,
+        pattern: PatternGroup,
+        edge_cases: List[EdgeCase],
+        previous_count: int = 0
+    ) -> None:
+        """
+        Fold new member cases into a pattern's centroid in the tenant index.
+
+        Keeps the in-process index current between syncs; the next sync
+        recomputes the centroid exactly from the pattern's links.
+        """
+        if not self.settings.EDGE_CASE_ANN_ENABLED or not edge_cases:
+            return
+        try:
+            embeddings = await self.get_embeddings(edge_cases)
+            vectors = [embeddings[c.id] for c in edge_cases if c.id in embeddings]
+            if not vectors:
+                return
+            index = await self._get_pattern_index(edge_cases[0].tenant_id, len(vectors[0]))
+            existing = index.get(pattern.id)
+            if existing is not None and previous_count:
+                vectors.append(existing * previous_count)
+            centroid = self._centroid(vectors)
+            if centroid is not None:
+                index.add([str(pattern.id)], centroid[np.newaxis])
+        except Exception as e:
+            logger.warning(f"Failed to update centroid for pattern {pattern.id}: {e}")
+
+    @staticmethod
+    def _centroid(vectors: List[np.ndarray]) -> Optional[np.ndarray]:
+        """Direction of the summed vectors (the L2-normalised mean)."""
+        if not vectors:
+            return None
+        total = np.sum(vectors, axis=0)
+        norm = np.linalg.norm(total)
+        return (total / norm).astype(np.float32) if norm > 0 else None
+
+    def _get_index(self, tenant_id: UUID, name: str, dimensions: int) -> VectorIndex:
+        return get_vector_index(
+            tenant_id,
+            name,
+            dimensions,
+            index_dir=self.settings.EDGE_CASE_ANN_INDEX_DIR,
+            nprobe=self.settings.EDGE_CASE_ANN_NPROBE
+        )
+
+    async def _save_index(self, index: VectorIndex, tenant_id: UUID, name: str) -> None:
+        """Persist an index when EDGE_CASE_ANN_INDEX_DIR is configured."""
+        path = vector_index_path(self.settings.EDGE_CASE_ANN_INDEX_DIR, tenant_id, name)
+        if path is None:
+            return
+        try:
+            await asyncio.to_thread(index.save, path)
+        except OSError as e:
+            logger.warning(f"Failed to save vector index {path}: {e}")
 
-        # Calculate similarity scores for each candidate
-        similarities = []
-        for candidate in candidates:
-            score = self._calculate_similarity(edge_case, candidate)
-            if score >= threshold:
-                similarities.append({
-                    'edge_case': candidate,
-                    'similarity_score': score
-                })
+    async def score_candidates(
+        self,
+        edge_case: EdgeCase,
+        candidates: Sequence[EdgeCase]
+    ) -> np.ndarray:
+        """
+        Calculate similarity scores between an edge case and many candidates.
+
+        Produces the same scores as _calculate_similarity, but computes
+        semantic similarity as one cosine matrix-vector product over cached
+        embeddings.
 
-        # Sort by similarity score (highest first)
-        similarities.sort(key=lambda x: x['similarity_score'], reverse=True)
+        Args:
+            edge_case: The edge case to compare against
+            candidates: Candidate edge cases
 
-        # Return top N
-        return similarities[:limit]
+        Returns:
+            Array of similarity scores (0.0-1.0), one per candidate
+        """
+        embeddings = await self.get_embeddings([edge_case, *candidates])
+
+        semantic = np.zeros(len(candidates), dtype=np.float32)
+        query = embeddings.get(edge_case.id)
+        if query is not None:
+            rows = [i for i, candidate in enumerate(candidates) if candidate.id in embeddings]
+            if rows:
+                matrix = np.stack([embeddings[candidates[i].id] for i in rows])
+                # Convert cosine from [-1, 1] to [0, 1]
+                semantic[rows] = (matrix @ query + 1) / 2
+
+        other_signals = np.array(
+            [self._calculate_similarity(edge_case, candidate, semantic_score=0.0) for candidate in candidates],
+            dtype=np.float32
+        )
+        return other_signals + self.SIMILARITY_WEIGHTS['semantic'] * semantic
+
+    async def get_embeddings(
+        self,
+        edge_cases: Sequence[EdgeCase]
+    ) -> Dict[UUID, np.ndarray]:
+        """
+        Return L2-normalised utterance embeddings keyed by edge case id.
+
+        Lookup order: in-process cache, then the edge_case_embeddings table,
+        then batched encoding. Entries whose utterance (or model) changed
+        are re-encoded. New embeddings are added to the session and saved
+        with the caller's next commit.
+
+        Args:
+            edge_cases: Edge cases to embed (cases without an utterance are skipped)
+
+        Returns:
+            Dict mapping edge case id to float32 embedding
+        """
+        wanted: Dict[UUID, Tuple[str, str]] = {}
+        for case in edge_cases:
+            utterance = self._get_utterance(case)
+            if utterance:
+                wanted[case.id] = (utterance, self._embedding_hash(utterance))
+
+        embeddings: Dict[UUID, np.ndarray] = {}
+        uncached: List[UUID] = []
+        for case_id, (_, content_hash) in wanted.items():
+            cached = self._embedding_cache.get(case_id)
+            if cached is not None and cached[0] == content_hash:
+                embeddings[case_id] = cached[1]
+            else:
+                uncached.append(case_id)
+
+        if not uncached:
+            return embeddings
+
+        stored = await self._load_stored_embeddings(uncached)
+
+        stale: List[UUID] = []
+        for case_id in uncached:
+            content_hash = wanted[case_id][1]
+            row = stored.get(case_id)
+            vector = row.vector if row is not None and row.content_hash == content_hash else None
+            if vector is None:
+                stale.append(case_id)
+                continue
+            embeddings[case_id] = vector
+            self._embedding_cache[case_id] = (content_hash, vector)
+
+        if stale:
+            # Encode each distinct utterance once
+            texts = list(dict.fromkeys(wanted[case_id][0] for case_id in stale))
+            encoded = await asyncio.to_thread(self._encode_batch, texts)
+            by_text = dict(zip(texts, encoded))
+
+            for case_id in stale:
+                utterance, content_hash = wanted[case_id]
+                vector = by_text[utterance]
+                embeddings[case_id] = vector
+                self._embedding_cache[case_id] = (content_hash, vector)
+
+            await self._store_embeddings(stale, wanted, embeddings, stored)
+
+        return embeddings
+
+    async def _load_stored_embeddings(
+        self,
+        edge_case_ids: List[UUID]
+    ) -> Dict[UUID, EdgeCaseEmbedding]:
+        """Load persisted embeddings for the given edge cases."""
+        stored: Dict[UUID, EdgeCaseEmbedding] = {}
+        for start in range(0, len(edge_case_ids), EMBEDDING_LOOKUP_CHUNK_SIZE):
+            chunk = edge_case_ids[start:start + EMBEDDING_LOOKUP_CHUNK_SIZE]
+            result = await self.db.execute(
+                select(EdgeCaseEmbedding).where(EdgeCaseEmbedding.edge_case_id.in_(chunk))
+            )
+            for row in result.scalars().all():
+                stored[row.edge_case_id] = row
+        return stored
+
+    async def _store_embeddings(
+        self,
+        edge_case_ids: List[UUID],
+        wanted: Dict[UUID, Tuple[str, str]],
+        embeddings: Dict[UUID, np.ndarray],
+        stored: Dict[UUID, EdgeCaseEmbedding]
+    ) -> None:
+        """Insert or refresh persisted embeddings (flushed in a savepoint)."""
+        model_name = self.settings.SEMANTIC_SIMILARITY_MODEL
+        try:
+            async with self.db.begin_nested():
+                for case_id in edge_case_ids:
+                    vector = embeddings[case_id]
+                    row = stored.get(case_id)
+                    if row is None:
+                        row = EdgeCaseEmbedding(edge_case_id=case_id)
+                        self.db.add(row)
+                    row.model_name = model_name
+                    row.content_hash = wanted[case_id][1]
+                    row.dimensions = len(vector)
+                    row.embedding = EdgeCaseEmbedding.encode_vector(vector)
+        except Exception as e:
+            # A concurrent worker may have stored the same rows; the in-process
+            # cache still holds the vectors for this run
+            logger.warning(f"Failed to persist {len(edge_case_ids)} edge case embeddings: {e}")
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """Encode utterances in batches and L2-normalise them (runs in a thread)."""
+        vectors = np.asarray(
+            self.model.encode(
+                texts,
+                batch_size=self.settings.EDGE_CASE_EMBEDDING_BATCH_SIZE,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            ),
+            dtype=np.float32
+        )
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+    def _embedding_hash(self, utterance: str) -> str:
+        """Hash identifying the model and text an embedding was computed from."""
+        payload = f"{self.settings.SEMANTIC_SIMILARITY_MODEL}\n{utterance}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _get_utterance(case: EdgeCase) -> str:
+        """Return the user utterance from an edge case's scenario definition."""
+        return (case.scenario_definition or {}).get('user_utterance', '') or ''
 
     def _calculate_similarity(
         self,
         case1: EdgeCase,
-        case2: EdgeCase
+        case2: EdgeCase,
+        semantic_score: Optional[float] = None
     ) -> float:
         """
         Calculate overall similarity score between two edge cases.
@@ -148,22 +590,19 @@ class EdgeCaseSimilarityService:
         Args:
             case1: First edge case
             case2: Second edge case
+            semantic_score: Precomputed semantic similarity (optional)
 
         Returns:
             Similarity score between 0.0 and 1.0
         """
-        weights = {
-            'semantic': 0.40,
-            'category': 0.20,
-            'language': 0.15,
-            'confidence': 0.10,
-            'tags': 0.15
-        }
+        weights = self.SIMILARITY_WEIGHTS
 
         scores = {}
 
         # 1. Semantic similarity of utterances
-        scores['semantic'] = self._semantic_similarity(case1, case2)
+        if semantic_score is None:
+            semantic_score = self._semantic_similarity(case1, case2)
+        scores['semantic'] = semantic_score
 
         # 2. Category matching
         scores['category'] = self._category_similarity(case1, case2)
@@ -396,6 +835,7 @@ class EdgeCaseSimilarityService:
 
         await self.db.commit()
         await self.db.refresh(pattern)
+        await self._update_pattern_centroid(pattern, edge_cases)
 
         return pattern
 
@@ -512,6 +952,9 @@ class EdgeCaseSimilarityService:
         """
         Find existing pattern group with same name or overlapping edge cases.
 
+        Falls back to the nearest pattern-group centroid in the tenant's
+        vector index when no pattern has the same name.
+
         Args:
             pattern_name: Name to search for
             edge_cases: Edge cases to check for overlap
@@ -528,6 +971,13 @@ class EdgeCaseSimilarityService:
         )
         existing = result.scalar_one_or_none()
 
+        # Search by centroid similarity
+        if existing is None and self.settings.EDGE_CASE_ANN_ENABLED:
+            try:
+                existing = await self._find_pattern_by_centroid(edge_cases)
+            except Exception as e:
+                logger.warning(f"Pattern centroid lookup failed: {e}")
+
         return existing
 
     # ========================================================================
@@ -765,6 +1215,7 @@ class EdgeCaseSimilarityService:
 
         await self.db.commit()
         await self.db.refresh(pattern)
+        await self._update_pattern_centroid(pattern, edge_cases)
 
         return pattern
 
@@ -812,6 +1263,9 @@ class EdgeCaseSimilarityService:
         edge_case.status = 'grouped'
 
         await self.db.commit()
+        await self._update_pattern_centroid(
+            pattern, [edge_case], previous_count=pattern.occurrence_count - 1
+        )
 
         logger.info(f"Added edge case {edge_case.id} to pattern {pattern.id}")
 
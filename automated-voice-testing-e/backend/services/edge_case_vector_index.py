@@ -0,0 +1,391 @@
+"""
+Edge Case Vector Index - Approximate nearest-neighbour search over embeddings.
+
+Part of Phase 2: Pattern Recognition & Grouping.
+Provides a per-tenant in-process IVF (inverted file) index over the
+L2-normalised utterance embeddings produced by EdgeCaseSimilarityService,
+so similarity lookups and pattern-group centroid matching do not scan the
+whole corpus.
+
+Vectors are partitioned into ~sqrt(n) lists by spherical k-means. A query
+only scores the vectors in its ``nprobe`` nearest lists. Small indexes are
+searched exhaustively. Vectors can be added or replaced incrementally;
+the partitioning is retrained when the index has doubled in size since it
+was last trained. Indexes can be saved to and loaded from ``.npz`` files.
+
+Usage:
+    from services.edge_case_vector_index import get_vector_index
+
+    index = get_vector_index(tenant_id, "edge_cases", dimensions=384)
+    index.add(["case-1", "case-2"], vectors)
+    matches = index.search(query_vector, k=10)  # [(id, cosine), ...]
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+
+# Below this many vectors, searches scan every vector
+MIN_TRAIN_SIZE = 1024
+
+# Vectors sampled per list when training the partitioning
+TRAIN_SAMPLES_PER_LIST = 64
+
+KMEANS_ITERATIONS = 10
+
+# Rows scored per matrix product when assigning vectors to lists
+ASSIGN_CHUNK_SIZE = 65536
+
+
+class VectorIndex:
+    """
+    IVF index over L2-normalised float32 vectors, scored by inner product.
+
+    Attributes:
+        dimensions: Vector dimensionality
+        nprobe: Number of lists scanned per query
+        synced_at: Timestamp of the newest source row reflected in the index
+    """
+
+    def __init__(
+        self,
+        dimensions: int,
+        nprobe: int = 8,
+        min_train_size: int = MIN_TRAIN_SIZE,
+        seed: int = 0
+    ):
+        """
+        Initialize an empty index.
+
+        Args:
+            dimensions: Vector dimensionality
+            nprobe: Number of lists scanned per query
+            min_train_size: Vector count at which the index starts partitioning
+            seed: Seed for k-means initialisation and sampling
+        """
+        self.dimensions = dimensions
+        self.nprobe = max(1, nprobe)
+        self.min_train_size = min_train_size
+        self.seed = seed
+        self.synced_at: Optional[datetime] = None
+
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._vectors = np.empty((0, dimensions), dtype=np.float32)
+        self._assignments = np.empty(0, dtype=np.int32)
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+        self._lists: Optional[List[np.ndarray]] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, item_id: object) -> bool:
+        return str(item_id) in self._positions
+
+    @property
+    def nlist(self) -> int:
+        """Number of lists (0 while the index is searched exhaustively)."""
+        return 0 if self._centroids is None else len(self._centroids)
+
+    def get(self, item_id: object) -> Optional[np.ndarray]:
+        """Return a copy of the stored vector for an id, if present."""
+        with self._lock:
+            position = self._positions.get(str(item_id))
+            return None if position is None else self._vectors[position].copy()
+
+    def add(self, ids: Sequence[object], vectors: np.ndarray) -> None:
+        """
+        Add vectors, replacing any existing vector with the same id.
+
+        Args:
+            ids: Item ids (converted to str)
+            vectors: Array of shape (len(ids), dimensions)
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dimensions)
+        if len(ids) != len(vectors):
+            raise ValueError("ids and vectors must have the same length")
+        if not len(ids):
+            return
+
+        with self._lock:
+            # Last write wins for ids repeated within the batch
+            latest: Dict[str, int] = {}
+            for row, item_id in enumerate(ids):
+                latest[str(item_id)] = row
+
+            new_ids = [item_id for item_id in latest if item_id not in self._positions]
+            start = len(self._ids)
+            self._reserve(start + len(new_ids))
+            for offset, item_id in enumerate(new_ids):
+                self._positions[item_id] = start + offset
+                self._ids.append(item_id)
+
+            positions = np.fromiter((self._positions[i] for i in latest), dtype=np.int64, count=len(latest))
+            self._vectors[positions] = vectors[list(latest.values())]
+            self._assignments[positions] = self._assign(self._vectors[positions])
+            self._lists = None
+
+            if len(self._ids) >= self.min_train_size and len(self._ids) >= 2 * self._trained_size:
+                self._train()
+
+    def remove(self, ids: Sequence[object]) -> None:
+        """Remove ids from the index (unknown ids are ignored)."""
+        with self._lock:
+            for item_id in map(str, ids):
+                position = self._positions.pop(item_id, None)
+                if position is None:
+                    continue
+                last = len(self._ids) - 1
+                if position != last:
+                    moved = self._ids[last]
+                    self._ids[position] = moved
+                    self._positions[moved] = position
+                    self._vectors[position] = self._vectors[last]
+                    self._assignments[position] = self._assignments[last]
+                self._ids.pop()
+            self._lists = None
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int,
+        nprobe: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Return the (approximately) k most similar ids, highest score first.
+
+        Args:
+            query: L2-normalised query vector
+            k: Number of results
+            nprobe: Lists to scan (defaults to the index setting)
+
+        Returns:
+            List of (id, inner product) tuples
+        """
+        query = np.asarray(query, dtype=np.float32).reshape(self.dimensions)
+        with self._lock:
+            size = len(self._ids)
+            if k <= 0 or size == 0:
+                return []
+
+            nprobe = nprobe or self.nprobe
+            if self._centroids is None or nprobe >= len(self._centroids):
+                positions = None
+                scores = self._vectors[:size] @ query
+            else:
+                centroid_scores = self._centroids @ query
+                probe = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+                lists = self._get_lists()
+                positions = np.concatenate([lists[i] for i in probe])
+                scores = self._vectors[positions] @ query
+
+            return self._top_k(scores, positions, k)
+
+    def search_exact(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        """Exhaustive search, used as ground truth for recall measurements."""
+        query = np.asarray(query, dtype=np.float32).reshape(self.dimensions)
+        with self._lock:
+            if k <= 0 or not self._ids:
+                return []
+            return self._top_k(self._vectors[:len(self._ids)] @ query, None, k)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Atomically write the index to an .npz file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            size = len(self._ids)
+            arrays = {
+                "version": np.array(INDEX_FORMAT_VERSION),
+                "ids": np.array(self._ids, dtype=str),
+                "vectors": self._vectors[:size],
+                "assignments": self._assignments[:size],
+                "centroids": (
+                    self._centroids if self._centroids is not None
+                    else np.empty((0, self.dimensions), dtype=np.float32)
+                ),
+                "trained_size": np.array(self._trained_size),
+                "synced_at": np.array(self.synced_at.isoformat() if self.synced_at else ""),
+            }
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    np.savez(handle, **arrays)
+                os.replace(tmp_path, path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, Path],
+        nprobe: int = 8,
+        min_train_size: int = MIN_TRAIN_SIZE
+    ) -> "VectorIndex":
+        """
+        Load an index written by save().
+
+        Raises:
+            ValueError: If the file was written by an incompatible version
+        """
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"]) != INDEX_FORMAT_VERSION:
+                raise ValueError(f"Unsupported vector index version in {path}")
+            vectors = data["vectors"].astype(np.float32)
+            index = cls(vectors.shape[1], nprobe=nprobe, min_train_size=min_train_size)
+            index._ids = data["ids"].tolist()
+            index._positions = {item_id: i for i, item_id in enumerate(index._ids)}
+            index._vectors = vectors
+            index._assignments = data["assignments"].astype(np.int32)
+            centroids = data["centroids"].astype(np.float32)
+            index._centroids = centroids if len(centroids) else None
+            index._trained_size = int(data["trained_size"])
+            synced_at = str(data["synced_at"])
+            index.synced_at = datetime.fromisoformat(synced_at) if synced_at else None
+        return index
+
+    def _reserve(self, size: int) -> None:
+        """Grow the vector buffer geometrically so appends are amortised O(1)."""
+        capacity = len(self._vectors)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, 64)
+        vectors = np.empty((capacity, self.dimensions), dtype=np.float32)
+        vectors[:len(self._ids)] = self._vectors[:len(self._ids)]
+        assignments = np.full(capacity, -1, dtype=np.int32)
+        assignments[:len(self._ids)] = self._assignments[:len(self._ids)]
+        self._vectors, self._assignments = vectors, assignments
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        """Return the nearest list for each vector (-1 while untrained)."""
+        if self._centroids is None:
+            return np.full(len(vectors), -1, dtype=np.int32)
+        assignments = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), ASSIGN_CHUNK_SIZE):
+            chunk = vectors[start:start + ASSIGN_CHUNK_SIZE]
+            assignments[start:start + len(chunk)] = np.argmax(chunk @ self._centroids.T, axis=1)
+        return assignments
+
+    def _train(self) -> None:
+        """Partition the current vectors with spherical k-means."""
+        size = len(self._ids)
+        vectors = self._vectors[:size]
+        nlist = max(1, int(round(np.sqrt(size))))
+        rng = np.random.default_rng(self.seed)
+
+        sample_size = min(size, nlist * TRAIN_SAMPLES_PER_LIST)
+        sample = vectors[rng.choice(size, sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+
+        for _ in range(KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Empty lists keep their previous centroid
+            centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+
+        self._centroids = centroids.astype(np.float32)
+        self._assignments[:size] = self._assign(vectors)
+        self._trained_size = size
+        self._lists = None
+        logger.debug(f"Trained vector index with {nlist} lists over {size} vectors")
+
+    def _get_lists(self) -> List[np.ndarray]:
+        """Positions of the vectors in each list (rebuilt after changes)."""
+        if self._lists is None:
+            assignments = self._assignments[:len(self._ids)]
+            order = np.argsort(assignments, kind="stable")
+            counts = np.bincount(assignments, minlength=len(self._centroids))
+            self._lists = np.split(order, np.cumsum(counts)[:-1])
+        return self._lists
+
+    def _top_k(
+        self,
+        scores: np.ndarray,
+        positions: Optional[np.ndarray],
+        k: int
+    ) -> List[Tuple[str, float]]:
+        if len(scores) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        if positions is not None:
+            return [(self._ids[positions[i]], float(scores[i])) for i in top]
+        return [(self._ids[i], float(scores[i])) for i in top]
+
+
+# Process-wide indexes keyed by (tenant id, index name)
+_vector_indexes: Dict[Tuple[str, str], VectorIndex] = {}
+_vector_indexes_lock = threading.Lock()
+
+
+def get_vector_index(
+    tenant_id: object,
+    name: str,
+    dimensions: int,
+    index_dir: Optional[Union[str, Path]] = None,
+    nprobe: int = 8
+) -> VectorIndex:
+    """
+    Return the process-wide index for a tenant, loading it from disk once.
+
+    Args:
+        tenant_id: Tenant owning the indexed items
+        name: Index name (e.g. "edge_cases", "pattern_groups")
+        dimensions: Vector dimensionality
+        index_dir: Directory holding saved indexes (None = memory only)
+        nprobe: Lists scanned per query
+
+    Returns:
+        The tenant's VectorIndex (empty if nothing was saved yet)
+    """
+    key = (str(tenant_id), name)
+    index = _vector_indexes.get(key)
+    if index is not None and index.dimensions == dimensions:
+        return index
+
+    with _vector_indexes_lock:
+        index = _vector_indexes.get(key)
+        if index is None or index.dimensions != dimensions:
+            index = None
+            path = vector_index_path(index_dir, tenant_id, name)
+            if path is not None and path.exists():
+                try:
+                    index = VectorIndex.load(path, nprobe=nprobe)
+                    if index.dimensions != dimensions:
+                        index = None
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable vector index {path}: {e}")
+                    index = None
+            if index is None:
+                index = VectorIndex(dimensions, nprobe=nprobe)
+            _vector_indexes[key] = index
+    return index
+
+
+def vector_index_path(
+    index_dir: Optional[Union[str, Path]],
+    tenant_id: object,
+    name: str
+) -> Optional[Path]:
+    """File a tenant's index is saved to (None when persistence is disabled)."""
+    if index_dir is None:
+        return None
+    return Path(index_dir) / str(tenant_id) / f"{name}.npz"
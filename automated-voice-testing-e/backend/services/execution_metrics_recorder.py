@@ -4,15 +4,20 @@ Utility for recording execution metrics via MetricsService (TASK-219).
 The ExecutionMetricsRecorder extracts timing and validation metadata from
 MultiTurnExecution and ValidationResult objects and persists them through the
 MetricsService, normalising timestamps and dimensions for downstream analytics.
+
+On the execution hot path pass a MetricWriter (services/metric_writer.py)
+instead of a MetricsService: it accepts the same record_metric() calls and
+writes them in batches.
 """
 
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Union
 from uuid import UUID
 
 from services.dashboard_service import invalidate_dashboard_cache
+from services.metric_writer import MetricWriter
 from services.metrics_service import MetricsService
 
 
@@ -22,7 +27,7 @@ class ExecutionMetricsRecorder:
     def __init__(
         self,
         *,
-        metrics_service: MetricsService,
+        metrics_service: Union[MetricsService, MetricWriter],
         clock: Optional[Callable[[], datetime]] = None,
     ) -> None:
         if metrics_service is None:
@@ -0,0 +1,331 @@
+"""
+Expected Outcome Matcher
+
+Compiles the response-content rules of an ExpectedOutcome into an immutable
+matcher that validates an AI response in a single pass.
+
+The rules come from ``expected_response_content`` (or the language-specific
+``expected_response_patterns`` in ``language_variations``) plus
+``forbidden_phrases``:
+
+- contains / not_contains / forbidden_phrases: case-insensitive literals
+- regex / regex_not_match: case-insensitive regular expressions
+
+The response is lowercased once per validation. When an outcome has many
+literal phrases they are folded into one trie-shaped regex that the
+response is scanned with once. Regexes are compiled once, and
+invalid ones are reported without being re-parsed. Compiled matchers are
+cached per (outcome id, updated_at, language code), so editing an outcome
+invalidates its matchers.
+
+Example:
+    >>> from services.expected_outcome_matcher import get_outcome_matcher
+    >>>
+    >>> matcher = get_outcome_matcher(expected_outcome, language_code="fr-FR")
+    >>> result = matcher.validate("Il fait beau à Paris")
+    >>> print(result['passed'])
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Pattern, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of compiled matchers kept in memory
+MATCHER_CACHE_SIZE = 4096
+
+# Outcomes with at least this many literal phrases are matched with one
+# trie scan; below it, per-phrase substring checks are faster
+PHRASE_SCAN_MIN_PHRASES = 16
+
+
+@dataclass(frozen=True, eq=False)
+class ResponseContentMatcher:
+    """
+    Compiled response-content rules for one outcome and language.
+
+    Attributes:
+        contains: Phrases that must appear
+        not_contains: Phrases that must not appear
+        regex: Compiled patterns that must match (None for invalid patterns)
+        regex_not_match: Compiled patterns that must not match (None if invalid)
+        forbidden_phrases: Additional phrases that must not appear
+        has_rules: False when there is no expected content (auto-pass)
+    """
+
+    contains: Tuple[Tuple[Any, str], ...] = ()
+    not_contains: Tuple[Tuple[Any, str], ...] = ()
+    regex: Tuple[Tuple[Any, Optional[Pattern[str]]], ...] = ()
+    regex_not_match: Tuple[Tuple[Any, Optional[Pattern[str]]], ...] = ()
+    forbidden_phrases: Tuple[Tuple[Any, str], ...] = ()
+    has_rules: bool = False
+    _phrases: FrozenSet[str] = field(default=frozenset(), repr=False)
+    _phrase_scanner: Optional[Pattern[str]] = field(default=None, repr=False)
+    _longer_phrases: Dict[str, FrozenSet[str]] = field(default_factory=dict, repr=False)
+
+    def find_phrases(self, response_lower: str) -> FrozenSet[str]:
+        """Return every compiled literal phrase occurring in the lowercased response."""
+        if self._phrase_scanner is None:
+            # Few phrases: direct substring checks are cheaper than a scan
+            return frozenset(phrase for phrase in self._phrases if phrase in response_lower)
+        # Find the longest phrase starting at each position: the scanner skips
+        # to candidate starts in C, and resuming one character after each hit
+        # keeps overlapping phrases. A shorter phrase is also present
+        # wherever a phrase it prefixes is.
+        search = self._phrase_scanner.search
+        longest = set()
+        match = search(response_lower)
+        while match is not None:
+            longest.add(match.group())
+            match = search(response_lower, match.start() + 1)
+        found = set(longest)
+        for phrase, longer in self._longer_phrases.items():
+            if phrase not in found and not longest.isdisjoint(longer):
+                found.add(phrase)
+        return frozenset(found)
+
+    def validate(self, ai_response: Optional[str]) -> Dict[str, Any]:
+        """
+        Validate an AI response against the compiled rules.
+
+        Returns:
+            Same structure as ValidationHoundifyMixin._validate_response_content
+        """
+        result = {
+            'passed': True,
+            'errors': [],
+            'details': {
+                'contains': {'passed': True, 'matched': [], 'missing': []},
+                'not_contains': {'passed': True, 'found': []},
+                'regex': {'passed': True, 'matched': [], 'failed': []},
+                'regex_not_match': {'passed': True, 'found': []},
+                'forbidden_phrases': {'passed': True, 'found': []},
+            }
+        }
+
+        # If no expected content defined, auto-pass
+        if not self.has_rules:
+            logger.debug("No expected_response_content defined, auto-passing")
+            return result
+
+        # If no AI response to check against, fail if patterns expected
+        if not ai_response or not ai_response.strip():
+            result['passed'] = False
+            result['errors'].append("No AI response to validate")
+            logger.warning("No AI response provided for content validation")
+            return result
+
+        details = result['details']
+        found = self.find_phrases(ai_response.lower())
+
+        for pattern, phrase in self.contains:
+            if phrase in found:
+                details['contains']['matched'].append(pattern)
+            else:
+                details['contains']['missing'].append(pattern)
+                details['contains']['passed'] = False
+                result['passed'] = False
+                result['errors'].append(f"Missing required phrase: '{pattern}'")
+
+        for pattern, phrase in self.not_contains:
+            if phrase in found:
+                details['not_contains']['found'].append(pattern)
+                details['not_contains']['passed'] = False
+                result['passed'] = False
+                result['errors'].append(f"Found forbidden phrase: '{pattern}'")
+
+        for pattern, compiled in self.regex:
+            if compiled is None:
+                result['errors'].append(f"Invalid regex pattern: '{pattern}'")
+            elif compiled.search(ai_response):
+                details['regex']['matched'].append(pattern)
+            else:
+                details['regex']['failed'].append(pattern)
+                details['regex']['passed'] = False
+                result['passed'] = False
+                result['errors'].append(f"Regex pattern not matched: '{pattern}'")
+
+        for pattern, compiled in self.regex_not_match:
+            if compiled is not None and compiled.search(ai_response):
+                details['regex_not_match']['found'].append(pattern)
+                details['regex_not_match']['passed'] = False
+                result['passed'] = False
+                result['errors'].append(f"Response matched forbidden regex: '{pattern}'")
+
+        for pattern, phrase in self.forbidden_phrases:
+            if phrase in found:
+                details['forbidden_phrases']['found'].append(pattern)
+                details['forbidden_phrases']['passed'] = False
+                result['passed'] = False
+                result['errors'].append(f"Found forbidden phrase: '{pattern}'")
+
+        logger.info(
+            f"Response content validation: passed={result['passed']}, "
+            f"errors={len(result['errors'])}"
+        )
+
+        return result
+
+
+def compile_response_content(
+    expected_response_content: Optional[Dict[str, Any]],
+    forbidden_phrases: Optional[List[str]] = None
+) -> ResponseContentMatcher:
+    """
+    Compile response-content rules into a matcher (uncached).
+
+    Args:
+        expected_response_content: Dict with contains/not_contains/regex/
+            regex_not_match lists, or None
+        forbidden_phrases: Additional forbidden phrases
+
+    Returns:
+        Immutable ResponseContentMatcher
+    """
+    if not expected_response_content:
+        return ResponseContentMatcher()
+
+    def literals(values: Any) -> Tuple[Tuple[Any, str], ...]:
+        if not values or not isinstance(values, list):
+            return ()
+        return tuple((value, str(value).lower()) for value in values if value)
+
+    def regexes(values: Any) -> Tuple[Tuple[Any, Optional[Pattern[str]]], ...]:
+        if not values or not isinstance(values, list):
+            return ()
+        compiled = []
+        for value in values:
+            if not value:
+                continue
+            try:
+                compiled.append((value, re.compile(value, re.IGNORECASE)))
+            except re.error as e:
+                logger.warning(f"Invalid regex pattern '{value}': {e}")
+                compiled.append((value, None))
+        return tuple(compiled)
+
+    contains = literals(expected_response_content.get('contains', []))
+    not_contains = literals(expected_response_content.get('not_contains', []))
+    forbidden = literals(forbidden_phrases)
+
+    phrases = {phrase for _, phrase in contains + not_contains + forbidden}
+    scanner = None
+    longer_phrases: Dict[str, FrozenSet[str]] = {}
+    if len(phrases) >= PHRASE_SCAN_MIN_PHRASES:
+        scanner = re.compile(_trie_pattern(_build_trie(phrases)))
+        for phrase in phrases:
+            longer = frozenset(p for p in phrases if p != phrase and p.startswith(phrase))
+            if longer:
+                longer_phrases[phrase] = longer
+
+    return ResponseContentMatcher(
+        contains=contains,
+        not_contains=not_contains,
+        regex=regexes(expected_response_content.get('regex', [])),
+        regex_not_match=regexes(expected_response_content.get('regex_not_match', [])),
+        forbidden_phrases=forbidden,
+        has_rules=True,
+        _phrases=frozenset(phrases),
+        _phrase_scanner=scanner,
+        _longer_phrases=longer_phrases,
+    )
+
+
+def resolve_response_content(
+    expected_outcome: Any,
+    language_code: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Return the response-content rules that apply for a language.
+
+    Uses ``language_variations[language_code]['expected_response_patterns']``
+    when present, otherwise ``expected_response_content``.
+    """
+    language_variations = getattr(expected_outcome, 'language_variations', None)
+    if language_code and language_variations and isinstance(language_variations, dict):
+        lang_variation = language_variations.get(language_code, {})
+        if lang_variation and 'expected_response_patterns' in lang_variation:
+            logger.debug(f"Using language-specific validation patterns for {language_code}")
+            return lang_variation['expected_response_patterns']
+    return getattr(expected_outcome, 'expected_response_content', None)
+
+
+_matcher_cache: "OrderedDict[Tuple[Any, datetime, Optional[str]], ResponseContentMatcher]" = OrderedDict()
+_matcher_cache_lock = threading.Lock()
+
+
+def get_outcome_matcher(
+    expected_outcome: Any,
+    language_code: Optional[str] = None
+) -> ResponseContentMatcher:
+    """
+    Return the compiled matcher for an outcome and language.
+
+    Matchers of persisted outcomes are cached by (id, updated_at, language
+    code); outcomes without an id or updated_at are compiled every time.
+
+    Args:
+        expected_outcome: ExpectedOutcome (or None for no rules)
+        language_code: Language code selecting language_variations rules
+
+    Returns:
+        Cached ResponseContentMatcher
+    """
+    outcome_id = getattr(expected_outcome, 'id', None)
+    updated_at = getattr(expected_outcome, 'updated_at', None)
+    if outcome_id is None or not isinstance(updated_at, datetime):
+        return compile_response_content(
+            resolve_response_content(expected_outcome, language_code),
+            getattr(expected_outcome, 'forbidden_phrases', None)
+        )
+
+    key = (outcome_id, updated_at, language_code)
+    with _matcher_cache_lock:
+        matcher = _matcher_cache.get(key)
+        if matcher is not None:
+            _matcher_cache.move_to_end(key)
+            return matcher
+
+    matcher = compile_response_content(
+        resolve_response_content(expected_outcome, language_code),
+        getattr(expected_outcome, 'forbidden_phrases', None)
+    )
+    with _matcher_cache_lock:
+        _matcher_cache[key] = matcher
+        while len(_matcher_cache) > MATCHER_CACHE_SIZE:
+            _matcher_cache.popitem(last=False)
+    return matcher
+
+
+def _build_trie(phrases: Any) -> Dict[str, Any]:
+    trie: Dict[str, Any] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    return trie
+
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    """Render a trie as a regex whose alternations branch on distinct characters."""
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ''
+    terminal = '' in node
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    body = f"(?:{'|'.join(branches)})"
+    # Greedy: prefer the longest phrase, fall back to the one ending here
+    return f"{body}?" if terminal else body
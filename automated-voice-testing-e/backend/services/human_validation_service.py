@@ -110,6 +110,7 @@ class HumanValidationService:
 
         await db.commit()
         await db.refresh(human_validation)
+        await self.queue_service.invalidate_stats_cache()
 
         # Send notification for edge case (after commit, non-blocking)
         if edge_case_data:
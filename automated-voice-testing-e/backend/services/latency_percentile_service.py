@@ -9,6 +9,14 @@ Key features:
 - Percentile calculations (p50, p90, p95, p99)
 - Histogram generation
 - Latency trend analysis
+- Sketch-backed mode with bounded memory and mergeable summaries
+
+By default every latency is retained and percentiles are exact. With
+use_sketch=True latencies are folded into a LatencySketch (a
+QuantileSketch plus count, sum, sum of squares, min and max): recording is
+O(1), memory is bounded, percentiles are within the sketch's relative
+accuracy, and sketches from several workers merge into one. Only the most
+recent recent_window latencies are kept for trend and outlier analysis.
 
 Example:
     >>> service = LatencyPercentileService()
@@ -17,10 +25,137 @@ Example:
     >>> print(f"P99 latency: {p99}ms")
 """
 
+from collections import deque
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+import math
 import statistics
 
+from services.quantile_sketch import (
+    DEFAULT_MAX_BINS,
+    DEFAULT_RELATIVE_ACCURACY,
+    QuantileSketch,
+)
+
+STANDARD_PERCENTILES = (50, 90, 95, 99)
+
+
+class LatencySketch:
+    """
+    Mergeable, bounded-memory latency summary.
+
+    Combines a QuantileSketch with running count, sum, sum of squares,
+    min and max, so percentiles, mean and standard deviation are available
+    without the raw samples. Serialises to the QuantileSketch JSON form
+    extended with "sum", "sum_squares", "min" and "max".
+
+    Example:
+        >>> sketch = LatencySketch()
+        >>> for latency in [120.0, 150.0, 900.0]:
+        ...     sketch.add(latency)
+        >>> sketch.percentiles()['p50']  # ~150.0 within 1%
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_bins: int = DEFAULT_MAX_BINS
+    ):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Relative error bound of percentile estimates
+            max_bins: Maximum number of sketch buckets kept
+        """
+        self.sketch = QuantileSketch(alpha=relative_accuracy, max_bins=max_bins)
+        self.total = 0.0
+        self.total_squares = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    @property
+    def count(self) -> int:
+        """Number of latencies added."""
+        return self.sketch.count
+
+    @property
+    def mean(self) -> float:
+        """Mean latency (0.0 when empty)."""
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """Sample standard deviation (0.0 with fewer than two latencies)."""
+        if self.count < 2:
+            return 0.0
+        variance = (self.total_squares - self.total * self.total / self.count) / (self.count - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def add(self, latency_ms: float) -> None:
+        """Add one latency in O(1)."""
+        latency_ms = float(latency_ms)
+        self.sketch.add(latency_ms)
+        self.total += latency_ms
+        self.total_squares += latency_ms * latency_ms
+        self.min = latency_ms if self.min is None else min(self.min, latency_ms)
+        self.max = latency_ms if self.max is None else max(self.max, latency_ms)
+
+    def merge(self, other: "LatencySketch") -> None:
+        """
+        Add another sketch's latencies to this one.
+
+        Raises:
+            ValueError: If the sketches use a different relative accuracy
+        """
+        self.sketch.merge(other.sketch)
+        self.total += other.total
+        self.total_squares += other.total_squares
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Estimate a percentile (0-100), clamped to the observed min/max.
+
+        Returns:
+            Estimated latency, or None if the sketch is empty
+        """
+        value = self.sketch.quantile(percentile / 100)
+        if value is None:
+            return None
+        return min(max(value, self.min), self.max)
+
+    def percentiles(self, percentiles=STANDARD_PERCENTILES) -> Dict[str, float]:
+        """Return {'p50': ..., ...} for the given percentiles (0.0 when empty)."""
+        return {f"p{p:g}": self.percentile(p) or 0.0 for p in percentiles}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise to JSON-compatible form."""
+        data = self.sketch.to_dict()
+        data.update({
+            'sum': self.total,
+            'sum_squares': self.total_squares,
+            'min': self.min,
+            'max': self.max,
+        })
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "LatencySketch":
+        """Rebuild a sketch from to_dict() output (empty for None)."""
+        latency_sketch = cls()
+        if not data:
+            return latency_sketch
+        latency_sketch.sketch = QuantileSketch.from_dict(data)
+        latency_sketch.total = float(data.get('sum') or 0.0)
+        latency_sketch.total_squares = float(data.get('sum_squares') or 0.0)
+        latency_sketch.min = float(data['min']) if data.get('min') is not None else None
+        latency_sketch.max = float(data['max']) if data.get('max') is not None else None
+        return latency_sketch
+
 
 class LatencyPercentileService:
     """
@@ -29,6 +164,10 @@ class LatencyPercentileService:
     Provides latency recording, percentile calculations, histogram
     generation, and latency analysis for performance monitoring.
 
+    With use_sketch=True, percentiles, statistics, histograms and bucket
+    counts come from a LatencySketch instead of the retained latencies;
+    get_latencies(), outliers and trends cover the recent window only.
+
     Example:
         >>> service = LatencyPercentileService()
         >>> for latency in [100, 150, 200, 250, 300]:
@@ -37,11 +176,35 @@ class LatencyPercentileService:
         >>> print(f"Mean: {stats['mean']:.2f}ms")
     """
 
-    def __init__(self):
-        """Initialize the latency percentile service."""
-        self._latencies: List[float] = []
-        self._timestamps: List[str] = []
+    def __init__(
+        self,
+        use_sketch: bool = False,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        recent_window: int = 1000
+    ):
+        """
+        Initialize the latency percentile service.
+
+        Args:
+            use_sketch: Summarise latencies in a sketch instead of keeping them all
+            relative_accuracy: Relative error bound of sketch percentiles
+            recent_window: Latencies kept for trends/outliers in sketch mode
+        """
+        self.use_sketch = use_sketch
+        self._relative_accuracy = relative_accuracy
+        self._recent_window = recent_window
         self._baseline: Optional[Dict[str, float]] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        if self.use_sketch:
+            self._latencies = deque(maxlen=self._recent_window)
+            self._timestamps = deque(maxlen=self._recent_window)
+        else:
+            self._latencies = []
+            self._timestamps = []
+        self._sketch = LatencySketch(self._relative_accuracy)
+        self._sorted: Optional[List[float]] = None
 
     def record_latency(
         self,
@@ -60,10 +223,42 @@ class LatencyPercentileService:
         """
         self._latencies.append(latency_ms)
         self._timestamps.append(datetime.utcnow().isoformat())
+        self._sketch.add(latency_ms)
+        self._sorted = None
+
+    def get_sketch(self) -> LatencySketch:
+        """
+        Get the sketch summarising every recorded latency.
+
+        Returns:
+            The service's LatencySketch (shared, not a copy)
+
+        Example:
+            >>> payload = service.get_sketch().to_dict()
+        """
+        return self._sketch
+
+    def merge(self, sketch: LatencySketch) -> None:
+        """
+        Merge latencies summarised by another worker's sketch.
+
+        Args:
+            sketch: LatencySketch to fold in
+
+        Raises:
+            ValueError: If the service retains raw latencies (use_sketch=False)
+                or the sketch's relative accuracy differs
+
+        Example:
+            >>> service.merge(LatencySketch.from_dict(payload))
+        """
+        if not self.use_sketch:
+            raise ValueError("merge() requires use_sketch=True")
+        self._sketch.merge(sketch)
 
     def get_latencies(self) -> List[float]:
         """
-        Get all recorded latencies.
+        Get all recorded latencies (the recent window in sketch mode).
 
         Returns:
             List of latency values in milliseconds
@@ -72,7 +267,7 @@ class LatencyPercentileService:
             >>> latencies = service.get_latencies()
             >>> print(f"Recorded {len(latencies)} measurements")
         """
-        return self._latencies.copy()
+        return list(self._latencies)
 
     def clear_latencies(self) -> None:
         """
@@ -81,8 +276,7 @@ class LatencyPercentileService:
         Example:
             >>> service.clear_latencies()
         """
-        self._latencies = []
-        self._timestamps = []
+        self._reset()
 
     def calculate_percentile(
         self,
@@ -100,12 +294,17 @@ class LatencyPercentileService:
         Example:
             >>> p95 = service.calculate_percentile(95)
         """
+        if self.use_sketch:
+            return self._sketch.percentile(percentile) or 0.0
+
         if not self._latencies:
             return 0.0
 
-        sorted_latencies = sorted(self._latencies)
-        index = int((percentile / 100) * (len(sorted_latencies) - 1))
-        return sorted_latencies[index]
+        # Sorted once per batch of recordings, not once per percentile
+        if self._sorted is None:
+            self._sorted = sorted(self._latencies)
+        index = int((percentile / 100) * (len(self._sorted) - 1))
+        return self._sorted[index]
 
     def get_p50(self) -> float:
         """
@@ -191,18 +390,19 @@ class LatencyPercentileService:
             >>> for bucket in hist['buckets']:
             ...     print(f"{bucket['range']}: {bucket['count']}")
         """
-        if not self._latencies:
+        if not self._sketch.count:
             return {'buckets': [], 'total': 0}
 
-        min_val = min(self._latencies)
-        max_val = max(self._latencies)
+        weighted = self._weighted_latencies()
+        min_val = self._sketch.min
+        max_val = self._sketch.max
         bucket_size = (max_val - min_val) / bucket_count if bucket_count > 0 else 1
 
         buckets = []
         for i in range(bucket_count):
             low = min_val + (i * bucket_size)
             high = min_val + ((i + 1) * bucket_size)
-            count = sum(1 for latency in self._latencies if low <= latency < high)
+            count = sum(weight for latency, weight in weighted if low <= latency < high)
             buckets.append({
                 'range': f"{low:.1f}-{high:.1f}",
                 'low': low,
@@ -212,7 +412,7 @@ class LatencyPercentileService:
 
         return {
             'buckets': buckets,
-            'total': len(self._latencies),
+            'total': self._sketch.count,
             'bucket_size': bucket_size
         }
 
@@ -235,16 +435,17 @@ class LatencyPercentileService:
         if not boundaries:
             return {}
 
+        weighted = self._weighted_latencies()
         counts = {}
         for i in range(len(boundaries) - 1):
             low = boundaries[i]
             high = boundaries[i + 1]
             key = f"{low}-{high}"
-            counts[key] = sum(1 for latency in self._latencies if low <= latency < high)
+            counts[key] = sum(weight for latency, weight in weighted if low <= latency < high)
 
         # Handle overflow
         last = boundaries[-1]
-        counts[f"{last}+"] = sum(1 for latency in self._latencies if latency >= last)
+        counts[f"{last}+"] = sum(weight for latency, weight in weighted if latency >= last)
 
         return counts
 
@@ -259,7 +460,7 @@ class LatencyPercentileService:
             >>> stats = service.get_statistics()
             >>> print(f"Mean: {stats['mean']:.2f}ms")
         """
-        if not self._latencies:
+        if not self._sketch.count:
             return {
                 'count': 0,
                 'mean': 0.0,
@@ -269,6 +470,16 @@ class LatencyPercentileService:
                 'stddev': 0.0
             }
 
+        if self.use_sketch:
+            return {
+                'count': self._sketch.count,
+                'mean': self._sketch.mean,
+                'median': self.calculate_percentile(50),
+                'min': self._sketch.min,
+                'max': self._sketch.max,
+                'stddev': self._sketch.stddev
+            }
+
         return {
             'count': len(self._latencies),
             'mean': statistics.mean(self._latencies),
@@ -298,8 +509,12 @@ class LatencyPercentileService:
         if len(self._latencies) < 2:
             return []
 
-        mean = statistics.mean(self._latencies)
-        stddev = statistics.stdev(self._latencies)
+        if self.use_sketch:
+            mean = self._sketch.mean
+            stddev = self._sketch.stddev
+        else:
+            mean = statistics.mean(self._latencies)
+            stddev = statistics.stdev(self._latencies)
 
         if stddev == 0:
             return []
@@ -342,9 +557,10 @@ class LatencyPercentileService:
             }
 
         # Calculate moving averages
+        latencies = list(self._latencies)
         moving_avgs = []
-        for i in range(len(self._latencies) - window_size + 1):
-            window = self._latencies[i:i + window_size]
+        for i in range(len(latencies) - window_size + 1):
+            window = latencies[i:i + window_size]
             moving_avgs.append(statistics.mean(window))
 
         # Determine trend
@@ -435,6 +651,15 @@ class LatencyPercentileService:
             'overall_status': self._determine_overall_status(comparisons)
         }
 
+    def _weighted_latencies(self) -> List[tuple]:
+        """(latency, count) pairs: sketch buckets in sketch mode, else raw latencies."""
+        if self.use_sketch:
+            return [
+                (min(max(value, self._sketch.min), self._sketch.max), count)
+                for value, count in self._sketch.sketch.bins()
+            ]
+        return [(latency, 1) for latency in self._latencies]
+
     def _determine_overall_status(
         self,
         comparisons: Dict[str, Any]
@@ -0,0 +1,229 @@
+"""
+Cross-worker latency percentiles per suite run, language and CommandKind.
+
+Each worker records step latencies into local LatencySketch objects
+(O(1), no raw samples kept) and flush() merges them into Redis hashes with
+one atomic Lua script per key, so any number of workers contribute to the
+same percentiles without coordination:
+
+    latency_sketch:{suite_run_id}:{language_code}:{command_kind}
+
+A latency is recorded under its exact language/CommandKind key and under
+the "*" wildcard for each, so percentiles for the whole suite run, one
+language or one CommandKind are each a single HGETALL.
+
+Hash fields are the sketch buckets ("b:<bin>", counts) plus "alpha",
+"sum", "sum_squares", "min" and "max". Keys expire
+LATENCY_SKETCH_TTL_SECONDS after their last update.
+
+Example:
+    >>> store = get_latency_sketch_store()
+    >>> store.record(suite_run_id, 412.0, language_code="en-US", command_kind="WeatherCommand")
+    >>> await store.flush()
+    >>> await store.get_percentiles(suite_run_id, language_code="en-US")
+    {'count': 1, 'mean': 412.0, 'min': 412.0, 'max': 412.0, 'p50': 412.0, ...}
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from api.config import get_settings
+from services.latency_percentile_service import LatencySketch
+from services.quantile_sketch import DEFAULT_RELATIVE_ACCURACY
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "latency_sketch:"
+WILDCARD = "*"
+
+_BIN_FIELD_PREFIX = "b:"
+
+# KEYS[1] = sketch hash, ARGV[1] = LatencySketch.to_dict() JSON, ARGV[2] = TTL
+MERGE_SCRIPT = """
+local delta = cjson.decode(ARGV[1])
+for bin, count in pairs(delta.bins) do
+    redis.call('HINCRBY', KEYS[1], 'b:' .. bin, count)
+end
+redis.call('HSETNX', KEYS[1], 'alpha', tostring(delta.alpha))
+redis.call('HINCRBYFLOAT', KEYS[1], 'sum', tostring(delta.sum))
+redis.call('HINCRBYFLOAT', KEYS[1], 'sum_squares', tostring(delta.sum_squares))
+local low = redis.call('HGET', KEYS[1], 'min')
+if not low or delta.min < tonumber(low) then
+    redis.call('HSET', KEYS[1], 'min', tostring(delta.min))
+end
+local high = redis.call('HGET', KEYS[1], 'max')
+if not high or delta.max > tonumber(high) then
+    redis.call('HSET', KEYS[1], 'max', tostring(delta.max))
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+_SketchKey = Tuple[str, str, str]
+
+
+class LatencySketchStore:
+    """
+    Buffers latency sketches per worker and merges them into Redis.
+
+    Attributes:
+        relative_accuracy: Relative error bound of percentile estimates
+        ttl_seconds: Lifetime of a sketch after its last update
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        ttl_seconds: int = 7 * 24 * 3600,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            redis_client: RedisClient-compatible client (defaults to the global client)
+            relative_accuracy: Relative error bound of percentile estimates
+            ttl_seconds: Lifetime of a sketch after its last update
+        """
+        self._redis_client = redis_client
+        self.relative_accuracy = relative_accuracy
+        self.ttl_seconds = ttl_seconds
+        self._pending: Dict[_SketchKey, LatencySketch] = {}
+
+    @property
+    def pending(self) -> int:
+        """Number of sketches recorded locally and not yet flushed."""
+        return len(self._pending)
+
+    def record(
+        self,
+        suite_run_id: Any,
+        latency_ms: float,
+        language_code: Optional[str] = None,
+        command_kind: Optional[str] = None,
+    ) -> None:
+        """
+        Record one latency in the local sketches (no I/O).
+
+        Args:
+            suite_run_id: Suite run the latency belongs to
+            latency_ms: Latency in milliseconds
+            language_code: Language of the request (e.g. "en-US")
+            command_kind: Houndify CommandKind of the response
+        """
+        suite_run = str(suite_run_id)
+        language = language_code or WILDCARD
+        kind = command_kind or WILDCARD
+        for key in {
+            (suite_run, language, kind),
+            (suite_run, language, WILDCARD),
+            (suite_run, WILDCARD, kind),
+            (suite_run, WILDCARD, WILDCARD),
+        }:
+            sketch = self._pending.get(key)
+            if sketch is None:
+                sketch = self._pending[key] = LatencySketch(self.relative_accuracy)
+            sketch.add(latency_ms)
+
+    async def flush(self) -> int:
+        """
+        Merge the locally recorded sketches into Redis.
+
+        Latency percentiles are telemetry: sketches that cannot be written
+        are logged and dropped.
+
+        Returns:
+            Number of sketches merged
+        """
+        pending, self._pending = self._pending, {}
+        merged = 0
+        for key, sketch in pending.items():
+            try:
+                client = await self._get_client()
+                await client.eval(
+                    MERGE_SCRIPT,
+                    [self._redis_key(*key)],
+                    [json.dumps(sketch.to_dict()), self.ttl_seconds],
+                )
+                merged += 1
+            except Exception as e:
+                logger.warning(f"Failed to merge latency sketch {key}: {e}")
+        return merged
+
+    async def get(
+        self,
+        suite_run_id: Any,
+        language_code: Optional[str] = None,
+        command_kind: Optional[str] = None,
+    ) -> LatencySketch:
+        """
+        Load the merged sketch for a suite run, optionally narrowed by
+        language and/or CommandKind (empty if nothing was recorded).
+        """
+        client = await self._get_client()
+        fields = await client.hgetall(
+            self._redis_key(str(suite_run_id), language_code or WILDCARD, command_kind or WILDCARD)
+        )
+        if not fields:
+            return LatencySketch(self.relative_accuracy)
+
+        return LatencySketch.from_dict({
+            'alpha': float(fields.get('alpha', self.relative_accuracy)),
+            'bins': {
+                name[len(_BIN_FIELD_PREFIX):]: int(count)
+                for name, count in fields.items()
+                if name.startswith(_BIN_FIELD_PREFIX)
+            },
+            'sum': fields.get('sum'),
+            'sum_squares': fields.get('sum_squares'),
+            'min': fields.get('min'),
+            'max': fields.get('max'),
+        })
+
+    async def get_percentiles(
+        self,
+        suite_run_id: Any,
+        language_code: Optional[str] = None,
+        command_kind: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Latency summary (count, mean, min, max, p50, p90, p95, p99) for a
+        suite run, optionally narrowed by language and/or CommandKind.
+        """
+        sketch = await self.get(suite_run_id, language_code, command_kind)
+        summary: Dict[str, Any] = {
+            'count': sketch.count,
+            'mean': sketch.mean,
+            'min': sketch.min,
+            'max': sketch.max,
+        }
+        summary.update(sketch.percentiles())
+        return summary
+
+    @staticmethod
+    def _redis_key(suite_run: str, language: str, kind: str) -> str:
+        return f"{REDIS_KEY_PREFIX}{suite_run}:{language}:{kind}"
+
+    async def _get_client(self) -> Any:
+        if self._redis_client is None:
+            from api.redis_client import get_redis
+            self._redis_client = await get_redis().__anext__()
+        return self._redis_client
+
+
+_latency_sketch_store: Optional[LatencySketchStore] = None
+
+
+def get_latency_sketch_store() -> LatencySketchStore:
+    """Return the process-wide latency sketch store."""
+    global _latency_sketch_store
+    if _latency_sketch_store is None:
+        settings = get_settings()
+        _latency_sketch_store = LatencySketchStore(
+            relative_accuracy=settings.LATENCY_SKETCH_RELATIVE_ACCURACY,
+            ttl_seconds=settings.LATENCY_SKETCH_TTL_SECONDS,
+        )
+    return _latency_sketch_store
@@ -0,0 +1,440 @@
+"""
+LLM Admission Control
+
+Process-wide admission controller for LLM provider calls.
+
+Every provider/model pair gets its own limiter combining:
+
+- Token buckets for requests per minute and tokens per minute
+- An adaptive concurrency limit (AIMD): additive increase while calls
+  succeed within the latency target, multiplicative decrease on rate-limit
+  (429) responses and, more gently, on slow calls
+- A priority queue, so validation work whose results feed the human review
+  queue is admitted ahead of background pattern analysis
+
+Limits default to LLM_RATE_LIMIT_REQUESTS_PER_MINUTE,
+LLM_RATE_LIMIT_TOKENS_PER_MINUTE and LLM_MAX_CONCURRENCY, and can be
+overridden per provider or per provider/model through
+LLM_PROVIDER_RATE_LIMITS. Queue depth, wait time and the current
+concurrency limit are exported as Prometheus metrics.
+
+Example:
+    >>> from services.llm_admission import LLMPriority, get_admission_controller
+    >>>
+    >>> controller = get_admission_controller()
+    >>> async with controller.admit("openrouter", model, estimated_tokens=1500,
+    ...                             priority=LLMPriority.BACKGROUND) as admission:
+    ...     response = await call_provider()
+    ...     admission.record_usage(response["usage"]["total_tokens"])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from api import metrics
+from api.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Multiplicative decrease applied to the concurrency limit on a 429
+RATE_LIMIT_BACKOFF = 0.5
+
+# Multiplicative decrease applied when a call exceeds the latency target
+LATENCY_BACKOFF = 0.9
+
+# Minimum seconds between two decreases of the same limiter
+DECREASE_COOLDOWN_SECONDS = 1.0
+
+# Approximate characters per token used to estimate prompt size
+CHARS_PER_TOKEN = 4
+
+
+class LLMPriority(IntEnum):
+    """Admission priority of an LLM call (lower values are admitted first)."""
+
+    HUMAN_REVIEW = 0  # Validation whose results feed the human review queue
+    BACKGROUND = 1  # Pattern analysis and other deferrable work
+
+
+_priority_var: ContextVar[LLMPriority] = ContextVar('llm_priority', default=LLMPriority.HUMAN_REVIEW)
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority) -> Iterator[None]:
+    """Run LLM calls made in this context (including adapters) at ``priority``."""
+    token = _priority_var.set(priority)
+    try:
+        yield
+    finally:
+        _priority_var.reset(token)
+
+
+def current_llm_priority() -> LLMPriority:
+    """Return the priority LLM calls in this context are admitted with."""
+    return _priority_var.get()
+
+
+def estimate_tokens(*texts: Optional[str], max_output_tokens: int = 0) -> int:
+    """Estimate the tokens a request consumes from its prompt text and output budget."""
+    characters = sum(len(text) for text in texts if text)
+    return characters // CHARS_PER_TOKEN + max_output_tokens
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Return True if a provider SDK or HTTP error signals a 429/quota response."""
+    for candidate in (error, getattr(error, 'response', None)):
+        if candidate is None:
+            continue
+        for attribute in ('status_code', 'status', 'code'):
+            if getattr(candidate, attribute, None) == 429:
+                return True
+    name = type(error).__name__
+    return any(marker in name for marker in ('RateLimit', 'ResourceExhausted', 'TooManyRequests'))
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``per_minute`` tokens per minute."""
+
+    def __init__(self, per_minute: float, now: Optional[float] = None):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic() if now is None else now
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 if available now)."""
+        self._refill(now)
+        # Requests larger than the bucket only wait for a full bucket
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, amount: float) -> None:
+        """Refund (positive) or charge (negative) tokens after actual usage is known."""
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the provider reported a rate limit."""
+        self.tokens = min(self.tokens, 0.0)
+
+
+@dataclass
+class RateLimits:
+    """Limits applied to one provider/model."""
+
+    requests_per_minute: int
+    tokens_per_minute: int
+    max_concurrency: int
+    min_concurrency: int = 1
+    latency_target_ms: int = 10000
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    sequence: int
+    estimated_tokens: int = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    enqueued_at: float = field(compare=False)
+
+
+class Admission:
+    """A granted admission; report actual token usage through record_usage()."""
+
+    def __init__(self, limiter: Optional['ProviderLimiter'], estimated_tokens: int, wait_seconds: float):
+        self.limiter = limiter
+        self.estimated_tokens = estimated_tokens
+        self.wait_seconds = wait_seconds
+        self.tokens_used: Optional[int] = None
+
+    def record_usage(self, total_tokens: Optional[int]) -> None:
+        if total_tokens:
+            self.tokens_used = int(total_tokens)
+
+
+class ProviderLimiter:
+    """Token buckets, adaptive concurrency and priority queue for one provider/model."""
+
+    def __init__(self, provider: str, model: str, limits: RateLimits):
+        self.provider = provider
+        self.model = model
+        self.limits = limits
+        now = time.monotonic()
+        self.request_bucket = TokenBucket(limits.requests_per_minute, now)
+        self.token_bucket = TokenBucket(limits.tokens_per_minute, now)
+        self.concurrency_limit = float(limits.max_concurrency)
+        self.in_flight = 0
+        self.rate_limited_count = 0
+        self._waiters: List[_Waiter] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._last_decrease = 0.0
+        self._labels = {'provider': provider, 'model': model}
+        metrics.llm_concurrency_limit.labels(**self._labels).set(self.concurrency_limit)
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.future.done())
+
+    async def acquire(self, estimated_tokens: int, priority: LLMPriority) -> Admission:
+        """Wait until the call may be sent to the provider."""
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            priority=int(priority),
+            sequence=next(self._sequence),
+            estimated_tokens=estimated_tokens,
+            future=loop.create_future(),
+            enqueued_at=time.monotonic(),
+        )
+        heapq.heappush(self._waiters, waiter)
+        self._update_queue_metrics(priority)
+        self._dispatch()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just before the cancellation arrived; give the slot back
+                self._release_slot()
+            self._dispatch()
+            raise
+        finally:
+            self._update_queue_metrics(priority)
+
+        wait_seconds = time.monotonic() - waiter.enqueued_at
+        metrics.llm_admission_wait_seconds.labels(
+            priority=priority.name.lower(), **self._labels
+        ).observe(wait_seconds)
+        return Admission(self, estimated_tokens, wait_seconds)
+
+    def release(
+        self,
+        admission: Admission,
+        *,
+        latency_ms: float,
+        rate_limited: bool = False,
+    ) -> None:
+        """Free the admission's slot and adapt limits to the call's outcome."""
+        self._release_slot()
+
+        if admission.tokens_used is not None:
+            self.token_bucket.adjust(admission.estimated_tokens - admission.tokens_used)
+
+        if rate_limited:
+            self.rate_limited_count += 1
+            metrics.llm_rate_limited_total.labels(**self._labels).inc()
+            self.request_bucket.drain()
+            self._decrease(RATE_LIMIT_BACKOFF)
+        elif latency_ms > self.limits.latency_target_ms:
+            self._decrease(LATENCY_BACKOFF)
+        else:
+            # Additive increase: roughly +1 per window of concurrency_limit calls
+            self.concurrency_limit = min(
+                float(self.limits.max_concurrency),
+                self.concurrency_limit + 1.0 / self.concurrency_limit,
+            )
+            metrics.llm_concurrency_limit.labels(**self._labels).set(self.concurrency_limit)
+
+        self._dispatch()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current state of the limiter for diagnostics."""
+        depth_by_priority: Dict[str, int] = {}
+        for waiter in self._waiters:
+            if not waiter.future.done():
+                name = LLMPriority(waiter.priority).name.lower()
+                depth_by_priority[name] = depth_by_priority.get(name, 0) + 1
+        return {
+            'provider': self.provider,
+            'model': self.model,
+            'in_flight': self.in_flight,
+            'concurrency_limit': round(self.concurrency_limit, 2),
+            'queue_depth': sum(depth_by_priority.values()),
+            'queue_depth_by_priority': depth_by_priority,
+            'rate_limited_count': self.rate_limited_count,
+        }
+
+    def _release_slot(self) -> None:
+        self.in_flight = max(0, self.in_flight - 1)
+
+    def _decrease(self, factor: float) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < DECREASE_COOLDOWN_SECONDS:
+            return
+        self._last_decrease = now
+        self.concurrency_limit = max(
+            float(self.limits.min_concurrency), self.concurrency_limit * factor
+        )
+        metrics.llm_concurrency_limit.labels(**self._labels).set(self.concurrency_limit)
+        logger.info(
+            f"LLM concurrency for {self.provider}/{self.model} reduced to "
+            f"{self.concurrency_limit:.1f}"
+        )
+
+    def _dispatch(self) -> None:
+        """Admit waiters in priority order while slots and bucket tokens allow."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._waiters:
+            waiter = self._waiters[0]
+            if waiter.future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self.in_flight >= int(self.concurrency_limit):
+                return
+
+            now = time.monotonic()
+            delay = max(
+                self.request_bucket.wait_time(1, now),
+                self.token_bucket.wait_time(waiter.estimated_tokens, now),
+            )
+            if delay > 0:
+                # Lower priorities may not overtake the head of the queue
+                self._timer = waiter.future.get_loop().call_later(delay, self._dispatch)
+                return
+
+            heapq.heappop(self._waiters)
+            self.request_bucket.consume(1)
+            self.token_bucket.consume(waiter.estimated_tokens)
+            self.in_flight += 1
+            waiter.future.set_result(None)
+
+    def _update_queue_metrics(self, priority: LLMPriority) -> None:
+        depth = sum(
+            1 for waiter in self._waiters
+            if waiter.priority == priority and not waiter.future.done()
+        )
+        metrics.llm_admission_queue_depth.labels(
+            priority=priority.name.lower(), **self._labels
+        ).set(depth)
+
+
+class LLMAdmissionController:
+    """Registry of ProviderLimiters keyed by provider and model."""
+
+    def __init__(
+        self,
+        default_limits: RateLimits,
+        overrides: Optional[Dict[str, Dict[str, int]]] = None,
+        enabled: bool = True,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            default_limits: Limits for provider/models without an override
+            overrides: Limits by "provider" or "provider:model" with any of
+                requests_per_minute, tokens_per_minute, max_concurrency,
+                min_concurrency and latency_target_ms
+            enabled: When False, admit() never waits
+        """
+        self.default_limits = default_limits
+        self.overrides = overrides or {}
+        self.enabled = enabled
+        self._limiters: Dict[Tuple[str, str], ProviderLimiter] = {}
+
+    def limiter(self, provider: str, model: str) -> ProviderLimiter:
+        key = (provider, model)
+        if key not in self._limiters:
+            self._limiters[key] = ProviderLimiter(provider, model, self._limits_for(provider, model))
+        return self._limiters[key]
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        provider: str,
+        model: str,
+        estimated_tokens: int,
+        priority: Optional[LLMPriority] = None,
+    ) -> AsyncIterator[Admission]:
+        """
+        Hold an admission for the duration of one provider call.
+
+        Rate-limit errors raised inside the block shrink the limiter's
+        concurrency and are re-raised.
+
+        Args:
+            provider: Provider name (e.g. "openrouter")
+            model: Model identifier
+            estimated_tokens: Expected prompt plus completion tokens
+            priority: Admission priority (defaults to the context's priority)
+        """
+        if not self.enabled:
+            yield Admission(None, estimated_tokens, 0.0)
+            return
+
+        limiter = self.limiter(provider, model)
+        admission = await limiter.acquire(estimated_tokens, priority or current_llm_priority())
+        start_time = time.monotonic()
+        rate_limited = False
+        try:
+            yield admission
+        except Exception as e:
+            rate_limited = is_rate_limit_error(e)
+            if rate_limited:
+                logger.warning(f"{provider}/{model} rate limited: {e}")
+            raise
+        finally:
+            limiter.release(
+                admission,
+                latency_ms=(time.monotonic() - start_time) * 1000,
+                rate_limited=rate_limited,
+            )
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [limiter.snapshot() for limiter in self._limiters.values()]
+
+    def _limits_for(self, provider: str, model: str) -> RateLimits:
+        values = dict(vars(self.default_limits))
+        values.update(self.overrides.get(provider, {}))
+        values.update(self.overrides.get(f"{provider}:{model}", {}))
+        return RateLimits(**values)
+
+
+_admission_controller: Optional[LLMAdmissionController] = None
+
+
+def get_admission_controller() -> LLMAdmissionController:
+    """
+    Return the process-wide admission controller.
+
+    Configured by LLM_ADMISSION_ENABLED, LLM_RATE_LIMIT_REQUESTS_PER_MINUTE,
+    LLM_RATE_LIMIT_TOKENS_PER_MINUTE, LLM_MAX_CONCURRENCY,
+    LLM_MIN_CONCURRENCY, LLM_LATENCY_TARGET_MS and LLM_PROVIDER_RATE_LIMITS.
+    """
+    global _admission_controller
+    if _admission_controller is None:
+        settings = get_settings()
+        _admission_controller = LLMAdmissionController(
+            default_limits=RateLimits(
+                requests_per_minute=settings.LLM_RATE_LIMIT_REQUESTS_PER_MINUTE,
+                tokens_per_minute=settings.LLM_RATE_LIMIT_TOKENS_PER_MINUTE,
+                max_concurrency=settings.LLM_MAX_CONCURRENCY,
+                min_concurrency=settings.LLM_MIN_CONCURRENCY,
+                latency_target_ms=settings.LLM_LATENCY_TARGET_MS,
+            ),
+            overrides=settings.LLM_PROVIDER_RATE_LIMITS,
+            enabled=settings.LLM_ADMISSION_ENABLED,
+        )
+    return _admission_controller
@@ -0,0 +1,468 @@
+"""
+LLM Evaluation Cache
+
+Content-addressed cache of the LLM judge evaluations made by
+LLMPipelineService.
+
+Each evaluator or curator call is keyed by a SHA-256 of exactly what the
+provider receives: provider, model, sampling settings, system prompt and
+rendered evaluation prompt. Replaying an unchanged utterance, response and
+context through the same prompt template and model therefore hits the
+cache, while changing any of them produces a new key.
+
+Entries are kept in two tiers:
+
+- Redis: hot entries, expiring after LLM_EVAL_CACHE_REDIS_TTL_SECONDS
+- Postgres (llm_evaluation_cache): durable entries, expiring after
+  LLM_EVAL_CACHE_TTL_SECONDS; hits are promoted back to Redis
+
+Rows record the prompt-template version and model of each entry so they
+can be invalidated explicitly when either changes. Both tiers fail open:
+backend errors are logged and treated as misses.
+
+Example:
+    >>> from services.llm_evaluation_cache import get_evaluation_cache
+    >>>
+    >>> cache = get_evaluation_cache()
+    >>> cached = await cache.get(key)
+    >>> if cached is None:
+    ...     result = await adapter.evaluate(...)
+    ...     await cache.set(key, CachedEvaluation.from_result(result), ...)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, delete, or_, select, true
+
+from api.config import get_settings
+from models.llm_evaluation_cache import LLMEvaluationCacheEntry
+from models.llm_usage_log import LLMUsageLog, calculate_cost
+from services.llm_providers.base import EvaluationResult, get_evaluation_prompt
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "llm_eval:"
+
+# Seconds Redis is skipped after an error before it is tried again
+REDIS_RETRY_SECONDS = 30.0
+
+# Keys deleted per round trip when invalidating
+INVALIDATE_CHUNK_SIZE = 500
+
+
+def evaluation_prompt_version(system_prompt: str) -> str:
+    """
+    Fingerprint of the evaluation prompt template and a system prompt.
+
+    Changes whenever get_evaluation_prompt's template or the system prompt
+    is edited, independently of the utterance being evaluated.
+    """
+    template = get_evaluation_prompt(
+        user_utterance="{user_utterance}",
+        ai_response="{ai_response}",
+        context={
+            "step_order": "{step_order}",
+            "conversation_history": [{"user": "{user}", "ai": "{ai}"}],
+        },
+    )
+    payload = f"{system_prompt}\n{template}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def evaluation_cache_key(
+    *,
+    provider: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    system_prompt: str,
+    prompt: str
+) -> str:
+    """Canonical SHA-256 of a provider request."""
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "temperature": float(temperature),
+            "max_tokens": int(max_tokens),
+            "system_prompt": system_prompt,
+            "prompt": prompt,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedEvaluation:
+    """
+    A cached evaluation and the usage its original call incurred.
+
+    Attributes:
+        result: Parsed evaluation (scores, overall_score, decision, reasoning)
+        prompt_tokens: Prompt tokens of the original call
+        completion_tokens: Completion tokens of the original call
+        cost_usd: Estimated cost in USD of the original call
+    """
+
+    result: Dict[str, Any]
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+
+    @classmethod
+    def from_result(cls, result: EvaluationResult) -> "CachedEvaluation":
+        """Capture an EvaluationResult and the token usage of its raw response."""
+        usage = (result.raw_response or {}).get("usage") or {}
+        return cls(
+            result={
+                "scores": result.scores,
+                "overall_score": result.overall_score,
+                "decision": result.decision,
+                "reasoning": result.reasoning,
+            },
+            prompt_tokens=int(usage.get("prompt_tokens") or 0),
+            completion_tokens=int(usage.get("completion_tokens") or 0),
+        )
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def to_evaluation_result(self, provider: str, model: str, latency_ms: int = 0) -> EvaluationResult:
+        """Rebuild the EvaluationResult served for a cache hit."""
+        return EvaluationResult(
+            scores=dict(self.result.get("scores") or {}),
+            overall_score=float(self.result.get("overall_score", 0.0)),
+            decision=self.result.get("decision", "uncertain"),
+            reasoning=self.result.get("reasoning", ""),
+            raw_response={"cache_hit": True},
+            latency_ms=latency_ms,
+            provider=provider,
+            model=model,
+        )
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "result": self.result,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cost_usd": self.cost_usd,
+        })
+
+    @classmethod
+    def from_json(cls, value: str) -> "CachedEvaluation":
+        data = json.loads(value)
+        return cls(
+            result=data["result"],
+            prompt_tokens=int(data.get("prompt_tokens", 0)),
+            completion_tokens=int(data.get("completion_tokens", 0)),
+            cost_usd=float(data.get("cost_usd", 0.0)),
+        )
+
+
+@dataclass
+class CacheHit:
+    """A cache hit to be recorded in LLMUsageLog."""
+
+    operation: str
+    provider: str
+    model: str
+    cache_key: str
+    cached: CachedEvaluation
+    duration_ms: int = 0
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite returns naive datetimes
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+class LLMEvaluationCache:
+    """
+    Two-tier (Redis + Postgres) cache of LLM evaluations.
+
+    Attributes:
+        ttl_seconds: Lifetime of durable entries
+        redis_ttl_seconds: Lifetime of hot entries
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+        ttl_seconds: int = 30 * 24 * 3600,
+        redis_ttl_seconds: int = 24 * 3600,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_client: RedisClient-compatible client (defaults to the global client)
+            session_factory: Callable returning an AsyncSession context manager
+                (defaults to api.database.get_async_session)
+            ttl_seconds: Lifetime of durable entries
+            redis_ttl_seconds: Lifetime of hot entries (capped at ttl_seconds)
+        """
+        self._redis_client = redis_client
+        self._session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self.redis_ttl_seconds = min(redis_ttl_seconds, ttl_seconds)
+        self._redis_retry_at = 0.0
+
+    async def get(self, key: str) -> Optional[CachedEvaluation]:
+        """
+        Look up an evaluation, trying Redis before Postgres.
+
+        Returns:
+            The cached evaluation, or None on a miss
+        """
+        value = await self._redis_call("get", REDIS_KEY_PREFIX + key)
+        if value:
+            try:
+                return CachedEvaluation.from_json(value)
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring malformed LLM evaluation cache entry {key[:12]}: {e}")
+
+        try:
+            async with self._get_session() as session:
+                result = await session.execute(
+                    select(LLMEvaluationCacheEntry).where(
+                        LLMEvaluationCacheEntry.cache_key == key,
+                        LLMEvaluationCacheEntry.expires_at > _utcnow(),
+                    )
+                )
+                entry = result.scalar_one_or_none()
+        except Exception as e:
+            logger.warning(f"LLM evaluation cache lookup failed: {e}")
+            return None
+
+        if entry is None:
+            return None
+
+        cached = CachedEvaluation(
+            result=entry.result,
+            prompt_tokens=entry.prompt_tokens or 0,
+            completion_tokens=entry.completion_tokens or 0,
+            cost_usd=float(entry.cost_usd or 0),
+        )
+        remaining = int((_as_utc(entry.expires_at) - _utcnow()).total_seconds())
+        if remaining > 0:
+            await self._redis_call(
+                "set", REDIS_KEY_PREFIX + key, cached.to_json(),
+                ttl=min(self.redis_ttl_seconds, remaining)
+            )
+        return cached
+
+    async def set(
+        self,
+        key: str,
+        cached: CachedEvaluation,
+        *,
+        provider: str,
+        model: str,
+        prompt_version: str
+    ) -> None:
+        """
+        Store an evaluation in both tiers.
+
+        The cost of the original call is estimated from its token usage
+        (database pricing when available) and stored with the entry.
+        """
+        try:
+            async with self._get_session() as session:
+                cached.cost_usd = await session.run_sync(
+                    lambda sync_session: calculate_cost(
+                        model, cached.prompt_tokens, cached.completion_tokens,
+                        db=sync_session, provider=provider
+                    )
+                )
+                await session.merge(LLMEvaluationCacheEntry(
+                    cache_key=key,
+                    provider=provider,
+                    model=model,
+                    prompt_version=prompt_version,
+                    result=cached.result,
+                    prompt_tokens=cached.prompt_tokens,
+                    completion_tokens=cached.completion_tokens,
+                    cost_usd=cached.cost_usd,
+                    expires_at=_utcnow() + timedelta(seconds=self.ttl_seconds),
+                ))
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"LLM evaluation cache store failed: {e}")
+            if not cached.cost_usd:
+                cached.cost_usd = calculate_cost(
+                    model, cached.prompt_tokens, cached.completion_tokens, provider=provider
+                )
+
+        await self._redis_call(
+            "set", REDIS_KEY_PREFIX + key, cached.to_json(), ttl=self.redis_ttl_seconds
+        )
+
+    async def invalidate(
+        self,
+        *,
+        model: Optional[str] = None,
+        prompt_version: Optional[str] = None
+    ) -> int:
+        """
+        Delete entries produced by a model and/or prompt version.
+
+        With no arguments every entry is deleted.
+
+        Returns:
+            Number of entries deleted
+        """
+        conditions = []
+        if model is not None:
+            conditions.append(LLMEvaluationCacheEntry.model == model)
+        if prompt_version is not None:
+            conditions.append(LLMEvaluationCacheEntry.prompt_version == prompt_version)
+        return await self._delete_where(and_(*conditions) if conditions else true())
+
+    async def purge_stale(
+        self,
+        prompt_versions: Iterable[str],
+        models: Iterable[str]
+    ) -> int:
+        """
+        Delete expired entries and entries of prompt versions or models no longer in use.
+
+        Args:
+            prompt_versions: Prompt versions currently in use
+            models: Models currently in use
+
+        Returns:
+            Number of entries deleted
+        """
+        return await self._delete_where(or_(
+            LLMEvaluationCacheEntry.expires_at <= _utcnow(),
+            LLMEvaluationCacheEntry.prompt_version.not_in(list(prompt_versions)),
+            LLMEvaluationCacheEntry.model.not_in(list(models)),
+        ))
+
+    async def record_hits(self, tenant_id: Optional[UUID], hits: List[CacheHit]) -> None:
+        """
+        Record cache hits in LLMUsageLog as zero-cost calls.
+
+        The cost and tokens the hit avoided are kept in request_metadata
+        (saved_cost_usd, saved_tokens) so analytics can report savings.
+        """
+        if not hits:
+            return
+        if not tenant_id:
+            logger.debug(f"Skipping LLM cache hit logging (no tenant_id): {len(hits)} hits")
+            return
+
+        try:
+            async with self._get_session() as session:
+                session.add_all([
+                    LLMUsageLog(
+                        tenant_id=tenant_id,
+                        service_name="llm_pipeline",
+                        operation=hit.operation,
+                        model=hit.model,
+                        provider=hit.provider,
+                        prompt_tokens=0,
+                        completion_tokens=0,
+                        total_tokens=0,
+                        estimated_cost_usd=0,
+                        request_metadata={
+                            **hit.metadata,
+                            "cache_hit": True,
+                            "cache_key": hit.cache_key,
+                            "saved_cost_usd": hit.cached.cost_usd,
+                            "saved_tokens": hit.cached.total_tokens,
+                        },
+                        duration_ms=hit.duration_ms,
+                        success=True,
+                    )
+                    for hit in hits
+                ])
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Failed to log LLM cache hits: {e}")
+
+    async def _delete_where(self, condition: Any) -> int:
+        deleted = 0
+        try:
+            async with self._get_session() as session:
+                result = await session.execute(
+                    select(LLMEvaluationCacheEntry.cache_key).where(condition)
+                )
+                keys = list(result.scalars())
+                for start in range(0, len(keys), INVALIDATE_CHUNK_SIZE):
+                    chunk = keys[start:start + INVALIDATE_CHUNK_SIZE]
+                    await self._redis_call("delete", *(REDIS_KEY_PREFIX + key for key in chunk))
+                    await session.execute(
+                        delete(LLMEvaluationCacheEntry).where(
+                            LLMEvaluationCacheEntry.cache_key.in_(chunk)
+                        )
+                    )
+                    deleted += len(chunk)
+                await session.commit()
+        except Exception as e:
+            logger.error(f"LLM evaluation cache invalidation failed: {e}")
+            return deleted
+
+        logger.info(f"Invalidated {deleted} LLM evaluation cache entries")
+        return deleted
+
+    def _get_session(self):
+        if self._session_factory is None:
+            from api.database import get_async_session
+            self._session_factory = get_async_session
+        return self._session_factory()
+
+    async def _redis_call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call a Redis client method, skipping Redis for a while after an error."""
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        try:
+            if self._redis_client is None:
+                from api.redis_client import get_redis
+                self._redis_client = await get_redis().__anext__()
+            return await getattr(self._redis_client, method)(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"LLM evaluation cache Redis {method} failed: {e}")
+            self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+            return None
+
+
+_evaluation_cache: Optional[LLMEvaluationCache] = None
+
+
+def get_evaluation_cache() -> Optional[LLMEvaluationCache]:
+    """
+    Return the process-wide evaluation cache (None when disabled).
+
+    Configured by LLM_EVAL_CACHE_ENABLED, LLM_EVAL_CACHE_TTL_SECONDS and
+    LLM_EVAL_CACHE_REDIS_TTL_SECONDS.
+    """
+    global _evaluation_cache
+    settings = get_settings()
+    if not settings.LLM_EVAL_CACHE_ENABLED:
+        return None
+    if _evaluation_cache is None:
+        _evaluation_cache = LLMEvaluationCache(
+            ttl_seconds=settings.LLM_EVAL_CACHE_TTL_SECONDS,
+            redis_ttl_seconds=settings.LLM_EVAL_CACHE_REDIS_TTL_SECONDS,
+        )
+    return _evaluation_cache
@@ -22,6 +22,7 @@ from models.edge_case import EdgeCase
 from models.pattern_group import PatternGroup
 from models.llm_usage_log import LLMUsageLog, calculate_cost
 from api.config import get_settings
+from services.llm_admission import LLMPriority, estimate_tokens, get_admission_controller
 
 logger = logging.getLogger(__name__)
 
@@ -414,26 +415,34 @@ Respond ONLY with valid JSON in this exact format:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload
-                )
-                response.raise_for_status()
-
-                data = response.json()
-
-                # Extract token usage
-                usage = data.get("usage", {})
-                prompt_tokens = usage.get("prompt_tokens", 0)
-                completion_tokens = usage.get("completion_tokens", 0)
-                total_tokens = usage.get("total_tokens", 0)
-
-                success = True
-                content = data["choices"][0]["message"]["content"]
-
-                return content
+            # Background work: queued behind validation calls to the same model
+            async with get_admission_controller().admit(
+                "openrouter",
+                self.model,
+                estimate_tokens(prompt, max_output_tokens=payload["max_tokens"]),
+                priority=LLMPriority.BACKGROUND,
+            ) as admission:
+                async with httpx.AsyncClient(timeout=30.0) as client:
+                    response = await client.post(
+                        f"{self.base_url}/chat/completions",
+                        headers=headers,
+                        json=payload
+                    )
+                    response.raise_for_status()
+
+                    data = response.json()
+
+                    # Extract token usage
+                    usage = data.get("usage", {})
+                    prompt_tokens = usage.get("prompt_tokens", 0)
+                    completion_tokens = usage.get("completion_tokens", 0)
+                    total_tokens = usage.get("total_tokens", 0)
+                    admission.record_usage(total_tokens)
+
+                    success = True
+                    content = data["choices"][0]["message"]["content"]
+
+                    return content
 
         except Exception as e:
             error_message = str(e)
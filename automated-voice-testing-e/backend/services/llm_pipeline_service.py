@@ -6,6 +6,19 @@ Three-stage LLM validation pipeline for voice AI testing:
 2. Curator (Claude) - Tie-breaking when evaluators disagree
 3. Decision - Pass/Fail/Human Review based on consensus
 
+evaluate_batch() scores many turns at once (e.g. every step and language of
+a completed multi-turn execution), packing them into batch requests per
+evaluator and curator.
+
+With sequential evaluators (LLM_SEQUENTIAL_EVALUATORS), Evaluator A runs
+first and Evaluator B is only added when A's score is borderline; the path
+taken is recorded as PipelineResult.decision_path
+(services/validation_decision_policy.py).
+
+Evaluator and curator calls are served from the LLM evaluation cache
+(services/llm_evaluation_cache.py) when the same request was evaluated
+before; hits are logged to LLMUsageLog as zero-cost calls.
+
 This focuses on **behavioral testing** - assessing whether the agent
 performed the correct action, not whether it used exact words.
 
@@ -15,15 +28,33 @@ See: backend/services/llm_providers/LLM_VALIDATION_DESIGN.md
 import asyncio
 import logging
 import os
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
-
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from services.llm_evaluation_cache import (
+    CachedEvaluation,
+    CacheHit,
+    LLMEvaluationCache,
+    evaluation_cache_key,
+    evaluation_prompt_version,
+    get_evaluation_cache,
+)
 from services.llm_providers import (
     create_evaluator_a,
     create_evaluator_b,
     create_curator,
+    EvaluationItem,
     EvaluationResult,
 )
+from services.llm_providers.base import DEFAULT_EVALUATION_SYSTEM_PROMPT
+from services.validation_decision_policy import (
+    DECISION_PATH_DUAL_EVALUATOR,
+    DECISION_PATH_SINGLE_EVALUATOR,
+    DecisionPolicy,
+    get_decision_policy,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +78,21 @@ def get_pass_threshold() -> float:
     return float(os.getenv('LLM_PASS_THRESHOLD', '0.80'))
 
 
+def get_batch_max_items() -> int:
+    """Get maximum turns per batch evaluation request from environment."""
+    return int(os.getenv('LLM_BATCH_MAX_ITEMS', '10'))
+
+
+# System prompt for the curator's tie-breaking evaluation
+CURATOR_SYSTEM_PROMPT = (
+    "You are a senior QA expert reviewing conflicting evaluations. "
+    "Two evaluators assessed a voice AI response and disagreed. "
+    "Review both evaluations and provide your own independent assessment. "
+    "Focus on which evaluation more accurately captures the AI's performance. "
+    "Respond with valid JSON only. No markdown, no extra text."
+)
+
+
 # =============================================================================
 # Pipeline Result
 # =============================================================================
@@ -69,7 +115,10 @@ class PipelineResult:
         curator_decision: Curator's tie-breaking decision (if called)
         curator_reasoning: Curator's reasoning (if called)
         score_difference: Absolute difference between evaluator scores
-        consensus_type: 'high_consensus', 'curator_resolved', 'human_review'
+        consensus_type: 'high_consensus', 'curator_resolved', 'human_review',
+            'single_evaluator'
+        cache_hits: Number of evaluator/curator calls served from the cache
+        decision_path: 'single_evaluator' or 'dual_evaluator'
     """
     final_score: float = 0.0
     final_decision: str = "needs_review"
@@ -88,6 +137,8 @@ class PipelineResult:
     evaluator_a_latency_ms: int = 0
     evaluator_b_latency_ms: int = 0
     curator_latency_ms: int = 0
+    cache_hits: int = 0
+    decision_path: str = DECISION_PATH_DUAL_EVALUATOR
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
@@ -109,6 +160,8 @@ class PipelineResult:
             'evaluator_a_latency_ms': self.evaluator_a_latency_ms,
             'evaluator_b_latency_ms': self.evaluator_b_latency_ms,
             'curator_latency_ms': self.curator_latency_ms,
+            'cache_hits': self.cache_hits,
+            'decision_path': self.decision_path,
         }
 
 
@@ -123,6 +176,7 @@ class LLMPipelineService:
     Stage 1: Dual Evaluators
         - Evaluator A (Gemini) and B (GPT) run in parallel
         - Each provides a score (0.0-1.0) and reasoning
+        - With sequential evaluators, B only runs when A is borderline
 
     Stage 2: Curator (conditional)
         - Only called when evaluators disagree beyond consensus threshold
@@ -141,6 +195,9 @@ class LLMPipelineService:
         consensus_threshold: Optional[float] = None,
         extreme_disagreement_threshold: Optional[float] = None,
         pass_threshold: Optional[float] = None,
+        cache: Optional[LLMEvaluationCache] = None,
+        batch_max_items: Optional[int] = None,
+        policy: Optional[DecisionPolicy] = None,
     ):
         """
         Initialize the pipeline service.
@@ -150,6 +207,10 @@ class LLMPipelineService:
             consensus_threshold: Max score diff for high consensus
             extreme_disagreement_threshold: Score diff triggering human review
             pass_threshold: Minimum score to pass
+            cache: Evaluation cache (defaults to the process-wide cache,
+                None when LLM_EVAL_CACHE_ENABLED is false)
+            batch_max_items: Maximum turns per batch evaluation request
+            policy: Decision policy (defaults to the configured policy)
         """
         self.api_key = api_key
         self.consensus_threshold = (
@@ -159,6 +220,9 @@ class LLMPipelineService:
             extreme_disagreement_threshold or get_extreme_disagreement_threshold()
         )
         self.pass_threshold = pass_threshold or get_pass_threshold()
+        self.cache = cache if cache is not None else get_evaluation_cache()
+        self.batch_max_items = batch_max_items or get_batch_max_items()
+        self.policy = policy or get_decision_policy()
 
         # Lazy-loaded adapters
         self._evaluator_a = None
@@ -188,6 +252,7 @@ class LLMPipelineService:
         user_utterance: str,
         ai_response: str,
         context: Optional[Dict[str, Any]] = None,
+        tenant_id: Optional[UUID] = None,
     ) -> PipelineResult:
         """
         Run the three-stage evaluation pipeline.
@@ -196,19 +261,49 @@ class LLMPipelineService:
             user_utterance: What the user said
             ai_response: What the voice AI responded
             context: Additional context (conversation history, step order)
+            tenant_id: Tenant that cache hits are logged for
 
         Returns:
             PipelineResult with scores, decision, and confidence
         """
-        import time
         start_time = time.time()
+        cache_hits: List[CacheHit] = []
 
-        # Stage 1: Dual Evaluators (parallel)
-        eval_a, eval_b = await self._run_dual_evaluators(
-            user_utterance=user_utterance,
-            ai_response=ai_response,
-            context=context,
-        )
+        # Stage 1: Dual Evaluators (parallel, or B only when A is borderline)
+        if self.policy.sequential_evaluators:
+            eval_a = await self._run_evaluator(
+                "evaluator_a", self._get_evaluator_a(),
+                user_utterance=user_utterance,
+                ai_response=ai_response,
+                context=context,
+                cache_hits=cache_hits,
+            )
+            if self._is_decisive(eval_a):
+                result = self._single_evaluator_result(eval_a)
+                result.latency_ms = int((time.time() - start_time) * 1000)
+                result.cache_hits = len(cache_hits)
+                if self.cache is not None and cache_hits:
+                    await self.cache.record_hits(tenant_id, cache_hits)
+                logger.info(
+                    f"Pipeline complete: {result.final_decision} "
+                    f"(score={result.final_score:.2f}, evaluator A decisive)"
+                )
+                return result
+
+            eval_b = await self._run_evaluator(
+                "evaluator_b", self._get_evaluator_b(),
+                user_utterance=user_utterance,
+                ai_response=ai_response,
+                context=context,
+                cache_hits=cache_hits,
+            )
+        else:
+            eval_a, eval_b = await self._run_dual_evaluators(
+                user_utterance=user_utterance,
+                ai_response=ai_response,
+                context=context,
+                cache_hits=cache_hits,
+            )
 
         # Normalize scores to 0-1 range (evaluators return 0-10)
         score_a = eval_a.overall_score / 10.0
@@ -225,12 +320,17 @@ class LLMPipelineService:
             user_utterance=user_utterance,
             ai_response=ai_response,
             context=context,
+            cache_hits=cache_hits,
         )
 
         # Set latencies
         result.evaluator_a_latency_ms = eval_a.latency_ms
         result.evaluator_b_latency_ms = eval_b.latency_ms
         result.latency_ms = int((time.time() - start_time) * 1000)
+        result.cache_hits = len(cache_hits)
+
+        if self.cache is not None and cache_hits:
+            await self.cache.record_hits(tenant_id, cache_hits)
 
         logger.info(
             f"Pipeline complete: {result.final_decision} "
@@ -240,11 +340,122 @@ class LLMPipelineService:
 
         return result
 
+    async def evaluate_batch(
+        self,
+        items: List[EvaluationItem],
+        tenant_id: Optional[UUID] = None,
+    ) -> List[PipelineResult]:
+        """
+        Run the three-stage pipeline for many turns with batched LLM calls.
+
+        Each evaluator scores all turns in batch requests (with sequential
+        evaluators, Evaluator B only scores the turns where A is borderline),
+        then the curator scores every turn that needs tie-breaking in batch
+        requests. The consensus logic per turn is the same as evaluate().
+
+        Args:
+            items: Turns to evaluate
+            tenant_id: Tenant that cache hits are logged for
+
+        Returns:
+            One PipelineResult per item, in order
+        """
+        if not items:
+            return []
+
+        start_time = time.time()
+        cache_hits: List[CacheHit] = []
+
+        # Stage 1: Dual Evaluators (batched; B only on borderline turns when sequential)
+        if self.policy.sequential_evaluators:
+            evals_a = await self._run_evaluator_batch("evaluator_a", self._get_evaluator_a(), items, cache_hits)
+            dual_indexes = [
+                index for index, eval_a in enumerate(evals_a) if not self._is_decisive(eval_a)
+            ]
+            evals_b_dual = await self._run_evaluator_batch(
+                "evaluator_b", self._get_evaluator_b(), [items[index] for index in dual_indexes], cache_hits
+            )
+        else:
+            evals_a, evals_b_dual = await asyncio.gather(
+                self._run_evaluator_batch("evaluator_a", self._get_evaluator_a(), items, cache_hits),
+                self._run_evaluator_batch("evaluator_b", self._get_evaluator_b(), items, cache_hits),
+            )
+            dual_indexes = list(range(len(items)))
+        evals_b: Dict[int, EvaluationResult] = dict(zip(dual_indexes, evals_b_dual))
+
+        scores = {
+            index: (evals_a[index].overall_score / 10.0, eval_b.overall_score / 10.0)
+            for index, eval_b in evals_b.items()
+        }
+
+        # Stage 2: Curator (batched over the turns that need tie-breaking)
+        curator_indexes = [
+            index for index, (score_a, score_b) in scores.items()
+            if self._needs_curator(abs(score_a - score_b))
+        ]
+        curator_results: Dict[int, EvaluationResult] = {}
+        if curator_indexes:
+            curator_items = [
+                EvaluationItem(
+                    user_utterance=items[index].user_utterance,
+                    ai_response=items[index].ai_response,
+                    context=self._build_curator_context(
+                        *scores[index], evals_a[index], evals_b[index], items[index].context
+                    ),
+                )
+                for index in curator_indexes
+            ]
+            curated = await self._evaluate_stage_batch(
+                "curator", self._get_curator(), curator_items,
+                system_prompt=CURATOR_SYSTEM_PROMPT, cache_hits=cache_hits,
+            )
+            curator_results = dict(zip(curator_indexes, curated))
+
+        # Stage 3: Decision per turn
+        results = []
+        latency_ms = int((time.time() - start_time) * 1000)
+        for index, item in enumerate(items):
+            if index not in evals_b:
+                result = self._single_evaluator_result(evals_a[index])
+                result.latency_ms = latency_ms
+                results.append(result)
+                continue
+
+            score_a, score_b = scores[index]
+            result = await self._apply_consensus_logic(
+                score_a=score_a,
+                score_b=score_b,
+                score_diff=abs(score_a - score_b),
+                eval_a=evals_a[index],
+                eval_b=evals_b[index],
+                user_utterance=item.user_utterance,
+                ai_response=item.ai_response,
+                context=item.context,
+                curator_result=curator_results.get(index),
+            )
+            result.evaluator_a_latency_ms = evals_a[index].latency_ms
+            result.evaluator_b_latency_ms = evals_b[index].latency_ms
+            result.latency_ms = latency_ms
+            results.append(result)
+
+        if self.cache is not None and cache_hits:
+            await self.cache.record_hits(tenant_id, cache_hits)
+
+        logger.info(
+            f"Batch pipeline complete: {len(items)} turns, "
+            f"{len(items) - len(dual_indexes)} decided by evaluator A alone, "
+            f"{len(curator_indexes)} curated, {len(cache_hits)} cache hits, "
+            f"latency={latency_ms}ms"
+        )
+
+        return results
+
     async def _run_dual_evaluators(
         self,
         user_utterance: str,
         ai_response: str,
         context: Optional[Dict[str, Any]],
+        cache_hits: Optional[List[CacheHit]] = None,
     ) -> tuple[EvaluationResult, EvaluationResult]:
         """
         Stage 1: Run both evaluators in parallel.
@@ -257,15 +468,21 @@ class LLMPipelineService:
 
         # Run in parallel
         results = await asyncio.gather(
-            evaluator_a.evaluate(
+            self._evaluate_stage(
+                "evaluator_a",
+                evaluator_a,
                 user_utterance=user_utterance,
                 ai_response=ai_response,
                 context=context,
+                cache_hits=cache_hits,
             ),
-            evaluator_b.evaluate(
+            self._evaluate_stage(
+                "evaluator_b",
+                evaluator_b,
                 user_utterance=user_utterance,
                 ai_response=ai_response,
                 context=context,
+                cache_hits=cache_hits,
             ),
             return_exceptions=True,
         )
@@ -293,6 +510,241 @@ class LLMPipelineService:
 
         return eval_a, eval_b
 
+    async def _run_evaluator(
+        self,
+        stage: str,
+        adapter: Any,
+        user_utterance: str,
+        ai_response: str,
+        context: Optional[Dict[str, Any]],
+        cache_hits: Optional[List[CacheHit]] = None,
+    ) -> EvaluationResult:
+        """Run one evaluator, turning an exception into a failed result."""
+        try:
+            return await self._evaluate_stage(
+                stage,
+                adapter,
+                user_utterance=user_utterance,
+                ai_response=ai_response,
+                context=context,
+                cache_hits=cache_hits,
+            )
+        except Exception as e:
+            name = stage.replace("_", " ").title()
+            logger.error(f"{name} failed: {e}")
+            return EvaluationResult(
+                scores={},
+                overall_score=0.0,
+                decision="uncertain",
+                reasoning=f"{name} failed: {str(e)}",
+            )
+
+    async def _run_evaluator_batch(
+        self,
+        stage: str,
+        adapter: Any,
+        items: List[EvaluationItem],
+        cache_hits: List[CacheHit],
+    ) -> List[EvaluationResult]:
+        """Run one evaluator over a batch, turning an exception into failed results."""
+        if not items:
+            return []
+        try:
+            return await self._evaluate_stage_batch(stage, adapter, items, cache_hits=cache_hits)
+        except Exception as e:
+            return self._batch_failure_results(stage.replace("_", " ").title(), e, len(items))
+
+    def _is_decisive(self, eval_a: EvaluationResult) -> bool:
+        """Whether Evaluator A alone settles a turn (valid and not borderline)."""
+        if not eval_a.scores:
+            return False
+        return not self.policy.is_borderline(eval_a.overall_score / 10.0, self.pass_threshold)
+
+    def _single_evaluator_result(self, eval_a: EvaluationResult) -> PipelineResult:
+        """
+        Build the result of a turn decided by Evaluator A alone.
+
+        Confidence is medium: the decision is automatic, but without a
+        second opinion it is not reported as high consensus.
+        """
+        score_a = eval_a.overall_score / 10.0
+        return PipelineResult(
+            final_score=round(score_a, 4),
+            final_decision=self._score_to_decision(score_a),
+            confidence="medium",
+            evaluator_a_score=score_a,
+            evaluator_a_scores=eval_a.scores or None,
+            evaluator_a_reasoning=eval_a.reasoning,
+            consensus_type="single_evaluator",
+            evaluator_a_latency_ms=eval_a.latency_ms,
+            decision_path=DECISION_PATH_SINGLE_EVALUATOR,
+        )
+
+    @staticmethod
+    def _batch_failure_results(
+        name: str,
+        results: Any,
+        count: int,
+    ) -> List[EvaluationResult]:
+        """Replace a failed batch stage with failed results for every turn."""
+        if not isinstance(results, Exception):
+            return results
+        logger.error(f"{name} batch failed: {results}")
+        return [
+            EvaluationResult(
+                scores={},
+                overall_score=0.0,
+                decision="uncertain",
+                reasoning=f"{name} failed: {str(results)}",
+            )
+            for _ in range(count)
+        ]
+
+    async def _evaluate_stage(
+        self,
+        stage: str,
+        adapter: Any,
+        user_utterance: str,
+        ai_response: str,
+        context: Optional[Dict[str, Any]],
+        system_prompt: Optional[str] = None,
+        cache_hits: Optional[List[CacheHit]] = None,
+    ) -> EvaluationResult:
+        """
+        Run one evaluator or curator call through the evaluation cache.
+
+        Only successful, parseable evaluations are cached; provider errors
+        and unparseable responses are retried on the next run.
+        """
+        if self.cache is None:
+            return await adapter.evaluate(
+                user_utterance=user_utterance,
+                ai_response=ai_response,
+                context=context,
+                system_prompt=system_prompt,
+            )
+
+        key, system = self._cache_request(
+            adapter, EvaluationItem(user_utterance, ai_response, context), system_prompt
+        )
+        cached = await self._lookup_cached(stage, adapter, key, cache_hits)
+        if cached is not None:
+            return cached
+
+        result = await adapter.evaluate(
+            user_utterance=user_utterance,
+            ai_response=ai_response,
+            context=context,
+            system_prompt=system_prompt,
+        )
+        await self._store_cached(adapter, key, system, result)
+        return result
+
+    async def _evaluate_stage_batch(
+        self,
+        stage: str,
+        adapter: Any,
+        items: List[EvaluationItem],
+        system_prompt: Optional[str] = None,
+        cache_hits: Optional[List[CacheHit]] = None,
+    ) -> List[EvaluationResult]:
+        """
+        Run one evaluator or curator over many turns through the evaluation cache.
+
+        Cached turns are served from the cache and the rest are sent to the
+        adapter in batch requests. Results are cached under the same keys as
+        single evaluations, so either mode reuses the other's results.
+        """
+        if self.cache is None:
+            return await adapter.evaluate_batch(
+                items, system_prompt=system_prompt, max_items=self.batch_max_items
+            )
+
+        requests = [self._cache_request(adapter, item, system_prompt) for item in items]
+        results: List[Optional[EvaluationResult]] = list(await asyncio.gather(
+            *(self._lookup_cached(stage, adapter, key, cache_hits) for key, _ in requests)
+        ))
+
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            evaluated = await adapter.evaluate_batch(
+                [items[index] for index in missing],
+                system_prompt=system_prompt,
+                max_items=self.batch_max_items,
+            )
+            for index, result in zip(missing, evaluated):
+                results[index] = result
+                key, system = requests[index]
+                await self._store_cached(adapter, key, system, result)
+
+        return results
+
+    def _cache_request(
+        self,
+        adapter: Any,
+        item: EvaluationItem,
+        system_prompt: Optional[str],
+    ) -> Tuple[str, str]:
+        """Return the cache key and effective system prompt of an evaluation request."""
+        prompt, system = adapter.build_evaluation_request(
+            item.user_utterance, item.ai_response, item.context, system_prompt
+        )
+        key = evaluation_cache_key(
+            provider=adapter.provider_name,
+            model=adapter.model,
+            temperature=adapter.temperature,
+            max_tokens=adapter.max_tokens,
+            system_prompt=system,
+            prompt=prompt,
+        )
+        return key, system
+
+    async def _lookup_cached(
+        self,
+        stage: str,
+        adapter: Any,
+        key: str,
+        cache_hits: Optional[List[CacheHit]],
+    ) -> Optional[EvaluationResult]:
+        """Return the cached evaluation for a key, recording the hit."""
+        lookup_start = time.time()
+        cached = await self.cache.get(key)
+        if cached is None:
+            return None
+
+        lookup_ms = int((time.time() - lookup_start) * 1000)
+        logger.debug(f"LLM evaluation cache hit for {stage} ({key[:12]})")
+        if cache_hits is not None:
+            cache_hits.append(CacheHit(
+                operation=f"{stage}_cache_hit",
+                provider=adapter.provider_name,
+                model=adapter.model,
+                cache_key=key,
+                cached=cached,
+                duration_ms=lookup_ms,
+            ))
+        return cached.to_evaluation_result(
+            adapter.provider_name, adapter.model, latency_ms=lookup_ms
+        )
+
+    async def _store_cached(
+        self,
+        adapter: Any,
+        key: str,
+        system_prompt: str,
+        result: EvaluationResult,
+    ) -> None:
+        """Cache a successful, parseable evaluation."""
+        raw = result.raw_response
+        if result.scores and isinstance(raw, dict) and 'error' not in raw:
+            await self.cache.set(
+                key,
+                CachedEvaluation.from_result(result),
+                provider=adapter.provider_name,
+                model=adapter.model,
+                prompt_version=evaluation_prompt_version(system_prompt),
+            )
+
     async def _apply_consensus_logic(
         self,
         score_a: float,
@@ -303,6 +755,8 @@ class LLMPipelineService:
         user_utterance: str,
         ai_response: str,
         context: Optional[Dict[str, Any]],
+        cache_hits: Optional[List[CacheHit]] = None,
+        curator_result: Optional[EvaluationResult] = None,
     ) -> PipelineResult:
         """
         Stage 2 & 3: Apply consensus logic and determine decision.
@@ -311,6 +765,9 @@ class LLMPipelineService:
         - score_diff <= consensus_threshold → High consensus, average scores
         - consensus_threshold < score_diff < extreme_threshold → Curator decides
         - score_diff >= extreme_threshold → Human review required
+
+        A curator_result already obtained (e.g. from a batch) is used
+        instead of calling the curator.
         """
         # Log evaluator scores for debugging
         logger.info(
@@ -337,18 +794,20 @@ class LLMPipelineService:
             result.consensus_type = "high_consensus"
             result.final_decision = self._score_to_decision(final_score)
 
-        elif score_diff < self.extreme_disagreement_threshold:
+        elif self._needs_curator(score_diff):
             # CURATOR NEEDED: Call curator for tie-breaking
             logger.info(f"⚖️  Moderate disagreement detected (diff={score_diff:.2f}) - calling curator for tie-breaking")
-            curator_result = await self._call_curator(
-                score_a=score_a,
-                score_b=score_b,
-                eval_a=eval_a,
-                eval_b=eval_b,
-                user_utterance=user_utterance,
-                ai_response=ai_response,
-                context=context,
-            )
+            if curator_result is None:
+                curator_result = await self._call_curator(
+                    score_a=score_a,
+                    score_b=score_b,
+                    eval_a=eval_a,
+                    eval_b=eval_b,
+                    user_utterance=user_utterance,
+                    ai_response=ai_response,
+                    context=context,
+                    cache_hits=cache_hits,
+                )
             result.curator_decision = curator_result.decision
             result.curator_reasoning = curator_result.reasoning
             result.curator_latency_ms = curator_result.latency_ms
@@ -383,6 +842,7 @@ class LLMPipelineService:
         user_utterance: str,
         ai_response: str,
         context: Optional[Dict[str, Any]],
+        cache_hits: Optional[List[CacheHit]] = None,
     ) -> EvaluationResult:
         """
         Call the curator LLM for tie-breaking.
@@ -390,10 +850,30 @@ class LLMPipelineService:
         The curator receives both evaluations and must determine
         which one is more accurate.
         """
-        curator = self._get_curator()
+        return await self._evaluate_stage(
+            "curator",
+            self._get_curator(),
+            user_utterance=user_utterance,
+            ai_response=ai_response,
+            context=self._build_curator_context(score_a, score_b, eval_a, eval_b, context),
+            system_prompt=CURATOR_SYSTEM_PROMPT,
+            cache_hits=cache_hits,
+        )
+
+    def _needs_curator(self, score_diff: float) -> bool:
+        """Whether evaluator disagreement calls for curator tie-breaking."""
+        return self.consensus_threshold < score_diff < self.extreme_disagreement_threshold
 
-        # Build curator context with both evaluations
-        curator_context = {
+    @staticmethod
+    def _build_curator_context(
+        score_a: float,
+        score_b: float,
+        eval_a: EvaluationResult,
+        eval_b: EvaluationResult,
+        context: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build curator context with both evaluations."""
+        return {
             **(context or {}),
             'evaluator_a': {
                 'score': score_a,
@@ -408,22 +888,6 @@ class LLMPipelineService:
             'score_difference': abs(score_a - score_b),
         }
 
-        # Custom system prompt for curator
-        curator_system = (
-            "You are a senior QA expert reviewing conflicting evaluations. "
-            "Two evaluators assessed a voice AI response and disagreed. "
-            "Review both evaluations and provide your own independent assessment. "
-            "Focus on which evaluation more accurately captures the AI's performance. "
-            "Respond with valid JSON only. No markdown, no extra text."
-        )
-
-        return await curator.evaluate(
-            user_utterance=user_utterance,
-            ai_response=ai_response,
-            context=curator_context,
-            system_prompt=curator_system,
-        )
-
     def _score_to_decision(self, score: float) -> str:
         """
         Convert a score to a decision.
@@ -438,6 +902,25 @@ class LLMPipelineService:
             return "pass"
         return "fail"
 
+    async def purge_stale_cache(self) -> int:
+        """
+        Drop cached evaluations of prompt versions or models no longer in use.
+
+        Returns:
+            Number of cache entries deleted
+        """
+        if self.cache is None:
+            return 0
+        models = {
+            adapter.model
+            for adapter in (self._get_evaluator_a(), self._get_evaluator_b(), self._get_curator())
+        }
+        prompt_versions = {
+            evaluation_prompt_version(DEFAULT_EVALUATION_SYSTEM_PROMPT),
+            evaluation_prompt_version(CURATOR_SYSTEM_PROMPT),
+        }
+        return await self.cache.purge_stale(prompt_versions, models)
+
 
 # =============================================================================
 # Convenience Functions
@@ -448,6 +931,7 @@ async def run_llm_pipeline(
     ai_response: str,
     context: Optional[Dict[str, Any]] = None,
     api_key: Optional[str] = None,
+    tenant_id: Optional[UUID] = None,
 ) -> PipelineResult:
     """
     Run the LLM validation pipeline with default configuration.
@@ -459,6 +943,7 @@ async def run_llm_pipeline(
         ai_response: What the voice AI responded
         context: Additional context (conversation history, step order)
         api_key: OpenRouter API key (uses env var if not provided)
+        tenant_id: Tenant that cache hits are logged for
 
     Returns:
         PipelineResult with scores and decision
@@ -468,4 +953,5 @@ async def run_llm_pipeline(
         user_utterance=user_utterance,
         ai_response=ai_response,
         context=context,
+        tenant_id=tenant_id,
     )
@@ -28,7 +28,7 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
-from .base import BaseLLMAdapter, EvaluationResult
+from .base import BaseLLMAdapter, EvaluationItem, EvaluationResult
 from .openai_adapter import OpenAIAdapter
 from .anthropic_adapter import AnthropicAdapter
 from .google_adapter import GoogleAdapter
@@ -44,6 +44,7 @@ logger = logging.getLogger(__name__)
 __all__ = [
     # Base classes
     'BaseLLMAdapter',
+    'EvaluationItem',
     'EvaluationResult',
     # Direct provider adapters
     'OpenAIAdapter',
@@ -59,6 +59,32 @@ EVALUATION_TOOL = {
     }
 }
 
+# Tool definition for batch evaluation (one evaluation per turn)
+BATCH_EVALUATION_TOOL = {
+    "name": "submit_evaluations",
+    "description": "Submit the evaluation scores and reasoning for every voice AI turn",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "evaluations": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "id": {
+                            "type": "integer",
+                            "description": "Turn number being evaluated"
+                        },
+                        **EVALUATION_TOOL["input_schema"]["properties"],
+                    },
+                    "required": ["id", "scores", "reasoning"]
+                }
+            }
+        },
+        "required": ["evaluations"]
+    }
+}
+
 
 class AnthropicAdapter(BaseLLMAdapter):
     """
@@ -185,6 +211,65 @@ class AnthropicAdapter(BaseLLMAdapter):
             'stop_reason': response.stop_reason,
         }
 
+    async def _call_batch_api(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int
+    ) -> Dict[str, Any]:
+        """
+        Make a batch evaluation call to Anthropic with tool use.
+
+        Args:
+            prompt: The batch prompt to send
+            system_prompt: The system prompt for context
+            max_tokens: Maximum tokens in the response
+
+        Returns:
+            Dictionary with 'content' and 'usage' keys
+        """
+        if self._async_client is None:
+            await self._initialize_client()
+
+        enhanced_prompt = (
+            f"{prompt}\n\n"
+            "Use the submit_evaluations tool to provide the scores and reasoning for every turn."
+        )
+
+        response = await self._async_client.messages.create(
+            model=self.model,
+            system=system_prompt,
+            messages=[
+                {"role": "user", "content": enhanced_prompt}
+            ],
+            temperature=self.temperature,
+            max_tokens=max_tokens,
+            tools=[BATCH_EVALUATION_TOOL],
+            tool_choice={"type": "tool", "name": "submit_evaluations"}
+        )
+
+        content = ""
+        for block in response.content:
+            if hasattr(block, 'type') and block.type == 'tool_use':
+                content = json.dumps(block.input)
+                break
+            elif hasattr(block, 'text'):
+                content = block.text
+
+        return {
+            'content': content,
+            'usage': {
+                'input_tokens': response.usage.input_tokens if response.usage else 0,
+                'output_tokens': response.usage.output_tokens if response.usage else 0,
+                'total_tokens': (
+                    (response.usage.input_tokens + response.usage.output_tokens)
+                    if response.usage else 0
+                ),
+            },
+            'model': response.model,
+            'stop_reason': response.stop_reason,
+        }
+
     async def _call_api_text(self, prompt: str, system_prompt: str) -> Dict[str, Any]:
         """
         Make API call for plain text generation (no tool use).
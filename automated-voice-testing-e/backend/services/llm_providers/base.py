@@ -12,11 +12,17 @@ Key Design Decisions:
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import json
 import logging
+import os
+import time
 
 from pydantic import BaseModel, Field, field_validator
 
+from services.llm_admission import estimate_tokens, get_admission_controller, is_rate_limit_error
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,6 +81,39 @@ EVALUATION_JSON_SCHEMA = {
 }
 
 
+class LLMBatchEvaluationItem(LLMEvaluationResponse):
+    """One evaluation in a batch response, identified by turn index."""
+    id: int = Field(ge=0, description="Index of the evaluated turn")
+
+
+# JSON Schema for batch evaluation (one entry per turn)
+BATCH_EVALUATION_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "evaluations": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    **EVALUATION_JSON_SCHEMA["properties"],
+                },
+                "required": ["id", "scores", "reasoning"],
+                "additionalProperties": False
+            }
+        }
+    },
+    "required": ["evaluations"],
+    "additionalProperties": False
+}
+
+# Maximum turns packed into one batch evaluation request
+DEFAULT_BATCH_MAX_ITEMS = 10
+
+# Upper bound on output tokens requested for one batch
+BATCH_MAX_OUTPUT_TOKENS = 8192
+
+
 # =============================================================================
 # Evaluation Criteria and Thresholds (Programmatic)
 # =============================================================================
@@ -175,60 +214,33 @@ class EvaluationResult:
         }
 
 
-# =============================================================================
-# Evaluation Prompt (No overall_score or decision requested!)
-# =============================================================================
-
-def get_evaluation_prompt(
-    user_utterance: str,
-    ai_response: str,
-    context: Optional[Dict[str, Any]] = None
-) -> str:
+@dataclass
+class EvaluationItem:
     """
-    Generate the evaluation prompt for LLM judges.
+    One voice AI turn to evaluate in a batch.
 
-    This focuses on BEHAVIORAL testing - evaluating whether the AI performed
-    the correct action for the user's request, not whether it used exact words.
-
-    IMPORTANT: The prompt only asks for individual scores and reasoning.
-    Overall score and decision are calculated programmatically.
-
-    Args:
+    Attributes:
         user_utterance: What the user said
-        ai_response: What the voice AI responded (SpokenResponse)
+        ai_response: What the voice AI responded
         context: Additional context (conversation history, step order)
-
-    Returns:
-        Formatted evaluation prompt
     """
-    # Build conversation history section for multi-turn context
-    history_section = ""
-    if context and context.get('conversation_history'):
-        history = context['conversation_history']
-        if history:
-            history_lines = ["PREVIOUS CONVERSATION (for context only, do not evaluate):"]
-            for i, turn in enumerate(history, 1):
-                user_text = turn.get('user', '')
-                ai_text = turn.get('ai', '')
-                history_lines.append(f"  Turn {i}:")
-                history_lines.append(f"    User: {user_text}")
-                history_lines.append(f"    AI: {ai_text}")
-            history_section = "\n" + "\n".join(history_lines) + "\n"
+    user_utterance: str
+    ai_response: str
+    context: Optional[Dict[str, Any]] = None
 
-    # Build context section - only include step order for multi-turn awareness
-    context_section = ""
-    if context and context.get('step_order') is not None:
-        context_section = f"\nCONTEXT: Step {context['step_order']} in multi-turn conversation"
 
-    return f"""Evaluate this voice AI response for BEHAVIORAL correctness.
-Focus on whether the AI performed the RIGHT ACTION for the user's request,
-not whether it used exact words.
-{history_section}
-CURRENT TURN TO EVALUATE:
-USER REQUEST: {user_utterance}
-AI RESPONSE: {ai_response}{context_section}
+# =============================================================================
+# Evaluation Prompt (No overall_score or decision requested!)
+# =============================================================================
+
+DEFAULT_EVALUATION_SYSTEM_PROMPT = (
+    "You are an expert voice AI evaluator. "
+    "Respond with valid JSON only. No markdown, no extra text."
+)
 
-Score each criterion from 0 to 10:
+
+# Scoring rubric shared by single and batch evaluation prompts
+EVALUATION_RUBRIC = """Score each criterion from 0 to 10:
 
 1. RELEVANCE: Does the response address the user's request?
    - 10: Perfectly addresses the request
@@ -263,7 +275,71 @@ Score each criterion from 0 to 10:
    - 7-9: Most correct
    - 4-6: Some incorrect
    - 1-3: Most wrong
-   - 0: All wrong (or 10 if no entities to check)
+   - 0: All wrong (or 10 if no entities to check)"""
+
+
+def _format_turn_context(context: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+    """
+    Build the conversation history and step order sections of a prompt.
+
+    Returns:
+        Tuple of (history_section, context_section), empty when absent
+    """
+    # Build conversation history section for multi-turn context
+    history_section = ""
+    if context and context.get('conversation_history'):
+        history = context['conversation_history']
+        if history:
+            history_lines = ["PREVIOUS CONVERSATION (for context only, do not evaluate):"]
+            for i, turn in enumerate(history, 1):
+                user_text = turn.get('user', '')
+                ai_text = turn.get('ai', '')
+                history_lines.append(f"  Turn {i}:")
+                history_lines.append(f"    User: {user_text}")
+                history_lines.append(f"    AI: {ai_text}")
+            history_section = "\n" + "\n".join(history_lines) + "\n"
+
+    # Build context section - only include step order for multi-turn awareness
+    context_section = ""
+    if context and context.get('step_order') is not None:
+        context_section = f"\nCONTEXT: Step {context['step_order']} in multi-turn conversation"
+
+    return history_section, context_section
+
+
+def get_evaluation_prompt(
+    user_utterance: str,
+    ai_response: str,
+    context: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Generate the evaluation prompt for LLM judges.
+
+    This focuses on BEHAVIORAL testing - evaluating whether the AI performed
+    the correct action for the user's request, not whether it used exact words.
+
+    IMPORTANT: The prompt only asks for individual scores and reasoning.
+    Overall score and decision are calculated programmatically.
+
+    Args:
+        user_utterance: What the user said
+        ai_response: What the voice AI responded (SpokenResponse)
+        context: Additional context (conversation history, step order)
+
+    Returns:
+        Formatted evaluation prompt
+    """
+    history_section, context_section = _format_turn_context(context)
+
+    return f"""Evaluate this voice AI response for BEHAVIORAL correctness.
+Focus on whether the AI performed the RIGHT ACTION for the user's request,
+not whether it used exact words.
+{history_section}
+CURRENT TURN TO EVALUATE:
+USER REQUEST: {user_utterance}
+AI RESPONSE: {ai_response}{context_section}
+
+{EVALUATION_RUBRIC}
 
 Respond with JSON containing ONLY scores and reasoning:
 {{
@@ -278,6 +354,78 @@ Respond with JSON containing ONLY scores and reasoning:
 }}"""
 
 
+def get_batch_evaluation_prompt(items: List[EvaluationItem]) -> str:
+    """
+    Generate one prompt evaluating several turns.
+
+    Each turn is scored independently with the same rubric as
+    get_evaluation_prompt and identified by its index in ``items``.
+
+    Args:
+        items: Turns to evaluate
+
+    Returns:
+        Formatted batch evaluation prompt
+    """
+    turn_sections = []
+    for index, item in enumerate(items):
+        history_section, context_section = _format_turn_context(item.context)
+        turn_sections.append(
+            f"TURN {index}:{history_section}\n"
+            f"USER REQUEST: {item.user_utterance}\n"
+            f"AI RESPONSE: {item.ai_response}{context_section}"
+        )
+    turns = "\n\n".join(turn_sections)
+
+    return f"""Evaluate each of the following {len(items)} voice AI responses for BEHAVIORAL correctness.
+Focus on whether the AI performed the RIGHT ACTION for the user's request,
+not whether it used exact words. Evaluate every turn independently.
+
+{turns}
+
+For EACH turn, {EVALUATION_RUBRIC[0].lower()}{EVALUATION_RUBRIC[1:]}
+
+Respond with JSON containing ONLY one evaluation per turn, with the turn number as "id":
+{{
+  "evaluations": [
+    {{
+      "id": <turn number>,
+      "scores": {{
+        "relevance": <0-10>,
+        "correctness": <0-10>,
+        "completeness": <0-10>,
+        "tone": <0-10>,
+        "entity_accuracy": <0-10>
+      }},
+      "reasoning": "<1-2 sentence explanation of the AI's behavioral performance>"
+    }}
+  ]
+}}"""
+
+
+def _strip_code_fence(content: str) -> str:
+    """Strip whitespace and a surrounding markdown code block."""
+    content = content.strip()
+    if content.startswith('```'):
+        lines = content.split('\n')
+        # Remove first and last lines (```json and ```)
+        content = '\n'.join(lines[1:-1] if lines[-1] == '```' else lines[1:])
+        content = content.strip()
+    return content
+
+
+def _normalize_usage(usage: Optional[Dict[str, Any]]) -> Dict[str, int]:
+    """Token usage with OpenAI-style keys (Anthropic reports input/output tokens)."""
+    usage = usage or {}
+    prompt_tokens = int(usage.get('prompt_tokens', usage.get('input_tokens', 0)) or 0)
+    completion_tokens = int(usage.get('completion_tokens', usage.get('output_tokens', 0)) or 0)
+    return {
+        'prompt_tokens': prompt_tokens,
+        'completion_tokens': completion_tokens,
+        'total_tokens': prompt_tokens + completion_tokens,
+    }
+
+
 # =============================================================================
 # Base Adapter Class
 # =============================================================================
@@ -337,6 +485,73 @@ class BaseLLMAdapter(ABC):
         """
         pass
 
+    async def _admitted_call(
+        self,
+        call: Callable[[], Awaitable[Dict[str, Any]]],
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int
+    ) -> Dict[str, Any]:
+        """
+        Make a provider call through the process-wide admission controller.
+
+        The call waits for this provider/model's rate limits and adaptive
+        concurrency. Calls rejected with a rate limit are queued again, up to
+        LLM_MAX_RETRIES times, instead of failing the evaluation.
+
+        Args:
+            call: Zero-argument coroutine function making the API call
+            prompt: The prompt sent (used to estimate tokens)
+            system_prompt: The system prompt sent
+            max_tokens: Maximum tokens in the response
+
+        Returns:
+            The provider response
+        """
+        controller = get_admission_controller()
+        estimated = estimate_tokens(prompt, system_prompt, max_output_tokens=max_tokens)
+        max_retries = int(os.getenv('LLM_MAX_RETRIES', '3'))
+
+        for attempt in range(max_retries + 1):
+            try:
+                async with controller.admit(self.provider_name, self.model, estimated) as admission:
+                    response = await call()
+                    admission.record_usage(_normalize_usage(response.get('usage'))['total_tokens'])
+                    return response
+            except Exception as e:
+                if attempt == max_retries or not is_rate_limit_error(e):
+                    raise
+                logger.warning(
+                    f"{self.provider_name} rate limited, requeueing "
+                    f"(attempt {attempt + 1}/{max_retries})"
+                )
+
+    def build_evaluation_request(
+        self,
+        user_utterance: str,
+        ai_response: str,
+        context: Optional[Dict[str, Any]] = None,
+        system_prompt: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Build the (prompt, system prompt) pair evaluate() sends to the provider.
+
+        Args:
+            user_utterance: What the user said
+            ai_response: What the voice AI responded
+            context: Additional context (conversation history, step order)
+            system_prompt: Optional custom system prompt
+
+        Returns:
+            Tuple of (evaluation prompt, system prompt)
+        """
+        prompt = get_evaluation_prompt(
+            user_utterance=user_utterance,
+            ai_response=ai_response,
+            context=context
+        )
+        return prompt, system_prompt or DEFAULT_EVALUATION_SYSTEM_PROMPT
+
     async def evaluate(
         self,
         user_utterance: str,
@@ -364,20 +579,16 @@ class BaseLLMAdapter(ABC):
             if self._client is None:
                 await self._initialize_client()
 
-            prompt = get_evaluation_prompt(
+            prompt, system_prompt = self.build_evaluation_request(
                 user_utterance=user_utterance,
                 ai_response=ai_response,
-                context=context
-            )
-
-            default_system = (
-                "You are an expert voice AI evaluator. "
-                "Respond with valid JSON only. No markdown, no extra text."
+                context=context,
+                system_prompt=system_prompt
             )
 
-            response = await self._call_api(
-                prompt=prompt,
-                system_prompt=system_prompt or default_system
+            response = await self._admitted_call(
+                lambda: self._call_api(prompt=prompt, system_prompt=system_prompt),
+                prompt, system_prompt, self.max_tokens
             )
 
             latency_ms = int((time.time() - start_time) * 1000)
@@ -422,15 +633,8 @@ class BaseLLMAdapter(ABC):
         import json
 
         try:
-            # Clean up the content
-            content = content.strip()
-
-            # Handle markdown code blocks
-            if content.startswith('```'):
-                lines = content.split('\n')
-                # Remove first and last lines (```json and ```)
-                content = '\n'.join(lines[1:-1] if lines[-1] == '```' else lines[1:])
-                content = content.strip()
+            # Clean up the content and handle markdown code blocks
+            content = _strip_code_fence(content)
 
             # Parse JSON
             data = json.loads(content)
@@ -474,6 +678,208 @@ class BaseLLMAdapter(ABC):
                 reasoning=f"Validation failed: {str(e)}"
             )
 
+    async def evaluate_batch(
+        self,
+        items: List[EvaluationItem],
+        system_prompt: Optional[str] = None,
+        max_items: int = DEFAULT_BATCH_MAX_ITEMS
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate several voice AI turns with as few provider calls as possible.
+
+        Turns are packed into structured batch requests of up to ``max_items``
+        and the scored results are split back per turn. Turns missing from a
+        batch response, and every turn of adapters without batch support, are
+        evaluated individually.
+
+        Args:
+            items: Turns to evaluate
+            system_prompt: Optional custom system prompt
+            max_items: Maximum turns per provider request
+
+        Returns:
+            One EvaluationResult per item, in order
+        """
+        chunks = [
+            items[start:start + max(1, max_items)]
+            for start in range(0, len(items), max(1, max_items))
+        ]
+        chunk_results = await asyncio.gather(
+            *(self._evaluate_chunk(chunk, system_prompt) for chunk in chunks)
+        )
+        return [result for results in chunk_results for result in results]
+
+    async def _evaluate_chunk(
+        self,
+        items: List[EvaluationItem],
+        system_prompt: Optional[str]
+    ) -> List[EvaluationResult]:
+        """Evaluate one batch request worth of turns."""
+        if len(items) == 1:
+            return [await self._evaluate_item(items[0], system_prompt)]
+
+        if type(self)._call_batch_api is BaseLLMAdapter._call_batch_api:
+            return list(await asyncio.gather(
+                *(self._evaluate_item(item, system_prompt) for item in items)
+            ))
+
+        start_time = time.time()
+
+        try:
+            if self._client is None:
+                await self._initialize_client()
+
+            prompt = get_batch_evaluation_prompt(items)
+            system_prompt = system_prompt or DEFAULT_EVALUATION_SYSTEM_PROMPT
+            max_tokens = min(self.max_tokens * len(items), BATCH_MAX_OUTPUT_TOKENS)
+            response = await self._admitted_call(
+                lambda: self._call_batch_api(
+                    prompt=prompt, system_prompt=system_prompt, max_tokens=max_tokens
+                ),
+                prompt, system_prompt, max_tokens
+            )
+
+        except NotImplementedError:
+            return list(await asyncio.gather(
+                *(self._evaluate_item(item, system_prompt) for item in items)
+            ))
+
+        except Exception as e:
+            logger.error(f"Error batch evaluating with {self.provider_name}: {e}")
+            latency_ms = int((time.time() - start_time) * 1000)
+            return [
+                EvaluationResult(
+                    scores={},
+                    overall_score=0.0,
+                    decision="uncertain",
+                    reasoning=f"Evaluation failed: {str(e)}",
+                    latency_ms=latency_ms,
+                    provider=self.provider_name,
+                    model=self.model,
+                    raw_response={'error': str(e)}
+                )
+                for _ in items
+            ]
+
+        latency_ms = int((time.time() - start_time) * 1000)
+        results = self._parse_batch_response(response['content'], len(items))
+
+        # Attribute the request's usage evenly to the turns it scored
+        parsed_count = sum(1 for result in results if result is not None)
+        usage = _normalize_usage(response.get('usage'))
+        share = {
+            key: value // parsed_count if parsed_count else 0
+            for key, value in usage.items()
+        }
+        for index, result in enumerate(results):
+            if result is not None:
+                result.latency_ms = latency_ms
+                result.provider = self.provider_name
+                result.model = self.model
+                result.raw_response = {
+                    'usage': dict(share),
+                    'batch': {'size': len(items), 'index': index},
+                }
+
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            logger.warning(
+                f"{self.provider_name} batch response missing {len(missing)}/{len(items)} "
+                f"evaluations; evaluating them individually"
+            )
+            retried = await asyncio.gather(
+                *(self._evaluate_item(items[index], system_prompt) for index in missing)
+            )
+            for index, result in zip(missing, retried):
+                results[index] = result
+
+        return results
+
+    async def _evaluate_item(
+        self,
+        item: EvaluationItem,
+        system_prompt: Optional[str]
+    ) -> EvaluationResult:
+        return await self.evaluate(
+            user_utterance=item.user_utterance,
+            ai_response=item.ai_response,
+            context=item.context,
+            system_prompt=system_prompt
+        )
+
+    async def _call_batch_api(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int
+    ) -> Dict[str, Any]:
+        """
+        Make an API call returning BATCH_EVALUATION_JSON_SCHEMA content.
+
+        Override in subclasses that support batch evaluation; the default
+        makes evaluate_batch() fall back to one call per turn.
+
+        Args:
+            prompt: The batch prompt to send
+            system_prompt: The system prompt for context
+            max_tokens: Maximum tokens in the response
+
+        Returns:
+            Dictionary with 'content' and 'usage' keys
+        """
+        raise NotImplementedError(f"{self.provider_name} does not support batch evaluation")
+
+    def _parse_batch_response(
+        self,
+        content: str,
+        count: int
+    ) -> List[Optional[EvaluationResult]]:
+        """
+        Parse a batch response into per-turn results.
+
+        Entries are validated independently, so one malformed evaluation
+        only invalidates its own turn.
+
+        Args:
+            content: The raw text content from the LLM
+            count: Number of turns in the batch
+
+        Returns:
+            List of results by turn index (None where missing or invalid)
+        """
+        results: List[Optional[EvaluationResult]] = [None] * count
+
+        try:
+            data = json.loads(_strip_code_fence(content))
+            entries = data.get('evaluations') if isinstance(data, dict) else None
+            if not isinstance(entries, list):
+                raise ValueError("missing 'evaluations' array")
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.warning(f"Failed to parse batch response: {e}")
+            logger.debug(f"Raw content: {content[:500]}")
+            return results
+
+        for entry in entries:
+            try:
+                validated = LLMBatchEvaluationItem.model_validate(entry)
+            except Exception as e:
+                logger.warning(f"Invalid batch evaluation entry: {e}")
+                continue
+            if validated.id >= count or results[validated.id] is not None:
+                logger.warning(f"Unexpected batch evaluation id: {validated.id}")
+                continue
+
+            scores = validated.scores.model_dump()
+            overall_score = calculate_overall_score(scores)
+            results[validated.id] = EvaluationResult(
+                scores=scores,
+                overall_score=overall_score,
+                decision=determine_decision(overall_score),
+                reasoning=validated.reasoning
+            )
+
+        return results
+
     async def generate_text(
         self,
         prompt: str,
@@ -510,9 +916,10 @@ class BaseLLMAdapter(ABC):
             self.max_tokens = max_tokens
 
         try:
-            response = await self._call_api_text(
-                prompt=prompt,
-                system_prompt=system_prompt or default_system
+            system_prompt = system_prompt or default_system
+            response = await self._admitted_call(
+                lambda: self._call_api_text(prompt=prompt, system_prompt=system_prompt),
+                prompt, system_prompt, self.max_tokens
             )
             return response.get('content', '')
         finally:
@@ -15,6 +15,48 @@ from .base import BaseLLMAdapter
 
 logger = logging.getLogger(__name__)
 
+# Response schema for structured output (Gemini schema format)
+EVALUATION_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "scores": {
+            "type": "object",
+            "properties": {
+                "relevance": {"type": "number"},
+                "correctness": {"type": "number"},
+                "completeness": {"type": "number"},
+                "tone": {"type": "number"},
+                "entity_accuracy": {"type": "number"}
+            },
+            "required": [
+                "relevance", "correctness", "completeness",
+                "tone", "entity_accuracy"
+            ]
+        },
+        "reasoning": {"type": "string"}
+    },
+    "required": ["scores", "reasoning"]
+}
+
+# Response schema for batch evaluation (one evaluation per turn)
+BATCH_EVALUATION_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "evaluations": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    **EVALUATION_RESPONSE_SCHEMA["properties"],
+                },
+                "required": ["id", "scores", "reasoning"]
+            }
+        }
+    },
+    "required": ["evaluations"]
+}
+
 
 class GoogleAdapter(BaseLLMAdapter):
     """
@@ -76,36 +118,12 @@ class GoogleAdapter(BaseLLMAdapter):
 
         genai.configure(api_key=api_key)
 
-        # Define the response schema for structured output
-        # Gemini uses a different schema format
-        response_schema = {
-            "type": "object",
-            "properties": {
-                "scores": {
-                    "type": "object",
-                    "properties": {
-                        "relevance": {"type": "number"},
-                        "correctness": {"type": "number"},
-                        "completeness": {"type": "number"},
-                        "tone": {"type": "number"},
-                        "entity_accuracy": {"type": "number"}
-                    },
-                    "required": [
-                        "relevance", "correctness", "completeness",
-                        "tone", "entity_accuracy"
-                    ]
-                },
-                "reasoning": {"type": "string"}
-            },
-            "required": ["scores", "reasoning"]
-        }
-
         # Configure generation settings with structured output
         generation_config = GenerationConfig(
             temperature=self.temperature,
             max_output_tokens=self.max_tokens,
             response_mime_type="application/json",
-            response_schema=response_schema,
+            response_schema=EVALUATION_RESPONSE_SCHEMA,
         )
 
         self._generative_model = genai.GenerativeModel(
@@ -168,6 +186,73 @@ class GoogleAdapter(BaseLLMAdapter):
             ),
         }
 
+    async def _call_batch_api(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int
+    ) -> Dict[str, Any]:
+        """
+        Make a batch evaluation call to Google Generative AI.
+
+        Overrides the model's generation config with the batch response
+        schema and output token budget for this request.
+
+        Args:
+            prompt: The batch prompt to send
+            system_prompt: The system prompt for context
+            max_tokens: Maximum tokens in the response
+
+        Returns:
+            Dictionary with 'content' and 'usage' keys
+        """
+        if self._generative_model is None:
+            await self._initialize_client()
+
+        from google.generativeai.types import GenerationConfig
+
+        generation_config = GenerationConfig(
+            temperature=self.temperature,
+            max_output_tokens=max_tokens,
+            response_mime_type="application/json",
+            response_schema=BATCH_EVALUATION_RESPONSE_SCHEMA,
+        )
+
+        # Combine system prompt with user prompt for Gemini
+        full_prompt = f"{system_prompt}\n\n{prompt}"
+
+        response = await self._generative_model.generate_content_async(
+            full_prompt,
+            generation_config=generation_config,
+            request_options={"timeout": self.timeout}
+        )
+
+        content = response.text if response.text else ""
+        usage_metadata = getattr(response, 'usage_metadata', None)
+
+        return {
+            'content': content,
+            'usage': {
+                'prompt_tokens': (
+                    usage_metadata.prompt_token_count
+                    if usage_metadata else 0
+                ),
+                'completion_tokens': (
+                    usage_metadata.candidates_token_count
+                    if usage_metadata else 0
+                ),
+                'total_tokens': (
+                    usage_metadata.total_token_count
+                    if usage_metadata else 0
+                ),
+            },
+            'model': self.model,
+            'finish_reason': (
+                response.candidates[0].finish_reason.name
+                if response.candidates else 'unknown'
+            ),
+        }
+
     async def _call_api_text(self, prompt: str, system_prompt: str) -> Dict[str, Any]:
         """
         Make API call for plain text generation (no schema constraint).
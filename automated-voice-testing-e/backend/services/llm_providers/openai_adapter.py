@@ -12,7 +12,7 @@ import os
 import logging
 from typing import Any, Dict, Optional
 
-from .base import BaseLLMAdapter, EVALUATION_JSON_SCHEMA
+from .base import BaseLLMAdapter, BATCH_EVALUATION_JSON_SCHEMA, EVALUATION_JSON_SCHEMA
 
 logger = logging.getLogger(__name__)
 
@@ -135,6 +135,59 @@ class OpenAIAdapter(BaseLLMAdapter):
             'finish_reason': response.choices[0].finish_reason,
         }
 
+    async def _call_batch_api(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int
+    ) -> Dict[str, Any]:
+        """
+        Make a batch evaluation call to OpenAI with Structured Outputs.
+
+        Args:
+            prompt: The batch prompt to send
+            system_prompt: The system prompt for context
+            max_tokens: Maximum tokens in the response
+
+        Returns:
+            Dictionary with 'content' and 'usage' keys
+        """
+        if self._async_client is None:
+            await self._initialize_client()
+
+        response = await self._async_client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=self.temperature,
+            max_tokens=max_tokens,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "batch_evaluation_response",
+                    "strict": True,
+                    "schema": BATCH_EVALUATION_JSON_SCHEMA
+                }
+            }
+        )
+
+        content = response.choices[0].message.content or ""
+
+        return {
+            'content': content,
+            'usage': {
+                'prompt_tokens': response.usage.prompt_tokens if response.usage else 0,
+                'completion_tokens': (
+                    response.usage.completion_tokens if response.usage else 0
+                ),
+                'total_tokens': response.usage.total_tokens if response.usage else 0,
+            },
+            'model': response.model,
+            'finish_reason': response.choices[0].finish_reason,
+        }
+
     async def _call_api_text(self, prompt: str, system_prompt: str) -> Dict[str, Any]:
         """
         Make API call for plain text generation (no structured output).
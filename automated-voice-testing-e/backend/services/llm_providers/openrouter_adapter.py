@@ -13,7 +13,7 @@ import os
 import logging
 from typing import Any, Dict, Optional
 
-from .base import BaseLLMAdapter, EVALUATION_JSON_SCHEMA
+from .base import BaseLLMAdapter, BATCH_EVALUATION_JSON_SCHEMA, EVALUATION_JSON_SCHEMA
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +118,42 @@ class OpenRouterAdapter(BaseLLMAdapter):
         Returns:
             Dictionary with 'content' and 'usage' keys
         """
+        return await self._call_evaluation_api(prompt, system_prompt)
+
+    async def _call_batch_api(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int
+    ) -> Dict[str, Any]:
+        """
+        Make a batch evaluation call to OpenRouter.
+
+        Args:
+            prompt: The batch prompt to send
+            system_prompt: The system prompt for context
+            max_tokens: Maximum tokens in the response
+
+        Returns:
+            Dictionary with 'content' and 'usage' keys
+        """
+        return await self._call_evaluation_api(
+            prompt,
+            system_prompt,
+            schema_name="batch_evaluation_response",
+            schema=BATCH_EVALUATION_JSON_SCHEMA,
+            max_tokens=max_tokens,
+        )
+
+    async def _call_evaluation_api(
+        self,
+        prompt: str,
+        system_prompt: str,
+        schema_name: str = "evaluation_response",
+        schema: Dict[str, Any] = EVALUATION_JSON_SCHEMA,
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Call the API with structured output or JSON mode and normalize the response."""
         if self._async_client is None:
             await self._initialize_client()
 
@@ -128,10 +164,13 @@ class OpenRouterAdapter(BaseLLMAdapter):
         try:
             if supports_structured:
                 response = await self._call_with_structured_output(
-                    prompt, system_prompt
+                    prompt, system_prompt,
+                    schema_name=schema_name, schema=schema, max_tokens=max_tokens
                 )
             else:
-                response = await self._call_with_json_mode(prompt, system_prompt)
+                response = await self._call_with_json_mode(
+                    prompt, system_prompt, max_tokens=max_tokens
+                )
 
             content = response.choices[0].message.content or ""
 
@@ -159,7 +198,10 @@ class OpenRouterAdapter(BaseLLMAdapter):
     async def _call_with_structured_output(
         self,
         prompt: str,
-        system_prompt: str
+        system_prompt: str,
+        schema_name: str = "evaluation_response",
+        schema: Dict[str, Any] = EVALUATION_JSON_SCHEMA,
+        max_tokens: Optional[int] = None
     ):
         """Call API with structured output (OpenAI models only)."""
         return await self._async_client.chat.completions.create(
@@ -169,18 +211,23 @@ class OpenRouterAdapter(BaseLLMAdapter):
                 {"role": "user", "content": prompt}
             ],
             temperature=self.temperature,
-            max_tokens=self.max_tokens,
+            max_tokens=max_tokens or self.max_tokens,
             response_format={
                 "type": "json_schema",
                 "json_schema": {
-                    "name": "evaluation_response",
+                    "name": schema_name,
                     "strict": True,
-                    "schema": EVALUATION_JSON_SCHEMA
+                    "schema": schema
                 }
             }
         )
 
-    async def _call_with_json_mode(self, prompt: str, system_prompt: str):
+    async def _call_with_json_mode(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: Optional[int] = None
+    ):
         """Call API with JSON mode (more widely supported)."""
         # Add JSON instruction to system prompt for non-OpenAI models
         enhanced_system = (
@@ -195,7 +242,7 @@ class OpenRouterAdapter(BaseLLMAdapter):
                 {"role": "user", "content": prompt}
             ],
             temperature=self.temperature,
-            max_tokens=self.max_tokens,
+            max_tokens=max_tokens or self.max_tokens,
         )
 
     def _supports_structured_output(self) -> bool:
@@ -0,0 +1,240 @@
+"""
+Buffered, batching writer for metric datapoints.
+
+MetricsService.record_metric commits one transaction per datapoint, which
+puts a database round trip (plus rollup updates) on the execution hot path
+for every metric. MetricWriter accepts the same record_metric() call but
+only enqueues the point; a background task drains the queue and writes
+batches with MetricsService.record_metrics (one multi-row INSERT and one
+rollup update per batch).
+
+- Batches are flushed when max_batch_size points are waiting or
+  flush_interval_seconds after the first point of a batch arrived.
+- The queue is bounded (max_queue_size): record_metric() waits for space
+  when the writer falls behind, so producers are slowed down instead of
+  memory growing without limit.
+- close() stops the background task and writes everything still queued.
+
+A writer is bound to the event loop it was started on, and whoever creates
+it must close() it. ExecutionMetricsRecorder accepts a writer in place of a
+MetricsService; no execution path records metrics yet, so there is no
+process-wide writer.
+
+Example:
+    >>> writer = MetricWriter()
+    >>> await writer.record_metric(
+    ...     metric_type="response_time",
+    ...     metric_value=0.42,
+    ...     dimensions={"aggregation": "raw"},
+    ...     timestamp=datetime.now(timezone.utc),
+    ... )
+    >>> await writer.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from services.metrics_service import MetricPoint, MetricsService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MetricWriterStats:
+    """Counters describing a writer's activity since it was created."""
+
+    written: int = 0
+    failed: int = 0
+    batches: int = 0
+
+
+class MetricWriter:
+    """
+    Bounded in-process buffer of metric points flushed to the database in batches.
+
+    Attributes:
+        max_batch_size: Maximum points written per batch
+        flush_interval_seconds: Longest time a point waits for its batch to fill
+        stats: Written/failed point and batch counters
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        max_batch_size: int = 500,
+        flush_interval_seconds: float = 1.0,
+        max_queue_size: int = 10000,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            session_factory: Callable returning an AsyncSession context manager
+                (defaults to api.database.get_async_session)
+            max_batch_size: Maximum points written per batch
+            flush_interval_seconds: Longest time a point waits for its batch to fill
+            max_queue_size: Points buffered before record_metric() blocks
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_queue_size < max_batch_size:
+            raise ValueError("max_queue_size must be at least max_batch_size")
+
+        self._session_factory = session_factory
+        self.max_batch_size = max_batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_queue_size = max_queue_size
+        self.stats = MetricWriterStats()
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._closing: Optional[asyncio.Event] = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Number of points queued and not yet written."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def record_metric(
+        self,
+        *,
+        metric_type: str,
+        metric_value: float,
+        dimensions: Optional[Dict[str, Any]],
+        timestamp: datetime,
+    ) -> None:
+        """
+        Queue a metric datapoint for the next batch.
+
+        Same arguments as MetricsService.record_metric. Waits while the
+        queue is full (backpressure).
+
+        Raises:
+            ValueError: If timestamp is not timezone-aware.
+            RuntimeError: If the writer has been closed.
+        """
+        if timestamp.tzinfo is None or timestamp.tzinfo.utcoffset(timestamp) is None:
+            raise ValueError("timestamp must be timezone-aware")
+        if self._closed:
+            raise RuntimeError("MetricWriter is closed")
+
+        self._ensure_started()
+        await self._queue.put(MetricPoint(
+            metric_type=metric_type,
+            metric_value=metric_value,
+            dimensions=dict(dimensions or {}),
+            timestamp=timestamp,
+        ))
+
+    async def flush(self) -> int:
+        """
+        Write every queued point now.
+
+        Returns:
+            Number of points written
+        """
+        if self._queue is None:
+            return 0
+        written = 0
+        while not self._queue.empty():
+            written += await self._write_batch(self._take_batch())
+        return written
+
+    async def close(self) -> int:
+        """
+        Stop accepting points and write everything still queued.
+
+        The background task finishes the batch it is assembling (without
+        waiting for it to fill) and exits once the queue is empty.
+
+        Returns:
+            Number of points written after close() was called
+        """
+        written_before = self.stats.written
+        self._closed = True
+        if self._task is not None:
+            self._closing.set()
+            await self._task
+            self._task = None
+        await self.flush()
+        return self.stats.written - written_before
+
+    def _ensure_started(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._write_lock = asyncio.Lock()
+            self._closing = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        """Background loop: wait for a point, let the batch fill, write it."""
+        loop = asyncio.get_running_loop()
+        while not (self._closed and self._queue.empty()):
+            point = await self._next_point(self.flush_interval_seconds)
+            if point is None:
+                continue
+            batch = [point]
+            deadline = loop.time() + self.flush_interval_seconds
+            while len(batch) < self.max_batch_size:
+                batch.extend(self._take_batch(self.max_batch_size - len(batch)))
+                remaining = deadline - loop.time()
+                if len(batch) >= self.max_batch_size or remaining <= 0 or self._closed:
+                    break
+                point = await self._next_point(remaining)
+                if point is None:
+                    break
+                batch.append(point)
+            await self._write_batch(batch)
+
+    async def _next_point(self, timeout: float) -> Optional[MetricPoint]:
+        """Wait for the next queued point; None on timeout or close()."""
+        if not self._queue.empty():
+            return self._queue.get_nowait()
+        if self._closing.is_set():
+            return None
+        getter = asyncio.ensure_future(self._queue.get())
+        closing = asyncio.ensure_future(self._closing.wait())
+        await asyncio.wait({getter, closing}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        closing.cancel()
+        if getter.cancel():
+            return None
+        return getter.result()
+
+    def _take_batch(self, limit: Optional[int] = None) -> List[MetricPoint]:
+        """Dequeue up to limit (default max_batch_size) points without waiting."""
+        batch: List[MetricPoint] = []
+        limit = self.max_batch_size if limit is None else limit
+        while len(batch) < limit and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _write_batch(self, batch: List[MetricPoint]) -> int:
+        if not batch:
+            return 0
+        async with self._write_lock:
+            try:
+                async with self._get_session() as db:
+                    await MetricsService(db).record_metrics(batch)
+            except Exception as e:
+                # Metrics are telemetry: drop the batch rather than block execution
+                self.stats.failed += len(batch)
+                logger.error(f"Failed to write {len(batch)} metric points: {e}")
+                return 0
+        self.stats.written += len(batch)
+        self.stats.batches += 1
+        return len(batch)
+
+    def _get_session(self):
+        if self._session_factory is None:
+            from api.database import get_async_session
+            self._session_factory = get_async_session
+        return self._session_factory()
+
@@ -3,18 +3,95 @@ Metrics collection service for recording time-series metrics.
 
 Provides async helpers for persisting metric datapoints and retrieving
 aggregated results for dashboard visualisations.
+
+Aggregation runs in the database: dimension filters become JSONB
+containment predicates and raw points are bucketed with date_trunc.
+record_metric also maintains hourly and daily rollups
+(models/test_metric_rollup.py), and get_metrics serves each part of the
+window from the coarsest rollup that covers it whole, falling back to raw
+points only for the unaligned edges.
+
+record_metrics writes many points in one transaction (multi-row INSERT and
+one rollup update per bucket); services/metric_writer.py batches hot-path
+metrics through it.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, insert, literal_column, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.test_metric import TestMetric
+from models.test_metric_rollup import TestMetricDailyRollup, TestMetricHourlyRollup
+from services.quantile_sketch import QuantileSketch
+
+# Dimensions dropped from rollups; filtering on them reads raw points
+ROLLUP_EXCLUDED_DIMENSIONS = frozenset({"execution_id"})
+
+_ROLLUP_MODELS: Dict[str, Type[Any]] = {
+    "hour": TestMetricHourlyRollup,
+    "day": TestMetricDailyRollup,
+}
+
+_GRANULARITY_STEPS = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+}
+
+_SQLITE_BUCKET_FORMATS = {
+    "hour": "%Y-%m-%d %H:00:00",
+    "day": "%Y-%m-%d 00:00:00",
+}
+
+_CENTS = Decimal("0.01")
+
+
+@dataclass
+class MetricPoint:
+    """A metric datapoint waiting to be written with record_metrics."""
+
+    metric_type: str
+    metric_value: float
+    dimensions: Dict[str, Any]
+    timestamp: datetime
+
+
+@dataclass
+class _Bucket:
+    """Running count/sum/min/max (and optional sketch) of one bucket."""
+
+    count: int = 0
+    total: Decimal = Decimal("0")
+    minimum: Optional[Decimal] = None
+    maximum: Optional[Decimal] = None
+    sketch: Optional[QuantileSketch] = None
+
+    def add(
+        self,
+        count: int,
+        total: Decimal,
+        minimum: Optional[Decimal],
+        maximum: Optional[Decimal],
+    ) -> None:
+        self.count += count
+        self.total += total
+        if minimum is not None:
+            self.minimum = minimum if self.minimum is None else min(self.minimum, minimum)
+        if maximum is not None:
+            self.maximum = maximum if self.maximum is None else max(self.maximum, maximum)
+
+    def add_value(self, value: Decimal) -> None:
+        self.add(1, value, value, value)
+        if self.sketch is not None:
+            self.sketch.add(float(value))
 
 
 class MetricsService:
@@ -34,7 +111,7 @@ class MetricsService:
         timestamp: datetime,
     ) -> TestMetric:
         """
-        Persist a new metric datapoint.
+        Persist a new metric datapoint and fold it into the rollups.
 
         Raises:
             ValueError: If timestamp is not timezone-aware.
@@ -43,10 +120,7 @@ class MetricsService:
             raise ValueError("timestamp must be timezone-aware")
 
         normalized_dimensions = dict(dimensions or {})
-        decimal_value = (
-            Decimal(str(metric_value))
-            .quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-        )
+        decimal_value = self._quantize(metric_value)
 
         metric = TestMetric(
             metric_type=metric_type,
@@ -56,6 +130,7 @@ class MetricsService:
         )
 
         self.db.add(metric)
+        await self._update_rollups([metric])
         await self.db.commit()
         await self.db.refresh(metric)
 
@@ -69,6 +144,52 @@ class MetricsService:
 
         return metric
 
+    async def record_metrics(self, points: Sequence[MetricPoint]) -> int:
+        """
+        Persist many metric datapoints in one transaction.
+
+        Points are inserted with a single multi-row INSERT and folded into
+        the rollups with one update per affected bucket.
+
+        Returns:
+            Number of points written
+
+        Raises:
+            ValueError: If any timestamp is not timezone-aware.
+        """
+        if not points:
+            return 0
+
+        metrics = []
+        for point in points:
+            timestamp = point.timestamp
+            if timestamp.tzinfo is None or timestamp.tzinfo.utcoffset(timestamp) is None:
+                raise ValueError("timestamp must be timezone-aware")
+            metrics.append(TestMetric(
+                id=uuid.uuid4(),
+                metric_type=point.metric_type,
+                metric_value=self._quantize(point.metric_value),
+                dimensions=dict(point.dimensions or {}),
+                timestamp=timestamp,
+            ))
+
+        await self.db.execute(
+            insert(TestMetric),
+            [
+                {
+                    "id": metric.id,
+                    "metric_type": metric.metric_type,
+                    "metric_value": metric.metric_value,
+                    "dimensions": metric.dimensions,
+                    "timestamp": metric.timestamp,
+                }
+                for metric in metrics
+            ],
+        )
+        await self._update_rollups(metrics)
+        await self.db.commit()
+        return len(metrics)
+
     async def get_metrics(
         self,
         *,
@@ -77,8 +198,28 @@ class MetricsService:
         end_time: datetime,
         granularity: str,
         dimensions: Optional[Dict[str, Any]] = None,
+        quantiles: Optional[Sequence[float]] = None,
     ) -> List[Dict[str, Any]]:
-        """Retrieve metrics aggregated by the requested granularity."""
+        """
+        Retrieve metrics aggregated by the requested granularity.
+
+        Hour and day buckets are read from the coarsest rollup table that
+        covers each part of the window; unaligned edges and filters on
+        high-cardinality dimensions are aggregated from raw points in SQL.
+
+        Args:
+            metric_type: Metric name to query
+            start_time: Inclusive window start (timezone-aware)
+            end_time: Exclusive window end (timezone-aware)
+            granularity: 'raw', 'hour' or 'day'
+            dimensions: Dimension key/value pairs the points must contain
+            quantiles: Quantiles (0.0-1.0) to estimate per bucket, returned
+                under "quantiles" as {"p50": ..., "p95": ...}
+
+        Returns:
+            One dict per point or bucket with timestamp, metric_value and
+            count (buckets also carry min_value and max_value)
+        """
         if start_time.tzinfo is None or start_time.tzinfo.utcoffset(start_time) is None:
             raise ValueError("start_time must be timezone-aware")
         if end_time.tzinfo is None or end_time.tzinfo.utcoffset(end_time) is None:
@@ -90,62 +231,329 @@ class MetricsService:
         if granularity_key not in {"raw", "hour", "day"}:
             raise ValueError(f"Unsupported granularity '{granularity}'")
 
-        stmt = (
-            select(TestMetric)
-            .where(
-                TestMetric.metric_type == metric_type,
-                TestMetric.timestamp >= start_time,
-                TestMetric.timestamp < end_time,
-            )
-            .order_by(TestMetric.timestamp)
-        )
-
-        result = await self.db.execute(stmt)
-        metrics = [
-            metric
-            for metric in result.scalars().all()
-            if self._matches_dimensions(metric, dimensions)
-        ]
+        start_time = self._normalise_timestamp(start_time)
+        end_time = self._normalise_timestamp(end_time)
 
         if granularity_key == "raw":
+            stmt = (
+                select(TestMetric.timestamp, TestMetric.metric_value)
+                .where(*self._raw_filters(metric_type, start_time, end_time, dimensions))
+                .order_by(TestMetric.timestamp)
+            )
+            result = await self.db.execute(stmt)
             return [
                 {
-                    "timestamp": self._normalise_timestamp(metric.timestamp),
-                    "metric_value": float(metric.metric_value),
+                    "timestamp": self._normalise_timestamp(timestamp),
+                    "metric_value": float(value),
                     "count": 1,
                 }
-                for metric in metrics
+                for timestamp, value in result.all()
             ]
 
-        buckets = self._bucket_metrics(metrics, granularity_key)
-        return self._serialize_buckets(buckets)
+        buckets: Dict[datetime, _Bucket] = {}
+        with_sketch = bool(quantiles)
+        for source, segment_start, segment_end in self._plan_segments(
+            start_time, end_time, granularity_key, dimensions
+        ):
+            if source == "raw":
+                await self._aggregate_raw(
+                    metric_type, segment_start, segment_end, granularity_key,
+                    dimensions, buckets, with_sketch,
+                )
+            else:
+                await self._aggregate_rollups(
+                    _ROLLUP_MODELS[source], metric_type, segment_start, segment_end,
+                    granularity_key, dimensions, buckets, with_sketch,
+                )
+
+        return self._serialize_buckets(buckets, quantiles)
+
+    # ------------------------------------------------------------------
+    # Rollup maintenance
+    # ------------------------------------------------------------------
+
+    async def _update_rollups(self, metrics: Sequence[TestMetric]) -> None:
+        """Fold metric points into the hourly and daily rollup rows."""
+        for granularity, model in _ROLLUP_MODELS.items():
+            deltas: Dict[Tuple[str, datetime, str], Tuple[Dict[str, Any], _Bucket]] = {}
+            for metric in metrics:
+                rollup_dimensions = self._rollup_dimensions(metric.dimensions)
+                bucket_start = self._truncate_timestamp(
+                    self._normalise_timestamp(metric.timestamp), granularity
+                )
+                key = (metric.metric_type, bucket_start, json.dumps(rollup_dimensions, sort_keys=True))
+                if key not in deltas:
+                    deltas[key] = (rollup_dimensions, _Bucket(sketch=QuantileSketch()))
+                deltas[key][1].add_value(self._quantize(metric.metric_value))
+
+            if deltas:
+                await self._apply_rollup_deltas(model, deltas)
+
+    async def _apply_rollup_deltas(
+        self,
+        model: Type[Any],
+        deltas: Dict[Tuple[str, datetime, str], Tuple[Dict[str, Any], _Bucket]],
+    ) -> None:
+        """
+        Add bucket deltas to rollup rows under row locks.
+
+        Missing rows are created with INSERT ... ON CONFLICT DO NOTHING so
+        concurrent writers never race on the unique bucket key; the rows are
+        then locked in full key order (metric type, bucket, dimensions), so
+        writers touching the same rows always lock them in the same order
+        and cannot deadlock, and updated.
+        """
+        insert = postgresql.insert if self._dialect_name() == "postgresql" else sqlite.insert
+        await self.db.execute(
+            insert(model)
+            .values([
+                {
+                    "id": uuid.uuid4(),
+                    "metric_type": metric_type,
+                    "bucket_start": bucket_start,
+                    "dimensions": rollup_dimensions,
+                    "count": 0,
+                    "value_sum": Decimal("0"),
+                }
+                for (metric_type, bucket_start, _), (rollup_dimensions, _) in deltas.items()
+            ])
+            .on_conflict_do_nothing(index_elements=["metric_type", "bucket_start", "dimensions"])
+        )
+
+        stmt = (
+            select(model)
+            .where(or_(*[
+                and_(
+                    model.metric_type == metric_type,
+                    model.bucket_start == bucket_start,
+                    model.dimensions == rollup_dimensions,
+                )
+                for (metric_type, bucket_start, _), (rollup_dimensions, _) in deltas.items()
+            ]))
+            .order_by(model.metric_type, model.bucket_start, model.dimensions)
+            .with_for_update()
+        )
+        result = await self.db.execute(stmt)
+        for row in result.scalars().all():
+            key = (
+                row.metric_type,
+                self._normalise_timestamp(row.bucket_start),
+                json.dumps(row.dimensions or {}, sort_keys=True),
+            )
+            if key not in deltas:
+                continue
+            delta = deltas[key][1]
+            sketch = QuantileSketch.from_dict(row.sketch)
+            sketch.merge(delta.sketch)
+
+            row.count = int(row.count or 0) + delta.count
+            row.value_sum = Decimal(str(row.value_sum or 0)) + delta.total
+            row.value_min = delta.minimum if row.value_min is None else min(Decimal(str(row.value_min)), delta.minimum)
+            row.value_max = delta.maximum if row.value_max is None else max(Decimal(str(row.value_max)), delta.maximum)
+            row.sketch = sketch.to_dict()
 
     @staticmethod
-    def _matches_dimensions(metric: TestMetric, dimensions: Optional[Dict[str, Any]]) -> bool:
-        if not dimensions:
-            return True
-        metric_dims = metric.dimensions or {}
-        return all(metric_dims.get(key) == value for key, value in dimensions.items())
+    def _rollup_dimensions(dimensions: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        # Sorted keys keep the stored JSON identical for equal dimension sets
+        dims = dimensions or {}
+        return {
+            key: dims[key]
+            for key in sorted(dims)
+            if key not in ROLLUP_EXCLUDED_DIMENSIONS
+        }
 
-    def _bucket_metrics(
+    # ------------------------------------------------------------------
+    # Query planning and aggregation
+    # ------------------------------------------------------------------
+
+    def _plan_segments(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        granularity: str,
+        dimensions: Optional[Dict[str, Any]],
+    ) -> List[Tuple[str, datetime, datetime]]:
+        """Split the window into (source, start, end) parts, coarsest first."""
+        if any(key in ROLLUP_EXCLUDED_DIMENSIONS for key in (dimensions or {})):
+            return [("raw", start_time, end_time)]
+        sources = ["day", "hour"] if granularity == "day" else ["hour"]
+        return self._split_window(start_time, end_time, sources)
+
+    def _split_window(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        sources: List[str],
+    ) -> List[Tuple[str, datetime, datetime]]:
+        if start_time >= end_time:
+            return []
+        if not sources:
+            return [("raw", start_time, end_time)]
+
+        source, finer = sources[0], sources[1:]
+        aligned_start = self._truncate_timestamp(start_time, source)
+        if aligned_start < start_time:
+            aligned_start += _GRANULARITY_STEPS[source]
+        aligned_end = self._truncate_timestamp(end_time, source)
+        if aligned_start >= aligned_end:
+            return self._split_window(start_time, end_time, finer)
+
+        return (
+            self._split_window(start_time, aligned_start, finer)
+            + [(source, aligned_start, aligned_end)]
+            + self._split_window(aligned_end, end_time, finer)
+        )
+
+    async def _aggregate_raw(
         self,
-        metrics: Iterable[TestMetric],
+        metric_type: str,
+        start_time: datetime,
+        end_time: datetime,
         granularity: str,
-    ) -> Dict[datetime, Tuple[Decimal, int]]:
-        buckets: Dict[datetime, Tuple[Decimal, int]] = {}
-        for metric in metrics:
-            timestamp = self._normalise_timestamp(metric.timestamp)
-            bucket_start = self._truncate_timestamp(timestamp, granularity)
-            current_sum, current_count = buckets.get(bucket_start, (Decimal("0"), 0))
-            metric_value = (
-                Decimal(str(metric.metric_value))
-                .quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        dimensions: Optional[Dict[str, Any]],
+        buckets: Dict[datetime, _Bucket],
+        with_sketch: bool,
+    ) -> None:
+        filters = self._raw_filters(metric_type, start_time, end_time, dimensions)
+
+        if with_sketch:
+            # Raw segments are window edges, so their points are few
+            result = await self.db.execute(
+                select(TestMetric.timestamp, TestMetric.metric_value).where(*filters)
+            )
+            for timestamp, value in result.all():
+                bucket_start = self._truncate_timestamp(self._normalise_timestamp(timestamp), granularity)
+                self._get_bucket(buckets, bucket_start, with_sketch).add_value(self._quantize(value))
+            return
+
+        bucket = self._bucket_expression(TestMetric.timestamp, granularity)
+        stmt = (
+            select(
+                bucket,
+                func.count(),
+                func.sum(TestMetric.metric_value),
+                func.min(TestMetric.metric_value),
+                func.max(TestMetric.metric_value),
             )
-            buckets[bucket_start] = (
-                current_sum + metric_value,
-                current_count + 1,
+            .where(*filters)
+            .group_by(bucket)
+        )
+        result = await self.db.execute(stmt)
+        for bucket_value, count, total, minimum, maximum in result.all():
+            self._get_bucket(buckets, self._parse_bucket(bucket_value), with_sketch).add(
+                int(count), self._to_decimal(total), self._to_decimal(minimum), self._to_decimal(maximum),
             )
-        return buckets
+
+    async def _aggregate_rollups(
+        self,
+        model: Type[Any],
+        metric_type: str,
+        start_time: datetime,
+        end_time: datetime,
+        granularity: str,
+        dimensions: Optional[Dict[str, Any]],
+        buckets: Dict[datetime, _Bucket],
+        with_sketch: bool,
+    ) -> None:
+        filters = [
+            model.metric_type == metric_type,
+            model.bucket_start >= start_time,
+            model.bucket_start < end_time,
+            *self._dimension_filters(model.dimensions, dimensions),
+        ]
+
+        if with_sketch:
+            result = await self.db.execute(
+                select(
+                    model.bucket_start, model.count, model.value_sum,
+                    model.value_min, model.value_max, model.sketch,
+                ).where(*filters)
+            )
+            for bucket_start, count, total, minimum, maximum, sketch in result.all():
+                bucket_start = self._truncate_timestamp(self._normalise_timestamp(bucket_start), granularity)
+                bucket = self._get_bucket(buckets, bucket_start, with_sketch)
+                bucket.add(int(count), self._to_decimal(total), self._to_decimal(minimum), self._to_decimal(maximum))
+                bucket.sketch.merge(QuantileSketch.from_dict(sketch))
+            return
+
+        bucket = self._bucket_expression(model.bucket_start, granularity)
+        stmt = (
+            select(
+                bucket,
+                func.sum(model.count),
+                func.sum(model.value_sum),
+                func.min(model.value_min),
+                func.max(model.value_max),
+            )
+            .where(*filters)
+            .group_by(bucket)
+        )
+        result = await self.db.execute(stmt)
+        for bucket_value, count, total, minimum, maximum in result.all():
+            if not count:
+                continue
+            self._get_bucket(buckets, self._parse_bucket(bucket_value), with_sketch).add(
+                int(count), self._to_decimal(total), self._to_decimal(minimum), self._to_decimal(maximum),
+            )
+
+    def _raw_filters(
+        self,
+        metric_type: str,
+        start_time: datetime,
+        end_time: datetime,
+        dimensions: Optional[Dict[str, Any]],
+    ) -> List[Any]:
+        return [
+            TestMetric.metric_type == metric_type,
+            TestMetric.timestamp >= start_time,
+            TestMetric.timestamp < end_time,
+            *self._dimension_filters(TestMetric.dimensions, dimensions),
+        ]
+
+    def _dimension_filters(self, column: Any, dimensions: Optional[Dict[str, Any]]) -> List[Any]:
+        """JSONB containment on PostgreSQL, one json_extract per key elsewhere."""
+        if not dimensions:
+            return []
+        if self._dialect_name() == "postgresql":
+            return [column.contains(dict(dimensions))]
+        return [
+            func.json_extract(column, f'$."{key}"') == value
+            for key, value in dimensions.items()
+        ]
+
+    def _bucket_expression(self, column: Any, granularity: str) -> Any:
+        # Literal (not bound) arguments so GROUP BY matches the SELECT expression
+        if self._dialect_name() == "postgresql":
+            return func.date_trunc(
+                literal_column(f"'{granularity}'"),
+                func.timezone(literal_column("'UTC'"), column),
+            )
+        return func.strftime(literal_column(f"'{_SQLITE_BUCKET_FORMATS[granularity]}'"), column)
+
+    def _dialect_name(self) -> str:
+        return self.db.get_bind().dialect.name
+
+    @staticmethod
+    def _parse_bucket(value: Any) -> datetime:
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        return MetricsService._normalise_timestamp(value)
+
+    @staticmethod
+    def _get_bucket(buckets: Dict[datetime, _Bucket], bucket_start: datetime, with_sketch: bool) -> _Bucket:
+        if bucket_start not in buckets:
+            buckets[bucket_start] = _Bucket(sketch=QuantileSketch() if with_sketch else None)
+        return buckets[bucket_start]
+
+    @staticmethod
+    def _quantize(value: Any) -> Decimal:
+        return Decimal(str(value)).quantize(_CENTS, rounding=ROUND_HALF_UP)
+
+    @staticmethod
+    def _to_decimal(value: Any) -> Optional[Decimal]:
+        if value is None:
+            return None
+        return Decimal(str(value))
 
     @staticmethod
     def _normalise_timestamp(timestamp: datetime) -> datetime:
@@ -163,17 +571,25 @@ class MetricsService:
 
     def _serialize_buckets(
         self,
-        buckets: Dict[datetime, Tuple[Decimal, int]],
+        buckets: Dict[datetime, _Bucket],
+        quantiles: Optional[Sequence[float]] = None,
     ) -> List[Dict[str, Any]]:
         serialized: List[Dict[str, Any]] = []
         for bucket_start in sorted(buckets.keys()):
-            total, count = buckets[bucket_start]
-            average = (total / count).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            serialized.append(
-                {
-                    "timestamp": bucket_start,
-                    "metric_value": float(average),
-                    "count": count,
+            bucket = buckets[bucket_start]
+            if bucket.count == 0:
+                continue
+            average = (bucket.total / bucket.count).quantize(_CENTS, rounding=ROUND_HALF_UP)
+            entry: Dict[str, Any] = {
+                "timestamp": bucket_start,
+                "metric_value": float(average),
+                "count": bucket.count,
+                "min_value": float(bucket.minimum) if bucket.minimum is not None else None,
+                "max_value": float(bucket.maximum) if bucket.maximum is not None else None,
+            }
+            if quantiles:
+                entry["quantiles"] = {
+                    f"p{q * 100:g}": bucket.sketch.quantile(q) for q in quantiles
                 }
-            )
+            serialized.append(entry)
         return serialized
@@ -30,6 +30,7 @@ from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.exc import MultipleResultsFound
 from sqlalchemy.orm import selectinload
 
 from models.scenario_script import ScenarioScript, ScenarioStep
@@ -37,17 +38,26 @@ from models.expected_outcome import ExpectedOutcome
 from models.multi_turn_execution import MultiTurnExecution, StepExecution
 from models.suite_run import SuiteRun
 from models.validation_result import ValidationResult
-from services.tts_service import TTSService
+from services.tts_service import TTSService, get_tts_executor
 from services.storage_service import StorageService
 from services.validation_queue_service import ValidationQueueService
 from services.validation_service import determine_review_status
-from services.llm_pipeline_service import LLMPipelineService
+from services.llm_pipeline_service import LLMPipelineService, PipelineResult
+from services.llm_providers import EvaluationItem
+from services.expected_outcome_matcher import get_outcome_matcher
+from services.validation_decision_policy import (
+    DECISION_PATH_DETERMINISTIC_FAIL,
+    DECISION_PATH_DETERMINISTIC_PASS,
+    DECISION_PATH_HOUNDIFY_ONLY,
+    get_decision_policy,
+    has_deterministic_checks,
+)
 from services.validation_houndify import ValidationHoundifyMixin
 from services.defect_auto_creator import DefectAutoCreator, get_defect_threshold
+from services.latency_sketch_store import get_latency_sketch_store
 from integrations.houndify import create_houndify_client
 from api.config import get_settings
-from api.events import emit_to_room
-from services.audio_utils import convert_to_pcm
+from api.events import emit_suite_run_update, emit_to_room
 from services.noise_profile_library_service import NoiseProfileLibraryService
 
 logger = logging.getLogger(__name__)
@@ -70,7 +80,6 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
     def __init__(self):
         """Initialize the multi-turn execution service."""
         self.settings = get_settings()
-        self.tts_service = TTSService()
 
         # Initialize StorageService with proper MinIO/S3 credentials
         self.storage_service = StorageService(
@@ -81,14 +90,27 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
             default_bucket=self.settings.MINIO_AUDIO_BUCKET
         )
 
+        # TTS with in-process LRU, dedicated executor and (optionally) the
+        # audio bucket as a content-addressed cache shared across workers
+        self.tts_service = TTSService(
+            memory_cache_size=self.settings.TTS_MEMORY_CACHE_SIZE,
+            executor=get_tts_executor(self.settings.TTS_EXECUTOR_WORKERS),
+            shared_store=self.storage_service if self.settings.TTS_SHARED_CACHE_ENABLED else None,
+            shared_store_bucket=self.settings.MINIO_AUDIO_BUCKET,
+            shared_store_prefix=self.settings.TTS_SHARED_CACHE_PREFIX,
+        )
+
         # Initialize Houndify client using centralized factory
         self.houndify_client = create_houndify_client(
             client_id=self.settings.SOUNDHOUND_CLIENT_ID,
             client_key=self.settings.SOUNDHOUND_API_KEY,
         )
 
-        # Initialize noise profile library
-        self.noise_profile_library = NoiseProfileLibraryService()
+        # Initialize noise profile library (precomputed noise loops shared per process)
+        self.noise_profile_library = NoiseProfileLibraryService(
+            bank_seconds=self.settings.NOISE_BANK_SECONDS,
+            bank_dir=self.settings.NOISE_BANK_DIR,
+        )
 
     def _apply_noise_to_pcm(
         self,
@@ -110,6 +132,7 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
                 - snr_db: float (optional) - SNR override
                 - randomize_snr: bool - Whether to randomize SNR
                 - snr_variance: float - Variance for randomization
+                - seed: int (optional) - Seed for reproducible noise placement
             sample_rate: Audio sample rate (default 16000)
 
         Returns:
@@ -147,7 +170,8 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
             signal=signal,
             profile_name=profile_name,
             snr_db=snr_db,
-            sample_rate=sample_rate
+            sample_rate=sample_rate,
+            seed=noise_config.get('seed')
         )
 
         # Clip to prevent overflow and convert back to 16-bit PCM
@@ -172,7 +196,10 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
         tenant_id: UUID,
         socketio=None,
         language_codes: Optional[List[str]] = None,
-        suite_id: Optional[UUID] = None
+        suite_id: Optional[UUID] = None,
+        variant_concurrency: Optional[int] = None,
+        defer_llm_validation: bool = False,
+        update_suite_run: bool = True
     ) -> MultiTurnExecution:
         """
         Execute a complete multi-turn scenario.
@@ -188,6 +215,21 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
                           If ["en-US"], executes only English variants
                           If ["en-US", "fr-FR"], executes both
             suite_id: Optional test suite ID if executing as part of a suite
+            variant_concurrency: Optional cap on language variants processed
+                          concurrently within a step for this execution.
+                          Falls back to script_metadata['variant_concurrency'],
+                          then EXECUTION_VARIANT_CONCURRENCY. 1 = sequential.
+            defer_llm_validation: Leave LLM validation of llm_ensemble/hybrid
+                          scripts to validate_deferred_llm(), which evaluates
+                          all steps and languages in batch once the execution
+                          has run. In hybrid mode a step whose Houndify check
+                          fails still stops the execution early; llm_ensemble
+                          steps are decided by the LLM alone, so every step
+                          runs before its verdict is known. The suite run is
+                          recounted after the batch.
+            update_suite_run: Recount the suite run's tests and set its status
+                          when the execution finishes. Callers that own the
+                          suite run counters (inline batches) pass False.
 
         Returns:
             MultiTurnExecution: The execution record
@@ -226,6 +268,10 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
         
         logger.info(f"✓ Loaded scenario: {script.name} ({len(script.steps)} steps)")
 
+        # Expected outcomes were loaded with the steps; validation reads them
+        # from this map instead of querying once per step and language
+        expected_outcomes = self._index_expected_outcomes(script)
+
         # 2. Create multi-turn execution record
         execution = await self._create_execution(db, script, suite_run_id, tenant_id, suite_id)
         logger.info(f"✓ Created execution record: {execution.id}")
@@ -235,14 +281,18 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
 
         # 3. Execute each step in sequence
         try:
-            await self._execute_steps(db, execution, script, socketio, language_codes)
+            await self._execute_steps(
+                db, execution, script, socketio, language_codes, variant_concurrency,
+                expected_outcomes=expected_outcomes,
+                defer_llm_validation=defer_llm_validation
+            )
 
             # Mark execution as completed
             execution.status = 'completed'
             execution.completed_at = datetime.utcnow()
 
             # Update suite run status (if part of a suite)
-            if suite_run_id:
+            if suite_run_id and update_suite_run:
                 await self._update_suite_run_status(db, suite_run_id, 'completed')
 
             await db.commit()
@@ -268,27 +318,53 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
             execution.status = 'failed'
 
             # Update suite run status to failed (if part of a suite)
-            if suite_run_id:
+            if suite_run_id and update_suite_run:
                 await self._update_suite_run_status(db, suite_run_id, 'failed')
             execution.error_message = str(e)
             execution.completed_at = datetime.utcnow()
             await db.commit()
 
+            # Failed executions are not validated later; evaluate the steps
+            # that did run now
+            if defer_llm_validation:
+                try:
+                    await self.validate_deferred_llm(db, execution)
+                except Exception as validation_err:
+                    logger.warning(f"Deferred LLM validation failed: {validation_err}")
+
             # Emit execution failed event
             await self._emit_execution_failed(execution, str(e))
 
             raise
 
+        finally:
+            # Publish this worker's step latency percentiles (see latency_sketch_store)
+            await get_latency_sketch_store().flush()
+
     async def _load_script(self, db: AsyncSession, script_id: UUID) -> Optional[ScenarioScript]:
-        """Load scenario script with all steps."""
+        """
+        Load scenario script with all steps and their expected outcomes.
+
+        Outcomes for every step come from one extra SELECT. Their historical
+        validation_results are not loaded; execution never reads them.
+        """
         stmt = (
             select(ScenarioScript)
             .where(ScenarioScript.id == script_id)
-            .options(selectinload(ScenarioScript.steps))
+            .options(
+                selectinload(ScenarioScript.steps)
+                .selectinload(ScenarioStep.expected_outcomes)
+                .lazyload(ExpectedOutcome.validation_results)
+            )
         )
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    def _index_expected_outcomes(script: ScenarioScript) -> Dict[UUID, List[ExpectedOutcome]]:
+        """Map each step id to its prefetched expected outcomes."""
+        return {step.id: list(step.expected_outcomes or []) for step in script.steps}
+
     async def _create_execution(
         self,
         db: AsyncSession,
@@ -346,7 +422,10 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
         execution: MultiTurnExecution,
         script: ScenarioScript,
         socketio=None,
-        language_codes: Optional[List[str]] = None
+        language_codes: Optional[List[str]] = None,
+        variant_concurrency: Optional[int] = None,
+        expected_outcomes: Optional[Dict[UUID, List[ExpectedOutcome]]] = None,
+        defer_llm_validation: bool = False
     ) -> None:
         """
         Execute all steps in the scenario sequentially.
@@ -366,8 +445,12 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
                           None = execute all language variants
                           ["en-US"] = execute only English variants
                           ["en-US", "fr-FR"] = execute both English and French variants
+            variant_concurrency: Optional per-execution cap on concurrent language variants
+            expected_outcomes: Prefetched expected outcomes keyed by step id
+            defer_llm_validation: Skip per-step LLM validation (run later in batch)
         """
         conversation_state = None  # No state for first turn
+        variant_concurrency = self._resolve_variant_concurrency(script, variant_concurrency)
 
         # Get all steps sorted by step_order
         sorted_steps = self._filter_steps_by_language(script.steps, language_codes)
@@ -397,7 +480,10 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
                 step=step,
                 conversation_state=conversation_state,
                 script=script,
-                language_codes=language_codes
+                language_codes=language_codes,
+                variant_concurrency=variant_concurrency,
+                expected_outcomes=expected_outcomes,
+                defer_llm_validation=defer_llm_validation
             )
 
             # Get the step execution record
@@ -430,11 +516,18 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
         step: ScenarioStep,
         conversation_state: Optional[Dict[str, Any]],
         script: ScenarioScript,
-        language_codes: Optional[List[str]] = None
+        language_codes: Optional[List[str]] = None,
+        variant_concurrency: Optional[int] = None,
+        expected_outcomes: Optional[Dict[UUID, List[ExpectedOutcome]]] = None,
+        defer_llm_validation: bool = False
     ) -> Dict[str, Any]:
         """
         Execute a single step in the scenario.
 
+        Language variants are fanned out with at most ``variant_concurrency``
+        in flight; per-variant timings are stored under
+        ``validation_details['variant_execution']``.
+
         Args:
             db: Database session
             execution: Multi-turn execution record
@@ -442,12 +535,19 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
             conversation_state: Conversation state from previous step (or None for first step)
             script: Scenario script (for accessing metadata like language_code)
             language_codes: Optional list of language codes to filter variants
+            variant_concurrency: Maximum variants processed concurrently
+                          (defaults to EXECUTION_VARIANT_CONCURRENCY)
+            expected_outcomes: Prefetched expected outcomes keyed by step id
+            defer_llm_validation: Skip LLM validation of llm_ensemble/hybrid
+                          scripts; validate_deferred_llm() runs it in batch
 
         Returns:
             Dictionary with step execution results
         """
         start_time = datetime.utcnow()
         request_id = f"req_{execution.id}_{step.step_order}"
+        if variant_concurrency is None:
+            variant_concurrency = self.settings.EXECUTION_VARIANT_CONCURRENCY
 
         try:
             # 1. Generate TTS audio for language variants (filtered by language_codes)
@@ -457,38 +557,39 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
             language_variants = self._get_language_variants(script, step, language_codes)
             logger.info(f"  - Found {len(language_variants)} language variant(s): {list(language_variants.keys())}")
 
-            # Generate and upload audio for each language
-            audio_urls = {}
-            audio_data_by_lang = {}
-
-            for lang_code, utterance in language_variants.items():
-                # Convert language code to TTS format (e.g., "en-US" -> "en")
-                tts_lang = lang_code.split('-')[0] if lang_code else "en"
-
-                logger.info(f"  - Generating audio for {lang_code}: '{utterance}'")
-                audio_data = self.tts_service.text_to_speech(
-                    text=utterance,
-                    lang=tts_lang
-                )
-                logger.info(f"    ✓ Generated {len(audio_data)} bytes")
-
-                # Upload to storage
-                audio_url = await self._upload_audio_to_storage(
-                    audio_data,
-                    execution.id,
-                    step.step_order,
-                    lang_code
-                )
+            # Run TTS, upload, PCM conversion, noise and Houndify for every
+            # variant with bounded concurrency. Results come back in
+            # language_variants order so downstream processing is deterministic.
+            noise_config = (script.script_metadata or {}).get('noise_config', {})
+            fan_out_start = time.perf_counter()
+            variant_runs = await self._run_language_variants(
+                execution=execution,
+                step=step,
+                language_variants=language_variants,
+                conversation_state=conversation_state,
+                noise_config=noise_config,
+                request_id=request_id,
+                concurrency=variant_concurrency,
+            )
+            variant_execution = {
+                'concurrency': min(variant_concurrency, max(len(language_variants), 1)),
+                'wall_clock_ms': self._elapsed_ms(fan_out_start),
+                'serial_ms': sum(run['timings'].get('total_ms', 0) for run in variant_runs.values()),
+                'per_variant_timings': {
+                    lang_code: run['timings'] for lang_code, run in variant_runs.items()
+                },
+            }
 
-                if audio_url:
-                    audio_urls[lang_code] = audio_url
-                    audio_data_by_lang[lang_code] = audio_data
-                    logger.info(f"    ✓ Uploaded to: {audio_url}")
+            audio_urls = {
+                lang_code: run['audio_url']
+                for lang_code, run in variant_runs.items()
+                if run.get('audio_url')
+            }
 
             logger.info(f"✓ Generated and uploaded audio for {len(audio_urls)} language(s)")
 
             # 1b. Validate ALL language variants
-            if not audio_data_by_lang:
+            if not audio_urls:
                 error_msg = "Failed to generate audio for any language variant. Check storage service configuration."
                 logger.error(f"❌ {error_msg}")
                 raise RuntimeError(error_msg)
@@ -496,7 +597,7 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
             # ═══════════════════════════════════════════════════════════════════
             # 🌍 MULTI-LANGUAGE VALIDATION: Process each language variant
             # ═══════════════════════════════════════════════════════════════════
-            logger.info(f"STEP {step.step_order}.2: Validating {len(audio_data_by_lang)} language variant(s)")
+            logger.info(f"STEP {step.step_order}.2: Validating {len(audio_urls)} language variant(s)")
 
             # Track validation results per language
             language_validation_results = {}
@@ -509,53 +610,19 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
             primary_response_audio_base64 = None  # TTS response audio from Houndify
             any_validation_passed = False
 
-            for lang_code, audio_data in audio_data_by_lang.items():
-                logger.info(f"\n  ─── Language: {lang_code} {'(PRIMARY)' if lang_code == primary_lang else ''} ───")
+            for lang_code, variant_run in variant_runs.items():
+                if not variant_run.get('audio_url'):
+                    continue
 
-                # Convert audio to raw PCM format for Houndify
-                try:
-                    pcm_audio = convert_to_pcm(audio_data, target_rate=16000, raw=True)
-                    logger.info(f"    ✓ Converted to raw PCM: {len(pcm_audio)} bytes")
-                except Exception as e:
-                    logger.warning(f"    ⚠ PCM conversion failed, using original: {e}")
-                    pcm_audio = audio_data
-
-                # Apply noise injection if configured at scenario level
-                noise_config = (script.script_metadata or {}).get('noise_config', {})
-                if noise_config.get('enabled', False):
-                    try:
-                        pcm_audio = self._apply_noise_to_pcm(
-                            pcm_bytes=pcm_audio,
-                            noise_config=noise_config,
-                            sample_rate=16000
-                        )
-                    except Exception as e:
-                        logger.warning(f"    ⚠ Noise injection failed, using original: {e}")
-
-                # Get utterance for this language
-                utterance = language_variants.get(lang_code, step.user_utterance)
-
-                # Build request_info for this language
-                # LanguageCode is passed to enable language-specific responses
-                lang_request_info = {
-                    "Prompt": utterance,
-                    "LanguageCode": lang_code,  # Pass language to Houndify client
-                    "Latitude": 37.7749,
-                    "Longitude": -122.4194,
-                    "TimeZone": "America/Los_Angeles",
-                    "ConversationState": conversation_state
-                }
+                logger.info(f"\n  ─── Language: {lang_code} {'(PRIMARY)' if lang_code == primary_lang else ''} ───")
 
-                lang_request_id = f"{request_id}_{lang_code}"
+                lang_request_id = variant_run['request_id']
 
-                # Send to Houndify
                 try:
-                    response = await self.houndify_client.voice_query(
-                        audio_data=pcm_audio,
-                        user_id=execution.user_id,
-                        request_id=lang_request_id,
-                        request_info=lang_request_info
-                    )
+                    if 'error' in variant_run:
+                        raise variant_run['error']
+
+                    response = variant_run['response']
 
                     # Extract response data
                     ai_response = None
@@ -578,6 +645,15 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
                         # Extract NativeData for entity validation
                         native_data = result.get("NativeData")
 
+                    houndify_ms = variant_run['timings'].get('houndify_ms')
+                    if execution.suite_run_id and houndify_ms is not None:
+                        get_latency_sketch_store().record(
+                            execution.suite_run_id,
+                            houndify_ms,
+                            language_code=lang_code,
+                            command_kind=command_kind,
+                        )
+
                     logger.info(f"    - Transcription: {transcription}")
                     logger.info(f"    - Command Kind: {command_kind}")
                     logger.info(f"    - Confidence: {confidence_score}")
@@ -603,7 +679,8 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
                         command_kind=command_kind,
                         confidence_score=confidence_score,
                         language_code=lang_code,  # Pass language code for language-specific validation
-                        actual_entities=native_data  # Pass NativeData for entity validation
+                        actual_entities=native_data,  # Pass NativeData for entity validation
+                        expected_outcomes=expected_outcomes
                     )
 
                     if validation_result['passed']:
@@ -688,7 +765,8 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
                         }
                         for lang, r in language_validation_results.items()
                         if 'error' not in r  # Only include successful executions
-                    }
+                    },
+                    'variant_execution': variant_execution,
                 },
                 response_time_ms=response_time_ms,
                 executed_at=start_time
@@ -789,11 +867,34 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
                 # 🤖 LLM Pipeline Validation (if enabled)
                 # ═══════════════════════════════════════════════════════════════════
                 validation_mode = getattr(script, 'validation_mode', 'houndify')
+                houndify_passed = validation_result.get('passed', False)
+                decision_path = self._deterministic_decision_path(
+                    validation_mode=validation_mode,
+                    validation_result=validation_result,
+                    command_kind_match_score=command_kind_match_score,
+                    asr_confidence=confidence_score,
+                )
+                if (
+                    decision_path is None
+                    and defer_llm_validation
+                    and validation_mode in ('llm_ensemble', 'hybrid')
+                ):
+                    # LLM evaluation, combined decision and review queueing run
+                    # in batch for the whole execution (validate_deferred_llm)
+                    logger.info(f"  - {lang_code}: LLM validation deferred to batch")
+                    continue
+
                 llm_passed = True  # Default to True if LLM not enabled
                 llm_decision = 'pass'  # Default decision
                 llm_confidence = 'high'  # Default confidence
 
-                if validation_mode in ('llm_ensemble', 'hybrid'):
+                if decision_path in (DECISION_PATH_DETERMINISTIC_PASS, DECISION_PATH_DETERMINISTIC_FAIL):
+                    # Deterministic checks are conclusive - the LLM is skipped
+                    # and the Houndify result stands in for its decision
+                    llm_decision = 'pass' if houndify_passed else 'fail'
+                    logger.info(f"  - {lang_code}: LLM validation skipped ({decision_path})")
+
+                elif validation_mode in ('llm_ensemble', 'hybrid'):
                     # Get the AI response and user utterance for this language
                     lang_ai_response = lang_result.get('ai_response', primary_ai_response)
                     lang_utterance = language_variants.get(lang_code, step.user_utterance)
@@ -812,107 +913,19 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
                         context=eval_context
                     )
 
-                # ═══════════════════════════════════════════════════════════════════
-                # 🔀 Compute COMBINED decision (deterministic + LLM)
-                # ═══════════════════════════════════════════════════════════════════
-                houndify_passed = validation_result.get('passed', False)
-                final_decision = self._compute_combined_decision(
+                await self._finalize_validation_result(
+                    db=db,
+                    execution=execution,
+                    validation_result=validation_result_obj,
+                    validation_mode=validation_mode,
                     houndify_passed=houndify_passed,
                     llm_decision=llm_decision,
-                    validation_mode=validation_mode
+                    llm_confidence=llm_confidence,
+                    validation_score=validation_score,
+                    # Houndify + LLM combined wall-clock time
+                    total_validation_latency_ms=int((time.time() - validation_start_time) * 1000),
+                    decision_path=decision_path,
                 )
-                review_status = self._compute_review_status(
-                    final_decision=final_decision,
-                    llm_confidence=llm_confidence
-                )
-
-                # Store combined decision on validation result
-                validation_result_obj.final_decision = final_decision
-                validation_result_obj.review_status = review_status
-
-                # Calculate total validation latency (Houndify + LLM combined wall-clock time)
-                total_validation_latency_ms = int((time.time() - validation_start_time) * 1000)
-
-                # Add total_validation_latency_ms to both houndify_result and ensemble_result
-                if validation_result_obj.houndify_result:
-                    validation_result_obj.houndify_result['total_validation_latency_ms'] = total_validation_latency_ms
-                if validation_result_obj.ensemble_result:
-                    validation_result_obj.ensemble_result['total_validation_latency_ms'] = total_validation_latency_ms
-
-                await db.commit()
-
-                logger.info(
-                    f"  - {lang_code}: Combined decision: houndify={houndify_passed}, "
-                    f"llm={llm_decision}, final={final_decision}, status={review_status}, "
-                    f"latency={total_validation_latency_ms}ms"
-                )
-
-                # ═══════════════════════════════════════════════════════════════════
-                # 🔴 Track validation outcome for defect auto-creation
-                # ═══════════════════════════════════════════════════════════════════
-                # Call for ALL review statuses - auto_fail increments streak,
-                # other statuses reset it (prevents false positives from intermittent failures)
-                try:
-                    await self._check_defect_auto_creation(
-                        db=db,
-                        execution=execution,
-                        validation_result=validation_result_obj,
-                        review_status=review_status,
-                    )
-                except Exception as defect_err:
-                    logger.warning(f"Defect auto-creation check failed: {defect_err}")
-
-                # ═══════════════════════════════════════════════════════════════════
-                # 📋 Enqueue for human review based on COMBINED decision
-                # ═══════════════════════════════════════════════════════════════════
-                # Queue if the combined decision is not auto_pass
-                needs_human_review = review_status != "auto_pass"
-
-                # 5% random sampling of auto_pass items for calibration
-                # This allows us to measure agreement on pass decisions too
-                is_sampled = False
-                if review_status == "auto_pass" and random.random() < 0.05:
-                    needs_human_review = True
-                    is_sampled = True
-                    logger.info(f"    🎲 Random sample: auto_pass selected for human review")
-
-                if needs_human_review:
-                    from decimal import Decimal
-
-                    queue_service = ValidationQueueService()
-
-                    # Priority based on combined decision:
-                    # - Priority 1: Combined decision is 'fail' (highest urgency)
-                    # - Priority 2: Combined decision is 'uncertain' (systems disagreed)
-                    # - Priority 5: Needs review for other reasons
-                    # - Priority 10: Random sample (lowest urgency, for calibration)
-                    if is_sampled:
-                        priority = 10  # Random sample - lowest priority
-                    elif final_decision == 'fail':
-                        priority = 1  # Confirmed failure
-                    elif final_decision == 'uncertain':
-                        priority = 2  # Systems disagreed or LLM uncertain
-                    else:
-                        priority = 5  # Needs review
-
-                    confidence_percentage = Decimal(str(validation_score * 100)).quantize(
-                        Decimal('0.01')
-                    )
-
-                    queue_item = await queue_service.enqueue_for_human_review(
-                        db=db,
-                        validation_result_id=validation_result_obj.id,
-                        priority=priority,
-                        confidence_score=confidence_percentage,
-                        language_code=lang_code,  # 🌍 Pass language code to queue
-                        requires_native_speaker=False
-                    )
-
-                    sample_tag = " [SAMPLE]" if is_sampled else ""
-                    logger.info(
-                        f"    → Queued for review: {queue_item.id}{sample_tag} "
-                        f"(final={final_decision}, houndify={houndify_passed}, llm={llm_decision})"
-                    )
 
             # ═══════════════════════════════════════════════════════════════════
             # 📝 Update step_execution.validation_details with full results
@@ -924,42 +937,10 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
             validation_results = await db.execute(stmt)
             validation_results = validation_results.scalars().all()
 
-            # Build enhanced per-language results with houndify and LLM data
-            # Start with the execution data we already stored
-            enhanced_per_language = dict(step_execution.validation_details.get('per_language_results', {}))
-            # Track if all languages passed the combined decision
-            # Start with False if no results exist (all failed with errors)
-            all_passed = len(validation_results) > 0
-            for vr in validation_results:
-                # Use combined final_decision, not just houndify_passed
-                lang_passed = vr.final_decision == 'pass'
-                if not lang_passed:
-                    all_passed = False
-                # Get existing data for this language (if any)
-                existing_data = enhanced_per_language.get(vr.language_code, {})
-                # Merge validation results with execution data
-                enhanced_per_language[vr.language_code] = {
-                    **existing_data,  # Keep user_utterance, ai_response, transcription, etc.
-                    'passed': lang_passed,  # Combined decision, not just houndify
-                    'errors': vr.houndify_result.get('errors', []) if vr.houndify_result else [],
-                    'houndify_result': vr.houndify_result,
-                    'ensemble_result': vr.ensemble_result,
-                    'final_decision': vr.final_decision,
-                    'review_status': vr.review_status,
-                }
-
-            # Update step_execution validation_details and validation_passed
             # Use combined decision from LLM + Houndify, not just houndify-only result
-            step_execution.validation_passed = all_passed
-            step_execution.validation_details = {
-                'languages_validated': list(language_validation_results.keys()),
-                'primary_language': primary_lang,
-                'per_language_results': enhanced_per_language,
-                # Include primary language's results at top level for convenience
-                'houndify_result': enhanced_per_language.get(primary_lang, {}).get('houndify_result'),
-                'ensemble_result': enhanced_per_language.get(primary_lang, {}).get('ensemble_result'),
-                'final_decision': enhanced_per_language.get(primary_lang, {}).get('final_decision'),
-            }
+            all_passed = self._summarize_step_validation(
+                step_execution, validation_results, getattr(script, 'validation_mode', 'houndify')
+            )
             await db.commit()
 
             return {
@@ -991,6 +972,228 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
 
             raise
 
+    def _resolve_variant_concurrency(
+        self,
+        script: ScenarioScript,
+        variant_concurrency: Optional[int] = None
+    ) -> int:
+        """
+        Resolve the per-execution language variant concurrency cap.
+
+        Priority:
+        1. Explicit ``variant_concurrency`` argument
+        2. script.script_metadata['variant_concurrency']
+        3. EXECUTION_VARIANT_CONCURRENCY setting
+
+        Returns:
+            Concurrency cap (always >= 1)
+        """
+        if variant_concurrency is None:
+            script_metadata = script.script_metadata or {}
+            variant_concurrency = script_metadata.get('variant_concurrency')
+        if variant_concurrency is None:
+            variant_concurrency = self.settings.EXECUTION_VARIANT_CONCURRENCY
+        try:
+            return max(1, int(variant_concurrency))
+        except (TypeError, ValueError):
+            logger.warning(
+                f"Invalid variant_concurrency {variant_concurrency!r}, "
+                f"using {self.settings.EXECUTION_VARIANT_CONCURRENCY}"
+            )
+            return max(1, self.settings.EXECUTION_VARIANT_CONCURRENCY)
+
+    @staticmethod
+    def _elapsed_ms(since: float) -> int:
+        """Milliseconds elapsed since a ``time.perf_counter()`` reading."""
+        return int((time.perf_counter() - since) * 1000)
+
+    async def _run_language_variants(
+        self,
+        execution: MultiTurnExecution,
+        step: ScenarioStep,
+        language_variants: Dict[str, str],
+        conversation_state: Optional[Dict[str, Any]],
+        noise_config: Dict[str, Any],
+        request_id: str,
+        concurrency: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Process all language variants of a step with bounded concurrency.
+
+        Every variant is sent with the same incoming ConversationState, so
+        running them concurrently does not change what Houndify sees. The
+        returned dict preserves the order of ``language_variants`` regardless
+        of completion order, keeping primary-language selection deterministic.
+
+        Args:
+            execution: Multi-turn execution record
+            step: Scenario step being executed
+            language_variants: Mapping of language code to utterance
+            conversation_state: ConversationState from the previous step
+            noise_config: Scenario-level noise configuration
+            request_id: Base request ID for the step
+            concurrency: Maximum variants in flight at once
+
+        Returns:
+            Mapping of language code to the variant run result
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        fan_out_start = time.perf_counter()
+
+        async def run_variant(lang_code: str, utterance: str) -> Dict[str, Any]:
+            async with semaphore:
+                started_at_ms = self._elapsed_ms(fan_out_start)
+                variant_run = await self._process_language_variant(
+                    execution=execution,
+                    step=step,
+                    lang_code=lang_code,
+                    utterance=utterance,
+                    conversation_state=conversation_state,
+                    noise_config=noise_config,
+                    request_id=request_id,
+                )
+                variant_run['timings']['started_at_ms'] = started_at_ms
+                return variant_run
+
+        tasks = [
+            asyncio.ensure_future(run_variant(lang_code, utterance))
+            for lang_code, utterance in language_variants.items()
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return dict(zip(language_variants.keys(), results))
+
+    async def _process_language_variant(
+        self,
+        execution: MultiTurnExecution,
+        step: ScenarioStep,
+        lang_code: str,
+        utterance: str,
+        conversation_state: Optional[Dict[str, Any]],
+        noise_config: Dict[str, Any],
+        request_id: str
+    ) -> Dict[str, Any]:
+        """
+        Run TTS, upload, PCM conversion, noise and Houndify for one variant.
+
+        Does not touch the database session, so variants can run
+        concurrently. TTS and PCM decoding run on the TTS executor (with the
+        decoded PCM cached) and noise injection is offloaded to a thread, so
+        none of it stalls the event loop.
+
+        Returns:
+            Dictionary with ``audio_url``, ``request_id``, ``timings`` and
+            either ``response`` or ``error`` (Houndify failure). ``audio_url``
+            is None when the upload failed, in which case Houndify is skipped.
+        """
+        timings: Dict[str, Any] = {}
+        variant_start = time.perf_counter()
+        lang_request_id = f"{request_id}_{lang_code}"
+        variant_run: Dict[str, Any] = {
+            'audio_url': None,
+            'request_id': lang_request_id,
+            'timings': timings,
+        }
+
+        # Convert language code to TTS format (e.g., "en-US" -> "en")
+        tts_lang = lang_code.split('-')[0] if lang_code else "en"
+
+        logger.info(f"  - Generating audio for {lang_code}: '{utterance}'")
+        phase_start = time.perf_counter()
+        audio_data = await self.tts_service.text_to_speech_async(
+            text=utterance,
+            lang=tts_lang
+        )
+        timings['tts_ms'] = self._elapsed_ms(phase_start)
+        logger.info(f"    ✓ {lang_code}: generated {len(audio_data)} bytes")
+
+        # Upload to storage
+        phase_start = time.perf_counter()
+        audio_url = await self._upload_audio_to_storage(
+            audio_data,
+            execution.id,
+            step.step_order,
+            lang_code
+        )
+        timings['upload_ms'] = self._elapsed_ms(phase_start)
+
+        if not audio_url:
+            timings['total_ms'] = self._elapsed_ms(variant_start)
+            return variant_run
+
+        variant_run['audio_url'] = audio_url
+        logger.info(f"    ✓ {lang_code}: uploaded to {audio_url}")
+
+        # Convert audio to raw PCM format for Houndify (served from the
+        # derived PCM cache when this utterance has been decoded before)
+        phase_start = time.perf_counter()
+        try:
+            pcm_result = await self.tts_service.synthesize_pcm_async(
+                text=utterance,
+                lang=tts_lang,
+                target_rate=16000
+            )
+            pcm_audio = pcm_result.audio_bytes
+            timings['pcm_cache_hit'] = pcm_result.cache_hit
+            logger.info(
+                f"    ✓ {lang_code}: raw PCM {len(pcm_audio)} bytes "
+                f"({pcm_result.cache_source})"
+            )
+        except Exception as e:
+            logger.warning(f"    ⚠ {lang_code}: PCM conversion failed, using original: {e}")
+            pcm_audio = audio_data
+        timings['pcm_ms'] = self._elapsed_ms(phase_start)
+
+        # Apply noise injection if configured at scenario level
+        if noise_config.get('enabled', False):
+            phase_start = time.perf_counter()
+            try:
+                pcm_audio = await asyncio.to_thread(
+                    self._apply_noise_to_pcm,
+                    pcm_bytes=pcm_audio,
+                    noise_config=noise_config,
+                    sample_rate=16000
+                )
+            except Exception as e:
+                logger.warning(f"    ⚠ {lang_code}: noise injection failed, using original: {e}")
+            timings['noise_ms'] = self._elapsed_ms(phase_start)
+
+        # Build request_info for this language
+        # LanguageCode is passed to enable language-specific responses
+        lang_request_info = {
+            "Prompt": utterance,
+            "LanguageCode": lang_code,  # Pass language to Houndify client
+            "Latitude": 37.7749,
+            "Longitude": -122.4194,
+            "TimeZone": "America/Los_Angeles",
+            "ConversationState": conversation_state
+        }
+
+        # Send to Houndify
+        phase_start = time.perf_counter()
+        try:
+            variant_run['response'] = await self.houndify_client.voice_query(
+                audio_data=pcm_audio,
+                user_id=execution.user_id,
+                request_id=lang_request_id,
+                request_info=lang_request_info
+            )
+        except Exception as e:
+            variant_run['error'] = e
+        timings['houndify_ms'] = self._elapsed_ms(phase_start)
+        response = variant_run.get('response')
+        if isinstance(response, dict) and response.get('ClientTiming'):
+            # Connect/fill/first-partial/final breakdown from the real client
+            timings['houndify'] = response['ClientTiming']
+        timings['total_ms'] = self._elapsed_ms(variant_start)
+
+        return variant_run
+
     async def _validate_step(
         self,
         db: AsyncSession,
@@ -1000,7 +1203,8 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
         command_kind: Optional[str],
         confidence_score: Optional[float],
         language_code: Optional[str] = None,
-        actual_entities: Optional[Dict[str, Any]] = None
+        actual_entities: Optional[Dict[str, Any]] = None,
+        expected_outcomes: Optional[Dict[UUID, List[ExpectedOutcome]]] = None
     ) -> Dict[str, Any]:
         """
         Validate step execution against expected outcome.
@@ -1014,6 +1218,8 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
             confidence_score: Recognition confidence
             language_code: Language code for language-specific validation
             actual_entities: NativeData/entities from Houndify response
+            expected_outcomes: Prefetched expected outcomes keyed by step id;
+                          the step's outcome is queried when it is not in the map
 
         Returns:
             Dictionary with validation results including latency_ms
@@ -1022,9 +1228,17 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
         validation_start_time = time.time()
 
         # Get expected outcome for this step
-        stmt = select(ExpectedOutcome).where(ExpectedOutcome.scenario_step_id == step.id)
-        result = await db.execute(stmt)
-        expected_outcome = result.scalar_one_or_none()
+        if expected_outcomes is not None and step.id in expected_outcomes:
+            step_outcomes = expected_outcomes[step.id]
+            if len(step_outcomes) > 1:
+                raise MultipleResultsFound(
+                    f"Multiple ExpectedOutcomes configured for step {step.id}"
+                )
+            expected_outcome = step_outcomes[0] if step_outcomes else None
+        else:
+            stmt = select(ExpectedOutcome).where(ExpectedOutcome.scenario_step_id == step.id)
+            result = await db.execute(stmt)
+            expected_outcome = result.scalar_one_or_none()
 
         if not expected_outcome:
             # No ExpectedOutcome configured - auto-pass with warning
@@ -1055,35 +1269,12 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
             errors.append(f"Confidence too low: {confidence_score} < {min_confidence}")
 
         # Check response content patterns if defined
-        # Uses ValidationHoundifyMixin._validate_response_content for deterministic checks
-
-        # Check if language_variations exists and language_code is provided
-        language_variations = getattr(expected_outcome, 'language_variations', None)
-        if language_code and language_variations and isinstance(language_variations, dict):
-            # Extract language-specific expected response patterns
-            lang_variation = language_variations.get(language_code, {})
-            if lang_variation and 'expected_response_patterns' in lang_variation:
-                expected_response_content = lang_variation['expected_response_patterns']
-                logger.info(
-                    f"    Using language-specific validation patterns for {language_code}: "
-                    f"{expected_response_content}"
-                )
-            else:
-                # Fall back to default expected_response_content
-                expected_response_content = expected_outcome.expected_response_content or {}
-                logger.debug(
-                    f"    No language-specific patterns found for {language_code}, "
-                    f"using default expected_response_content"
-                )
-        else:
-            # No language variations or language_code, use default
-            expected_response_content = expected_outcome.expected_response_content or {}
-
-        forbidden_phrases = expected_outcome.forbidden_phrases
+        # Uses ValidationHoundifyMixin._validate_response_content for deterministic checks,
+        # with the outcome's rules (language_variations resolved) compiled once and cached
+        matcher = get_outcome_matcher(expected_outcome, language_code)
         response_content_result = self._validate_response_content(
             ai_response=ai_response,
-            expected_response_content=expected_response_content,
-            forbidden_phrases=forbidden_phrases,
+            matcher=matcher,
         )
 
         # Add response content errors to overall errors
@@ -1214,7 +1405,8 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
                     'total_steps': execution.total_steps,
                     'user_utterance': step.user_utterance,
                     'progress_percentage': ((step.step_order - 1) / execution.total_steps) * 100
-                }
+                },
+                coalesce_key=str(execution.id)
             )
             logger.debug(f"[SOCKET.IO] Emitted multi_turn_step_started for step {step.step_order}")
         except Exception as e:
@@ -1334,29 +1526,42 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
         self,
         db: AsyncSession,
         suite_run_id: UUID,
-        status: str
-    ) -> None:
+        status: Optional[str]
+    ) -> Optional[SuiteRun]:
         """
         Update suite run status and completion timestamp.
 
+        The suite run row is locked while its executions are recounted, so
+        concurrent recounts of the same run are applied one at a time.
+
         Args:
             db: Database session
             suite_run_id: Suite run ID to update
-            status: New status (completed, failed, etc.)
+            status: New status (completed, failed, etc.). None keeps the
+                status of a running suite run and re-derives a finished one
+                (failed or completed) from the new counts.
+
+        Returns:
+            The updated suite run, or None if it was not found or failed to update
         """
         try:
             # Load suite run
             result = await db.execute(
-                select(SuiteRun).where(SuiteRun.id == suite_run_id)
+                select(SuiteRun)
+                .where(SuiteRun.id == suite_run_id)
+                .with_for_update()
+                .execution_options(populate_existing=True)
             )
             suite_run = result.scalar_one_or_none()
 
             if not suite_run:
                 logger.warning(f"Suite run {suite_run_id} not found, cannot update status")
-                return
+                return None
 
             # Update status using model methods to ensure timestamps are set
-            if status == 'completed':
+            if status is None:
+                pass
+            elif status == 'completed':
                 suite_run.mark_as_completed()
             elif status == 'failed':
                 suite_run.mark_as_failed()
@@ -1416,13 +1621,50 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
             suite_run.passed_tests = passed_tests
             suite_run.failed_tests = failed_tests
 
+            if status is None and suite_run.status in ('completed', 'failed'):
+                if failed_tests:
+                    suite_run.mark_as_failed()
+                else:
+                    suite_run.mark_as_completed()
+
             logger.info(
-                f"Updated suite run {suite_run_id}: status={status}, "
+                f"Updated suite run {suite_run_id}: status={suite_run.status}, "
                 f"total={total_tests}, passed={passed_tests}, failed={failed_tests}"
             )
+            return suite_run
 
         except Exception as e:
             logger.error(f"Failed to update suite run status: {str(e)}", exc_info=True)
+            return None
+
+    async def _refresh_suite_run(self, db: AsyncSession, suite_run_id: UUID) -> None:
+        """
+        Recount a suite run after deferred LLM validation and publish it.
+
+        Executions keep the status they finished with; as with inline
+        validation, a failed verdict is counted from the ValidationResult
+        review status. A suite run that already finished is re-marked failed
+        or completed from the new counts.
+
+        Args:
+            db: Database session
+            suite_run_id: Suite run to recount
+        """
+        suite_run = await self._update_suite_run_status(db, suite_run_id, None)
+        if suite_run is None:
+            await db.rollback()
+            return
+        await db.commit()
+
+        await emit_suite_run_update(
+            suite_run_id,
+            {
+                'status': suite_run.status,
+                'total_tests': suite_run.total_tests,
+                'passed_tests': suite_run.passed_tests,
+                'failed_tests': suite_run.failed_tests,
+            }
+        )
 
     def _get_language_code(
         self,
@@ -1615,6 +1857,324 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
             logger.error(f"Failed to upload response audio: {e}", exc_info=True)
             return None
 
+    def _summarize_step_validation(
+        self,
+        step_execution: StepExecution,
+        validation_results: List[ValidationResult],
+        validation_mode: str,
+    ) -> bool:
+        """
+        Merge per-language ValidationResults into step_execution.validation_details.
+
+        Languages whose LLM validation is deferred (no final decision yet)
+        count as passed when the deterministic checks already decided them:
+        Houndify passed in hybrid mode, always in llm_ensemble mode.
+
+        Args:
+            step_execution: Step execution to update
+            validation_results: ValidationResults of the step
+            validation_mode: 'houndify', 'llm_ensemble', or 'hybrid'
+
+        Returns:
+            Whether all languages passed the combined decision
+        """
+        details = step_execution.validation_details or {}
+        primary_lang = details.get('primary_language')
+
+        # Build enhanced per-language results with houndify and LLM data
+        # Start with the execution data we already stored
+        enhanced_per_language = dict(details.get('per_language_results', {}))
+        # Track if all languages passed the combined decision
+        # Start with False if no results exist (all failed with errors)
+        all_passed = len(validation_results) > 0
+        for vr in validation_results:
+            if vr.final_decision is None:
+                lang_passed = validation_mode != 'hybrid' or bool(vr.houndify_passed)
+            else:
+                # Use combined final_decision, not just houndify_passed
+                lang_passed = vr.final_decision == 'pass'
+            if not lang_passed:
+                all_passed = False
+            # Get existing data for this language (if any)
+            existing_data = enhanced_per_language.get(vr.language_code, {})
+            # Merge validation results with execution data
+            enhanced_per_language[vr.language_code] = {
+                **existing_data,  # Keep user_utterance, ai_response, transcription, etc.
+                'passed': lang_passed,  # Combined decision, not just houndify
+                'errors': vr.houndify_result.get('errors', []) if vr.houndify_result else [],
+                'houndify_result': vr.houndify_result,
+                'ensemble_result': vr.ensemble_result,
+                'final_decision': vr.final_decision,
+                'review_status': vr.review_status,
+            }
+
+        # Update step_execution validation_details and validation_passed
+        step_execution.validation_passed = all_passed
+        step_execution.validation_details = {
+            **details,  # Keep languages_validated, primary_language, variant_execution
+            'per_language_results': enhanced_per_language,
+            # Include primary language's results at top level for convenience
+            'houndify_result': enhanced_per_language.get(primary_lang, {}).get('houndify_result'),
+            'ensemble_result': enhanced_per_language.get(primary_lang, {}).get('ensemble_result'),
+            'final_decision': enhanced_per_language.get(primary_lang, {}).get('final_decision'),
+        }
+        return all_passed
+
+    async def validate_deferred_llm(
+        self,
+        db: AsyncSession,
+        execution: MultiTurnExecution,
+        pipeline_service: Optional[LLMPipelineService] = None,
+    ) -> int:
+        """
+        Run deferred LLM validation for an execution in batch.
+
+        Every ValidationResult left without a decision by an execution run
+        with ``defer_llm_validation`` is evaluated in one
+        LLMPipelineService.evaluate_batch() call, which packs all steps and
+        languages into batch requests per evaluator. Each result is then
+        finalized as in inline validation, the step summaries refreshed and
+        the execution's suite run recounted.
+
+        Args:
+            db: Database session
+            execution: Multi-turn execution to validate
+            pipeline_service: LLM pipeline (defaults to a new LLMPipelineService)
+
+        Returns:
+            Number of ValidationResults evaluated
+        """
+        stmt = (
+            select(ValidationResult, StepExecution)
+            .join(StepExecution, ValidationResult.step_execution_id == StepExecution.id)
+            .where(
+                ValidationResult.multi_turn_execution_id == execution.id,
+                ValidationResult.final_decision.is_(None),
+                ValidationResult.llm_passed.is_(None),
+            )
+            .order_by(StepExecution.step_order, ValidationResult.language_code)
+        )
+        rows = (await db.execute(stmt)).all()
+        if not rows:
+            return 0
+
+        script = await db.get(ScenarioScript, execution.script_id)
+        validation_mode = getattr(script, 'validation_mode', 'houndify')
+        if validation_mode not in ('llm_ensemble', 'hybrid'):
+            return 0
+
+        items = []
+        for validation_result, step_execution in rows:
+            per_language = (step_execution.validation_details or {}).get('per_language_results', {})
+            lang_data = per_language.get(validation_result.language_code, {})
+            ai_response = lang_data.get('ai_response', step_execution.ai_response)
+            items.append(EvaluationItem(
+                user_utterance=lang_data.get('user_utterance') or step_execution.user_utterance,
+                ai_response=ai_response or "",
+                context={'step_order': step_execution.step_order},
+            ))
+
+        logger.info(
+            f"[LLM Pipeline] Batch evaluating {len(items)} deferred validations "
+            f"for execution {execution.id}"
+        )
+        start_time = time.time()
+        try:
+            pipeline_service = pipeline_service or LLMPipelineService()
+            pipeline_results: List[Optional[PipelineResult]] = await pipeline_service.evaluate_batch(
+                items, tenant_id=execution.tenant_id
+            )
+        except Exception as e:
+            logger.error(f"[LLM Pipeline] Batch evaluation failed: {str(e)}", exc_info=True)
+            pipeline_results = [None] * len(items)
+        llm_latency_ms = int((time.time() - start_time) * 1000)
+
+        if len(pipeline_results) != len(rows):
+            # Results are matched to rows by position; any without a result
+            # go to human review rather than being dropped by zip()
+            logger.error(
+                f"[LLM Pipeline] Batch returned {len(pipeline_results)} results "
+                f"for {len(rows)} validations of execution {execution.id}"
+            )
+            pipeline_results = list(pipeline_results[:len(rows)])
+            pipeline_results += [None] * (len(rows) - len(pipeline_results))
+
+        for (validation_result, _), pipeline_result in zip(rows, pipeline_results):
+            if pipeline_result is None:
+                # Same safe default as inline validation: send to human review
+                llm_decision, llm_confidence = 'needs_review', 'low'
+            else:
+                _, llm_decision, llm_confidence = self._apply_pipeline_result(
+                    validation_result, pipeline_result
+                )
+            houndify_result = validation_result.houndify_result or {}
+            await self._finalize_validation_result(
+                db=db,
+                execution=execution,
+                validation_result=validation_result,
+                validation_mode=validation_mode,
+                houndify_passed=bool(validation_result.houndify_passed),
+                llm_decision=llm_decision,
+                llm_confidence=llm_confidence,
+                validation_score=houndify_result.get('validation_score', 0.0),
+                total_validation_latency_ms=houndify_result.get('latency_ms', 0) + llm_latency_ms,
+            )
+
+        step_executions = {step_execution.id: step_execution for _, step_execution in rows}
+        step_results = await db.execute(
+            select(ValidationResult).where(
+                ValidationResult.step_execution_id.in_(list(step_executions))
+            )
+        )
+        results_by_step: Dict[UUID, List[ValidationResult]] = {}
+        for validation_result in step_results.scalars().all():
+            results_by_step.setdefault(validation_result.step_execution_id, []).append(validation_result)
+        for step_id, step_execution in step_executions.items():
+            self._summarize_step_validation(
+                step_execution, results_by_step.get(step_id, []), validation_mode
+            )
+        await db.commit()
+
+        # The suite run was counted when the execution finished, before any
+        # LLM verdict existed
+        if execution.suite_run_id:
+            await self._refresh_suite_run(db, execution.suite_run_id)
+
+        return len(rows)
+
+    async def _finalize_validation_result(
+        self,
+        db: AsyncSession,
+        execution: MultiTurnExecution,
+        validation_result: ValidationResult,
+        validation_mode: str,
+        houndify_passed: bool,
+        llm_decision: str,
+        llm_confidence: str,
+        validation_score: float,
+        total_validation_latency_ms: int,
+        decision_path: Optional[str] = None,
+    ) -> None:
+        """
+        Store the combined decision of a language validation and act on it.
+
+        Computes the combined (deterministic + LLM) decision and review
+        status, records the total validation latency, tracks the outcome for
+        defect auto-creation and enqueues the result for human review.
+
+        Args:
+            db: Database session
+            execution: Multi-turn execution the result belongs to
+            validation_result: ValidationResult to finalize
+            validation_mode: 'houndify', 'llm_ensemble', or 'hybrid'
+            houndify_passed: Whether Houndify validation passed
+            llm_decision: LLM's decision (pass/fail/needs_review)
+            llm_confidence: LLM's confidence (high/medium/low)
+            validation_score: Composite deterministic validation score (0.0-1.0)
+            total_validation_latency_ms: Houndify + LLM validation latency
+            decision_path: Path taken when the LLM pipeline did not run
+                (LLM paths are recorded by _apply_pipeline_result)
+        """
+        # ═══════════════════════════════════════════════════════════════════
+        # 🔀 Compute COMBINED decision (deterministic + LLM)
+        # ═══════════════════════════════════════════════════════════════════
+        final_decision = self._compute_combined_decision(
+            houndify_passed=houndify_passed,
+            llm_decision=llm_decision,
+            validation_mode=validation_mode
+        )
+        review_status = self._compute_review_status(
+            final_decision=final_decision,
+            llm_confidence=llm_confidence
+        )
+
+        # Store combined decision on validation result
+        validation_result.final_decision = final_decision
+        validation_result.review_status = review_status
+        if decision_path is not None:
+            validation_result.decision_path = decision_path
+
+        # Add total_validation_latency_ms to both houndify_result and ensemble_result
+        if validation_result.houndify_result:
+            validation_result.houndify_result['total_validation_latency_ms'] = total_validation_latency_ms
+        if validation_result.ensemble_result:
+            validation_result.ensemble_result['total_validation_latency_ms'] = total_validation_latency_ms
+
+        await db.commit()
+
+        logger.info(
+            f"  - {validation_result.language_code}: Combined decision: houndify={houndify_passed}, "
+            f"llm={llm_decision}, final={final_decision}, status={review_status}, "
+            f"latency={total_validation_latency_ms}ms"
+        )
+
+        # ═══════════════════════════════════════════════════════════════════
+        # 🔴 Track validation outcome for defect auto-creation
+        # ═══════════════════════════════════════════════════════════════════
+        # Call for ALL review statuses - auto_fail increments streak,
+        # other statuses reset it (prevents false positives from intermittent failures)
+        try:
+            await self._check_defect_auto_creation(
+                db=db,
+                execution=execution,
+                validation_result=validation_result,
+                review_status=review_status,
+            )
+        except Exception as defect_err:
+            logger.warning(f"Defect auto-creation check failed: {defect_err}")
+
+        # ═══════════════════════════════════════════════════════════════════
+        # 📋 Enqueue for human review based on COMBINED decision
+        # ═══════════════════════════════════════════════════════════════════
+        # Queue if the combined decision is not auto_pass
+        needs_human_review = review_status != "auto_pass"
+
+        # 5% random sampling of auto_pass items for calibration
+        # This allows us to measure agreement on pass decisions too
+        is_sampled = False
+        if review_status == "auto_pass" and random.random() < 0.05:
+            needs_human_review = True
+            is_sampled = True
+            logger.info(f"    🎲 Random sample: auto_pass selected for human review")
+
+        if needs_human_review:
+            from decimal import Decimal
+
+            queue_service = ValidationQueueService()
+
+            # Priority based on combined decision:
+            # - Priority 1: Combined decision is 'fail' (highest urgency)
+            # - Priority 2: Combined decision is 'uncertain' (systems disagreed)
+            # - Priority 5: Needs review for other reasons
+            # - Priority 10: Random sample (lowest urgency, for calibration)
+            if is_sampled:
+                priority = 10  # Random sample - lowest priority
+            elif final_decision == 'fail':
+                priority = 1  # Confirmed failure
+            elif final_decision == 'uncertain':
+                priority = 2  # Systems disagreed or LLM uncertain
+            else:
+                priority = 5  # Needs review
+
+            confidence_percentage = Decimal(str(validation_score * 100)).quantize(
+                Decimal('0.01')
+            )
+
+            queue_item = await queue_service.enqueue_for_human_review(
+                db=db,
+                validation_result_id=validation_result.id,
+                priority=priority,
+                confidence_score=confidence_percentage,
+                language_code=validation_result.language_code,  # 🌍 Pass language code to queue
+                requires_native_speaker=False
+            )
+
+            sample_tag = " [SAMPLE]" if is_sampled else ""
+            logger.info(
+                f"    → Queued for review: {queue_item.id}{sample_tag} "
+                f"(final={final_decision}, houndify={houndify_passed}, llm={llm_decision})"
+            )
+
     async def _run_llm_pipeline_validation(
         self,
         db: AsyncSession,
@@ -1654,17 +2214,10 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
                 user_utterance=user_utterance,
                 ai_response=ai_response,
                 context=context,
+                tenant_id=getattr(validation_result, 'tenant_id', None),
             )
 
-            # Determine if LLM passed (pass decision with high/medium confidence)
-            llm_passed = (
-                pipeline_result.final_decision == 'pass' and
-                pipeline_result.confidence in ('high', 'medium')
-            )
-
-            # Update validation result with pipeline results (using correct field names)
-            validation_result.ensemble_result = pipeline_result.to_dict()
-            validation_result.llm_passed = llm_passed
+            llm_passed, _, _ = self._apply_pipeline_result(validation_result, pipeline_result)
 
             await db.commit()
 
@@ -1682,6 +2235,60 @@ class MultiTurnExecutionService(ValidationHoundifyMixin):
             # Return needs_review so it goes to human review (safe default)
             return False, 'needs_review', 'low'
 
+    @staticmethod
+    def _apply_pipeline_result(
+        validation_result: ValidationResult,
+        pipeline_result: PipelineResult,
+    ) -> tuple:
+        """
+        Store an LLM pipeline result on a validation result.
+
+        Returns:
+            tuple: (llm_passed, llm_decision, llm_confidence)
+        """
+        # Determine if LLM passed (pass decision with high/medium confidence)
+        llm_passed = (
+            pipeline_result.final_decision == 'pass' and
+            pipeline_result.confidence in ('high', 'medium')
+        )
+
+        # Update validation result with pipeline results (using correct field names)
+        validation_result.ensemble_result = pipeline_result.to_dict()
+        validation_result.llm_passed = llm_passed
+        validation_result.decision_path = pipeline_result.decision_path
+
+        return llm_passed, pipeline_result.final_decision, pipeline_result.confidence
+
+    @staticmethod
+    def _deterministic_decision_path(
+        validation_mode: str,
+        validation_result: Dict[str, Any],
+        command_kind_match_score: float,
+        asr_confidence: Optional[float],
+    ) -> Optional[str]:
+        """
+        Return the decision path when the LLM pipeline will not run.
+
+        Houndify-only scenarios never call the LLM; hybrid scenarios skip it
+        when the deterministic checks are conclusive under the decision
+        policy. Returns None when the LLM pipeline should run.
+        """
+        if validation_mode not in ('llm_ensemble', 'hybrid'):
+            return DECISION_PATH_HOUNDIFY_ONLY
+        # Steps without an ExpectedOutcome auto-pass without any checks
+        expected_outcome = validation_result.get('expected_outcome')
+        checks_configured = expected_outcome is not None and has_deterministic_checks(
+            expected_outcome.expected_command_kind, validation_result.get('expected_entities')
+        )
+        return get_decision_policy().deterministic_path(
+            validation_mode=validation_mode,
+            houndify_passed=validation_result.get('passed', False),
+            command_kind_matched=command_kind_match_score == 1.0,
+            entities_passed=(validation_result.get('entity_validation') or {}).get('passed', True),
+            asr_confidence=asr_confidence,
+            checks_configured=checks_configured,
+        )
+
     def _compute_combined_decision(
         self,
         houndify_passed: bool,
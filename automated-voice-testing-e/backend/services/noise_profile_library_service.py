@@ -10,15 +10,35 @@ Noise categories:
 - Environmental: HVAC, office, home, crowd/babble
 - Industrial: Factory, machinery, construction
 
+Noise is served from a bank of precomputed, seeded noise loops (one per
+profile and sample rate) shared by every instance in the process and
+optionally memory-mapped from disk. Applying noise slices the loop at a
+random offset instead of synthesising it with FFTs on every call.
+
 Example:
     >>> service = NoiseProfileLibraryService()
     >>> profile = service.get_profile('car_cabin_highway')
     >>> print(f"Category: {profile['category']}")
 """
 
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
+import logging
+import threading
+import zlib
+
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_BANK_SECONDS = 30.0
+DEFAULT_BANK_SEED = 1234
+BANK_FORMAT_VERSION = 1  # Bump when noise synthesis changes to invalidate disk banks
+
+# (profile, sample_rate, num_samples, seed) -> float32 noise loop
+_noise_bank: Dict[Tuple[str, int, int, int], np.ndarray] = {}
+_noise_bank_lock = threading.Lock()
+
 
 class NoiseProfileLibraryService:
     """
@@ -42,8 +62,28 @@ class NoiseProfileLibraryService:
     CATEGORY_ENVIRONMENTAL = 'environmental'
     CATEGORY_INDUSTRIAL = 'industrial'
 
-    def __init__(self):
-        """Initialize the noise profile library service."""
+    def __init__(
+        self,
+        bank_seconds: float = DEFAULT_BANK_SECONDS,
+        bank_dir: Optional[Union[str, Path]] = None,
+        bank_seed: int = DEFAULT_BANK_SEED
+    ):
+        """
+        Initialize the noise profile library service.
+
+        Args:
+            bank_seconds: Length of each precomputed noise loop in seconds
+            bank_dir: Directory for .npy noise banks loaded with mmap
+                     (None keeps banks in memory only)
+            bank_seed: Base seed for noise loop synthesis
+        """
+        if bank_seconds <= 0:
+            raise ValueError("bank_seconds must be positive")
+
+        self.bank_seconds = bank_seconds
+        self.bank_dir = Path(bank_dir) if bank_dir else None
+        self.bank_seed = bank_seed
+
         self.categories: List[str] = [
             self.CATEGORY_VEHICLE,
             self.CATEGORY_ENVIRONMENTAL,
@@ -346,39 +386,122 @@ class NoiseProfileLibraryService:
         self,
         profile_name: str,
         duration: float,
-        sample_rate: int = 16000
+        sample_rate: int = 16000,
+        seed: Optional[int] = None
     ) -> np.ndarray:
         """
         Generate noise signal for a profile.
 
+        The noise is a slice of the profile's precomputed loop starting at a
+        random offset; the same seed always yields the same slice.
+
         Args:
             profile_name: Profile identifier
             duration: Duration in seconds
             sample_rate: Sample rate in Hz
+            seed: Seed for the slice offset (optional)
 
         Returns:
-            Noise signal array
+            Noise signal array (float32, peak-normalized)
 
         Example:
             >>> noise = service.generate_noise('hvac_office', 5.0)
             >>> print(f"Samples: {len(noise)}")
         """
-        params = self.get_profile_parameters(profile_name)
         num_samples = int(duration * sample_rate)
+        rng = np.random.default_rng(seed)
+        noise = self._slice_bank(
+            self.get_noise_bank(profile_name, sample_rate),
+            rng.integers(0, 2 ** 63 - 1, size=1),
+            num_samples
+        )[0]
+
+        # Normalize
+        return noise / (np.max(np.abs(noise)) + np.float32(1e-10))
+
+    def get_noise_bank(self, profile_name: str, sample_rate: int = 16000) -> np.ndarray:
+        """
+        Return the precomputed noise loop for a profile and sample rate.
+
+        Loops are built once per process (or loaded from ``bank_dir``) and
+        shared by all instances. Because they are synthesised in the
+        frequency domain they are periodic, so slices may wrap around the end.
+
+        Args:
+            profile_name: Profile identifier
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Read-only float32 noise loop, peak-normalized
+        """
+        num_samples = int(self.bank_seconds * sample_rate)
+        key = (profile_name, sample_rate, num_samples, self.bank_seed)
+
+        bank = _noise_bank.get(key)
+        if bank is not None:
+            return bank
+
+        with _noise_bank_lock:
+            bank = _noise_bank.get(key)
+            if bank is None:
+                bank = self._load_or_build_bank(profile_name, sample_rate, num_samples)
+                _noise_bank[key] = bank
+        return bank
+
+    def _load_or_build_bank(self, profile_name: str, sample_rate: int, num_samples: int) -> np.ndarray:
+        """Load a noise loop from disk (mmap) or synthesise it."""
+        bank_path = None
+        if self.bank_dir is not None:
+            bank_path = self.bank_dir / (
+                f"{profile_name}_{sample_rate}hz_{num_samples}_{self.bank_seed}_v{BANK_FORMAT_VERSION}.npy"
+            )
+            if bank_path.exists():
+                try:
+                    return np.load(bank_path, mmap_mode='r')
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable noise bank {bank_path}: {e}")
+
+        rng = np.random.default_rng(self._bank_seed_for(profile_name, sample_rate))
+        bank = self._synthesize_noise(profile_name, num_samples, sample_rate, rng)
+        bank.setflags(write=False)
+
+        if bank_path is not None:
+            try:
+                self.bank_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path = bank_path.with_suffix('.tmp.npy')
+                np.save(tmp_path, bank)
+                tmp_path.replace(bank_path)
+                return np.load(bank_path, mmap_mode='r')
+            except OSError as e:
+                logger.warning(f"Failed to write noise bank {bank_path}: {e}")
+
+        return bank
+
+    def _bank_seed_for(self, profile_name: str, sample_rate: int) -> int:
+        """Stable per-profile seed (independent of Python's hash randomization)."""
+        return self.bank_seed ^ zlib.crc32(f"{profile_name}:{sample_rate}".encode())
+
+    def _synthesize_noise(
+        self,
+        profile_name: str,
+        num_samples: int,
+        sample_rate: int,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+        """Synthesise a peak-normalized float32 noise signal for a profile."""
+        params = self.get_profile_parameters(profile_name)
 
         # Generate base noise based on spectral shape
         spectral_shape = params.get('spectral_shape', 'pink')
 
-        if spectral_shape == 'white':
-            noise = np.random.randn(num_samples)
-        elif spectral_shape == 'pink':
-            noise = self._generate_pink_noise(num_samples)
+        if spectral_shape == 'pink':
+            noise = self._generate_pink_noise(num_samples, rng)
         elif spectral_shape == 'brown':
-            noise = self._generate_brown_noise(num_samples)
+            noise = self._generate_brown_noise(num_samples, rng)
         elif spectral_shape == 'speech_shaped':
-            noise = self._generate_speech_shaped_noise(num_samples, sample_rate)
+            noise = self._generate_speech_shaped_noise(num_samples, sample_rate, rng)
         else:
-            noise = np.random.randn(num_samples)
+            noise = rng.standard_normal(num_samples)
 
         # Apply frequency filtering
         freq_range = params.get('frequency_range', [20, 8000])
@@ -389,18 +512,18 @@ class NoiseProfileLibraryService:
 
         return noise.astype(np.float32)
 
-    def _generate_pink_noise(self, num_samples: int) -> np.ndarray:
+    def _generate_pink_noise(self, num_samples: int, rng: np.random.Generator) -> np.ndarray:
         """Generate pink (1/f) noise."""
-        white = np.random.randn(num_samples)
+        white = rng.standard_normal(num_samples)
         fft = np.fft.rfft(white)
         freqs = np.fft.rfftfreq(num_samples)
         freqs[0] = 1  # Avoid division by zero
         pink_fft = fft / np.sqrt(freqs)
         return np.fft.irfft(pink_fft, num_samples)
 
-    def _generate_brown_noise(self, num_samples: int) -> np.ndarray:
+    def _generate_brown_noise(self, num_samples: int, rng: np.random.Generator) -> np.ndarray:
         """Generate brown (1/f^2) noise."""
-        white = np.random.randn(num_samples)
+        white = rng.standard_normal(num_samples)
         fft = np.fft.rfft(white)
         freqs = np.fft.rfftfreq(num_samples)
         freqs[0] = 1
@@ -410,11 +533,12 @@ class NoiseProfileLibraryService:
     def _generate_speech_shaped_noise(
         self,
         num_samples: int,
-        sample_rate: int
+        sample_rate: int,
+        rng: np.random.Generator
     ) -> np.ndarray:
         """Generate speech-shaped noise."""
         # Approximate speech spectrum
-        white = np.random.randn(num_samples)
+        white = rng.standard_normal(num_samples)
         fft = np.fft.rfft(white)
         freqs = np.fft.rfftfreq(num_samples, 1 / sample_rate)
 
@@ -442,12 +566,19 @@ class NoiseProfileLibraryService:
 
         return np.fft.irfft(fft, len(signal))
 
+    @staticmethod
+    def _slice_bank(bank: np.ndarray, offsets: np.ndarray, num_samples: int) -> np.ndarray:
+        """Gather ``num_samples`` from the loop at each offset, wrapping at the end."""
+        indices = (np.asarray(offsets)[:, None] % len(bank)) + np.arange(num_samples)[None, :]
+        return np.take(bank, indices, mode='wrap')
+
     def apply_noise(
         self,
         signal: np.ndarray,
         profile_name: str,
         snr_db: float,
-        sample_rate: int = 16000
+        sample_rate: int = 16000,
+        seed: Optional[int] = None
     ) -> np.ndarray:
         """
         Apply noise profile to audio signal at specified SNR.
@@ -457,6 +588,8 @@ class NoiseProfileLibraryService:
             profile_name: Noise profile identifier
             snr_db: Target SNR in dB
             sample_rate: Sample rate in Hz
+            seed: Seed for the noise offset; the same seed gives the same
+                  result (optional)
 
         Returns:
             Noisy audio signal
@@ -465,28 +598,62 @@ class NoiseProfileLibraryService:
             >>> noisy = service.apply_noise(clean_signal, 'hvac_office', 15)
             >>> print(f"Applied noise at 15 dB SNR")
         """
-        duration = len(signal) / sample_rate
-        noise = self.generate_noise(profile_name, duration, sample_rate)
+        signal = np.asarray(signal, dtype=np.float32)
+        return self.apply_noise_batch(
+            signal[None, :], profile_name, snr_db, sample_rate, seed
+        )[0]
 
-        # Adjust noise length to match signal
-        if len(noise) > len(signal):
-            noise = noise[:len(signal)]
-        elif len(noise) < len(signal):
-            noise = np.pad(noise, (0, len(signal) - len(noise)))
+    def apply_noise_batch(
+        self,
+        signals: np.ndarray,
+        profile_name: str,
+        snr_db: Union[float, Sequence[float]],
+        sample_rate: int = 16000,
+        seed: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Apply noise to a batch of equal-length signals in one vectorised pass.
+
+        Each row gets its own random offset into the profile's noise loop.
+
+        Args:
+            signals: Clean signals, shape (num_signals, num_samples)
+            profile_name: Noise profile identifier
+            snr_db: Target SNR in dB, scalar or one value per signal
+            sample_rate: Sample rate in Hz
+            seed: Seed for the noise offsets (optional)
+
+        Returns:
+            Noisy signals (float32), same shape as ``signals``
+        """
+        signals = np.asarray(signals, dtype=np.float32)
+        if signals.ndim != 2:
+            raise ValueError("signals must be a 2-D array (num_signals, num_samples)")
+
+        num_signals, num_samples = signals.shape
+        rng = np.random.default_rng(seed)
+        offsets = rng.integers(0, 2 ** 63 - 1, size=num_signals)
+        noise = self._slice_bank(self.get_noise_bank(profile_name, sample_rate), offsets, num_samples)
 
         # Calculate signal power
-        signal_power = np.mean(signal ** 2)
+        signal_power = np.mean(np.square(signals), axis=1, keepdims=True)
 
         # Calculate noise power for desired SNR
-        snr_linear = 10 ** (snr_db / 10)
-        noise_power = signal_power / snr_linear
+        snr = np.broadcast_to(np.asarray(snr_db, dtype=np.float32), (num_signals,))[:, None]
+        target_noise_power = signal_power / np.power(np.float32(10), snr / np.float32(10))
 
         # Scale noise
-        current_noise_power = np.mean(noise ** 2)
-        if current_noise_power > 0:
-            noise = noise * np.sqrt(noise_power / current_noise_power)
-
-        return (signal + noise).astype(np.float32)
+        current_noise_power = np.mean(np.square(noise), axis=1, keepdims=True)
+        scale = np.sqrt(
+            np.divide(
+                target_noise_power,
+                current_noise_power,
+                out=np.zeros_like(current_noise_power),
+                where=current_noise_power > 0
+            )
+        )
+
+        return (signals + noise * scale).astype(np.float32, copy=False)
 
     def get_profile_metrics(
         self,
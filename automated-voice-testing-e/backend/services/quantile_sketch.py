@@ -0,0 +1,169 @@
+"""
+Mergeable quantile sketch for streaming percentile estimation.
+
+A log-bucketed histogram (DDSketch style): each value is counted in the
+bucket ceil(log_gamma(|v|)), with gamma = (1 + alpha) / (1 - alpha), so any
+quantile is answered with a relative error of at most alpha. Sketches with
+the same alpha merge by adding bucket counts, which lets hourly and daily
+metric rollups combine into percentiles for any window without the raw
+values.
+
+The serialised form is plain JSON so it can be stored in a JSONB column
+and built in SQL (see the test_metric_rollups migration backfill):
+
+    {"alpha": 0.01, "bins": {"p42": 3, "n7": 1, "z": 2}}
+
+where "pN" counts positive values in bucket N, "nN" negative values and
+"z" zeros. Memory is bounded by max_bins: past it, the lowest buckets are
+collapsed into one, so only the low tail loses accuracy.
+
+Example:
+    >>> sketch = QuantileSketch()
+    >>> for latency in [120.0, 150.0, 180.0, 900.0]:
+    ...     sketch.add(latency)
+    >>> sketch.quantile(0.5)  # ~150.0 within 1%
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BINS = 2048
+
+_ZERO_BIN = "z"
+
+
+class QuantileSketch:
+    """
+    Log-bucketed histogram answering quantiles within a relative error.
+
+    Attributes:
+        alpha: Relative accuracy of quantile estimates
+        max_bins: Maximum number of buckets kept
+        count: Number of values added
+    """
+
+    def __init__(self, alpha: float = DEFAULT_RELATIVE_ACCURACY, max_bins: int = DEFAULT_MAX_BINS):
+        if not 0.0 < alpha < 1.0:
+            raise ValueError("alpha must be between 0 and 1")
+        if max_bins < 2:
+            raise ValueError("max_bins must be at least 2")
+        self.alpha = alpha
+        self.max_bins = max_bins
+        self._gamma = (1.0 + alpha) / (1.0 - alpha)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: Dict[str, int] = {}
+        self.count = 0
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value (count times) to the sketch."""
+        if count <= 0:
+            return
+        key = self._bin_key(float(value))
+        self._bins[key] = self._bins.get(key, 0) + count
+        self.count += count
+        if len(self._bins) > self.max_bins:
+            self._collapse()
+
+    def update(self, values: Iterable[float]) -> None:
+        """Add every value of an iterable to the sketch."""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Add another sketch's counts to this one.
+
+        Raises:
+            ValueError: If the sketches use a different relative accuracy
+        """
+        if not math.isclose(other.alpha, self.alpha):
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other._bins.items():
+            self._bins[key] = self._bins.get(key, 0) + count
+        self.count += other.count
+        if len(self._bins) > self.max_bins:
+            self._collapse()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the q-quantile (0.0 to 1.0) of the added values.
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for sign, index, count in self._ordered_bins():
+            seen += count
+            if seen > rank:
+                return self._bin_value(sign, index)
+        sign, index, _ = self._ordered_bins()[-1]
+        return self._bin_value(sign, index)
+
+    def bins(self) -> List[Tuple[float, int]]:
+        """Return (representative value, count) per bucket in ascending value order."""
+        return [(self._bin_value(sign, index), count) for sign, index, count in self._ordered_bins()]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise to the JSON form stored in metric rollups."""
+        return {"alpha": self.alpha, "bins": dict(self._bins)}
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "QuantileSketch":
+        """Rebuild a sketch from to_dict() output (empty for None)."""
+        if not data:
+            return cls()
+        sketch = cls(alpha=float(data.get("alpha", DEFAULT_RELATIVE_ACCURACY)))
+        for key, count in (data.get("bins") or {}).items():
+            sketch._bins[str(key)] = int(count)
+            sketch.count += int(count)
+        if len(sketch._bins) > sketch.max_bins:
+            sketch._collapse()
+        return sketch
+
+    def _collapse(self) -> None:
+        """Fold the lowest buckets into the next one until max_bins remain."""
+        ordered = self._ordered_bins()
+        excess = len(ordered) - self.max_bins
+        folded = sum(count for _, _, count in ordered[:excess + 1])
+        for sign, index, _ in ordered[:excess]:
+            del self._bins[self._key_for(sign, index)]
+        sign, index, _ = ordered[excess]
+        self._bins[self._key_for(sign, index)] = folded
+
+    @staticmethod
+    def _key_for(sign: int, index: int) -> str:
+        if sign == 0:
+            return _ZERO_BIN
+        return f"{'p' if sign > 0 else 'n'}{index}"
+
+    def _bin_key(self, value: float) -> str:
+        if value == 0.0:
+            return _ZERO_BIN
+        index = math.ceil(math.log(abs(value)) / self._log_gamma)
+        return f"{'p' if value > 0 else 'n'}{index}"
+
+    def _bin_value(self, sign: int, index: int) -> float:
+        if sign == 0:
+            return 0.0
+        # Midpoint (in relative terms) of (gamma^(i-1), gamma^i]
+        return sign * 2.0 * self._gamma ** index / (self._gamma + 1.0)
+
+    def _ordered_bins(self):
+        ordered = []
+        for key, count in self._bins.items():
+            if key == _ZERO_BIN:
+                ordered.append((0, 0, count))
+            else:
+                ordered.append((1 if key[0] == "p" else -1, int(key[1:]), count))
+        # Negative values from most to least negative, then zero, then positive
+        ordered.sort(key=lambda item: (item[0], item[1] * item[0]))
+        return ordered
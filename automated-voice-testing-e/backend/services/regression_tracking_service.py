@@ -11,11 +11,13 @@ providing functionality for:
 
 from __future__ import annotations
 
+import uuid
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -24,6 +26,22 @@ from models.defect import Defect
 from models.scenario_script import ScenarioScript
 from services.regression_detection_service import RegressionFinding
 
+# Maximum ids per IN (...) clause when loading or resolving regressions
+REGRESSION_LOOKUP_CHUNK_SIZE = 1000
+
+AUTO_RESOLVE_NOTE = "Auto-resolved: test passed in subsequent run"
+
+
+@dataclass(frozen=True)
+class ExecutionRegressionOutcome:
+    """Regression findings of one execution, for bulk recording."""
+
+    script_id: UUID
+    tenant_id: Optional[UUID]
+    baseline_version: Optional[int]
+    findings: Sequence[RegressionFinding]
+    passed: bool
+
 
 class RegressionTrackingService:
     """Service for managing persistent regression records."""
@@ -154,7 +172,7 @@ class RegressionTrackingService:
         for regression in regressions:
             regression.resolve(
                 resolved_by=None,
-                note="Auto-resolved: test passed in subsequent run"
+                note=AUTO_RESOLVE_NOTE
             )
             resolved_regressions.append(regression)
 
@@ -163,6 +181,118 @@ class RegressionTrackingService:
 
         return resolved_regressions
 
+    async def record_execution_outcomes(
+        self,
+        outcomes: Sequence[ExecutionRegressionOutcome],
+    ) -> Dict[str, int]:
+        """
+        Record the regressions of many executions with bulk statements.
+
+        Equivalent to calling record_regression for each finding and, for
+        passing executions, auto_resolve_passing_tests, in outcome order.
+        Active regressions of all scripts are loaded in one query, the
+        outcomes are applied in memory, and the results are written with
+        one INSERT, one UPDATE by primary key and one resolving UPDATE (IN
+        lists are split at REGRESSION_LOOKUP_CHUNK_SIZE ids). Does not commit.
+
+        Args:
+            outcomes: Per-execution findings, in execution order
+
+        Returns:
+            Dict with counts of created, updated and resolved regressions
+        """
+        script_ids = list({outcome.script_id for outcome in outcomes})
+        active: Dict[UUID, List[Dict[str, Any]]] = {}
+        for start in range(0, len(script_ids), REGRESSION_LOOKUP_CHUNK_SIZE):
+            chunk = script_ids[start:start + REGRESSION_LOOKUP_CHUNK_SIZE]
+            result = await self.session.execute(
+                select(
+                    Regression.id,
+                    Regression.script_id,
+                    Regression.occurrence_count,
+                    Regression.details,
+                )
+                .where(Regression.script_id.in_(chunk), Regression.status == "active")
+                .order_by(Regression.detection_date)
+            )
+            for row in result.all():
+                active.setdefault(row.script_id, []).append({
+                    "id": row.id,
+                    "occurrence_count": row.occurrence_count,
+                    "details": row.details,
+                })
+
+        now = datetime.now(timezone.utc)
+        created: Dict[UUID, Dict[str, Any]] = {}
+        updated: Dict[UUID, Dict[str, Any]] = {}
+        resolved: List[UUID] = []
+
+        for outcome in outcomes:
+            for finding in outcome.findings:
+                records = active.get(outcome.script_id)
+                if not records:
+                    record = {
+                        "id": uuid.uuid4(),
+                        "tenant_id": outcome.tenant_id,
+                        "script_id": outcome.script_id,
+                        "category": finding.category,
+                        "severity": self._determine_severity(finding),
+                        "status": "active",
+                        "baseline_version": outcome.baseline_version,
+                        "detection_date": now,
+                        "last_seen_date": now,
+                        "occurrence_count": 1,
+                        "details": finding.detail,
+                        "resolution_date": None,
+                        "resolution_note": None,
+                    }
+                    created[record["id"]] = record
+                    active[outcome.script_id] = [record]
+                    continue
+
+                # Same merge as Regression.update_occurrence
+                record = records[0]
+                details = record["details"]
+                record["details"] = {**details, **finding.detail} if isinstance(details, dict) else finding.detail
+                record["occurrence_count"] += 1
+                record["last_seen_date"] = now
+                if record["id"] not in created:
+                    updated[record["id"]] = record
+
+            if outcome.passed:
+                for record in active.pop(outcome.script_id, []):
+                    if record["id"] in created:
+                        record.update(status="resolved", resolution_date=now, resolution_note=AUTO_RESOLVE_NOTE)
+                    else:
+                        resolved.append(record["id"])
+
+        if created:
+            await self.session.execute(insert(Regression), list(created.values()))
+        if updated:
+            await self.session.execute(update(Regression), [
+                {
+                    "id": record["id"],
+                    "occurrence_count": record["occurrence_count"],
+                    "details": record["details"],
+                    "last_seen_date": record["last_seen_date"],
+                }
+                for record in updated.values()
+            ])
+        for start in range(0, len(resolved), REGRESSION_LOOKUP_CHUNK_SIZE):
+            await self.session.execute(
+                update(Regression)
+                .where(Regression.id.in_(resolved[start:start + REGRESSION_LOOKUP_CHUNK_SIZE]))
+                .values(
+                    status="resolved",
+                    resolution_date=now,
+                    resolved_by=None,
+                    resolution_note=AUTO_RESOLVE_NOTE,
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+        return {"created": len(created), "updated": len(updated), "resolved": len(resolved)}
+
     async def create_defect_from_regression(
         self,
         *,
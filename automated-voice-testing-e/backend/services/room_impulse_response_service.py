@@ -15,15 +15,130 @@ Key parameters:
 - Early reflections: First 50-80ms of response
 - Late reverb: Diffuse sound after early reflections
 
+Convolution uses direct, FFT or overlap-add convolution depending on the
+signal and RIR lengths. Preset RIRs are generated once per process with a
+stable seed and reused (see get_rir).
+
 Example:
     >>> service = RoomImpulseResponseService()
     >>> rir = service.generate_rir('medium_office', 1.0)
     >>> print(f"RIR samples: {len(rir)}")
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+import threading
+import zlib
+
 import numpy as np
 
+CONVOLUTION_AUTO = 'auto'
+CONVOLUTION_DIRECT = 'direct'
+CONVOLUTION_FFT = 'fft'
+CONVOLUTION_OVERLAP_ADD = 'overlap_add'
+CONVOLUTION_METHODS = (CONVOLUTION_AUTO, CONVOLUTION_DIRECT, CONVOLUTION_FFT, CONVOLUTION_OVERLAP_ADD)
+
+# Direct convolution wins below this many multiply-adds (N * M)
+DIRECT_CONVOLUTION_MAX_OPS = 2 ** 18
+# Overlap-add wins over a single FFT once the signal is this many times longer than the RIR
+OVERLAP_ADD_MIN_RATIO = 8
+
+DEFAULT_RIR_SEED = 1234
+
+# (preset, num_samples, sample_rate, seed) -> float32 RIR
+_rir_bank: Dict[Tuple[str, int, int, int], np.ndarray] = {}
+_rir_bank_lock = threading.Lock()
+
+
+def _next_pow2(n: int) -> int:
+    """Smallest power of two >= n."""
+    return 1 << max(0, int(n - 1).bit_length())
+
+
+def choose_convolution_method(signal_length: int, kernel_length: int) -> str:
+    """
+    Pick the cheapest convolution method for the given lengths.
+
+    Args:
+        signal_length: Samples in the signal
+        kernel_length: Samples in the impulse response
+
+    Returns:
+        'direct', 'fft' or 'overlap_add'
+    """
+    if signal_length * kernel_length <= DIRECT_CONVOLUTION_MAX_OPS:
+        return CONVOLUTION_DIRECT
+    long_len, short_len = max(signal_length, kernel_length), min(signal_length, kernel_length)
+    if long_len >= OVERLAP_ADD_MIN_RATIO * short_len:
+        return CONVOLUTION_OVERLAP_ADD
+    return CONVOLUTION_FFT
+
+
+def fft_convolve(signal: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """Full linear convolution with a single zero-padded FFT."""
+    out_len = len(signal) + len(kernel) - 1
+    nfft = _next_pow2(out_len)
+    spectrum = np.fft.rfft(signal, nfft) * np.fft.rfft(kernel, nfft)
+    return np.fft.irfft(spectrum, nfft)[:out_len]
+
+
+def overlap_add_convolve(signal: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """
+    Full linear convolution by overlap-add.
+
+    The longer input is split into blocks that are transformed together in
+    one batched FFT; each block's tail (shorter than a block) is added to
+    the start of the next block.
+    """
+    if len(kernel) > len(signal):
+        signal, kernel = kernel, signal
+
+    out_len = len(signal) + len(kernel) - 1
+    nfft = _next_pow2(4 * len(kernel))
+    block_len = nfft - len(kernel) + 1
+    num_blocks = -(-len(signal) // block_len)
+
+    blocks = np.zeros((num_blocks, block_len), dtype=np.float64)
+    blocks.flat[:len(signal)] = signal
+    filtered = np.fft.irfft(
+        np.fft.rfft(blocks, nfft, axis=1) * np.fft.rfft(kernel, nfft)[None, :],
+        nfft,
+        axis=1
+    )
+
+    # Tail length is len(kernel) - 1 < block_len, so it only overlaps the next block
+    heads = filtered[:, :block_len]
+    tails = np.zeros((num_blocks, block_len), dtype=np.float64)
+    tails[:, :nfft - block_len] = filtered[:, block_len:]
+    heads[1:] += tails[:-1]
+
+    return np.concatenate([heads.ravel(), tails[-1]])[:out_len]
+
+
+def convolve(signal: np.ndarray, kernel: np.ndarray, method: str = CONVOLUTION_AUTO) -> np.ndarray:
+    """
+    Full linear convolution (same result as np.convolve(mode='full')).
+
+    Args:
+        signal: Input signal
+        kernel: Impulse response
+        method: 'auto', 'direct', 'fft' or 'overlap_add'
+
+    Returns:
+        Convolved signal of length len(signal) + len(kernel) - 1
+    """
+    if method not in CONVOLUTION_METHODS:
+        raise ValueError(f"method must be one of {CONVOLUTION_METHODS}")
+    if len(signal) == 0 or len(kernel) == 0:
+        return np.zeros(0, dtype=np.float64)
+    if method == CONVOLUTION_AUTO:
+        method = choose_convolution_method(len(signal), len(kernel))
+
+    if method == CONVOLUTION_DIRECT:
+        return np.convolve(signal, kernel, mode='full')
+    if method == CONVOLUTION_OVERLAP_ADD:
+        return overlap_add_convolve(signal, kernel)
+    return fft_convolve(signal, kernel)
+
 
 class RoomImpulseResponseService:
     """
@@ -240,7 +355,8 @@ class RoomImpulseResponseService:
         self,
         preset_name: str,
         duration: float = 1.0,
-        sample_rate: Optional[int] = None
+        sample_rate: Optional[int] = None,
+        seed: Optional[int] = None
     ) -> np.ndarray:
         """
         Generate room impulse response for a preset.
@@ -249,6 +365,7 @@ class RoomImpulseResponseService:
             preset_name: Room preset identifier
             duration: RIR duration in seconds
             sample_rate: Sample rate (uses default if not specified)
+            seed: Seed for reflections and late reverb (optional)
 
         Returns:
             RIR signal array
@@ -262,6 +379,7 @@ class RoomImpulseResponseService:
 
         preset = self.get_room_preset(preset_name)
         rt60 = preset.get('rt60', 0.5)
+        rng = np.random.default_rng(seed)
 
         num_samples = int(duration * sample_rate)
 
@@ -282,7 +400,7 @@ class RoomImpulseResponseService:
 
         # Add some early reflections based on room dimensions
         for i in range(5):
-            delay_ms = (i + 1) * 10 + np.random.uniform(-2, 2)
+            delay_ms = (i + 1) * 10 + rng.uniform(-2, 2)
             delay_samples = int(delay_ms * sample_rate / 1000)
             if delay_samples < early_samples:
                 # Reflection amplitude decreases with each reflection
@@ -292,7 +410,7 @@ class RoomImpulseResponseService:
         # Late reverb (diffuse noise shaped by envelope)
         late_start = early_samples
         if late_start < num_samples:
-            noise = np.random.randn(num_samples - late_start) * 0.1
+            noise = rng.standard_normal(num_samples - late_start) * 0.1
             noise *= envelope[late_start:]
             rir[late_start:] += noise
 
@@ -304,10 +422,55 @@ class RoomImpulseResponseService:
 
         return rir.astype(np.float32)
 
+    def get_rir(
+        self,
+        preset_name: str,
+        duration: float = 1.0,
+        sample_rate: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Return the cached RIR for a preset, generating it on first use.
+
+        RIRs are generated with a stable per-preset seed and shared by all
+        instances in the process, so repeated calls return the same array.
+
+        Args:
+            preset_name: Room preset identifier
+            duration: RIR duration in seconds
+            sample_rate: Sample rate (uses default if not specified)
+
+        Returns:
+            Read-only float32 RIR
+
+        Example:
+            >>> rir = service.get_rir('living_room')
+            >>> rir is service.get_rir('living_room')
+            True
+        """
+        if sample_rate is None:
+            sample_rate = self.sample_rate
+
+        num_samples = int(duration * sample_rate)
+        seed = DEFAULT_RIR_SEED ^ zlib.crc32(f"{preset_name}:{sample_rate}".encode())
+        key = (preset_name, num_samples, sample_rate, seed)
+
+        rir = _rir_bank.get(key)
+        if rir is not None:
+            return rir
+
+        with _rir_bank_lock:
+            rir = _rir_bank.get(key)
+            if rir is None:
+                rir = self.generate_rir(preset_name, duration, sample_rate, seed=seed)
+                rir.setflags(write=False)
+                _rir_bank[key] = rir
+        return rir
+
     def apply_rir(
         self,
         signal: np.ndarray,
-        rir: np.ndarray
+        rir: np.ndarray,
+        method: str = CONVOLUTION_AUTO
     ) -> np.ndarray:
         """
         Apply room impulse response to audio signal.
@@ -317,6 +480,8 @@ class RoomImpulseResponseService:
         Args:
             signal: Clean audio signal
             rir: Room impulse response
+            method: Convolution method ('auto', 'direct', 'fft' or
+                   'overlap_add'); 'auto' picks by signal and RIR length
 
         Returns:
             Reverberant audio signal
@@ -326,18 +491,94 @@ class RoomImpulseResponseService:
             >>> print(f"Output length: {len(reverberant)}")
         """
         # Convolve signal with RIR
-        reverberant = np.convolve(signal, rir, mode='full')
+        reverberant = convolve(signal, rir, method)
 
         # Trim to original length
         reverberant = reverberant[:len(signal)]
 
         # Normalize to prevent clipping
-        max_val = np.max(np.abs(reverberant))
+        max_val = np.max(np.abs(reverberant)) if len(reverberant) else 0
         if max_val > 0:
             reverberant = reverberant / max_val
 
         return reverberant.astype(np.float32)
 
+    def apply_rir_batch(
+        self,
+        signals: Sequence[np.ndarray],
+        rir: np.ndarray
+    ) -> List[np.ndarray]:
+        """
+        Apply one room impulse response to many signals in a single pass.
+
+        Signals are zero-padded to a common length and transformed together,
+        so the RIR spectrum is computed once for the whole batch.
+
+        Args:
+            signals: Clean audio signals (lengths may differ)
+            rir: Room impulse response
+
+        Returns:
+            Reverberant signals, each trimmed to its input length and
+            peak-normalized (float32)
+
+        Example:
+            >>> outputs = service.apply_rir_batch(utterances, service.get_rir('hall'))
+            >>> print(len(outputs) == len(utterances))
+        """
+        if len(signals) == 0:
+            return []
+
+        lengths = [len(signal) for signal in signals]
+        max_len = max(lengths)
+        if max_len == 0 or len(rir) == 0:
+            return [np.zeros(length, dtype=np.float32) for length in lengths]
+
+        # nfft covers the full linear convolution, so there is no circular wrap-around
+        nfft = _next_pow2(max_len + len(rir) - 1)
+        batch = np.zeros((len(signals), max_len), dtype=np.float64)
+        for row, signal in enumerate(signals):
+            batch[row, :lengths[row]] = signal
+
+        reverberant = np.fft.irfft(
+            np.fft.rfft(batch, nfft, axis=1) * np.fft.rfft(rir, nfft)[None, :],
+            nfft,
+            axis=1
+        )[:, :max_len]
+
+        # Zero the padding so it does not affect normalization
+        positions = np.arange(max_len)[None, :]
+        reverberant[positions >= np.asarray(lengths)[:, None]] = 0.0
+
+        peaks = np.max(np.abs(reverberant), axis=1, keepdims=True)
+        np.divide(reverberant, peaks, out=reverberant, where=peaks > 0)
+
+        return [
+            reverberant[row, :length].astype(np.float32)
+            for row, length in enumerate(lengths)
+        ]
+
+    def apply_room_preset(
+        self,
+        signals: Sequence[np.ndarray],
+        preset_name: str,
+        duration: float = 1.0,
+        sample_rate: Optional[int] = None
+    ) -> List[np.ndarray]:
+        """
+        Reverberate signals with a preset's cached RIR.
+
+        Args:
+            signals: Clean audio signals
+            preset_name: Room preset identifier
+            duration: RIR duration in seconds
+            sample_rate: Sample rate (uses default if not specified)
+
+        Returns:
+            Reverberant signals (see apply_rir_batch)
+        """
+        return self.apply_rir_batch(signals, self.get_rir(preset_name, duration, sample_rate))
+
     def analyze_room_acoustics(
         self,
         preset_name: str
@@ -440,8 +681,8 @@ class RoomImpulseResponseService:
         preset = self.get_room_preset(preset_name)
         acoustics = self.analyze_room_acoustics(preset_name)
 
-        # Generate a test RIR
-        rir = self.generate_rir(preset_name, 0.5)
+        # Use the cached preset RIR
+        rir = self.get_rir(preset_name, 0.5)
 
         # Calculate RIR characteristics
         direct_to_reverb = self._calculate_direct_to_reverb(rir)
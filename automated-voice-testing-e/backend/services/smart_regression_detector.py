@@ -8,25 +8,34 @@ Handles regression detection with LLM non-determinism awareness:
 
 This service integrates regression detection into suite execution, automatically
 detecting and recording regressions after test runs complete.
+
+A suite run is analysed as a batch: the baselines of all its scripts are
+loaded in one query, deterministic metrics are compared one metric at a
+time over arrays holding every execution, and findings are recorded with
+bulk statements (RegressionTrackingService.record_execution_outcomes).
 """
 
 from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload, load_only
 
 from models.multi_turn_execution import MultiTurnExecution
 from models.regression_baseline import RegressionBaseline
-from services.regression_tracking_service import RegressionTrackingService
+from services.regression_tracking_service import ExecutionRegressionOutcome, RegressionTrackingService
 
 logger = logging.getLogger(__name__)
 
+# Maximum script ids per IN (...) clause when loading baselines
+BASELINE_LOOKUP_CHUNK_SIZE = 1000
+
 
 @dataclass
 class RegressionFinding:
@@ -79,11 +88,13 @@ class SmartRegressionDetector:
         Returns:
             List of detected regressions
         """
-        findings: List[RegressionFinding] = []
-
         # Get all executions for this suite run with tenant isolation
-        stmt = select(MultiTurnExecution).where(
-            MultiTurnExecution.suite_run_id == suite_run_id
+        stmt = (
+            select(MultiTurnExecution)
+            # Only scalar columns are compared; skip the eager relationship loads
+            .options(lazyload('*'))
+            .where(MultiTurnExecution.suite_run_id == suite_run_id)
+            .order_by(MultiTurnExecution.created_at)
         )
 
         # CRITICAL: Enforce tenant isolation if tenant_id is provided
@@ -95,115 +106,121 @@ class SmartRegressionDetector:
 
         logger.info(f"Analyzing {len(executions)} executions for regressions in suite {suite_run_id}")
 
+        # Baselines are keyed by script, so they're scoped by the executions' tenant
+        baselines = await self._load_active_baselines(execution.script_id for execution in executions)
+        pairs = []
         for execution in executions:
-            # Get baseline for this scenario with tenant isolation
-            baseline = await self._get_active_baseline(
-                script_id=execution.script_id,
-                tenant_id=execution.tenant_id  # Use execution's tenant_id for consistency
-            )
-
-            if not baseline:
+            baseline = baselines.get(str(execution.script_id))
+            if baseline is None:
                 logger.debug(f"No baseline found for script {execution.script_id}, skipping")
                 continue
+            pairs.append((execution, baseline))
 
-            # Detect regressions for this execution
-            execution_findings = await self._detect_execution_regressions(
-                execution,
-                baseline,
-            )
-            findings.extend(execution_findings)
-
-            # Record or update regressions
-            for finding in execution_findings:
-                await self.tracking_service.record_regression(
-                    finding=finding,
-                    tenant_id=execution.tenant_id,  # Use execution's tenant_id
-                    baseline_version=baseline.version,
-                )
-
-            # Auto-resolve if test is now passing
-            if execution.status in self.SUCCESS_STATUSES:
-                await self.tracking_service.auto_resolve_passing_tests(
-                    script_id=execution.script_id
-                )
+        findings_per_execution = self._detect_batch_regressions(pairs)
 
+        findings: List[RegressionFinding] = []
+        outcomes: List[ExecutionRegressionOutcome] = []
+        for (execution, baseline), execution_findings in zip(pairs, findings_per_execution):
+            findings.extend(execution_findings)
+            outcomes.append(ExecutionRegressionOutcome(
+                script_id=execution.script_id,
+                tenant_id=execution.tenant_id,  # Use execution's tenant_id
+                baseline_version=baseline.version,
+                findings=execution_findings,
+                # Auto-resolve if test is now passing
+                passed=execution.status in self.SUCCESS_STATUSES,
+            ))
+
+        # Record or update regressions
+        counts = await self.tracking_service.record_execution_outcomes(outcomes)
         await self.db.commit()
-        logger.info(f"Detected {len(findings)} regressions in suite {suite_run_id}")
+        logger.info(
+            f"Detected {len(findings)} regressions in suite {suite_run_id} "
+            f"({counts['created']} new, {counts['updated']} recurring, {counts['resolved']} auto-resolved)"
+        )
 
         return findings
 
-    async def _get_active_baseline(
+    async def _load_active_baselines(
         self,
-        script_id: UUID,
-        tenant_id: Optional[UUID] = None
-    ) -> Optional[RegressionBaseline]:
+        script_ids: Iterable[UUID],
+    ) -> Dict[str, RegressionBaseline]:
         """
-        Get the active baseline for a scenario script with tenant isolation.
+        Load the baselines of many scenario scripts.
 
         Args:
-            script_id: UUID of the scenario script
-            tenant_id: Optional tenant ID for multi-tenant isolation
+            script_ids: UUIDs of the scenario scripts
 
         Returns:
-            Active baseline or None if not found
+            Baselines keyed by script ID string (scripts without one are absent)
         """
-        stmt = (
-            select(RegressionBaseline)
-            .where(RegressionBaseline.script_id == script_id)
-            .where(RegressionBaseline.is_active == True)
-        )
-
-        # CRITICAL: Enforce tenant isolation if tenant_id is provided
-        if tenant_id is not None:
-            stmt = stmt.where(RegressionBaseline.tenant_id == tenant_id)
-
-        stmt = stmt.order_by(RegressionBaseline.version.desc())
-
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        wanted = sorted({str(script_id) for script_id in script_ids})
+        baselines: Dict[str, RegressionBaseline] = {}
+        for start in range(0, len(wanted), BASELINE_LOOKUP_CHUNK_SIZE):
+            chunk = wanted[start:start + BASELINE_LOOKUP_CHUNK_SIZE]
+            result = await self.db.execute(
+                select(RegressionBaseline)
+                .options(load_only(
+                    RegressionBaseline.script_id,
+                    RegressionBaseline.result_status,
+                    RegressionBaseline.metrics,
+                    RegressionBaseline.version,
+                ))
+                .where(RegressionBaseline.script_id.in_(chunk))
+            )
+            for baseline in result.scalars().all():
+                baselines[baseline.script_id] = baseline
+        return baselines
 
-    async def _detect_execution_regressions(
+    def _detect_batch_regressions(
         self,
-        execution: MultiTurnExecution,
-        baseline: RegressionBaseline,
-    ) -> List[RegressionFinding]:
+        pairs: Sequence[Tuple[MultiTurnExecution, RegressionBaseline]],
+    ) -> List[List[RegressionFinding]]:
         """
-        Detect regressions for a single execution against its baseline.
+        Detect regressions for executions against their baselines.
 
         Tier 1: Check deterministic metrics (strict)
         Tier 2: Check LLM final verdict (advisory)
-        """
-        findings: List[RegressionFinding] = []
-
-        # Extract metrics from execution
-        current_metrics = self._extract_metrics(execution)
-        baseline_metrics = baseline.snapshot_data.get('metrics', {}) if baseline.snapshot_data else {}
 
-        # Tier 1: Status regression (deterministic)
-        status_finding = self._check_status_regression(
-            baseline_status=baseline.snapshot_data.get('status') if baseline.snapshot_data else None,
-            current_status=execution.status,
-            script_id=execution.script_id,
-        )
-        if status_finding:
-            findings.append(status_finding)
+        Returns:
+            Findings for each (execution, baseline) pair, in pair order
+        """
+        current_metrics = [self._extract_metrics(execution) for execution, _ in pairs]
+        baseline_metrics = [baseline.metrics or {} for _, baseline in pairs]
+        script_ids = [execution.script_id for execution, _ in pairs]
 
         # Tier 1: Deterministic metric regressions (strict gating)
         metric_findings = self._check_deterministic_metrics(
             baseline_metrics=baseline_metrics,
             current_metrics=current_metrics,
-            script_id=execution.script_id,
+            script_ids=script_ids,
         )
-        findings.extend(metric_findings)
 
-        # Tier 2: LLM final verdict regression (advisory only)
-        llm_finding = self._check_llm_verdict_regression(
-            baseline_metrics=baseline_metrics,
-            current_metrics=current_metrics,
-            script_id=execution.script_id,
-        )
-        if llm_finding:
-            findings.append(llm_finding)
+        findings: List[List[RegressionFinding]] = []
+        for index, (execution, baseline) in enumerate(pairs):
+            execution_findings: List[RegressionFinding] = []
+
+            # Tier 1: Status regression (deterministic)
+            status_finding = self._check_status_regression(
+                baseline_status=baseline.result_status,
+                current_status=execution.status,
+                script_id=execution.script_id,
+            )
+            if status_finding:
+                execution_findings.append(status_finding)
+
+            execution_findings.extend(metric_findings[index])
+
+            # Tier 2: LLM final verdict regression (advisory only)
+            llm_finding = self._check_llm_verdict_regression(
+                baseline_metrics=baseline_metrics[index],
+                current_metrics=current_metrics[index],
+                script_id=execution.script_id,
+            )
+            if llm_finding:
+                execution_findings.append(llm_finding)
+
+            findings.append(execution_findings)
 
         return findings
 
@@ -218,11 +235,10 @@ class SmartRegressionDetector:
         """
         metrics: Dict[str, Any] = {}
 
-        if not execution.execution_metadata:
+        metadata = getattr(execution, 'execution_metadata', None)
+        if not metadata:
             return metrics
 
-        metadata = execution.execution_metadata
-
         # Extract deterministic metrics
         for metric_name in self.DETERMINISTIC_METRICS:
             if metric_name in metadata:
@@ -279,38 +295,58 @@ class SmartRegressionDetector:
 
     def _check_deterministic_metrics(
         self,
-        baseline_metrics: Dict[str, Any],
-        current_metrics: Dict[str, Any],
-        script_id: UUID,
-    ) -> List[RegressionFinding]:
+        baseline_metrics: Sequence[Dict[str, Any]],
+        current_metrics: Sequence[Dict[str, Any]],
+        script_ids: Sequence[UUID],
+    ) -> List[List[RegressionFinding]]:
         """
         Check for regressions in deterministic metrics.
 
-        This is Tier 1: Strict gating with tight tolerances.
-        """
-        findings: List[RegressionFinding] = []
+        This is Tier 1: Strict gating with tight tolerances. Each metric is
+        compared for all executions at once over arrays of the values.
 
-        for metric_name in self.DETERMINISTIC_METRICS:
-            if metric_name not in baseline_metrics or metric_name not in current_metrics:
-                continue
+        Returns:
+            Findings for each execution, in input order
+        """
+        findings: List[List[RegressionFinding]] = [[] for _ in script_ids]
 
-            baseline_value = baseline_metrics[metric_name]
-            current_value = current_metrics[metric_name]
+        # Check for degradation (lower is worse for most metrics)
+        # Use 5% tolerance for deterministic metrics
+        tolerance = 0.05
 
-            # Skip non-numeric metrics
-            if not isinstance(baseline_value, (int, float)) or not isinstance(current_value, (int, float)):
+        for metric_name in self.DETERMINISTIC_METRICS:
+            rows: List[int] = []
+            baseline_values: List[Any] = []
+            current_values: List[Any] = []
+            for row, (baseline, current) in enumerate(zip(baseline_metrics, current_metrics)):
+                baseline_value = baseline.get(metric_name)
+                current_value = current.get(metric_name)
+
+                # Skip missing and non-numeric metrics
+                if isinstance(baseline_value, (int, float)) and isinstance(current_value, (int, float)):
+                    rows.append(row)
+                    baseline_values.append(baseline_value)
+                    current_values.append(current_value)
+
+            if not rows:
                 continue
 
-            # Check for degradation (lower is worse for most metrics)
-            # Use 5% tolerance for deterministic metrics
-            tolerance = 0.05
-            threshold = baseline_value * (1 - tolerance)
+            baseline_array = np.asarray(baseline_values, dtype=float)
+            current_array = np.asarray(current_values, dtype=float)
+            regressed = current_array < baseline_array * (1 - tolerance)
+            nonzero = baseline_array != 0
+            change_pcts = np.zeros_like(baseline_array)
+            np.divide(
+                (current_array - baseline_array) * 100, baseline_array, out=change_pcts, where=nonzero
+            )
 
-            if current_value < threshold:
-                change_pct = ((current_value - baseline_value) / baseline_value * 100) if baseline_value != 0 else 0
+            for index in np.flatnonzero(regressed):
+                baseline_value = baseline_values[index]
+                current_value = current_values[index]
+                change_pct = float(change_pcts[index])
 
-                findings.append(RegressionFinding(
-                    script_id=script_id,
+                findings[rows[index]].append(RegressionFinding(
+                    script_id=script_ids[rows[index]],
                     category='metric',
                     detail={
                         'metric': metric_name,
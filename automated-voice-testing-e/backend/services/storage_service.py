@@ -291,6 +291,62 @@ class StorageService:
             # Don't raise exception, just return False
             return False
 
+    async def download_by_key(self, key: str, bucket: Optional[str] = None) -> Optional[bytes]:
+        """
+        Download a file from S3 by its key, returning None if it does not exist.
+
+        Unlike download_audio, a missing object is not an error. This makes it
+        suitable for content-addressed lookups (e.g. the shared TTS cache)
+        where a miss is the expected outcome.
+
+        Args:
+            key: The S3 object key (e.g., "tts-cache/<sha256>.mp3")
+            bucket: S3 bucket name (uses default if None)
+
+        Returns:
+            bytes: Object contents, or None if the object does not exist
+
+        Raises:
+            RuntimeError: If the download fails for any other reason
+
+        Example:
+            >>> storage = StorageService()
+            >>> data = await storage.download_by_key("tts-cache/abc123.mp3")
+            >>> if data is None:
+            ...     print("cache miss")
+        """
+        if not key or not key.strip():
+            raise ValueError("key cannot be empty")
+
+        if bucket is None:
+            bucket = self.default_bucket
+
+        try:
+            loop = asyncio.get_event_loop()
+            response = await loop.run_in_executor(
+                None,
+                lambda: self.s3_client.get_object(
+                    Bucket=bucket,
+                    Key=key
+                )
+            )
+            data = response['Body'].read()
+            logger.debug(f"Downloaded {len(data)} bytes from {bucket}/{key}")
+            return data
+
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+            if error_code in ('NoSuchKey', '404', 'NotFound'):
+                return None
+            error_msg = f"S3 download by key failed: {error_code} - {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        except Exception as e:
+            error_msg = f"Unexpected error during download_by_key: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
     def _parse_s3_url(self, s3_url: str) -> tuple[str, str]:
         """
         Parse S3 URL into bucket and key components.
@@ -9,6 +9,13 @@ Features:
 - Text-to-speech conversion using gTTS
 - Support for multiple languages
 - Caching of generated audio to disk
+- Bounded in-process LRU cache in front of the disk cache
+- Raw PCM entry point with a derived-artifact cache, so cached audio is
+  not re-decoded through ffmpeg on every run
+- Async API that offloads synthesis to a dedicated thread pool
+- Single-flight deduplication of concurrent identical requests
+- Optional shared, content-addressed cache in S3/MinIO (keyed by the
+  SHA-256 cache key) so multiple workers share one warm cache
 - Cache key generation based on text and language
 - Automatic cache directory creation
 
@@ -19,18 +26,64 @@ Example:
     >>> audio_bytes = tts.text_to_speech("Hello, world!", lang="en")
     >>> # audio_bytes contains MP3 audio data
     >>> # Subsequent calls with same text will use cached audio
+    >>>
+    >>> # From async code, without blocking the event loop
+    >>> audio_bytes = await tts.text_to_speech_async("Hello, world!", lang="en")
 """
 
+import asyncio
 import io
 import hashlib
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Optional
 from gtts import gTTS
 
+from services.audio_utils import convert_to_pcm
+
+if TYPE_CHECKING:
+    from services.storage_service import StorageService
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_TTS_EXECUTOR_WORKERS = 4
+DEFAULT_MEMORY_CACHE_SIZE = 256
+DEFAULT_SHARED_CACHE_PREFIX = "tts-cache"
+
+_tts_executor: Optional[ThreadPoolExecutor] = None
+_tts_executor_lock = threading.Lock()
+
+
+def get_tts_executor(max_workers: Optional[int] = None) -> ThreadPoolExecutor:
+    """
+    Return the process-wide thread pool used for blocking TTS work.
+
+    The pool is created on first use and shared by every TTSService in the
+    process, keeping gTTS and disk I/O off the event loop without competing
+    for the loop's default executor. ``max_workers`` only applies to the
+    call that creates the pool.
+
+    Args:
+        max_workers: Pool size (default: DEFAULT_TTS_EXECUTOR_WORKERS)
+
+    Returns:
+        ThreadPoolExecutor: Shared TTS executor
+    """
+    global _tts_executor
+    if _tts_executor is None:
+        with _tts_executor_lock:
+            if _tts_executor is None:
+                _tts_executor = ThreadPoolExecutor(
+                    max_workers=max_workers or DEFAULT_TTS_EXECUTOR_WORKERS,
+                    thread_name_prefix="tts",
+                )
+    return _tts_executor
+
 
 @dataclass
 class TTSAudioResult:
@@ -42,6 +95,7 @@ class TTSAudioResult:
     cache_hit: bool
     audio_format: str
     sample_rate: int
+    cache_source: str = "generated"  # memory, disk, shared or generated
 
 
 class TTSService:
@@ -65,13 +119,30 @@ class TTSService:
         >>> audio_es = tts.text_to_speech("Hola mundo", lang="es")
     """
 
-    def __init__(self, cache_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        memory_cache_size: int = DEFAULT_MEMORY_CACHE_SIZE,
+        executor: Optional[ThreadPoolExecutor] = None,
+        shared_store: Optional["StorageService"] = None,
+        shared_store_bucket: Optional[str] = None,
+        shared_store_prefix: str = DEFAULT_SHARED_CACHE_PREFIX,
+    ):
         """
         Initialize the TTS service.
 
         Args:
             cache_dir: Directory for caching audio files. If None, uses
-                      './tts_cache' in the current directory.
+                      '/tmp/tts_cache'.
+            memory_cache_size: Maximum entries in the in-process LRU cache
+                      (0 disables it)
+            executor: Thread pool for blocking synthesis and disk I/O in the
+                      async API (default: shared pool from get_tts_executor)
+            shared_store: Optional StorageService used as a content-addressed
+                      cache shared across workers (async API only)
+            shared_store_bucket: Bucket for the shared cache (default: the
+                      store's default bucket)
+            shared_store_prefix: Key prefix for shared cache objects
         """
         if cache_dir is None:
             # Use default cache directory in /tmp (writable by non-root users)
@@ -83,6 +154,15 @@ class TTSService:
         # gTTS outputs 22.05 kHz MP3 audio by default
         self.default_sample_rate = 22050
 
+        self.memory_cache_size = max(0, memory_cache_size)
+        self._memory_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._executor = executor
+        self.shared_store = shared_store
+        self.shared_store_bucket = shared_store_bucket
+        self.shared_store_prefix = shared_store_prefix.strip("/")
+        self._inflight: Dict[str, asyncio.Future] = {}
+
         # Create cache directory if it doesn't exist
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
@@ -90,15 +170,8 @@ class TTSService:
 
     def synthesize(self, text: str, lang: str = "en") -> TTSAudioResult:
         """Generate speech audio and return cache metadata."""
-        audio_bytes, cache_key, cache_file, cache_hit = self._synthesize_with_cache(text, lang)
-        return TTSAudioResult(
-            audio_bytes=audio_bytes,
-            cache_key=cache_key,
-            cache_path=cache_file,
-            cache_hit=cache_hit,
-            audio_format=self.default_audio_format,
-            sample_rate=self.default_sample_rate,
-        )
+        audio_bytes, cache_key, cache_file, cache_source = self._synthesize_with_cache(text, lang)
+        return self._build_result(audio_bytes, cache_key, cache_file, cache_source)
 
     def text_to_speech(self, text: str, lang: str = "en") -> bytes:
         """
@@ -132,38 +205,370 @@ class TTSService:
         result = self.synthesize(text, lang)
         return result.audio_bytes
 
-    def _synthesize_with_cache(self, text: str, lang: str) -> tuple[bytes, str, Path, bool]:
+    async def synthesize_async(self, text: str, lang: str = "en") -> TTSAudioResult:
+        """
+        Generate speech audio without blocking the event loop.
+
+        Lookup order is in-process LRU, disk cache, shared store, then gTTS.
+        Blocking work runs on the TTS executor. Concurrent requests for the
+        same (text, lang) share one synthesis (single-flight).
+
+        Args:
+            text: The text to convert to speech
+            lang: Language code (ISO 639-1)
+
+        Returns:
+            TTSAudioResult: Audio bytes and cache metadata
+
+        Raises:
+            ValueError: If text is empty or None
+            RuntimeError: If TTS generation fails
+        """
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        cache_key = self._generate_cache_key(text, lang)
+        cache_file = self.cache_dir / f"{cache_key}.mp3"
+
+        audio_bytes, cache_source = await self._single_flight(
+            cache_key,
+            lambda: self._load_or_generate_async(text, lang, cache_key, cache_file),
+        )
+        return self._build_result(audio_bytes, cache_key, cache_file, cache_source)
+
+    async def text_to_speech_async(self, text: str, lang: str = "en") -> bytes:
+        """
+        Async counterpart of text_to_speech.
+
+        Args:
+            text: The text to convert to speech
+            lang: Language code (ISO 639-1)
+
+        Returns:
+            bytes: Audio data in MP3 format
+        """
+        result = await self.synthesize_async(text, lang)
+        return result.audio_bytes
+
+    def synthesize_pcm(
+        self,
+        text: str,
+        lang: str = "en",
+        target_rate: int = 16000,
+        channels: int = 1,
+        sample_width: int = 2,
+    ) -> TTSAudioResult:
+        """
+        Generate speech as raw PCM, reusing a cached decode when available.
+
+        The decoded PCM is a derived artifact of the MP3 and is cached next
+        to it under a key built from the TTS cache key, sample rate, channel
+        count and sample width, so repeated runs skip the ffmpeg decode.
+
+        Args:
+            text: The text to convert to speech
+            lang: Language code (ISO 639-1)
+            target_rate: Output sample rate in Hz (default: 16000)
+            channels: Output channel count (default: 1)
+            sample_width: Output bytes per sample (default: 2, 16-bit)
+
+        Returns:
+            TTSAudioResult: Raw little-endian PCM bytes and cache metadata
+
+        Raises:
+            ValueError: If text is empty or None
+            RuntimeError: If TTS generation or PCM conversion fails
+        """
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        tts_key = self._generate_cache_key(text, lang)
+        pcm_key = self._pcm_cache_key(tts_key, target_rate, channels, sample_width)
+        pcm_file = self.cache_dir / pcm_key
+
+        pcm_bytes = self._memory_get(pcm_key)
+        cache_source = "memory"
+        if pcm_bytes is None:
+            pcm_bytes = self._read_disk_cache(pcm_file)
+            cache_source = "disk"
+        if pcm_bytes is None:
+            mp3_bytes = self.text_to_speech(text, lang)
+            pcm_bytes = self._decode_pcm(mp3_bytes, target_rate, channels, sample_width)
+            self._write_disk_cache(pcm_file, pcm_bytes)
+            cache_source = "generated"
+        self._memory_put(pcm_key, pcm_bytes)
+
+        return self._build_pcm_result(pcm_bytes, pcm_key, pcm_file, cache_source, target_rate)
+
+    async def synthesize_pcm_async(
+        self,
+        text: str,
+        lang: str = "en",
+        target_rate: int = 16000,
+        channels: int = 1,
+        sample_width: int = 2,
+    ) -> TTSAudioResult:
+        """
+        Async counterpart of synthesize_pcm.
+
+        Lookup order is in-process LRU, disk cache, shared store, then decode
+        of the (itself cached) MP3 on the TTS executor. Concurrent identical
+        requests share one decode.
+        """
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        tts_key = self._generate_cache_key(text, lang)
+        pcm_key = self._pcm_cache_key(tts_key, target_rate, channels, sample_width)
+        pcm_file = self.cache_dir / pcm_key
+
+        async def load() -> tuple[bytes, str]:
+            loop = asyncio.get_running_loop()
+            executor = self._executor or get_tts_executor()
+
+            pcm_bytes = await loop.run_in_executor(executor, self._read_disk_cache, pcm_file)
+            if pcm_bytes is not None:
+                return pcm_bytes, "disk"
+
+            pcm_bytes = await self._read_shared_cache(pcm_key)
+            if pcm_bytes is not None:
+                await loop.run_in_executor(executor, self._write_disk_cache, pcm_file, pcm_bytes)
+                return pcm_bytes, "shared"
+
+            mp3_bytes = await self.text_to_speech_async(text, lang)
+            pcm_bytes = await loop.run_in_executor(
+                executor, self._decode_pcm, mp3_bytes, target_rate, channels, sample_width
+            )
+            await loop.run_in_executor(executor, self._write_disk_cache, pcm_file, pcm_bytes)
+            await self._write_shared_cache(pcm_key, pcm_bytes)
+            return pcm_bytes, "generated"
+
+        pcm_bytes, cache_source = await self._single_flight(pcm_key, load)
+        return self._build_pcm_result(pcm_bytes, pcm_key, pcm_file, cache_source, target_rate)
+
+    async def _single_flight(
+        self,
+        cache_key: str,
+        loader: Callable[[], Awaitable[tuple[bytes, str]]],
+    ) -> tuple[bytes, str]:
+        """
+        Return cached bytes for ``cache_key``, running ``loader`` at most once.
+
+        Checks the in-process LRU first; concurrent callers for a key that is
+        already being loaded await the same result instead of loading again.
+        Loaded bytes are stored in the LRU.
+        """
+        cached = self._memory_get(cache_key)
+        if cached is not None:
+            return cached, "memory"
+
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            logger.debug(f"Joining in-flight TTS request for cache key {cache_key}")
+            data, _ = await asyncio.shield(inflight)
+            return data, "memory"
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            data, cache_source = await loader()
+            self._memory_put(cache_key, data)
+            future.set_result((data, cache_source))
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve the exception so it is not reported as unhandled
+            # when no other request joined this one.
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(cache_key, None)
+
+        return data, cache_source
+
+    async def _load_or_generate_async(
+        self,
+        text: str,
+        lang: str,
+        cache_key: str,
+        cache_file: Path,
+    ) -> tuple[bytes, str]:
+        loop = asyncio.get_running_loop()
+        executor = self._executor or get_tts_executor()
+
+        audio_bytes = await loop.run_in_executor(executor, self._read_disk_cache, cache_file)
+        if audio_bytes is not None:
+            logger.debug(f"Using cached audio for text: '{text[:50]}...' (lang={lang})")
+            return audio_bytes, "disk"
+
+        audio_bytes = await self._read_shared_cache(cache_key)
+        if audio_bytes is not None:
+            logger.debug(f"Using shared cached audio for text: '{text[:50]}...' (lang={lang})")
+            await loop.run_in_executor(executor, self._write_disk_cache, cache_file, audio_bytes)
+            return audio_bytes, "shared"
+
+        audio_bytes = await loop.run_in_executor(executor, self._generate_audio, text, lang)
+        await loop.run_in_executor(executor, self._write_disk_cache, cache_file, audio_bytes)
+        await self._write_shared_cache(cache_key, audio_bytes)
+        return audio_bytes, "generated"
+
+    def _synthesize_with_cache(self, text: str, lang: str) -> tuple[bytes, str, Path, str]:
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
         cache_key = self._generate_cache_key(text, lang)
         cache_file = self.cache_dir / f"{cache_key}.mp3"
-        cache_hit = cache_file.exists()
 
-        if cache_hit:
+        audio_bytes = self._memory_get(cache_key)
+        if audio_bytes is not None:
+            return audio_bytes, cache_key, cache_file, "memory"
+
+        audio_bytes = self._read_disk_cache(cache_file)
+        if audio_bytes is not None:
             logger.debug(f"Using cached audio for text: '{text[:50]}...' (lang={lang})")
-            with open(cache_file, 'rb') as f:
-                audio_bytes = f.read()
-            return audio_bytes, cache_key, cache_file, True
+            self._memory_put(cache_key, audio_bytes)
+            return audio_bytes, cache_key, cache_file, "disk"
+
+        audio_bytes = self._generate_audio(text, lang)
+        self._write_disk_cache(cache_file, audio_bytes)
+        self._memory_put(cache_key, audio_bytes)
+        return audio_bytes, cache_key, cache_file, "generated"
 
+    def _generate_audio(self, text: str, lang: str) -> bytes:
+        """Synthesize MP3 audio with gTTS (blocking network call)."""
         logger.info(f"Generating TTS audio for text: '{text[:50]}...' (lang={lang})")
 
         try:
             tts = gTTS(text=text, lang=lang, slow=False)
             audio_buffer = io.BytesIO()
             tts.write_to_fp(audio_buffer)
-            audio_buffer.seek(0)
-            audio_bytes = audio_buffer.read()
+            return audio_buffer.getvalue()
 
-            with open(cache_file, 'wb') as f:
-                f.write(audio_bytes)
+        except Exception as e:
+            logger.error(f"Failed to generate TTS audio: {e}")
+            raise RuntimeError(f"Text-to-speech generation failed: {str(e)}") from e
 
+    def _read_disk_cache(self, cache_file: Path) -> Optional[bytes]:
+        try:
+            with open(cache_file, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _write_disk_cache(self, cache_file: Path, audio_bytes: bytes) -> None:
+        # Write to a temp file and rename so concurrent readers never see a
+        # partially written cache entry.
+        tmp_file = cache_file.with_name(
+            f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(audio_bytes)
+            os.replace(tmp_file, cache_file)
             logger.debug(f"Cached audio to {cache_file}")
-            return audio_bytes, cache_key, cache_file, False
+        except OSError as e:
+            logger.warning(f"Failed to write TTS cache file {cache_file}: {e}")
+            tmp_file.unlink(missing_ok=True)
+
+    def _memory_get(self, cache_key: str) -> Optional[bytes]:
+        if not self.memory_cache_size:
+            return None
+        with self._memory_lock:
+            audio_bytes = self._memory_cache.get(cache_key)
+            if audio_bytes is not None:
+                self._memory_cache.move_to_end(cache_key)
+            return audio_bytes
+
+    def _memory_put(self, cache_key: str, audio_bytes: bytes) -> None:
+        if not self.memory_cache_size:
+            return
+        with self._memory_lock:
+            self._memory_cache[cache_key] = audio_bytes
+            self._memory_cache.move_to_end(cache_key)
+            while len(self._memory_cache) > self.memory_cache_size:
+                self._memory_cache.popitem(last=False)
+
+    def _shared_cache_key(self, cache_key: str) -> str:
+        # Derived artifacts (PCM) already carry their extension in the key
+        if "." in cache_key:
+            return f"{self.shared_store_prefix}/{cache_key}"
+        return f"{self.shared_store_prefix}/{cache_key}.mp3"
+
+    @staticmethod
+    def _pcm_cache_key(tts_key: str, target_rate: int, channels: int, sample_width: int) -> str:
+        """Cache key (and file name) for PCM derived from the MP3 for ``tts_key``."""
+        return f"{tts_key}.{target_rate}hz_{channels}ch_{sample_width * 8}bit.pcm"
+
+    @staticmethod
+    def _decode_pcm(mp3_bytes: bytes, target_rate: int, channels: int, sample_width: int) -> bytes:
+        return convert_to_pcm(
+            mp3_bytes,
+            target_rate=target_rate,
+            raw=True,
+            channels=channels,
+            sample_width=sample_width,
+        )
 
+    def _build_pcm_result(
+        self,
+        pcm_bytes: bytes,
+        pcm_key: str,
+        pcm_file: Path,
+        cache_source: str,
+        target_rate: int,
+    ) -> TTSAudioResult:
+        return TTSAudioResult(
+            audio_bytes=pcm_bytes,
+            cache_key=pcm_key,
+            cache_path=pcm_file,
+            cache_hit=cache_source != "generated",
+            audio_format="pcm",
+            sample_rate=target_rate,
+            cache_source=cache_source,
+        )
+
+    async def _read_shared_cache(self, cache_key: str) -> Optional[bytes]:
+        if self.shared_store is None:
+            return None
+        try:
+            return await self.shared_store.download_by_key(
+                self._shared_cache_key(cache_key),
+                bucket=self.shared_store_bucket,
+            )
         except Exception as e:
-            logger.error(f"Failed to generate TTS audio: {e}")
-            raise RuntimeError(f"Text-to-speech generation failed: {str(e)}") from e
+            logger.warning(f"Shared TTS cache lookup failed for {cache_key}: {e}")
+            return None
+
+    async def _write_shared_cache(self, cache_key: str, audio_bytes: bytes) -> None:
+        if self.shared_store is None:
+            return
+        try:
+            await self.shared_store.upload_audio(
+                audio_bytes,
+                self._shared_cache_key(cache_key),
+                bucket=self.shared_store_bucket or self.shared_store.default_bucket,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish TTS audio {cache_key} to shared cache: {e}")
+
+    def _build_result(
+        self,
+        audio_bytes: bytes,
+        cache_key: str,
+        cache_file: Path,
+        cache_source: str,
+    ) -> TTSAudioResult:
+        return TTSAudioResult(
+            audio_bytes=audio_bytes,
+            cache_key=cache_key,
+            cache_path=cache_file,
+            cache_hit=cache_source != "generated",
+            audio_format=self.default_audio_format,
+            sample_rate=self.default_sample_rate,
+            cache_source=cache_source,
+        )
 
     def _generate_cache_key(self, text: str, lang: str) -> str:
         """
@@ -204,7 +609,8 @@ class TTSService:
         """
         Clear all cached audio files.
 
-        This method removes all MP3 files from the cache directory.
+        This method removes all MP3 files (and derived PCM files) from the
+        cache directory and empties the in-process LRU. The shared store is left untouched.
         Useful for freeing up disk space or forcing regeneration of audio.
 
         Returns:
@@ -218,7 +624,11 @@ class TTSService:
         """
         deleted_count = 0
 
-        for cache_file in self.cache_dir.glob("*.mp3"):
+        with self._memory_lock:
+            self._memory_cache.clear()
+
+        cache_files = [*self.cache_dir.glob("*.mp3"), *self.cache_dir.glob("*.pcm")]
+        for cache_file in cache_files:
             try:
                 cache_file.unlink()
                 deleted_count += 1
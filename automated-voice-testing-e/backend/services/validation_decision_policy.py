@@ -0,0 +1,145 @@
+"""
+Validation Decision Policy
+
+Decides how much LLM evaluation a validation needs.
+
+Hybrid validation combines deterministic Houndify checks with the LLM
+pipeline, but the deterministic result is often conclusive on its own:
+
+- deterministic_fail: CommandKind or entity checks failed hard; the LLM
+  cannot turn the combined decision into a pass, so it is skipped
+- deterministic_pass: every check passed with very high ASR confidence;
+  the LLM is skipped. Requires at least one deterministic check (expected
+  CommandKind or entities): with none, Houndify passes trivially and the
+  LLM is the only real check
+- single_evaluator: evaluator A's score is far enough from the pass
+  threshold that evaluator B (and the curator) are not called
+- dual_evaluator: the full pipeline ran (A was borderline or failed)
+- houndify_only: the scenario uses houndify validation mode
+
+The path taken is stored on ValidationResult.decision_path, so LLM calls
+and latency saved can be reported per suite run.
+
+Configured by VALIDATION_EARLY_EXIT_ENABLED,
+VALIDATION_EARLY_EXIT_MIN_ASR_CONFIDENCE, LLM_SEQUENTIAL_EVALUATORS and
+LLM_BORDERLINE_MARGIN.
+
+Example:
+    >>> policy = get_decision_policy()
+    >>> path = policy.deterministic_path(
+    ...     validation_mode='hybrid',
+    ...     houndify_passed=False,
+    ...     command_kind_matched=False,
+    ...     entities_passed=True,
+    ...     asr_confidence=0.9,
+    ...     checks_configured=True,
+    ... )
+    >>> print(path)  # 'deterministic_fail'
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from api.config import get_settings
+
+DECISION_PATH_DETERMINISTIC_FAIL = "deterministic_fail"
+DECISION_PATH_DETERMINISTIC_PASS = "deterministic_pass"
+DECISION_PATH_SINGLE_EVALUATOR = "single_evaluator"
+DECISION_PATH_DUAL_EVALUATOR = "dual_evaluator"
+DECISION_PATH_HOUNDIFY_ONLY = "houndify_only"
+
+# LLM evaluator calls made on each path (curator calls excluded)
+EVALUATOR_CALLS_BY_PATH = {
+    DECISION_PATH_DETERMINISTIC_FAIL: 0,
+    DECISION_PATH_DETERMINISTIC_PASS: 0,
+    DECISION_PATH_SINGLE_EVALUATOR: 1,
+    DECISION_PATH_DUAL_EVALUATOR: 2,
+    DECISION_PATH_HOUNDIFY_ONLY: 0,
+}
+
+
+def has_deterministic_checks(
+    expected_command_kind: Optional[str],
+    expected_entities: Optional[Dict[str, Any]],
+) -> bool:
+    """Whether an expected outcome defines a CommandKind or entity check."""
+    return bool(expected_command_kind) or bool(expected_entities)
+
+
+@dataclass
+class DecisionPolicy:
+    """
+    Short-circuit rules for hybrid and LLM validation.
+
+    Attributes:
+        early_exit_enabled: Skip the LLM when deterministic checks are conclusive
+        min_asr_confidence: ASR confidence required for a deterministic pass
+        sequential_evaluators: Call evaluator B only when A is borderline
+        borderline_margin: Distance from the pass threshold that is borderline
+    """
+    early_exit_enabled: bool = True
+    min_asr_confidence: float = 0.95
+    sequential_evaluators: bool = True
+    borderline_margin: float = 0.15
+
+    def deterministic_path(
+        self,
+        validation_mode: str,
+        houndify_passed: Optional[bool],
+        command_kind_matched: bool,
+        entities_passed: bool,
+        asr_confidence: Optional[float],
+        checks_configured: bool = False,
+    ) -> Optional[str]:
+        """
+        Return the decision path if the LLM can be skipped, else None.
+
+        Only hybrid validation short-circuits: in llm_ensemble mode the LLM
+        decision is the result.
+
+        Args:
+            validation_mode: 'houndify', 'llm_ensemble', or 'hybrid'
+            houndify_passed: Whether all deterministic checks passed
+            command_kind_matched: Whether the CommandKind check passed
+            entities_passed: Whether entity validation passed
+            asr_confidence: Raw ASR confidence from Houndify (0.0 to 1.0)
+            checks_configured: Whether the expected outcome defines at least
+                one deterministic check (see has_deterministic_checks)
+
+        Returns:
+            DECISION_PATH_DETERMINISTIC_FAIL, DECISION_PATH_DETERMINISTIC_PASS
+            or None
+        """
+        if not self.early_exit_enabled or validation_mode != 'hybrid':
+            return None
+        if not checks_configured or houndify_passed is None:
+            return None
+
+        if not houndify_passed and (not command_kind_matched or not entities_passed):
+            return DECISION_PATH_DETERMINISTIC_FAIL
+
+        if (
+            houndify_passed
+            and asr_confidence is not None
+            and asr_confidence >= self.min_asr_confidence
+        ):
+            return DECISION_PATH_DETERMINISTIC_PASS
+
+        return None
+
+    def is_borderline(self, score: float, pass_threshold: float) -> bool:
+        """Whether an evaluator score (0.0-1.0) is too close to call alone."""
+        return abs(score - pass_threshold) <= self.borderline_margin
+
+
+def get_decision_policy() -> DecisionPolicy:
+    """Return the decision policy configured in settings."""
+    settings = get_settings()
+    return DecisionPolicy(
+        early_exit_enabled=settings.VALIDATION_EARLY_EXIT_ENABLED,
+        min_asr_confidence=settings.VALIDATION_EARLY_EXIT_MIN_ASR_CONFIDENCE,
+        sequential_evaluators=settings.LLM_SEQUENTIAL_EVALUATORS,
+        borderline_margin=settings.LLM_BORDERLINE_MARGIN,
+    )
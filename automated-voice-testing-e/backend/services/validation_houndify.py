@@ -27,9 +27,9 @@ Example:
 from __future__ import annotations
 
 import logging
-import re
 from typing import Any, Dict, List, Optional
 
+from services.expected_outcome_matcher import ResponseContentMatcher, compile_response_content
 from validators.entity_validator import EntityValidator
 
 logger = logging.getLogger(__name__)
@@ -265,8 +265,9 @@ class ValidationHoundifyMixin:
     def _validate_response_content(
         self,
         ai_response: Optional[str],
-        expected_response_content: Optional[Dict[str, Any]],
+        expected_response_content: Optional[Dict[str, Any]] = None,
         forbidden_phrases: Optional[List[str]] = None,
+        matcher: Optional[ResponseContentMatcher] = None,
     ) -> Dict[str, Any]:
         """
         Validate AI response against expected content patterns.
@@ -284,6 +285,8 @@ class ValidationHoundifyMixin:
             ai_response: The AI's spoken response from Houndify
             expected_response_content: Dict with pattern definitions, or None
             forbidden_phrases: Additional forbidden phrases from ExpectedOutcome
+            matcher: Precompiled matcher (see get_outcome_matcher); when given,
+                expected_response_content and forbidden_phrases are ignored
 
         Returns:
             Dict with:
@@ -301,118 +304,9 @@ class ValidationHoundifyMixin:
             ... )
             >>> print(result['passed'])  # True
         """
-        result = {
-            'passed': True,
-            'errors': [],
-            'details': {
-                'contains': {'passed': True, 'matched': [], 'missing': []},
-                'not_contains': {'passed': True, 'found': []},
-                'regex': {'passed': True, 'matched': [], 'failed': []},
-                'regex_not_match': {'passed': True, 'found': []},
-                'forbidden_phrases': {'passed': True, 'found': []},
-            }
-        }
-
-        # If no expected content defined, auto-pass
-        if not expected_response_content:
-            logger.debug("No expected_response_content defined, auto-passing")
-            return result
-
-        # If expected_response_content is empty dict, auto-pass
-        if isinstance(expected_response_content, dict) and not expected_response_content:
-            logger.debug("Empty expected_response_content, auto-passing")
-            return result
-
-        # If no AI response to check against, fail if patterns expected
-        if not ai_response or not ai_response.strip():
-            result['passed'] = False
-            result['errors'].append("No AI response to validate")
-            logger.warning("No AI response provided for content validation")
-            return result
-
-        response_lower = ai_response.lower()
-
-        # Check 'contains' patterns
-        contains_patterns = expected_response_content.get('contains', [])
-        if contains_patterns and isinstance(contains_patterns, list):
-            for pattern in contains_patterns:
-                if not pattern:
-                    continue
-                pattern_lower = str(pattern).lower()
-                if pattern_lower in response_lower:
-                    result['details']['contains']['matched'].append(pattern)
-                else:
-                    result['details']['contains']['missing'].append(pattern)
-                    result['details']['contains']['passed'] = False
-                    result['passed'] = False
-                    result['errors'].append(f"Missing required phrase: '{pattern}'")
-
-        # Check 'not_contains' patterns
-        not_contains = expected_response_content.get('not_contains', [])
-        if not_contains and isinstance(not_contains, list):
-            for pattern in not_contains:
-                if not pattern:
-                    continue
-                pattern_lower = str(pattern).lower()
-                if pattern_lower in response_lower:
-                    result['details']['not_contains']['found'].append(pattern)
-                    result['details']['not_contains']['passed'] = False
-                    result['passed'] = False
-                    result['errors'].append(f"Found forbidden phrase: '{pattern}'")
-
-        # Check 'regex' patterns (must match)
-        regex_patterns = expected_response_content.get('regex', [])
-        if regex_patterns and isinstance(regex_patterns, list):
-            for pattern in regex_patterns:
-                if not pattern:
-                    continue
-                try:
-                    if re.search(pattern, ai_response, re.IGNORECASE):
-                        result['details']['regex']['matched'].append(pattern)
-                    else:
-                        result['details']['regex']['failed'].append(pattern)
-                        result['details']['regex']['passed'] = False
-                        result['passed'] = False
-                        result['errors'].append(f"Regex pattern not matched: '{pattern}'")
-                except re.error as e:
-                    logger.warning(f"Invalid regex pattern '{pattern}': {e}")
-                    result['errors'].append(f"Invalid regex pattern: '{pattern}'")
-
-        # Check 'regex_not_match' patterns (must NOT match)
-        regex_not_match = expected_response_content.get('regex_not_match', [])
-        if regex_not_match and isinstance(regex_not_match, list):
-            for pattern in regex_not_match:
-                if not pattern:
-                    continue
-                try:
-                    if re.search(pattern, ai_response, re.IGNORECASE):
-                        result['details']['regex_not_match']['found'].append(pattern)
-                        result['details']['regex_not_match']['passed'] = False
-                        result['passed'] = False
-                        result['errors'].append(
-                            f"Response matched forbidden regex: '{pattern}'"
-                        )
-                except re.error as e:
-                    logger.warning(f"Invalid regex pattern '{pattern}': {e}")
-
-        # Check forbidden_phrases from ExpectedOutcome
-        if forbidden_phrases and isinstance(forbidden_phrases, list):
-            for phrase in forbidden_phrases:
-                if not phrase:
-                    continue
-                phrase_lower = str(phrase).lower()
-                if phrase_lower in response_lower:
-                    result['details']['forbidden_phrases']['found'].append(phrase)
-                    result['details']['forbidden_phrases']['passed'] = False
-                    result['passed'] = False
-                    result['errors'].append(f"Found forbidden phrase: '{phrase}'")
-
-        logger.info(
-            f"Response content validation: passed={result['passed']}, "
-            f"errors={len(result['errors'])}"
-        )
-
-        return result
+        if matcher is None:
+            matcher = compile_response_content(expected_response_content, forbidden_phrases)
+        return matcher.validate(ai_response)
 
     def _validate_entities(
         self,
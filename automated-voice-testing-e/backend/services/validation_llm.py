@@ -28,6 +28,7 @@ from __future__ import annotations
 import logging
 import os
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from uuid import UUID
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +79,7 @@ class ValidationLLMMixin:
         user_utterance: str,
         ai_response: str,
         context: Optional[Dict[str, Any]] = None,
+        tenant_id: Optional[UUID] = None,
     ) -> "PipelineResult":
         """
         Run the three-stage LLM validation pipeline.
@@ -89,6 +91,7 @@ class ValidationLLMMixin:
             user_utterance: What the user said
             ai_response: What the voice AI responded
             context: Additional context (conversation history, step order)
+            tenant_id: Tenant that LLM evaluation cache hits are logged for
 
         Returns:
             PipelineResult with scores, decision, and confidence
@@ -109,6 +112,7 @@ class ValidationLLMMixin:
                 user_utterance=user_utterance,
                 ai_response=ai_response,
                 context=context,
+                tenant_id=tenant_id,
             )
 
             logger.info(
@@ -9,6 +9,7 @@ The service provides:
     - Task enqueueing: Add validation results to the queue with priority
     - Task retrieval: Get next validation task for a validator
     - Task claiming: Claim a validation task for a validator
+    - Atomic claiming: Claim the next task(s) in one round trip (SKIP LOCKED)
     - Task releasing: Release a claimed task back to the queue
     - Queue statistics: Get current queue metrics
 
@@ -32,11 +33,14 @@ Example:
     ...     validator_id=user_id,
     ...     language_code='es'
     ... )
+    >>>
+    >>> # Atomically claim the next task (safe with many concurrent validators)
+    >>> claimed = await service.claim_next(db=db, validator_id=user_id, language_code='es')
 """
 
 from typing import Optional, Dict, Any, List
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 
 from sqlalchemy import select, func, and_, or_
@@ -49,6 +53,13 @@ from models.multi_turn_execution import MultiTurnExecution, StepExecution
 from models.scenario_script import ScenarioScript, ScenarioStep
 from models.human_validation import HumanValidation
 from models.user import User
+from services.validation_queue_stats_cache import (
+    ValidationQueueStatsCache,
+    get_validation_queue_stats_cache,
+)
+
+# Upper bound on the number of tasks one claim_next call may take
+MAX_CLAIM_BATCH_SIZE = 50
 
 
 class ValidationQueueService:
@@ -63,10 +74,38 @@ class ValidationQueueService:
         enqueue_for_human_review: Add a validation result to the queue
         get_next_validation: Get the next validation task for a validator
         claim_validation: Claim a validation task for a validator
+        claim_next: Atomically claim the next pending task(s) for a validator
         release_validation: Release a claimed task back to the queue
         get_queue_stats: Get current queue statistics
+        invalidate_stats_cache: Mark cached queue statistics stale
     """
 
+    def __init__(self, stats_cache: Optional[ValidationQueueStatsCache] = None):
+        """
+        Initialize the service.
+
+        Args:
+            stats_cache: Queue statistics cache (defaults to the process-wide
+                cache; None when VALIDATION_QUEUE_STATS_CACHE_TTL_SECONDS is 0)
+        """
+        self._stats_cache = stats_cache
+
+    @property
+    def stats_cache(self) -> Optional[ValidationQueueStatsCache]:
+        """Cache used by get_queue_stats and invalidated on queue transitions."""
+        return self._stats_cache or get_validation_queue_stats_cache()
+
+    async def invalidate_stats_cache(self) -> None:
+        """
+        Mark cached queue statistics stale.
+
+        Called after every committed queue transition (enqueue, claim,
+        release, complete).
+        """
+        stats_cache = self.stats_cache
+        if stats_cache is not None:
+            await stats_cache.invalidate()
+
     async def enqueue_for_human_review(
         self,
         db: AsyncSession,
@@ -115,6 +154,7 @@ class ValidationQueueService:
         db.add(queue_item)
         await db.commit()
         await db.refresh(queue_item)
+        await self.invalidate_stats_cache()
 
         return queue_item
 
@@ -130,8 +170,11 @@ class ValidationQueueService:
 
         Retrieves the highest priority pending validation task, optionally
         matching the validator's language code. Tasks are ordered by:
-        1. Priority (ascending, 1 = highest)
-        2. Creation time (oldest first)
+        1. Language match (when language_code is given)
+        2. Priority (ascending, 1 = highest)
+        3. Creation time (oldest first)
+
+        The task is not claimed; use claim_next to take it atomically.
 
         Args:
             db: Async database session
@@ -150,7 +193,107 @@ class ValidationQueueService:
             >>> if next_task:
             ...     print(f"Task priority: {next_task.priority}")
         """
-        # Build base query for pending tasks
+        tasks = await self._select_pending(db, language_code, tenant_id, limit=1)
+        return tasks[0] if tasks else None
+
+    async def claim_next(
+        self,
+        db: AsyncSession,
+        validator_id: UUID,
+        language_code: Optional[str] = None,
+        tenant_id: Optional[UUID] = None,
+        limit: int = 1,
+    ) -> List[ValidationQueue]:
+        """
+        Atomically claim the next pending validation task(s) for a validator.
+
+        Selects and claims in a single transaction with
+        SELECT ... FOR UPDATE SKIP LOCKED: rows another validator is
+        claiming concurrently are skipped rather than waited on, so any
+        number of validators can poll at once and never receive the same
+        task. Ordering is the same as get_next_validation.
+
+        Args:
+            db: Async database session
+            validator_id: UUID of the validator claiming the tasks
+            language_code: Optional language code; matching tasks are claimed first
+            tenant_id: Optional tenant ID for filtering
+            limit: Number of tasks to claim (1 to MAX_CLAIM_BATCH_SIZE)
+
+        Returns:
+            List[ValidationQueue]: Claimed tasks (empty if the queue is empty)
+
+        Raises:
+            ValueError: If limit is outside 1..MAX_CLAIM_BATCH_SIZE
+
+        Example:
+            >>> tasks = await service.claim_next(
+            ...     db=db,
+            ...     validator_id=user_id,
+            ...     language_code='es',
+            ...     limit=5
+            ... )
+            >>> print(f"Claimed {len(tasks)} tasks")
+        """
+        if not 1 <= limit <= MAX_CLAIM_BATCH_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_CLAIM_BATCH_SIZE}")
+
+        tasks = await self._select_pending(db, language_code, tenant_id, limit=limit, lock=True)
+        if not tasks:
+            return []
+
+        claimed_at = datetime.utcnow()
+        for task in tasks:
+            task.status = 'claimed'
+            task.claimed_by = validator_id
+            task.claimed_at = claimed_at
+
+        await db.commit()
+        await self.invalidate_stats_cache()
+        return tasks
+
+    async def _select_pending(
+        self,
+        db: AsyncSession,
+        language_code: Optional[str],
+        tenant_id: Optional[UUID],
+        limit: int,
+        lock: bool = False,
+    ) -> List[ValidationQueue]:
+        """
+        Up to limit pending tasks in claim order: language matches first
+        (when a language is given), then priority (1 = highest), then oldest.
+
+        Every query is ordered by priority and created_at alone, so it walks
+        the partial index ix_validation_queue_pending_priority and stops
+        after limit rows. The language preference is a filter on a first
+        query; a second query fills the rest of the batch. With lock, rows
+        are taken with FOR UPDATE SKIP LOCKED.
+        """
+        queries = [self._pending_query(tenant_id)]
+        if language_code:
+            language_match = or_(
+                ValidationQueue.language_code == language_code,
+                ValidationQueue.language_code.like(f"{language_code}%")
+            )
+            queries.insert(0, queries[0].where(language_match))
+
+        tasks: List[ValidationQueue] = []
+        for query in queries:
+            if tasks:
+                query = query.where(ValidationQueue.id.notin_([task.id for task in tasks]))
+            query = query.limit(limit - len(tasks))
+            if lock:
+                query = query.with_for_update(skip_locked=True, of=ValidationQueue)
+            result = await db.execute(query)
+            tasks.extend(result.scalars().all())
+            if len(tasks) >= limit:
+                break
+        return tasks
+
+    @staticmethod
+    def _pending_query(tenant_id: Optional[UUID] = None):
+        """Pending tasks ordered by priority (1 = highest), then oldest."""
         query = select(ValidationQueue).where(
             ValidationQueue.status == 'pending'
         )
@@ -158,34 +301,10 @@ class ValidationQueueService:
             query = query.where(
                 ValidationQueue.validation_result.has(ValidationResult.tenant_id == tenant_id)
             )
-
-        # If language code provided, prefer matching tasks
-        if language_code:
-            # Try to find a task matching the language
-            language_query = query.where(
-                or_(
-                    ValidationQueue.language_code == language_code,
-                    ValidationQueue.language_code.like(f"{language_code}%")
-                )
-            ).order_by(
-                ValidationQueue.priority.asc(),
-                ValidationQueue.created_at.asc()
-            ).limit(1)
-
-            result = await db.execute(language_query)
-            task = result.scalar_one_or_none()
-
-            if task:
-                return task
-
-        # If no language match or no language specified, get any pending task
-        general_query = query.order_by(
+        return query.order_by(
             ValidationQueue.priority.asc(),
             ValidationQueue.created_at.asc()
-        ).limit(1)
-
-        result = await db.execute(general_query)
-        return result.scalar_one_or_none()
+        )
 
     async def get_validations_by_user(
         self,
@@ -282,13 +401,14 @@ class ValidationQueueService:
             >>> if success:
             ...     print("Task claimed successfully")
         """
-        # Find the queue item
+        # Find the queue item, locking it so concurrent claims serialize and
+        # all but the first see it as no longer pending
         query = select(ValidationQueue).where(
             and_(
                 ValidationQueue.id == queue_id,
                 ValidationQueue.status == 'pending'
             )
-        )
+        ).with_for_update(of=ValidationQueue)
         if tenant_id:
             query = query.where(
                 ValidationQueue.validation_result.has(ValidationResult.tenant_id == tenant_id)
@@ -306,6 +426,7 @@ class ValidationQueueService:
         queue_item.claimed_at = datetime.utcnow()
 
         await db.commit()
+        await self.invalidate_stats_cache()
         return True
 
     async def get_validation_data(
@@ -623,6 +744,7 @@ class ValidationQueueService:
         queue_item.claimed_at = None
 
         await db.commit()
+        await self.invalidate_stats_cache()
         return True
 
     async def get_queue_stats(
@@ -637,6 +759,10 @@ class ValidationQueueService:
         counts by status, priority distribution, language breakdown, throughput
         metrics, and SLA metrics.
 
+        Results are served from the shared statistics cache when possible;
+        it expires after VALIDATION_QUEUE_STATS_CACHE_TTL_SECONDS and on any
+        queue transition.
+
         Args:
             db: Async database session
             tenant_id: Optional tenant ID to filter statistics
@@ -665,198 +791,129 @@ class ValidationQueueService:
             >>> print(f"Throughput last hour: {stats['throughput']['last_hour']}")
             >>> print(f"Avg time to claim: {stats['sla']['avg_time_to_claim_seconds']}s")
         """
-        # Count by status
-        pending_query = select(func.count()).select_from(ValidationQueue).where(
-            ValidationQueue.status == 'pending'
-        )
-        if tenant_id:
-            pending_query = pending_query.where(
-                ValidationQueue.validation_result.has(ValidationResult.tenant_id == tenant_id)
-            )
-        claimed_query = select(func.count()).select_from(ValidationQueue).where(
-            ValidationQueue.status == 'claimed'
-        )
-        if tenant_id:
-            claimed_query = claimed_query.where(
-                ValidationQueue.validation_result.has(ValidationResult.tenant_id == tenant_id)
-            )
-        completed_query = select(func.count()).select_from(ValidationQueue).where(
-            ValidationQueue.status == 'completed'
-        )
-        if tenant_id:
-            completed_query = completed_query.where(
-                ValidationQueue.validation_result.has(ValidationResult.tenant_id == tenant_id)
-            )
-
-        pending_count = (await db.execute(pending_query)).scalar()
-        claimed_count = (await db.execute(claimed_query)).scalar()
-        completed_count = (await db.execute(completed_query)).scalar()
-
-        # Get priority distribution for pending tasks
-        priority_query = select(
-            ValidationQueue.priority,
-            func.count().label('count')
-        ).where(
-            ValidationQueue.status == 'pending'
-        ).group_by(
-            ValidationQueue.priority
-        ).order_by(
-            ValidationQueue.priority
-        )
-        if tenant_id:
-            priority_query = priority_query.where(
-                ValidationQueue.validation_result.has(ValidationResult.tenant_id == tenant_id)
-            )
-
-        priority_result = await db.execute(priority_query)
-        priority_distribution = {
-            row.priority: row.count
-            for row in priority_result
-        }
+        stats_cache = self.stats_cache
+        generation = None
+        if stats_cache is not None:
+            generation, cached = await stats_cache.get(tenant_id)
+            if cached is not None:
+                return cached
 
-        # Get language distribution for pending tasks
-        language_query = select(
-            ValidationQueue.language_code,
-            func.count().label('count')
-        ).where(
-            and_(
-                ValidationQueue.status == 'pending',
-                ValidationQueue.language_code.isnot(None)
-            )
-        ).group_by(
-            ValidationQueue.language_code
-        ).order_by(
-            func.count().desc()
-        ).limit(10)
-        if tenant_id:
-            language_query = language_query.where(
-                ValidationQueue.validation_result.has(ValidationResult.tenant_id == tenant_id)
-            )
+        stats = await self._compute_queue_stats(db, tenant_id)
 
-        language_result = await db.execute(language_query)
-        language_distribution = {
-            row.language_code: row.count
-            for row in language_result
-        }
+        if stats_cache is not None:
+            await stats_cache.set(tenant_id, generation, stats)
+        return stats
 
-        # Calculate throughput metrics
-        from datetime import datetime, timedelta
+    async def _compute_queue_stats(
+        self,
+        db: AsyncSession,
+        tenant_id: Optional[UUID] = None,
+    ) -> Dict[str, Any]:
+        """
+        Compute queue statistics with one grouped aggregation.
 
+        Rows are grouped by (status, priority, language_code), a few hundred
+        groups at most, and each group carries the FILTERed throughput counts
+        and SLA sums; the result is assembled from the groups.
+        """
         now = datetime.utcnow()
         one_hour_ago = now - timedelta(hours=1)
         one_day_ago = now - timedelta(hours=24)
         seven_days_ago = now - timedelta(days=7)
 
-        # Count completed validations in different time windows
+        completed = ValidationQueue.status == 'completed'
         # Using updated_at as a proxy for completion time
-        throughput_hour_query = select(func.count()).select_from(ValidationQueue).where(
-            and_(
-                ValidationQueue.status == 'completed',
-                ValidationQueue.updated_at >= one_hour_ago
-            )
+        time_to_claim = func.extract('epoch', ValidationQueue.claimed_at - ValidationQueue.created_at)
+        time_to_complete = func.extract('epoch', ValidationQueue.updated_at - ValidationQueue.claimed_at)
+        total_time = func.extract('epoch', ValidationQueue.updated_at - ValidationQueue.created_at)
+        claim_measured = and_(
+            ValidationQueue.claimed_at.isnot(None),
+            ValidationQueue.created_at.isnot(None)
         )
-        throughput_24h_query = select(func.count()).select_from(ValidationQueue).where(
-            and_(
-                ValidationQueue.status == 'completed',
-                ValidationQueue.updated_at >= one_day_ago
-            )
+        complete_measured = and_(
+            completed,
+            ValidationQueue.claimed_at.isnot(None),
+            ValidationQueue.updated_at.isnot(None)
         )
-        throughput_7d_query = select(func.count()).select_from(ValidationQueue).where(
-            and_(
-                ValidationQueue.status == 'completed',
-                ValidationQueue.updated_at >= seven_days_ago
-            )
+        total_measured = and_(
+            completed,
+            ValidationQueue.created_at.isnot(None),
+            ValidationQueue.updated_at.isnot(None)
         )
 
+        query = select(
+            ValidationQueue.status,
+            ValidationQueue.priority,
+            ValidationQueue.language_code,
+            func.count().label('count'),
+            func.count().filter(and_(completed, ValidationQueue.updated_at >= one_hour_ago)).label('last_hour'),
+            func.count().filter(and_(completed, ValidationQueue.updated_at >= one_day_ago)).label('last_24_hours'),
+            func.count().filter(and_(completed, ValidationQueue.updated_at >= seven_days_ago)).label('last_7_days'),
+            func.sum(time_to_claim).filter(claim_measured).label('claim_seconds'),
+            func.count().filter(claim_measured).label('claim_count'),
+            func.sum(time_to_complete).filter(complete_measured).label('complete_seconds'),
+            func.count().filter(complete_measured).label('complete_count'),
+            func.sum(total_time).filter(total_measured).label('total_seconds'),
+            func.count().filter(total_measured).label('total_measured_count'),
+        ).group_by(
+            ValidationQueue.status,
+            ValidationQueue.priority,
+            ValidationQueue.language_code
+        )
         if tenant_id:
-            throughput_hour_query = throughput_hour_query.where(
-                ValidationQueue.validation_result.has(ValidationResult.tenant_id == tenant_id)
-            )
-            throughput_24h_query = throughput_24h_query.where(
-                ValidationQueue.validation_result.has(ValidationResult.tenant_id == tenant_id)
-            )
-            throughput_7d_query = throughput_7d_query.where(
-                ValidationQueue.validation_result.has(ValidationResult.tenant_id == tenant_id)
-            )
-
-        completed_last_hour = (await db.execute(throughput_hour_query)).scalar() or 0
-        completed_last_24h = (await db.execute(throughput_24h_query)).scalar() or 0
-        completed_last_7d = (await db.execute(throughput_7d_query)).scalar() or 0
-
+            query = query.join(
+                ValidationResult, ValidationResult.id == ValidationQueue.validation_result_id
+            ).where(ValidationResult.tenant_id == tenant_id)
+
+        status_counts = {'pending': 0, 'claimed': 0, 'completed': 0}
+        priority_distribution: Dict[int, int] = {}
+        language_counts: Dict[str, int] = {}
+        totals = dict.fromkeys((
+            'last_hour', 'last_24_hours', 'last_7_days',
+            'claim_seconds', 'claim_count',
+            'complete_seconds', 'complete_count',
+            'total_seconds', 'total_measured_count',
+        ), 0)
+
+        for row in await db.execute(query):
+            if row.status in status_counts:
+                status_counts[row.status] += row.count
+            if row.status == 'pending':
+                priority_distribution[row.priority] = priority_distribution.get(row.priority, 0) + row.count
+                if row.language_code is not None:
+                    language_counts[row.language_code] = language_counts.get(row.language_code, 0) + row.count
+            for key in totals:
+                totals[key] += getattr(row, key) or 0
+
+        def _average(seconds_key: str, count_key: str) -> Optional[float]:
+            if not totals[count_key]:
+                return None
+            average = float(totals[seconds_key]) / totals[count_key]
+            return round(average, 2) if average else None
+
+        completed_last_7d = totals['last_7_days']
         # Calculate average per hour (based on 7-day data)
         avg_per_hour = round(completed_last_7d / (7 * 24), 2) if completed_last_7d > 0 else 0.0
 
-        # Calculate SLA metrics (time from created to claimed, claimed to completed)
-        # Get average time to claim (pending -> claimed)
-        sla_claim_query = select(
-            func.avg(
-                func.extract('epoch', ValidationQueue.claimed_at - ValidationQueue.created_at)
-            )
-        ).where(
-            and_(
-                ValidationQueue.claimed_at.isnot(None),
-                ValidationQueue.created_at.isnot(None)
-            )
-        )
-
-        # Get average time to complete (claimed -> completed)
-        sla_complete_query = select(
-            func.avg(
-                func.extract('epoch', ValidationQueue.updated_at - ValidationQueue.claimed_at)
-            )
-        ).where(
-            and_(
-                ValidationQueue.status == 'completed',
-                ValidationQueue.claimed_at.isnot(None),
-                ValidationQueue.updated_at.isnot(None)
-            )
-        )
-
-        # Get average total time (created -> completed)
-        sla_total_query = select(
-            func.avg(
-                func.extract('epoch', ValidationQueue.updated_at - ValidationQueue.created_at)
-            )
-        ).where(
-            and_(
-                ValidationQueue.status == 'completed',
-                ValidationQueue.created_at.isnot(None),
-                ValidationQueue.updated_at.isnot(None)
-            )
-        )
-
-        if tenant_id:
-            sla_claim_query = sla_claim_query.where(
-                ValidationQueue.validation_result.has(ValidationResult.tenant_id == tenant_id)
-            )
-            sla_complete_query = sla_complete_query.where(
-                ValidationQueue.validation_result.has(ValidationResult.tenant_id == tenant_id)
-            )
-            sla_total_query = sla_total_query.where(
-                ValidationQueue.validation_result.has(ValidationResult.tenant_id == tenant_id)
-            )
-
-        avg_time_to_claim = (await db.execute(sla_claim_query)).scalar()
-        avg_time_to_complete = (await db.execute(sla_complete_query)).scalar()
-        avg_total_time = (await db.execute(sla_total_query)).scalar()
-
         return {
-            'pending_count': pending_count or 0,
-            'claimed_count': claimed_count or 0,
-            'completed_count': completed_count or 0,
-            'total_count': (pending_count or 0) + (claimed_count or 0) + (completed_count or 0),
-            'priority_distribution': priority_distribution,
-            'language_distribution': language_distribution,
+            'pending_count': status_counts['pending'],
+            'claimed_count': status_counts['claimed'],
+            'completed_count': status_counts['completed'],
+            'total_count': sum(status_counts.values()),
+            'priority_distribution': dict(sorted(priority_distribution.items())),
+            'language_distribution': dict(
+                sorted(language_counts.items(), key=lambda item: item[1], reverse=True)[:10]
+            ),
             'throughput': {
-                'last_hour': completed_last_hour,
-                'last_24_hours': completed_last_24h,
+                'last_hour': totals['last_hour'],
+                'last_24_hours': totals['last_24_hours'],
                 'last_7_days': completed_last_7d,
                 'avg_per_hour': avg_per_hour
             },
             'sla': {
-                'avg_time_to_claim_seconds': round(avg_time_to_claim, 2) if avg_time_to_claim else None,
-                'avg_time_to_complete_seconds': round(avg_time_to_complete, 2) if avg_time_to_complete else None,
-                'avg_total_time_seconds': round(avg_total_time, 2) if avg_total_time else None
+                'avg_time_to_claim_seconds': _average('claim_seconds', 'claim_count'),
+                'avg_time_to_complete_seconds': _average('complete_seconds', 'complete_count'),
+                'avg_total_time_seconds': _average('total_seconds', 'total_measured_count')
             }
         }
 
@@ -0,0 +1,138 @@
+"""
+Short-lived shared cache of validation queue statistics.
+
+The validator UI polls queue statistics from every open tab. Cached
+results are shared by all API workers through Redis and live for
+VALIDATION_QUEUE_STATS_CACHE_TTL_SECONDS, so the aggregation runs at most
+about once per TTL per tenant however many clients poll.
+
+Entries are keyed by a generation number that every queue transition
+(enqueue, claim, release, complete) increments, so a transition makes all
+tenants' cached statistics stale at once without knowing which tenant the
+item belongs to:
+
+    validation_queue:stats:generation           -> N
+    validation_queue:stats:{N}:{tenant_id|all}  -> stats JSON
+
+Reading the generation and the entry is one atomic script call. An entry
+computed while a transition happens is stored under the old generation
+and never read.
+
+The cache is an optimisation: Redis errors are logged, Redis is skipped
+for REDIS_RETRY_SECONDS, and statistics are computed from the database.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from api.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "validation_queue:stats:"
+GENERATION_KEY = REDIS_KEY_PREFIX + "generation"
+
+# Seconds to skip Redis after an error
+REDIS_RETRY_SECONDS = 30.0
+
+# KEYS[1] = generation key; ARGV[1] = entry key prefix, ARGV[2] = scope
+READ_SCRIPT = """
+local generation = redis.call('GET', KEYS[1]) or '0'
+return {generation, redis.call('GET', ARGV[1] .. generation .. ':' .. ARGV[2])}
+"""
+
+INVALIDATE_SCRIPT = "return redis.call('INCR', KEYS[1])"
+
+
+class ValidationQueueStatsCache:
+    """
+    Redis cache of get_queue_stats results, invalidated on queue transitions.
+
+    Attributes:
+        ttl_seconds: Lifetime of a cached statistics entry
+    """
+
+    def __init__(self, redis_client: Optional[Any] = None, ttl_seconds: int = 5):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_client: RedisClient-compatible client (defaults to the global client)
+            ttl_seconds: Lifetime of a cached statistics entry
+        """
+        self._redis_client = redis_client
+        self.ttl_seconds = ttl_seconds
+        self._redis_retry_at = 0.0
+
+    async def get(self, tenant_id: Optional[UUID]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Look up cached statistics for a tenant (None for all tenants).
+
+        Returns:
+            (generation, stats): generation to pass to set() on a miss (None
+            if Redis is unavailable) and the cached statistics, or None
+        """
+        result = await self._redis_call(
+            "eval", READ_SCRIPT, [GENERATION_KEY], [REDIS_KEY_PREFIX, self._scope(tenant_id)]
+        )
+        if not result:
+            return None, None
+
+        generation, value = result[0], result[1] if len(result) > 1 else None
+        return generation, json.loads(value) if value else None
+
+    async def set(self, tenant_id: Optional[UUID], generation: Optional[str], stats: Dict[str, Any]) -> None:
+        """Store statistics computed while generation was current."""
+        if generation is None:
+            return
+        await self._redis_call(
+            "set",
+            f"{REDIS_KEY_PREFIX}{generation}:{self._scope(tenant_id)}",
+            json.dumps(stats),
+            ttl=self.ttl_seconds,
+        )
+
+    async def invalidate(self) -> None:
+        """Make every cached entry stale (call after a queue transition commits)."""
+        await self._redis_call("eval", INVALIDATE_SCRIPT, [GENERATION_KEY], [])
+
+    @staticmethod
+    def _scope(tenant_id: Optional[UUID]) -> str:
+        return str(tenant_id) if tenant_id else "all"
+
+    async def _redis_call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call a Redis client method, skipping Redis for a while after an error."""
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        try:
+            if self._redis_client is None:
+                from api.redis_client import get_redis
+                self._redis_client = await get_redis().__anext__()
+            return await getattr(self._redis_client, method)(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"Validation queue stats cache Redis {method} failed: {e}")
+            self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+            return None
+
+
+_stats_cache: Optional[ValidationQueueStatsCache] = None
+
+
+def get_validation_queue_stats_cache() -> Optional[ValidationQueueStatsCache]:
+    """
+    Return the process-wide queue statistics cache (None when disabled).
+
+    Configured by VALIDATION_QUEUE_STATS_CACHE_TTL_SECONDS (0 disables).
+    """
+    global _stats_cache
+    ttl_seconds = get_settings().VALIDATION_QUEUE_STATS_CACHE_TTL_SECONDS
+    if ttl_seconds <= 0:
+        return None
+    if _stats_cache is None:
+        _stats_cache = ValidationQueueStatsCache(ttl_seconds=ttl_seconds)
+    return _stats_cache
@@ -63,6 +63,12 @@ except ImportError:  # pragma: no cover
         raise RuntimeError("Database session factory unavailable")
 
 # Import mixins
+from services.expected_outcome_matcher import get_outcome_matcher
+from services.validation_decision_policy import (
+    DECISION_PATH_HOUNDIFY_ONLY,
+    get_decision_policy,
+    has_deterministic_checks,
+)
 from services.validation_houndify import ValidationHoundifyMixin
 from services.validation_llm import ValidationLLMMixin
 
@@ -216,6 +222,7 @@ class ValidationService(
         houndify_data = self._extract_houndify_data(execution_context)
 
         command_kind_match_score = None
+        asr_confidence = None
         asr_confidence_score = None
         ai_spoken_response = None
 
@@ -244,39 +251,10 @@ class ValidationService(
         # Validate response content patterns (deterministic check)
         # This validates AI's spoken response against expected patterns
 
-        # Check if language_variations exists and language_code is provided
-        language_variations = getattr(expected_outcome, 'language_variations', None)
-        if language_code and language_variations and isinstance(language_variations, dict):
-            # Extract language-specific expected response patterns
-            lang_variation = language_variations.get(language_code, {})
-            if lang_variation and 'expected_response_patterns' in lang_variation:
-                expected_response_content = lang_variation['expected_response_patterns']
-                logger.info(
-                    f"Using language-specific validation patterns for {language_code}: "
-                    f"{expected_response_content}"
-                )
-            else:
-                # Fall back to default expected_response_content
-                expected_response_content = getattr(
-                    expected_outcome, 'expected_response_content', None
-                )
-                logger.debug(
-                    f"No language-specific patterns found for {language_code}, "
-                    f"using default expected_response_content"
-                )
-        else:
-            # No language variations or language_code, use default
-            expected_response_content = getattr(
-                expected_outcome, 'expected_response_content', None
-            )
-
-        forbidden_phrases = getattr(
-            expected_outcome, 'forbidden_phrases', None
-        )
+        # Rules (with language_variations resolved) are compiled once per outcome
         response_content_result = self._validate_response_content(
             ai_response=ai_spoken_response,
-            expected_response_content=expected_response_content,
-            forbidden_phrases=forbidden_phrases,
+            matcher=get_outcome_matcher(expected_outcome, language_code),
         )
 
         # Validate entities (compare expected vs actual)
@@ -298,17 +276,40 @@ class ValidationService(
         tasks = []
         run_houndify = validation_mode in ('houndify', 'hybrid')
         run_llm = validation_mode in ('llm_ensemble', 'hybrid')
+        decision_path = None if run_llm else DECISION_PATH_HOUNDIFY_ONLY
+        houndify_kwargs = dict(
+            command_kind_match_score=command_kind_match_score,
+            asr_confidence_score=asr_confidence_score,
+            response_content_result=response_content_result,
+            entity_validation_result=entity_validation_result,
+            expected_entities=expected_entities,
+            actual_entities=actual_entities,
+            expected_outcome_id=str(expected_outcome.id) if expected_outcome else None,
+        )
+        validation_start_time = time.time()
+
+        # Houndify checks are local and fast: when the decision policy may
+        # skip the LLM, run them first so a conclusive result avoids the call
+        policy = get_decision_policy()
+        if run_houndify and run_llm and policy.early_exit_enabled:
+            houndify_passed, houndify_result = await self._run_houndify_validation(**houndify_kwargs)
+            run_houndify = False
+            decision_path = policy.deterministic_path(
+                validation_mode=validation_mode,
+                houndify_passed=houndify_passed,
+                command_kind_matched=houndify_result['command_kind_match'],
+                entities_passed=entity_validation_result['passed'],
+                asr_confidence=asr_confidence,
+                checks_configured=has_deterministic_checks(
+                    expected_outcome.expected_command_kind, expected_entities
+                ),
+            )
+            if decision_path is not None:
+                run_llm = False
+                logger.info("LLM validation skipped (%s)", decision_path)
 
         if run_houndify:
-            houndify_task = self._run_houndify_validation(
-                command_kind_match_score=command_kind_match_score,
-                asr_confidence_score=asr_confidence_score,
-                response_content_result=response_content_result,
-                entity_validation_result=entity_validation_result,
-                expected_entities=expected_entities,
-                actual_entities=actual_entities,
-                expected_outcome_id=str(expected_outcome.id) if expected_outcome else None,
-            )
+            houndify_task = self._run_houndify_validation(**houndify_kwargs)
             tasks.append(('houndify', houndify_task))
 
         if run_llm:
@@ -326,11 +327,10 @@ class ValidationService(
 
         # Execute tasks in parallel and track wall-clock time
         # For parallel execution, total time ≈ max(Houndify, LLM), not sum
-        if tasks:
-            parallel_start_time = time.time()
+        if tasks or houndify_result:
             task_coros = [task[1] for task in tasks]
             results = await asyncio.gather(*task_coros, return_exceptions=True)
-            total_validation_latency_ms = int((time.time() - parallel_start_time) * 1000)
+            total_validation_latency_ms = int((time.time() - validation_start_time) * 1000)
 
             # Process results
             for i, (task_name, _) in enumerate(tasks):
@@ -372,6 +372,12 @@ class ValidationService(
                     llm_score=llm_result.final_score,
                     validation_mode=validation_mode,
                 )
+            elif decision_path is not None:
+                # Deterministic early exit: Houndify alone decides
+                final_decision = 'pass' if houndify_passed else 'fail'
+
+        if llm_result is not None:
+            decision_path = llm_result.decision_path
 
         # Compute review status
         if llm_result is not None:
@@ -412,6 +418,7 @@ class ValidationService(
             ensemble_result=ensemble_result,
             final_decision=final_decision,
             review_status=review_status,
+            decision_path=decision_path,
         )
         validation_result.multi_turn_execution_id = execution_id
         validation_result.expected_outcome_id = expected_outcome_id
@@ -595,6 +602,7 @@ class ValidationService(
             user_utterance=transcript,  # What user said (ASR transcription)
             ai_response=ai_spoken_response or transcript,  # What AI said back
             context=llm_context,
+            tenant_id=getattr(expected_outcome, 'tenant_id', None),
         )
 
         llm_passed = llm_result.final_decision == 'pass'
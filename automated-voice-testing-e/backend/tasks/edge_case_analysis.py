@@ -38,6 +38,7 @@ from services.edge_case_similarity_service import EdgeCaseSimilarityService
 from services.pattern_analysis_config_service import PatternAnalysisConfigService
 from services.notification_service import NotificationService
 from api.database import get_async_session
+from tasks.runtime import run_async
 import logging
 
 logger = logging.getLogger(__name__)
@@ -75,8 +76,7 @@ def analyze_edge_case_patterns(
             override_params={"lookback_days": 14}
         )
     """
-    import asyncio
-    return asyncio.run(_analyze_with_tenant_config(tenant_id, override_params))
+    return run_async(_analyze_with_tenant_config(tenant_id, override_params))
 
 
 async def _analyze_with_tenant_config(
@@ -432,8 +432,7 @@ def cleanup_old_patterns(days_inactive: int = 90) -> Dict[str, Any]:
     Returns:
         Dict with cleanup statistics
     """
-    import asyncio
-    return asyncio.run(_cleanup_old_patterns_async(days_inactive))
+    return run_async(_cleanup_old_patterns_async(days_inactive))
 
 
 async def _cleanup_old_patterns_async(days_inactive: int) -> Dict[str, Any]:
@@ -11,17 +11,20 @@ Handles:
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
+from api.config import get_settings
 from api.database import SessionLocal
 from celery import chord, group
 from celery_app import celery
 from models.scenario_script import ScenarioScript
 from models.suite_run import SuiteRun
-from services.multi_turn_execution_service import MultiTurnExecutionService
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session as SyncSession
+from tasks.runtime import get_multi_turn_execution_service, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -85,15 +88,17 @@ def execute_scenario(
             if not suite_run:
                 raise RuntimeError(f"Suite run {suite_run_uuid} not found")
 
-            # Use MultiTurnExecutionService for all scenario executions
-            service = MultiTurnExecutionService()
+            # Use the worker's shared MultiTurnExecutionService for all scenario executions
+            service = get_multi_turn_execution_service()
 
+            # LLM validation runs in batch in validate_multi_turn_execution
             execution = await service.execute_scenario(
                 db=session,
                 script_id=script_uuid,
                 suite_run_id=suite_run_uuid,
                 tenant_id=suite_run.tenant_id,
                 language_codes=[language_code] if language_code else None,
+                defer_llm_validation=True,
             )
 
             execution_result = {
@@ -109,7 +114,7 @@ def execute_scenario(
 
             await session.commit()
 
-    asyncio.run(_execute())
+    run_async(_execute())
 
     if not execution_result:
         raise RuntimeError("Scenario execution produced no results")
@@ -184,7 +189,18 @@ def execute_test_batch(
 
     run_inline = bool(config.get("run_inline"))
     if run_inline:
+        concurrency = _resolve_inline_concurrency(per_task_config)
+        started = time.perf_counter()
         inline_results = _run_inline_batch(test_case_ids, per_task_config, languages)
+        throughput = _build_throughput(len(inline_results), time.perf_counter() - started, concurrency)
+        logger.info(
+            "Inline batch %s: %s executions in %.1fs (%.1f scenarios/min, concurrency=%s)",
+            batch_id,
+            len(inline_results),
+            throughput['wall_clock_seconds'],
+            throughput['scenarios_per_minute'],
+            concurrency,
+        )
         return {
             'batch_id': batch_id,
             'total': total_executions,
@@ -192,6 +208,7 @@ def execute_test_batch(
             'completed': len(inline_results),
             'task_ids': [],
             'results': inline_results,
+            'throughput': throughput,
             'mode': 'inline',
             'message': 'Batch execution completed inline'
         }
@@ -255,7 +272,7 @@ def _get_scenario(script_id):
             return scenario
 
     try:
-        return asyncio.run(_fetch())
+        return run_async(_fetch())
     except Exception as exc:
         logger.error("Failed to fetch scenario %s: %s", script_id, exc)
         return None
@@ -268,6 +285,15 @@ def _run_inline_batch(
 ) -> list[dict[str, Any]]:
     """
     Execute the batch inline for immediate aggregation.
+
+    Executions run concurrently on this worker, bounded by
+    ``inline_concurrency`` in the config (default: settings
+    EXECUTION_INLINE_CONCURRENCY). Each execution uses its own session and
+    commits independently. The batch is the only writer of the suite run
+    counters: executions do not recount the run, and the counters are
+    incremented once at the end for every execution that finished. If any
+    execution raised, the first error is re-raised after the counters are
+    updated.
     """
     suite_run_id = config.get("suite_run_id")
     if not suite_run_id:
@@ -282,36 +308,87 @@ def _run_inline_batch(
     execution_languages = languages or [
         config.get("language_code") or config.get("language") or "en-US"
     ]
+    concurrency = _resolve_inline_concurrency(config)
+
+    async def _run_one(service, semaphore, tenant_id, case_id, language_code):
+        async with semaphore:
+            # AsyncSession is not safe for concurrent use; one per execution
+            async with SessionLocal() as session:
+                execution = await service.execute_scenario(
+                    db=session,
+                    script_id=UUID(case_id),
+                    suite_run_id=suite_run_uuid,
+                    tenant_id=tenant_id,
+                    language_codes=[language_code] if language_code else None,
+                    # Counters are incremented below; a recount per execution
+                    # would race them
+                    update_suite_run=False,
+                )
+                await session.commit()
+                return _build_execution_payload(execution)
 
-    async def _run_serial():
+    async def _run_concurrent():
         async with SessionLocal() as session:
             # Load suite run to get tenant_id
             suite_run = await session.get(SuiteRun, suite_run_uuid)
             if not suite_run:
                 raise RuntimeError(f"Suite run {suite_run_uuid} not found")
+            tenant_id = suite_run.tenant_id
+
+        service = get_multi_turn_execution_service()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # Results keep test_case_ids x languages order regardless of completion order
+        outcomes = await asyncio.gather(
+            *(
+                _run_one(service, semaphore, tenant_id, case_id, language_code)
+                for case_id in test_case_ids
+                for language_code in execution_languages
+            ),
+            return_exceptions=True,
+        )
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        inline_results.extend(outcome for outcome in outcomes if not isinstance(outcome, BaseException))
 
-            service = MultiTurnExecutionService()
-
-            for case_id in test_case_ids:
-                for language_code in execution_languages:
-                    execution = await service.execute_scenario(
-                        db=session,
-                        script_id=UUID(case_id),
-                        suite_run_id=suite_run_uuid,
-                        tenant_id=suite_run.tenant_id,
-                        language_codes=[language_code] if language_code else None,
-                    )
-                    inline_results.append(_build_execution_payload(execution))
-
-            await session.commit()
+        async with SessionLocal() as session:
             await _update_suite_run_statistics_async(session, suite_run_uuid, inline_results)
             summary = _summarize_result_buckets(inline_results)
             await _maybe_finalize_suite_run_async(session, suite_run_uuid, summary)
 
-    asyncio.run(_run_serial())
+        if errors:
+            logger.error(
+                "Inline batch for suite run %s: %s of %s executions failed",
+                suite_run_uuid,
+                len(errors),
+                len(outcomes),
+            )
+            raise errors[0]
+
+    run_async(_run_concurrent())
     return inline_results
 
 
+def _resolve_inline_concurrency(config: dict[str, Any]) -> int:
+    """Return the inline batch concurrency from config or settings (at least 1)."""
+    value = config.get("inline_concurrency")
+    if value is None:
+        value = get_settings().EXECUTION_INLINE_CONCURRENCY
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        return 1
+
+
+def _build_throughput(executions: int, elapsed_seconds: float, concurrency: int) -> dict[str, Any]:
+    """Summarize inline batch throughput for this worker."""
+    return {
+        'executions': executions,
+        'wall_clock_seconds': round(elapsed_seconds, 3),
+        'scenarios_per_minute': round(executions * 60 / elapsed_seconds, 2) if elapsed_seconds > 0 else 0.0,
+        'concurrency': concurrency,
+    }
+
+
 def _build_execution_payload(execution) -> dict[str, Any]:
     """Normalize execution details into a serializable dictionary."""
     status = getattr(execution, "status", "completed")
@@ -391,25 +468,31 @@ async def _update_suite_run_statistics_async(
     """
     Update SuiteRun counters (passed/failed/skipped) from inline executions.
     (Async version)
+
+    Counters are incremented in a single UPDATE so concurrent batches and
+    finalize callbacks for the same suite run cannot lose each other's counts.
     """
     if not execution_results:
         return
 
-    try:
-        suite_run = await session.get(SuiteRun, suite_run_id)
-    except Exception as exc:
-        logger.error("Unable to load SuiteRun %s: %s", suite_run_id, exc)
-        return
-
-    if not suite_run:
-        logger.warning("SuiteRun %s not found for inline update", suite_run_id)
-        return
-
-    for result in execution_results:
-        bucket = _bucket_status(result.get("status"))
-        _increment_suite_run_bucket(suite_run, bucket)
+    summary = _summarize_result_buckets(execution_results)
+    statement = (
+        update(SuiteRun)
+        .where(SuiteRun.id == suite_run_id)
+        .values(
+            passed_tests=func.coalesce(SuiteRun.passed_tests, 0) + summary["passed"],
+            failed_tests=func.coalesce(SuiteRun.failed_tests, 0) + summary["failed"],
+            skipped_tests=func.coalesce(SuiteRun.skipped_tests, 0) + summary["skipped"],
+        )
+        .execution_options(synchronize_session=False)
+    )
 
     try:
+        result = await session.execute(statement)
+        if not result.rowcount:
+            logger.warning("SuiteRun %s not found for inline update", suite_run_id)
+            await session.rollback()
+            return
         await session.commit()
     except Exception as exc:
         await session.rollback()
@@ -424,9 +507,17 @@ async def _maybe_finalize_suite_run_async(
     """
     Mark the SuiteRun completed/failed if all executions are accounted for.
     (Async version)
+
+    The row is re-read with a lock so counters written by other sessions
+    are visible and only one finalizer marks the run complete.
     """
     try:
-        suite_run = await session.get(SuiteRun, suite_run_id)
+        suite_run = await session.get(
+            SuiteRun,
+            suite_run_id,
+            populate_existing=True,
+            with_for_update=True,
+        )
     except Exception as exc:
         logger.error("Unable to refresh SuiteRun %s for completion: %s", suite_run_id, exc)
         return
@@ -442,7 +533,8 @@ async def _maybe_finalize_suite_run_async(
     if suite_run.total_tests and total_recorded < suite_run.total_tests:
         return
 
-    if summary.get("failed"):
+    # Other batches of the same run may have recorded failures
+    if summary.get("failed") or suite_run.failed_tests:
         suite_run.mark_as_failed()
     else:
         suite_run.mark_as_completed()
@@ -579,7 +671,7 @@ def finalize_batch_execution(
             await _update_suite_run_statistics_async(session, run_uuid, flattened_results)
             await _maybe_finalize_suite_run_async(session, run_uuid, summary)
 
-    asyncio.run(_apply())
+    run_async(_apply())
 
     return {
         "suite_run_id": suite_run_id,
@@ -12,9 +12,10 @@ Handles:
 
 from celery_app import celery
 from typing import Dict, Any, List, Optional
-import asyncio
 import logging
 
+from tasks.runtime import run_async
+
 logger = logging.getLogger(__name__)
 
 
@@ -120,7 +121,7 @@ def sync_all_jira_defects(self, tenant_id: Optional[str] = None) -> Dict[str, An
             for defect in td_list:
                 try:
                     # Fetch current status from Jira
-                    jira_issue = asyncio.run(
+                    jira_issue = run_async(
                         jira_client.get_issue(
                             issue_key=defect.jira_issue_key,
                             params={"fields": "status"},
@@ -382,7 +383,7 @@ def send_slack_notification(
 
         # Send appropriate notification type with interactive buttons
         if notification_type == "test_result":
-            result = asyncio.run(client.send_interactive_test_result(
+            result = run_async(client.send_interactive_test_result(
                 suite_run_id=payload.get("suite_run_id", ""),
                 suite_name=payload.get("suite_name", "Test Suite"),
                 status=payload.get("status", "warning"),
@@ -394,7 +395,7 @@ def send_slack_notification(
             ))
 
         elif notification_type == "defect":
-            result = asyncio.run(client.send_interactive_defect_alert(
+            result = run_async(client.send_interactive_defect_alert(
                 defect_id=payload.get("defect_id", ""),
                 title=payload.get("title", "New Defect"),
                 severity=payload.get("severity", "medium"),
@@ -404,7 +405,7 @@ def send_slack_notification(
             ))
 
         elif notification_type == "edge_case":
-            result = asyncio.run(client.send_interactive_edge_case_alert(
+            result = run_async(client.send_interactive_edge_case_alert(
                 edge_case_id=payload.get("edge_case_id", ""),
                 title=payload.get("title", "New Edge Case"),
                 category=payload.get("category", "uncategorized"),
@@ -416,7 +417,7 @@ def send_slack_notification(
             ))
 
         elif notification_type == "system_alert":
-            result = asyncio.run(client.send_system_alert(
+            result = run_async(client.send_system_alert(
                 severity=payload.get("severity", "info"),
                 title=payload.get("title", "System Alert"),
                 message=payload.get("message", ""),
@@ -426,7 +427,7 @@ def send_slack_notification(
 
         else:
             # Generic message
-            result = asyncio.run(client.send_message(
+            result = run_async(client.send_message(
                 text=payload.get("text", "Notification"),
                 channel=payload.get("channel"),
             ))
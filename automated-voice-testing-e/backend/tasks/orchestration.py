@@ -11,9 +11,9 @@ Handles high-level coordination of test runs, including:
 
 from celery_app import celery
 from typing import List, Dict, Any, Optional
-import asyncio
 from api.events import emit_suite_run_update
 from services.notification_service import get_notification_service, NotificationServiceError
+from tasks.runtime import run_async
 
 
 @celery.task(name='tasks.orchestration.create_suite_run', bind=True)
@@ -146,7 +146,7 @@ def create_suite_run(
 
             # STEP 6: Emit real-time event
             try:
-                asyncio.run(emit_suite_run_update(
+                run_async(emit_suite_run_update(
                     suite_run_id=suite_run.id,
                     data={
                         'status': 'pending',
@@ -261,7 +261,7 @@ def schedule_test_executions(
         # Emit real-time event
         try:
             from uuid import UUID
-            asyncio.run(emit_suite_run_update(
+            run_async(emit_suite_run_update(
                 suite_run_id=UUID(suite_run_id),
                 data={
                     'status': 'running',
@@ -475,7 +475,7 @@ def aggregate_results(
 
         # STEP 4: Emit real-time event
         try:
-            asyncio.run(emit_suite_run_update(
+            run_async(emit_suite_run_update(
                 suite_run_id=UUID(suite_run_id),
                 data={
                     'status': overall_status,
@@ -497,7 +497,7 @@ def aggregate_results(
                 notification_service = get_notification_service()
                 run_url = f"/suite-runs/{suite_run_id}"  # Relative URL for frontend
                 notification_status = "success" if overall_status == "completed" else "failure"
-                asyncio.run(notification_service.notify_test_run_result(
+                run_async(notification_service.notify_test_run_result(
                     status=notification_status,
                     passed=passed_tests,
                     failed=failed_tests,
@@ -622,7 +622,7 @@ def schedule_suite_run(
 
         # Emit real-time event to subscribed clients
         try:
-            asyncio.run(emit_suite_run_update(
+            run_async(emit_suite_run_update(
                 suite_run_id=run_id,
                 data={
                     'status': 'scheduled',
@@ -735,7 +735,7 @@ def monitor_suite_run_progress(
                 duration_seconds = 0.0
                 if suite_run.started_at and suite_run.completed_at:
                     duration_seconds = (suite_run.completed_at - suite_run.started_at).total_seconds()
-                asyncio.run(notification_service.notify_test_run_result(
+                run_async(notification_service.notify_test_run_result(
                     status=notification_status,
                     passed=suite_run.passed_tests or 0,
                     failed=suite_run.failed_tests or 0,
@@ -765,7 +765,7 @@ def monitor_suite_run_progress(
 
         # Emit real-time progress update to subscribed clients
         try:
-            asyncio.run(emit_suite_run_update(
+            run_async(emit_suite_run_update(
                 suite_run_id=run_id,
                 data={
                     'status': response_data['status'],
@@ -4,7 +4,6 @@ Celery tasks for automatic regression suite execution and detection.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any, Dict, Optional
 from uuid import UUID
@@ -14,6 +13,7 @@ from api.config import get_settings
 from api.database import SessionLocal
 from services.regression_suite_executor import RegressionSuiteExecutor
 from services.smart_regression_detector import SmartRegressionDetector
+from tasks.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +40,7 @@ def run_regression_suite(self, trigger: str = "scheduled", metadata: Optional[Di
         return {"status": "disabled", "reason": "automation disabled"}
 
     try:
-        result = asyncio.run(
+        result = run_async(
             _execute_regression_suite(
                 settings=settings,
                 trigger=trigger,
@@ -96,7 +96,7 @@ def detect_suite_regressions(
             return findings
 
     try:
-        findings = asyncio.run(_detect())
+        findings = run_async(_detect())
 
         logger.info(
             f"Regression detection completed for suite {suite_run_id}: "
@@ -0,0 +1,203 @@
+"""
+Worker Runtime
+
+Long-lived asyncio runtime shared by the Celery tasks of one worker process.
+
+Tasks used to call ``asyncio.run()`` for every invocation, which created a
+new event loop per task. Because asyncpg connections are bound to the loop
+that opened them, the SQLAlchemy pool could never hand a connection to the
+next task, and every service (TTS, S3 client, Houndify client, noise
+library) was rebuilt per scenario.
+
+This module keeps one event loop per worker process running in a
+background thread. Synchronous task code submits coroutines to it with
+``run_async()``, so the database pool and any loop-bound state survive
+between tasks. Expensive services are created lazily once per process via
+``get_worker_service()``.
+
+The runtime is started on ``worker_process_init`` and torn down (database
+engines disposed, loop stopped) on ``worker_process_shutdown``. Outside a
+Celery worker (eager mode, scripts) it is created on first use.
+
+Usage:
+    from tasks.runtime import run_async, get_multi_turn_execution_service
+
+    result = run_async(some_coroutine())
+    service = get_multi_turn_execution_service()
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from celery.signals import worker_process_init, worker_process_shutdown
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SHUTDOWN_TIMEOUT_SECONDS = 30
+
+
+class WorkerRuntime:
+    """
+    Event loop running in a daemon thread plus a per-process service registry.
+
+    Attributes:
+        loop: The long-lived event loop
+        pid: Process that created the runtime (a forked child must not reuse it)
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.pid = os.getpid()
+        self._services: Dict[str, Any] = {}
+        self._services_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            name="worker-runtime-loop",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread.is_alive() and not self.loop.is_closed()
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """
+        Run a coroutine on the runtime loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to execute
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            RuntimeError: If called from the runtime loop thread itself
+            Exception: Any exception raised by the coroutine
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("run_async() cannot be called from the worker runtime loop")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def get_service(self, name: str, factory: Callable[[], T]) -> T:
+        """
+        Return the process-wide instance registered under ``name``.
+
+        The factory is called at most once per runtime.
+
+        Args:
+            name: Registry key
+            factory: Zero-argument callable building the service
+
+        Returns:
+            The cached service instance
+        """
+        service = self._services.get(name)
+        if service is None:
+            with self._services_lock:
+                service = self._services.get(name)
+                if service is None:
+                    service = factory()
+                    self._services[name] = service
+                    logger.info("Initialised worker service %s", name)
+        return service
+
+    def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT_SECONDS) -> None:
+        """Dispose database engines, stop the loop and join its thread."""
+        if not self.is_running:
+            return
+
+        try:
+            from api.database import dispose_engine
+            self.run(asyncio.wait_for(dispose_engine(), timeout))
+        except Exception as exc:
+            logger.warning("Failed to dispose database engines on shutdown: %s", exc)
+
+        self._services.clear()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self.loop.close()
+
+
+_runtime: Optional[WorkerRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_worker_runtime() -> WorkerRuntime:
+    """
+    Return this process's runtime, creating it on first use.
+
+    A runtime inherited from a parent process through fork is discarded,
+    since its loop thread does not exist in the child.
+    """
+    global _runtime
+    runtime = _runtime
+    if runtime is None or runtime.pid != os.getpid() or not runtime.is_running:
+        with _runtime_lock:
+            runtime = _runtime
+            if runtime is None or runtime.pid != os.getpid() or not runtime.is_running:
+                runtime = WorkerRuntime()
+                _runtime = runtime
+    return runtime
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """
+    Run a coroutine on the worker's persistent event loop.
+
+    Drop-in replacement for ``asyncio.run()`` inside Celery tasks.
+    """
+    return get_worker_runtime().run(coro)
+
+
+def get_worker_service(name: str, factory: Callable[[], T]) -> T:
+    """Return a lazily created service instance shared by all tasks in this process."""
+    return get_worker_runtime().get_service(name, factory)
+
+
+def get_multi_turn_execution_service():
+    """Return the worker's shared MultiTurnExecutionService."""
+    from services.multi_turn_execution_service import MultiTurnExecutionService
+    return get_worker_service("multi_turn_execution", MultiTurnExecutionService)
+
+
+def shutdown_worker_runtime() -> None:
+    """Stop this process's runtime if one is running."""
+    global _runtime
+    with _runtime_lock:
+        runtime, _runtime = _runtime, None
+    if runtime is not None and runtime.pid == os.getpid():
+        runtime.shutdown()
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**kwargs) -> None:
+    """Reset inherited DB connections and start the runtime in a new pool process."""
+    try:
+        from api.database import primary_engine, replica_engine
+        # Connections opened by the parent must not be shared with the child
+        primary_engine.sync_engine.dispose(close=False)
+        if replica_engine is not None:
+            replica_engine.sync_engine.dispose(close=False)
+    except Exception as exc:
+        logger.warning("Failed to reset inherited database pool: %s", exc)
+
+    get_worker_runtime()
+    logger.info("Worker runtime started in process %s", os.getpid())
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(**kwargs) -> None:
+    """Close pooled DB connections and stop the runtime loop."""
+    shutdown_worker_runtime()
+    logger.info("Worker runtime stopped in process %s", os.getpid())
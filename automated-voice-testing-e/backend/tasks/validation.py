@@ -17,6 +17,7 @@ from models.validation_result import ValidationResult
 from models.validation_queue import ValidationQueue
 from services.validation_service import ValidationService, determine_review_status
 from services.validation_queue_service import ValidationQueueService
+from tasks.runtime import get_multi_turn_execution_service, run_async
 import logging
 from uuid import UUID
 from sqlalchemy import select
@@ -37,6 +38,9 @@ def validate_multi_turn_execution(
 
     This task validates scenario executions created by MultiTurnExecutionService.
     It checks each step's results against the scenario's expected outcomes.
+    LLM validation deferred by the execution is run here in batch: every
+    step and language is evaluated with a few batched LLM requests instead
+    of one pipeline run each.
 
     Args:
         execution_id: UUID of the MultiTurnExecution to validate
@@ -49,9 +53,9 @@ def validate_multi_turn_execution(
             - passed: Boolean indicating if validation passed
             - status: Validation status
             - step_results: Per-step validation results
+            - llm_validated_count: Validation results evaluated by the LLM batch
     """
-    import asyncio
-    from models.multi_turn_execution import MultiTurnExecution
+    from models.multi_turn_execution import MultiTurnExecution, StepExecution
 
     logger.info("Starting multi-turn validation for execution: %s", execution_id)
 
@@ -94,11 +98,18 @@ def validate_multi_turn_execution(
                         f"Execution {execution_id} does not belong to tenant {tenant_id}"
                     )
 
-            # Get step results from execution metadata
-            step_results = execution.execution_metadata.get("step_results", []) if execution.execution_metadata else []
+            # Evaluate deferred LLM validations of all steps in batch
+            service = get_multi_turn_execution_service()
+            llm_validated_count = await service.validate_deferred_llm(db, execution)
+
+            # Step results now include the LLM verdicts of the batch
+            step_results = (await db.execute(
+                select(StepExecution.validation_passed)
+                .where(StepExecution.multi_turn_execution_id == execution_uuid)
+            )).scalars().all()
 
-            # Determine overall pass/fail based on execution status
-            passed = execution.status == "completed"
+            # Passed if the execution ran to the end and every step passed validation
+            passed = execution.status == "completed" and all(step_results)
 
             return {
                 "validation_id": None,  # No separate validation record for now
@@ -107,10 +118,11 @@ def validate_multi_turn_execution(
                 "status": "completed",
                 "step_count": len(step_results),
                 "execution_status": execution.status,
+                "llm_validated_count": llm_validated_count,
                 "message": f"Multi-turn execution validated with {len(step_results)} steps"
             }
 
-    return asyncio.run(_validate())
+    return run_async(_validate())
 
 
 def _build_validator_scores(validation_result: ValidationResult) -> Dict[str, float]:
@@ -677,8 +689,7 @@ def generate_test_report(
     Returns:
         Dict containing report data
     """
-    import asyncio
-    return asyncio.run(_generate_test_report_async(suite_run_id, format, include_details))
+    return run_async(_generate_test_report_async(suite_run_id, format, include_details))
 
 
 # NOTE: The enqueue_for_human_review Celery task was removed.
@@ -742,5 +753,32 @@ def release_timed_out_validations(self) -> Dict[str, Any]:
     Returns:
         Dict containing release results
     """
-    import asyncio
-    return asyncio.run(_release_timed_out_validations_async())
+    return run_async(_release_timed_out_validations_async())
+
+
+async def _purge_llm_evaluation_cache_async() -> Dict[str, Any]:
+    """
+    Internal async implementation for purge_llm_evaluation_cache task.
+    """
+    from services.llm_pipeline_service import LLMPipelineService
+
+    pipeline_service = LLMPipelineService()
+    deleted_count = await pipeline_service.purge_stale_cache()
+
+    logger.info(f"Purged {deleted_count} stale LLM evaluation cache entries")
+
+    return {'deleted_count': deleted_count}
+
+
+@celery.task(name='tasks.validation.purge_llm_evaluation_cache', bind=True)
+def purge_llm_evaluation_cache(self) -> Dict[str, Any]:
+    """
+    Purge stale entries from the LLM evaluation cache.
+
+    Removes expired entries and entries produced by prompt templates or
+    models the pipeline no longer uses.
+
+    Returns:
+        Dict containing the number of entries deleted
+    """
+    return run_async(_purge_llm_evaluation_cache_async())
@@ -134,7 +134,7 @@ async def test_dashboard_snapshot_uses_time_range_windows(monkeypatch: pytest.Mo
     for call in calls:
         assert call["start_time"] == expected_start
         assert call["end_time"] == fixed_now
-        assert call["granularity"] == "raw"
+        assert call["granularity"] == "day"
 
 
 @pytest.mark.asyncio
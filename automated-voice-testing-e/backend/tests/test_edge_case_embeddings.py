@@ -0,0 +1,185 @@
+"""
+Tests for cached, batch-encoded edge case embeddings.
+
+Validates the EdgeCaseEmbedding storage helpers and, where the embedding
+stack is installed, that EdgeCaseSimilarityService encodes each utterance
+once, re-encodes it only when it changes, ranks candidates correctly and
+keeps enough index candidates when the time window filters out the nearest.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from models.edge_case_embedding import EdgeCaseEmbedding
+from services.edge_case_vector_index import VectorIndex
+
+
+def test_embedding_round_trips_through_bytes():
+    vector = np.array([0.6, -0.8, 0.0], dtype=np.float32)
+    row = EdgeCaseEmbedding(
+        edge_case_id=uuid4(),
+        dimensions=3,
+        embedding=EdgeCaseEmbedding.encode_vector(vector),
+    )
+
+    np.testing.assert_array_equal(row.vector, vector)
+    assert row.vector.dtype == np.float32
+
+
+def test_malformed_embedding_is_ignored():
+    row = EdgeCaseEmbedding(dimensions=4, embedding=EdgeCaseEmbedding.encode_vector(np.ones(3)))
+
+    assert row.vector is None
+
+
+def test_embedding_table_schema():
+    table = EdgeCaseEmbedding.__table__
+
+    assert table.name == "edge_case_embeddings"
+    assert [c.name for c in table.primary_key.columns] == ["edge_case_id"]
+    (foreign_key,) = table.c.edge_case_id.foreign_keys
+    assert foreign_key.target_fullname == "edge_cases.id"
+    assert foreign_key.ondelete == "CASCADE"
+
+
+class FakeEncoder:
+    """Deterministic encoder recording every batch it is asked to encode."""
+
+    def __init__(self):
+        self.batches: list = []
+
+    def encode(self, texts, **kwargs):
+        self.batches.append(list(texts))
+        vectors = [[len(text), text.count("a") + 1.0, 1.0] for text in texts]
+        return np.array(vectors, dtype=np.float32)
+
+
+class FakeSession:
+    """Async session stub holding stored embeddings in memory."""
+
+    def __init__(self):
+        self.rows: dict = {}
+        self.queries = 0
+
+    async def execute(self, statement):
+        self.queries += 1
+        rows = list(self.rows.values())
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: rows))
+
+    def add(self, row):
+        self.rows[row.edge_case_id] = row
+
+    def begin_nested(self):
+        return _NullContext()
+
+
+class _NullContext:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _case(utterance, category="ambiguity", tags=None):
+    return SimpleNamespace(
+        id=uuid4(),
+        scenario_definition={"user_utterance": utterance, "language_code": "en-US", "confidence_score": 0.5},
+        category=category,
+        tags=tags or [],
+    )
+
+
+@pytest.fixture()
+def similarity_service():
+    pytest.importorskip("sentence_transformers")
+    from services.edge_case_similarity_service import EdgeCaseSimilarityService
+
+    service = EdgeCaseSimilarityService(FakeSession(), use_llm=False)
+    service._model = FakeEncoder()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_utterances_are_encoded_once_and_persisted(similarity_service):
+    cases = [_case("play jazz"), _case("play jazz"), _case("call mom")]
+
+    first = await similarity_service.get_embeddings(cases)
+    second = await similarity_service.get_embeddings(cases)
+
+    # Duplicate utterances share one encode; the second call is served from cache
+    assert similarity_service._model.batches == [["play jazz", "call mom"]]
+    assert set(similarity_service.db.rows) == {case.id for case in cases}
+    for case in cases:
+        np.testing.assert_array_equal(first[case.id], second[case.id])
+        assert np.linalg.norm(first[case.id]) == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_changed_utterance_is_re_encoded(similarity_service):
+    case = _case("play jazz")
+    await similarity_service.get_embeddings([case])
+
+    case.scenario_definition = {"user_utterance": "play a jazz album"}
+    await similarity_service.get_embeddings([case])
+
+    assert similarity_service._model.batches == [["play jazz"], ["play a jazz album"]]
+    stored = similarity_service.db.rows[case.id]
+    assert stored.content_hash == similarity_service._embedding_hash("play a jazz album")
+
+
+@pytest.mark.asyncio
+async def test_batched_scores_match_pairwise_similarity(similarity_service):
+    query = _case("play jazz", tags=["music"])
+    candidates = [_case("play jazz", tags=["music"]), _case("call mom", category="timeout"), _case("")]
+
+    scores = await similarity_service.score_candidates(query, candidates)
+
+    # Recompute the semantic signal pairwise from the same cached vectors
+    vectors = await similarity_service.get_embeddings([query, *candidates])
+    for candidate, score in zip(candidates, scores):
+        semantic = (
+            (float(vectors[query.id] @ vectors[candidate.id]) + 1) / 2
+            if candidate.id in vectors else 0.0
+        )
+        expected = similarity_service._calculate_similarity(query, candidate, semantic_score=semantic)
+        assert score == pytest.approx(expected, abs=1e-6)
+    assert scores[0] == pytest.approx(1.0, abs=1e-6)
+
+
+class WindowSession:
+    """Async session stub answering candidate queries with the requested in-window cases."""
+
+    def __init__(self, in_window):
+        self.in_window = {case.id: case for case in in_window}
+
+    async def execute(self, statement):
+        [requested] = [value for value in statement.compile().params.values() if isinstance(value, list)]
+        rows = [self.in_window[case_id] for case_id in requested if case_id in self.in_window]
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: rows))
+
+
+@pytest.mark.asyncio
+async def test_ann_search_widens_until_enough_cases_are_in_the_window(similarity_service):
+    query = SimpleNamespace(id=uuid4(), tenant_id=uuid4())
+    # Cases ordered nearest first; only the five farthest are inside the time window
+    cases = [SimpleNamespace(id=uuid4()) for _ in range(40)]
+    angles = np.linspace(0.0, 1.5, len(cases))
+    vectors = np.stack([np.cos(angles), np.sin(angles), np.zeros(len(cases))], axis=1).astype(np.float32)
+    index = VectorIndex(3)
+    index.add([str(case.id) for case in cases], vectors)
+
+    similarity_service.db = WindowSession(cases[-5:])
+    similarity_service.settings = SimpleNamespace(EDGE_CASE_ANN_MIN_SIZE=1, EDGE_CASE_ANN_CANDIDATES=3)
+    similarity_service.get_embeddings = AsyncMock(return_value={query.id: vectors[0]})
+    similarity_service._get_edge_case_index = AsyncMock(return_value=index)
+
+    candidates = await similarity_service._find_ann_candidates(query, time_window_days=30)
+
+    assert [case.id for case in candidates] == [case.id for case in cases[-5:-2]]
@@ -0,0 +1,106 @@
+"""
+Tests for the per-tenant IVF vector index used for edge case matching.
+
+Validates exact behaviour on small indexes, incremental updates, recall of
+the partitioned search against brute force and persistence to disk.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from services import edge_case_vector_index as index_module
+from services.edge_case_vector_index import VectorIndex, get_vector_index, vector_index_path
+
+
+@pytest.fixture(autouse=True)
+def empty_registry(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(index_module, "_vector_indexes", {})
+
+
+def _make_corpus(size: int, dimensions: int, clusters: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    centres = rng.standard_normal((clusters, dimensions))
+    vectors = centres[rng.integers(0, clusters, size)] + 0.3 * rng.standard_normal((size, dimensions))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def _unit(*values: float) -> np.ndarray:
+    vector = np.array(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def test_small_index_search_is_exact_and_ordered():
+    index = VectorIndex(2)
+    index.add(["a", "b", "c"], np.stack([_unit(1, 0), _unit(1, 1), _unit(0, 1)]))
+
+    results = index.search(_unit(1, 0.1), k=2)
+
+    assert [item_id for item_id, _ in results] == ["a", "b"]
+    assert results[0][1] > results[1][1]
+    assert index.nlist == 0
+
+
+def test_add_replaces_and_remove_deletes():
+    index = VectorIndex(2)
+    index.add(["a", "b"], np.stack([_unit(1, 0), _unit(0, 1)]))
+    index.add(["a"], _unit(0, 1)[np.newaxis])
+    index.remove(["b", "missing"])
+
+    assert len(index) == 1
+    assert "b" not in index
+    np.testing.assert_allclose(index.get("a"), _unit(0, 1))
+    assert index.search(_unit(0, 1), k=5) == [("a", pytest.approx(1.0))]
+
+
+def test_partitioned_search_recall_against_exact():
+    corpus = _make_corpus(4000, 32, clusters=40)
+    index = VectorIndex(32, nprobe=8, min_train_size=1000)
+    for start in range(0, len(corpus), 500):
+        index.add([str(i) for i in range(start, start + 500)], corpus[start:start + 500])
+
+    assert index.nlist > 8
+    hits = 0
+    for query in corpus[:50]:
+        expected = {item_id for item_id, _ in index.search_exact(query, 10)}
+        hits += len(expected & {item_id for item_id, _ in index.search(query, 10)})
+    assert hits / 500 >= 0.9
+
+
+def test_vectors_added_after_training_are_searchable():
+    corpus = _make_corpus(1500, 16, clusters=10)
+    index = VectorIndex(16, min_train_size=1000)
+    index.add([str(i) for i in range(1500)], corpus)
+
+    new_vector = _unit(*np.linspace(1, 2, 16))
+    index.add(["new"], new_vector[np.newaxis])
+
+    assert index.search(new_vector, k=1, nprobe=index.nlist) == [("new", pytest.approx(1.0))]
+    assert index.search(new_vector, k=1)[0][0] == "new"
+
+
+def test_save_and_load_round_trip(tmp_path: Path):
+    corpus = _make_corpus(1200, 8, clusters=5)
+    index = VectorIndex(8, min_train_size=1000)
+    index.add([f"case-{i}" for i in range(1200)], corpus)
+    path = vector_index_path(tmp_path, "tenant-1", "edge_cases")
+    index.save(path)
+
+    loaded = get_vector_index("tenant-1", "edge_cases", 8, index_dir=tmp_path)
+
+    assert len(loaded) == 1200
+    assert loaded.nlist == index.nlist
+    assert loaded.search(corpus[7], k=3) == index.search(corpus[7], k=3)
+    # Later lookups reuse the loaded instance
+    assert get_vector_index("tenant-1", "edge_cases", 8, index_dir=tmp_path) is loaded
+
+
+def test_indexes_are_per_tenant():
+    first = get_vector_index("tenant-1", "edge_cases", 4)
+    first.add(["a"], _unit(1, 0, 0, 0)[np.newaxis])
+
+    assert len(get_vector_index("tenant-2", "edge_cases", 4)) == 0
+    assert get_vector_index("tenant-1", "pattern_groups", 4) is not first
@@ -0,0 +1,167 @@
+"""
+Tests for the Redis-backed Socket.IO event bus.
+
+Validates cross-process delivery (a publish-only bus reaching the clients
+of a started bus), latest-wins coalescing of progress events with
+flush-before-transition ordering, room state replay, and local delivery
+when Redis is unavailable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from api.event_bus import PUBLISH_SCRIPT, ROOM_STATE_PREFIX, SocketEventBus
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.redis.subscribers.setdefault(channel, []).append(self.queue)
+
+    async def listen(self):
+        while True:
+            yield {'type': 'message', 'data': await self.queue.get()}
+
+    async def close(self):
+        pass
+
+
+class FakeRedis:
+    """In-memory stand-in for RedisClient running the bus's publish script."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.subscribers = {}
+        self.client = self
+
+    def pubsub(self, ignore_subscribe_messages=True):
+        return FakePubSub(self)
+
+    async def eval(self, script, keys, args):
+        assert script == PUBLISH_SCRIPT
+        message, state_field, _ttl = args
+        for queue in self.subscribers.get(keys[0], []):
+            queue.put_nowait(message)
+        if state_field:
+            self.hashes.setdefault(keys[1], {})[state_field] = message
+        return 1
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+
+class FakeServer:
+    """Records emits like a socketio.AsyncServer."""
+
+    def __init__(self):
+        self.emitted = []
+
+    async def emit(self, event, data, room=None, skip_sid=None):
+        self.emitted.append((event, data, room))
+
+
+async def _settle(seconds: float = 0.05) -> None:
+    await asyncio.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_worker_events_reach_api_process_clients():
+    redis = FakeRedis()
+    server = FakeServer()
+    api_bus = SocketEventBus(redis, coalesce_window_seconds=0.01)
+    worker_bus = SocketEventBus(redis)
+    await api_bus.start(server)
+    await _settle()
+
+    try:
+        await worker_bus.publish('test_completed', {'status': 'passed'}, room='suite_run_1')
+        await _settle()
+        assert server.emitted == [('test_completed', {'status': 'passed'}, 'suite_run_1')]
+    finally:
+        await api_bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_progress_events_coalesce_latest_wins():
+    server = FakeServer()
+    bus = SocketEventBus(enabled=False, coalesce_window_seconds=60)
+    await bus.start(server)
+
+    try:
+        # 500 executions x 3 steps of progress, 5 executions in flight at a time
+        for execution in range(500):
+            for step in range(1, 4):
+                await bus.publish(
+                    'multi_turn_step_started',
+                    {'execution_id': execution % 5, 'step_order': step},
+                    room='suite_run_1',
+                    coalesce_key=str(execution % 5),
+                )
+            await bus.publish(
+                'suite_run_update', {'completed_tests': execution + 1}, room='suite_run_1', coalesce_key='suite_run'
+            )
+        assert server.emitted == []
+
+        # A state change flushes the room's held progress first
+        await bus.publish('multi_turn_execution_completed', {'execution_id': 4}, room='suite_run_1')
+        events = [event for event, _, _ in server.emitted]
+        assert sorted(events[:-1]) == ['multi_turn_step_started'] * 5 + ['suite_run_update']
+        assert events[-1] == 'multi_turn_execution_completed'
+        latest = {event: data for event, data, _ in server.emitted}
+        assert latest['suite_run_update'] == {'completed_tests': 500}
+        assert all(
+            data['step_order'] == 3 for event, data, _ in server.emitted if event == 'multi_turn_step_started'
+        )
+    finally:
+        await bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_window_flush_and_room_state_replay():
+    redis = FakeRedis()
+    server = FakeServer()
+    bus = SocketEventBus(redis, coalesce_window_seconds=0.02)
+    await bus.start(server)
+    await _settle()
+
+    try:
+        for completed in range(1, 4):
+            await bus.publish(
+                'suite_run_update',
+                {'completed_tests': completed},
+                room='suite_run_1',
+                coalesce_key='suite_run',
+                retain=True,
+            )
+        await _settle(0.1)
+        assert server.emitted == [('suite_run_update', {'completed_tests': 3}, 'suite_run_1')]
+
+        stored = redis.hashes[ROOM_STATE_PREFIX + 'suite_run_1']
+        assert json.loads(stored['suite_run_update:suite_run'])['data'] == {'completed_tests': 3}
+
+        server.emitted.clear()
+        assert await bus.replay('sid-1', 'suite_run_1') == 1
+        assert server.emitted == [('suite_run_update', {'completed_tests': 3}, 'sid-1')]
+    finally:
+        await bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_publish_falls_back_to_local_delivery():
+    class BrokenRedis:
+        async def eval(self, *args, **kwargs):
+            raise ConnectionError("redis down")
+
+    server = FakeServer()
+    bus = SocketEventBus(BrokenRedis())
+    bus._server = server
+
+    await bus.publish('validation_claimed', {'queue_id': 'q-1'}, room='validation_queue')
+    assert server.emitted == [('validation_claimed', {'queue_id': 'q-1'}, 'validation_queue')]
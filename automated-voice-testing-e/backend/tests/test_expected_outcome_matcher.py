@@ -0,0 +1,133 @@
+"""
+Tests for compiled ExpectedOutcome response-content matchers.
+
+Validates single-pass phrase detection (including overlapping and
+prefix phrases), regex handling, language variation resolution and the
+per-outcome matcher cache.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from services import expected_outcome_matcher as matcher_module
+from services.expected_outcome_matcher import compile_response_content, get_outcome_matcher
+from services.validation_houndify import ValidationHoundifyMixin
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(matcher_module, "_matcher_cache", matcher_module.OrderedDict())
+
+
+def _outcome(**kwargs):
+    defaults = {
+        "id": uuid4(),
+        "updated_at": datetime(2024, 1, 1),
+        "expected_response_content": {"contains": ["sunny"]},
+        "forbidden_phrases": None,
+        "language_variations": None,
+    }
+    defaults.update(kwargs)
+    return SimpleNamespace(**defaults)
+
+
+@pytest.mark.parametrize(
+    "phrases, response, expected",
+    [
+        (["new york", "new", "york", "ew y"], "Welcome to NEW YORK", {"new york", "new", "york", "ew y"}),
+        (["new york", "new"], "a new day", {"new"}),
+        (["aa", "aaa"], "aaaa", {"aa", "aaa"}),
+        (["72", "degrees"], "It is 72 degrees", {"72", "degrees"}),
+        (["a.b", "(x)"], "see a.b and (x)", {"a.b", "(x)"}),
+        (["sunny"], "cloudy", set()),
+    ],
+)
+@pytest.mark.parametrize("scan_min_phrases", [1, 1000])
+def test_phrase_scan_matches_substring_semantics(monkeypatch, scan_min_phrases, phrases, response, expected):
+    # Exercise both the trie scan and the direct substring path
+    monkeypatch.setattr(matcher_module, "PHRASE_SCAN_MIN_PHRASES", scan_min_phrases)
+    matcher = compile_response_content({"contains": phrases})
+
+    assert matcher.find_phrases(response.lower()) == expected
+
+
+def test_results_match_per_pattern_checks():
+    rules = {
+        "contains": ["Sunny", "degrees", "Paris"],
+        "not_contains": ["sorry", "DEG"],
+        "regex": [r"\d+ degrees", r"^bonjour", "("],
+        "regex_not_match": [r"error \d+", "["],
+    }
+
+    result = ValidationHoundifyMixin()._validate_response_content(
+        "It's sunny and 72 degrees", rules, forbidden_phrases=["and 72", ""]
+    )
+
+    assert result["passed"] is False
+    assert result["details"]["contains"] == {"passed": False, "matched": ["Sunny", "degrees"], "missing": ["Paris"]}
+    assert result["details"]["not_contains"]["found"] == ["DEG"]
+    assert result["details"]["regex"]["matched"] == [r"\d+ degrees"]
+    assert result["details"]["regex"]["failed"] == [r"^bonjour"]
+    assert result["details"]["regex_not_match"] == {"passed": True, "found": []}
+    assert result["details"]["forbidden_phrases"]["found"] == ["and 72"]
+    assert result["errors"] == [
+        "Missing required phrase: 'Paris'",
+        "Found forbidden phrase: 'DEG'",
+        "Regex pattern not matched: '^bonjour'",
+        "Invalid regex pattern: '('",
+        "Found forbidden phrase: 'and 72'",
+    ]
+
+
+def test_no_rules_auto_pass_and_empty_response_fails():
+    mixin = ValidationHoundifyMixin()
+
+    assert mixin._validate_response_content("anything", None, forbidden_phrases=["anything"])["passed"]
+    result = mixin._validate_response_content("   ", {"contains": ["x"]})
+    assert result["errors"] == ["No AI response to validate"]
+
+
+def test_language_variation_rules_are_used():
+    outcome = _outcome(
+        language_variations={"fr-FR": {"expected_response_patterns": {"contains": ["ensoleillé"]}}}
+    )
+
+    assert get_outcome_matcher(outcome, "fr-FR").validate("Il fait ensoleillé")["passed"]
+    assert not get_outcome_matcher(outcome, "fr-FR").validate("It is sunny")["passed"]
+    assert get_outcome_matcher(outcome, "de-DE").validate("It is sunny")["passed"]
+
+
+def test_matcher_cached_until_outcome_updated(monkeypatch):
+    compiled = []
+    original = matcher_module.compile_response_content
+
+    def counting(*args, **kwargs):
+        compiled.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(matcher_module, "compile_response_content", counting)
+    outcome = _outcome()
+
+    first = get_outcome_matcher(outcome, "en-US")
+    assert get_outcome_matcher(outcome, "en-US") is first
+    assert len(compiled) == 1
+
+    outcome.expected_response_content = {"contains": ["rainy"]}
+    outcome.updated_at += timedelta(seconds=1)
+    refreshed = get_outcome_matcher(outcome, "en-US")
+
+    assert refreshed is not first
+    assert refreshed.validate("rainy day")["passed"]
+
+
+def test_unsaved_outcomes_are_not_cached():
+    outcome = _outcome(id=None)
+
+    get_outcome_matcher(outcome)
+
+    assert len(matcher_module._matcher_cache) == 0
@@ -0,0 +1,127 @@
+"""
+Tests for HoundifyClient streaming client reuse, chunk pacing and timings.
+
+The Houndify SDK's StreamingHoundClient is replaced with a fake so no
+network access is needed.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from integrations.houndify import client as client_module
+from integrations.houndify.client import HoundifyClient
+from integrations.houndify.models import HoundifyError
+
+
+class FakeStreamingHoundClient:
+    """Records SDK calls and emits a partial and a final response."""
+
+    instances: list = []
+
+    def __init__(self, clientID, clientKey, userID, requestInfo=None, sampleRate=16000, timeout=None, **kwargs):
+        self.userID = userID
+        self.sampleRate = sampleRate
+        self.timeout = timeout
+        self.HoundRequestInfo = {"ClientID": clientID, "UserID": userID, "PartialTranscriptsDesired": True}
+        self.HoundRequestInfo.update(requestInfo or {})
+        self.chunks: list[bytes] = []
+        self.request_infos: list[dict] = []
+        self.fail = False
+        FakeStreamingHoundClient.instances.append(self)
+
+    def start(self, listener):
+        self.listener = listener
+        self.request_infos.append(dict(self.HoundRequestInfo))
+        self.chunks = []
+
+    def fill(self, data):
+        self.chunks.append(data)
+        if len(self.chunks) == 1:
+            self.listener.onPartialTranscript("partial")
+        return False
+
+    def finish(self):
+        if self.fail:
+            self.listener.onError("boom")
+        else:
+            self.listener.onFinalResponse({"AllResults": [{"SpokenResponse": "ok"}], "Status": "OK"})
+
+
+@pytest.fixture()
+def fake_sdk(monkeypatch: pytest.MonkeyPatch):
+    FakeStreamingHoundClient.instances = []
+    monkeypatch.setattr(client_module.houndify, "StreamingHoundClient", FakeStreamingHoundClient)
+    return FakeStreamingHoundClient
+
+
+def _client(**kwargs) -> HoundifyClient:
+    kwargs.setdefault("executor", ThreadPoolExecutor(max_workers=2))
+    return HoundifyClient("client-id", "Y2xpZW50LWtleQ==", **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_streaming_client_is_reused_with_fresh_request_info(fake_sdk):
+    client = _client(chunk_size=4)
+
+    await client.voice_query(b"abcdefghij", "user-1", "req-1", request_info={"LanguageCode": "fr-FR"})
+    response = await client.voice_query(b"abcdefghij", "user-2", "req-2", request_info={})
+
+    assert len(fake_sdk.instances) == 1
+    streaming_client = fake_sdk.instances[0]
+    assert streaming_client.chunks == [b"abcd", b"efgh", b"ij"]
+    assert streaming_client.userID == "user-2"
+    # Request info from the first query must not leak into the second
+    assert streaming_client.request_infos[0]["LanguageCode"] == "fr-FR"
+    assert "LanguageCode" not in streaming_client.request_infos[1]
+    assert streaming_client.request_infos[1]["UserID"] == "user-2"
+
+    timing = response["ClientTiming"]
+    assert timing["chunk_pacing"] == "fast"
+    assert timing["chunk_size"] == 4
+    assert timing["time_to_first_partial_ms"] is not None
+    assert timing["time_to_final_ms"] is not None
+    assert {"connect_ms", "fill_ms", "total_ms"} <= set(timing)
+
+
+@pytest.mark.asyncio
+async def test_failed_streaming_client_is_not_returned_to_pool(fake_sdk, monkeypatch):
+    client = _client()
+    original_start = FakeStreamingHoundClient.start
+
+    def failing_start(self, listener):
+        self.fail = True
+        original_start(self, listener)
+
+    monkeypatch.setattr(FakeStreamingHoundClient, "start", failing_start)
+    with pytest.raises(HoundifyError):
+        await client.voice_query(b"abc", "user-1", "req-1")
+
+    assert client._idle_streaming_clients == []
+
+
+@pytest.mark.asyncio
+async def test_realtime_pacing_feeds_audio_at_playback_speed(fake_sdk):
+    # 8 kHz 16-bit mono: 1600 bytes is 100 ms of audio, sent in 4 chunks
+    client = _client(chunk_size=400, chunk_pacing="fast", sample_rate=8000)
+
+    start = time.perf_counter()
+    await client.voice_query(b"\x00" * 1600, "user-1", "req-1")
+    fast_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    response = await client.voice_query(b"\x00" * 1600, "user-1", "req-2", chunk_pacing="realtime")
+    realtime_elapsed = time.perf_counter() - start
+
+    assert response["ClientTiming"]["chunk_pacing"] == "realtime"
+    # The last chunk starts 75 ms into the audio timeline
+    assert realtime_elapsed >= 0.07
+    assert fast_elapsed < realtime_elapsed
+
+
+def test_invalid_chunk_pacing_rejected():
+    with pytest.raises(ValueError):
+        _client(chunk_pacing="slow")
@@ -0,0 +1,73 @@
+"""
+Tests for LatencyPercentileService in exact and sketch-backed modes.
+
+Validates that sketch mode agrees with exact percentiles and statistics
+within the sketch's relative accuracy, keeps memory bounded, and merges
+sketches recorded by separate workers.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from services.latency_percentile_service import LatencyPercentileService, LatencySketch
+
+
+def _latencies(count: int, seed: int = 11):
+    rng = random.Random(seed)
+    return [rng.lognormvariate(5.5, 0.6) for _ in range(count)]
+
+
+def test_sketch_mode_matches_exact_mode():
+    exact = LatencyPercentileService()
+    sketched = LatencyPercentileService(use_sketch=True, recent_window=100)
+    for latency in _latencies(5000):
+        exact.record_latency(latency)
+        sketched.record_latency(latency)
+
+    for key, value in exact.get_all_percentiles().items():
+        assert sketched.get_all_percentiles()[key] == pytest.approx(value, rel=0.02)
+
+    exact_stats, sketch_stats = exact.get_statistics(), sketched.get_statistics()
+    assert sketch_stats['count'] == 5000
+    assert sketch_stats['min'] == exact_stats['min']
+    assert sketch_stats['max'] == exact_stats['max']
+    assert sketch_stats['mean'] == pytest.approx(exact_stats['mean'])
+    assert sketch_stats['stddev'] == pytest.approx(exact_stats['stddev'])
+    assert sketched.generate_histogram()['total'] == 5000
+    assert sum(sketched.get_bucket_counts([0, 200, 400]).values()) == 5000
+
+    # Only the recent window of raw latencies is retained
+    assert len(sketched.get_latencies()) == 100
+
+
+def test_sketches_from_workers_merge():
+    latencies = _latencies(3000, seed=3)
+    combined = LatencyPercentileService(use_sketch=True)
+    for latency in latencies:
+        combined.record_latency(latency)
+
+    workers = [LatencySketch() for _ in range(3)]
+    for index, latency in enumerate(latencies):
+        workers[index % 3].add(latency)
+    merged = LatencyPercentileService(use_sketch=True)
+    for sketch in workers:
+        merged.merge(LatencySketch.from_dict(sketch.to_dict()))
+
+    assert merged.get_all_percentiles() == combined.get_all_percentiles()
+    assert merged.get_statistics()['count'] == 3000
+    assert merged.get_statistics()['mean'] == pytest.approx(combined.get_statistics()['mean'])
+
+
+def test_exact_mode_rejects_merge_and_clear_resets():
+    service = LatencyPercentileService()
+    with pytest.raises(ValueError):
+        service.merge(LatencySketch())
+
+    sketched = LatencyPercentileService(use_sketch=True)
+    sketched.record_latency(120.0)
+    sketched.clear_latencies()
+    assert sketched.get_p99() == 0.0
+    assert sketched.get_statistics()['count'] == 0
@@ -0,0 +1,88 @@
+"""
+Tests for the Redis-backed latency sketch store.
+
+Validates that latencies recorded by separate workers merge into one
+sketch per suite run, language and CommandKind, and that flush failures
+drop the local sketches instead of raising.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from services.latency_percentile_service import LatencySketch
+from services.latency_sketch_store import MERGE_SCRIPT, LatencySketchStore
+
+
+class FakeRedis:
+    """Async Redis stand-in applying MERGE_SCRIPT's semantics in Python."""
+
+    def __init__(self) -> None:
+        self.hashes: Dict[str, Dict[str, str]] = {}
+        self.ttl: Dict[str, int] = {}
+
+    async def eval(self, script: str, keys: List[str], args: List[Any]) -> int:
+        assert script == MERGE_SCRIPT
+        fields = self.hashes.setdefault(keys[0], {})
+        delta = json.loads(args[0])
+        for name, count in delta['bins'].items():
+            fields[f"b:{name}"] = str(int(fields.get(f"b:{name}", 0)) + count)
+        fields.setdefault('alpha', str(delta['alpha']))
+        for name in ('sum', 'sum_squares'):
+            fields[name] = str(float(fields.get(name, 0)) + delta[name])
+        if 'min' not in fields or delta['min'] < float(fields['min']):
+            fields['min'] = str(delta['min'])
+        if 'max' not in fields or delta['max'] > float(fields['max']):
+            fields['max'] = str(delta['max'])
+        self.ttl[keys[0]] = int(args[1])
+        return 1
+
+    async def hgetall(self, key: str) -> Dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+
+@pytest.mark.asyncio
+async def test_workers_merge_into_shared_sketches():
+    redis = FakeRedis()
+    workers = [LatencySketchStore(redis_client=redis, ttl_seconds=60) for _ in range(2)]
+    expected = LatencySketch()
+    for index in range(400):
+        latency = 100.0 + index
+        language = "en-US" if index % 2 else "fr-FR"
+        workers[index % 2].record("run-1", latency, language_code=language, command_kind="WeatherCommand")
+        expected.add(latency)
+
+    for worker in workers:
+        assert await worker.flush() == 4
+        assert worker.pending == 0
+
+    reader = LatencySketchStore(redis_client=redis)
+    summary = await reader.get_percentiles("run-1")
+    assert summary['count'] == 400
+    assert summary['min'] == 100.0
+    assert summary['max'] == 499.0
+    assert summary['mean'] == pytest.approx(expected.mean)
+    assert summary['p95'] == pytest.approx(expected.percentile(95))
+
+    english = await reader.get_percentiles("run-1", language_code="en-US", command_kind="WeatherCommand")
+    assert english['count'] == 200
+    assert (await reader.get_percentiles("run-1", command_kind="WeatherCommand"))['count'] == 400
+    assert (await reader.get_percentiles("run-2"))['count'] == 0
+    assert set(redis.ttl.values()) == {60}
+
+
+@pytest.mark.asyncio
+async def test_flush_failure_drops_local_sketches():
+    class BrokenRedis:
+        async def eval(self, *args: Any) -> int:
+            raise ConnectionError("redis unavailable")
+
+    store = LatencySketchStore(redis_client=BrokenRedis())
+    store.record("run-1", 250.0)
+
+    assert store.pending == 1
+    assert await store.flush() == 0
+    assert store.pending == 0
@@ -0,0 +1,410 @@
+"""
+Tests for batched LLM evaluation.
+
+Validates that adapters pack turns into batch requests and split the
+results back per turn, that LLMPipelineService.evaluate_batch() matches
+per-turn evaluation with fewer provider calls, and that deferred LLM
+validation of a multi-turn execution is evaluated in one batch and
+recounts its suite run.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from models.base import Base
+from models.expected_outcome import ExpectedOutcome
+from models.human_validation import HumanValidation
+from models.multi_turn_execution import MultiTurnExecution, StepExecution
+from models.pattern_analysis_config import PatternAnalysisConfig
+from models.scenario_script import ScenarioScript, ScenarioStep
+from models.suite_run import SuiteRun
+from models.test_suite import TestSuite
+from models.user import User
+from models.validation_queue import ValidationQueue
+from models.validation_result import ValidationResult
+from services import llm_pipeline_service as pipeline_module
+from services.llm_pipeline_service import LLMPipelineService
+from services.llm_providers import EvaluationItem, OpenRouterAdapter
+from services.llm_providers.base import BaseLLMAdapter
+from services.multi_turn_execution_service import MultiTurnExecutionService
+
+TURN_PATTERN = re.compile(r"TURN (\d+):.*?USER REQUEST: (.*?)\nAI RESPONSE: (.*?)(?:\n|$)", re.S)
+
+
+def _score_for(ai_response: str, default: float) -> float:
+    match = re.search(r"score=(\d+(?:\.\d+)?)", ai_response)
+    return float(match.group(1)) if match else default
+
+
+def _evaluation(score: float) -> Dict[str, Any]:
+    return {
+        "scores": {
+            "relevance": score,
+            "correctness": score,
+            "completeness": score,
+            "tone": score,
+            "entity_accuracy": score,
+        },
+        "reasoning": f"Scored {score}",
+    }
+
+
+class StubProvider(BaseLLMAdapter):
+    """Local provider scoring each turn by the 'score=N' marker in its AI response."""
+
+    provider_name = "stub"
+    default_model = "stub/judge"
+
+    def __init__(self, default_score: float = 9.0, drop_ids=(), **kwargs: Any):
+        super().__init__(**kwargs)
+        self.default_score = default_score
+        self.drop_ids = set(drop_ids)
+        self.calls: List[str] = []
+        self.batch_calls: List[int] = []
+
+    async def _initialize_client(self) -> None:
+        self._client = object()
+
+    async def _call_api(self, prompt: str, system_prompt: str) -> Dict[str, Any]:
+        self.calls.append(prompt)
+        ai_response = prompt.split("AI RESPONSE: ", 1)[1].split("\n", 1)[0]
+        return {
+            "content": json.dumps(_evaluation(_score_for(ai_response, self.default_score))),
+            "usage": {"prompt_tokens": 400, "completion_tokens": 100},
+        }
+
+    async def _call_batch_api(self, prompt: str, system_prompt: str, max_tokens: int) -> Dict[str, Any]:
+        turns = TURN_PATTERN.findall(prompt)
+        self.batch_calls.append(len(turns))
+        evaluations = [
+            {"id": int(turn_id), **_evaluation(_score_for(ai_response, self.default_score))}
+            for turn_id, _, ai_response in turns
+            if int(turn_id) not in self.drop_ids
+        ]
+        return {
+            "content": json.dumps({"evaluations": evaluations}),
+            "usage": {"input_tokens": 900, "output_tokens": 300},
+        }
+
+
+class SingleOnlyProvider(StubProvider):
+    """Provider without batch support."""
+
+    _call_batch_api = BaseLLMAdapter._call_batch_api
+
+
+@pytest.fixture(autouse=True)
+def no_evaluation_cache(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(pipeline_module, "get_evaluation_cache", lambda: None)
+
+
+def _items(scores: List[float]) -> List[EvaluationItem]:
+    return [
+        EvaluationItem(f"request {index}", f"response {index} score={score}", {"step_order": index + 1})
+        for index, score in enumerate(scores)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_adapter_packs_turns_and_splits_results():
+    provider = StubProvider()
+    items = _items([9, 2, 5, 8, 1, 10, 7])
+
+    results = await provider.evaluate_batch(items, max_items=3)
+
+    assert sorted(provider.batch_calls) == [3, 3]
+    assert len(provider.calls) == 1  # the last chunk holds a single turn
+    assert [result.overall_score for result in results] == [9, 2, 5, 8, 1, 10, 7]
+    assert [result.decision for result in results[:3]] == ["pass", "fail", "uncertain"]
+    assert results[0].raw_response["batch"] == {"size": 3, "index": 0}
+    assert results[0].raw_response["usage"] == {
+        "prompt_tokens": 300, "completion_tokens": 100, "total_tokens": 400,
+    }
+    assert results[0].provider == "stub"
+
+
+@pytest.mark.asyncio
+async def test_missing_turns_are_evaluated_individually():
+    provider = StubProvider(drop_ids={1})
+
+    results = await provider.evaluate_batch(_items([9, 2, 5]))
+
+    assert provider.batch_calls == [3]
+    assert len(provider.calls) == 1
+    assert [result.overall_score for result in results] == [9, 2, 5]
+
+
+@pytest.mark.asyncio
+async def test_adapters_without_batch_support_fall_back_to_single_calls():
+    provider = SingleOnlyProvider()
+
+    results = await provider.evaluate_batch(_items([9, 2, 5]))
+
+    assert provider.batch_calls == []
+    assert len(provider.calls) == 3
+    assert [result.overall_score for result in results] == [9, 2, 5]
+
+
+@pytest.mark.asyncio
+async def test_openrouter_batch_request_uses_batch_schema():
+    adapter = OpenRouterAdapter(api_key="test", model="openai/gpt-4o-mini", max_tokens=512)
+    content = json.dumps({"evaluations": [{"id": 1, **_evaluation(3)}, {"id": 0, **_evaluation(8)}]})
+    create = AsyncMock(return_value=SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason="stop")],
+        usage=SimpleNamespace(prompt_tokens=800, completion_tokens=200, total_tokens=1000),
+        model="openai/gpt-4o-mini",
+    ))
+    adapter._async_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    adapter._client = adapter._async_client
+
+    results = await adapter.evaluate_batch(_items([8, 3]))
+
+    kwargs = create.await_args.kwargs
+    assert kwargs["max_tokens"] == 1024
+    assert kwargs["response_format"]["json_schema"]["name"] == "batch_evaluation_response"
+    assert "TURN 0:" in kwargs["messages"][1]["content"]
+    assert [result.overall_score for result in results] == [8, 3]
+    assert results[1].raw_response["usage"]["total_tokens"] == 500
+
+
+@pytest.mark.asyncio
+async def test_pipeline_batch_matches_single_evaluation():
+    def pipeline():
+        service = LLMPipelineService(api_key="test")
+        service._evaluator_a = StubProvider(default_score=9, model="stub/a")
+        service._evaluator_b = StubProvider(default_score=9, model="stub/b")
+        service._curator = StubProvider(default_score=8, model="stub/curator")
+        return service
+
+    items = [
+        EvaluationItem("play jazz", "Playing jazz", {"step_order": 1}),
+        EvaluationItem("weather", "It is sunny", {"step_order": 2}),
+        EvaluationItem("call mom", "Calling mom", {"step_order": 3}),
+    ]
+    batch_service = pipeline()
+    original = batch_service._evaluator_b._call_batch_api
+
+    async def disagreeing_batch(prompt, system_prompt, max_tokens):
+        response = await original(prompt, system_prompt, max_tokens)
+        data = json.loads(response["content"])
+        data["evaluations"][1].update(_evaluation(7))
+        data["evaluations"][2].update(_evaluation(2))
+        response["content"] = json.dumps(data)
+        return response
+
+    # Evaluator B disagrees moderately on the second turn and strongly on the third
+    batch_service._evaluator_b._call_batch_api = disagreeing_batch
+    batch_results = await batch_service.evaluate_batch(items)
+
+    assert batch_service._evaluator_a.batch_calls == [3]
+    assert batch_service._evaluator_b.batch_calls == [3]
+    # Only the moderate disagreement goes to the curator
+    assert len(batch_service._curator.calls) == 1
+    assert [result.consensus_type for result in batch_results] == [
+        "high_consensus", "curator_resolved", "human_review",
+    ]
+    assert batch_results[1].final_score == 0.8
+    assert batch_results[0].final_decision == "pass"
+    assert batch_results[2].final_decision == "needs_review"
+
+    single_service = pipeline()
+    single = await single_service.evaluate("play jazz", "Playing jazz", {"step_order": 1})
+    expected = single.to_dict()
+    actual = batch_results[0].to_dict()
+    for key in ("latency_ms", "evaluator_a_latency_ms", "evaluator_b_latency_ms"):
+        expected.pop(key)
+        actual.pop(key)
+    assert actual == expected
+
+
+# ---------------------------------------------------------------------------
+# Deferred validation of a multi-turn execution
+# ---------------------------------------------------------------------------
+
+@pytest_asyncio.fixture
+async def db_session():
+    """In-memory session with only the tables a scenario execution touches."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    tables = [
+        model.__table__ for model in (
+            User, TestSuite, SuiteRun, ScenarioScript, ScenarioStep, ExpectedOutcome,
+            MultiTurnExecution, StepExecution, ValidationResult, ValidationQueue,
+            HumanValidation, PatternAnalysisConfig,
+        )
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+class StubHoundifyClient:
+    """Houndify client stub that answers every query with a sunny forecast."""
+
+    async def voice_query(self, audio_data, user_id, request_id, request_info):
+        return {
+            "AllResults": [
+                {
+                    "SpokenResponse": f"weather is sunny ({request_info['LanguageCode']})",
+                    "CommandKind": "WeatherCommand",
+                    "ConversationState": {},
+                }
+            ]
+        }
+
+
+def _build_service() -> MultiTurnExecutionService:
+    service = MultiTurnExecutionService.__new__(MultiTurnExecutionService)
+    service.settings = SimpleNamespace(EXECUTION_VARIANT_CONCURRENCY=1)
+    service.tts_service = MagicMock()
+    service.tts_service.text_to_speech_async = AsyncMock(side_effect=lambda text, lang: text.encode())
+    service.tts_service.synthesize_pcm_async = AsyncMock(
+        side_effect=lambda text, lang, target_rate: SimpleNamespace(
+            audio_bytes=text.encode(), cache_hit=False, cache_source="generated"
+        )
+    )
+    service.houndify_client = StubHoundifyClient()
+    service._upload_audio_to_storage = AsyncMock(return_value="http://audio/step.mp3")
+    service._upload_response_audio_to_storage = AsyncMock(return_value=None)
+    service._check_defect_auto_creation = AsyncMock()
+    for name in (
+        "_emit_execution_started", "_emit_step_started", "_emit_step_completed",
+        "_emit_execution_completed", "_emit_execution_failed", "_emit_progress",
+    ):
+        setattr(service, name, AsyncMock())
+    return service
+
+
+def _stub_pipeline(default_score: float = 9.0) -> LLMPipelineService:
+    pipeline = LLMPipelineService(api_key="test")
+    pipeline._evaluator_a = StubProvider(default_score, model="stub/a")
+    pipeline._evaluator_b = StubProvider(default_score, model="stub/b")
+    pipeline._curator = StubProvider(default_score, model="stub/curator")
+    return pipeline
+
+
+async def _add_weather_script(db_session, validation_mode: str):
+    """Add a three-step, two-language scenario and return (user, script)."""
+    user = User(id=uuid4(), email="batch@example.com", username="batch", password_hash="x")
+    script = ScenarioScript(
+        id=uuid4(), name="Weather", is_active=True, approval_status="approved",
+        validation_mode=validation_mode, tenant_id=user.id,
+    )
+    db_session.add_all([user, script])
+    for order in (1, 2, 3):
+        step = ScenarioStep(
+            id=uuid4(), script_id=script.id, step_order=order,
+            user_utterance=f"what's the weather {order}",
+            step_metadata={"language_variants": [
+                {"language_code": "en-US", "user_utterance": f"what's the weather {order}"},
+                {"language_code": "fr-FR", "user_utterance": f"quel temps fait-il {order}"},
+            ]},
+        )
+        db_session.add(step)
+        db_session.add(ExpectedOutcome(
+            tenant_id=user.id, outcome_code=f"WEATHER_{order}", name=f"Weather {order}",
+            scenario_step_id=step.id, expected_response_content={"contains": ["sunny"]},
+        ))
+    await db_session.commit()
+    return user, script
+
+
+@pytest.mark.asyncio
+async def test_deferred_llm_validation_runs_in_one_batch(db_session, monkeypatch):
+    monkeypatch.setattr("services.multi_turn_execution_service.random.random", lambda: 1.0)
+    user, script = await _add_weather_script(db_session, "hybrid")
+
+    service = _build_service()
+    execution = await service.execute_scenario(
+        db=db_session, script_id=script.id, suite_run_id=None, tenant_id=user.id,
+        defer_llm_validation=True,
+    )
+    assert execution.status == "completed"
+    pending = (await db_session.execute(select(ValidationResult))).scalars().all()
+    assert len(pending) == 6
+    assert all(result.final_decision is None for result in pending)
+
+    pipeline = _stub_pipeline()
+
+    assert await service.validate_deferred_llm(db_session, execution, pipeline) == 6
+    assert pipeline._evaluator_a.batch_calls == [6]
+    assert pipeline._evaluator_b.batch_calls == [6]
+    assert pipeline._evaluator_a.calls == []
+
+    results = (await db_session.execute(select(ValidationResult))).scalars().all()
+    assert {result.final_decision for result in results} == {"pass"}
+    assert {result.review_status for result in results} == {"auto_pass"}
+    steps = (await db_session.execute(select(StepExecution))).scalars().all()
+    assert all(step.validation_passed for step in steps)
+    assert all(
+        lang["final_decision"] == "pass"
+        for step in steps
+        for lang in step.validation_details["per_language_results"].values()
+    )
+
+    # Nothing left to evaluate
+    assert await service.validate_deferred_llm(db_session, execution, pipeline) == 0
+
+
+@pytest.mark.asyncio
+async def test_deferred_verdicts_recount_suite_run(db_session, monkeypatch):
+    monkeypatch.setattr("services.multi_turn_execution_service.random.random", lambda: 1.0)
+    emit = AsyncMock()
+    monkeypatch.setattr("services.multi_turn_execution_service.emit_suite_run_update", emit)
+    user, script = await _add_weather_script(db_session, "llm_ensemble")
+    suite_run = SuiteRun(id=uuid4(), status="running", tenant_id=user.id)
+    db_session.add(suite_run)
+    await db_session.commit()
+
+    service = _build_service()
+    execution = await service.execute_scenario(
+        db=db_session, script_id=script.id, suite_run_id=suite_run.id, tenant_id=user.id,
+        defer_llm_validation=True,
+    )
+    # Every llm_ensemble step waits for its verdict, so none stops the execution
+    steps = (await db_session.execute(select(StepExecution))).scalars().all()
+    assert len(steps) == 3
+    await db_session.refresh(suite_run)
+    assert (suite_run.status, suite_run.passed_tests, suite_run.failed_tests) == ("completed", 1, 0)
+
+    assert await service.validate_deferred_llm(db_session, execution, _stub_pipeline(2.0)) == 6
+
+    await db_session.refresh(suite_run)
+    assert (suite_run.status, suite_run.passed_tests, suite_run.failed_tests) == ("failed", 0, 1)
+    emit.assert_awaited_once()
+    assert emit.await_args.args[1] == {
+        "status": "failed", "total_tests": 1, "passed_tests": 0, "failed_tests": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_deferred_validations_without_a_batch_result_go_to_review(db_session, monkeypatch):
+    monkeypatch.setattr("services.multi_turn_execution_service.random.random", lambda: 1.0)
+    user, script = await _add_weather_script(db_session, "llm_ensemble")
+
+    service = _build_service()
+    execution = await service.execute_scenario(
+        db=db_session, script_id=script.id, suite_run_id=None, tenant_id=user.id,
+        defer_llm_validation=True,
+    )
+
+    # A batch that comes back short must not leave validations undecided
+    pipeline = MagicMock()
+    pipeline.evaluate_batch = AsyncMock(return_value=[None, None])
+    assert await service.validate_deferred_llm(db_session, execution, pipeline) == 6
+
+    results = (await db_session.execute(select(ValidationResult))).scalars().all()
+    assert len(results) == 6
+    assert {result.review_status for result in results} == {"needs_review"}
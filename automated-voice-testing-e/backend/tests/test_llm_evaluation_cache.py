@@ -0,0 +1,292 @@
+"""
+Tests for the LLM evaluation cache and its use by LLMPipelineService.
+
+Validates canonical request keys, Redis/Postgres tiering with TTLs,
+explicit invalidation by model and prompt version, and that the pipeline
+serves repeated evaluations from the cache and logs the hits.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from models.base import Base
+from models.llm_evaluation_cache import LLMEvaluationCacheEntry
+from services.llm_evaluation_cache import (
+    REDIS_KEY_PREFIX,
+    CachedEvaluation,
+    LLMEvaluationCache,
+    evaluation_cache_key,
+    evaluation_prompt_version,
+)
+from services.llm_pipeline_service import CURATOR_SYSTEM_PROMPT, LLMPipelineService
+from services.llm_providers.base import BaseLLMAdapter, DEFAULT_EVALUATION_SYSTEM_PROMPT
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in for caching tests."""
+
+    def __init__(self) -> None:
+        self.store: Dict[str, str] = {}
+        self.ttl: Dict[str, int | None] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        self.store[key] = value
+        self.ttl[key] = ttl
+
+    async def delete(self, *keys: str) -> int:
+        deleted = 0
+        for key in keys:
+            deleted += key in self.store
+            self.store.pop(key, None)
+            self.ttl.pop(key, None)
+        return deleted
+
+
+class FakeAdapter(BaseLLMAdapter):
+    """Adapter returning a fixed evaluation and counting provider calls."""
+
+    provider_name = "fake"
+    default_model = "fake/judge"
+
+    def __init__(self, score: float = 9.0, content: str | None = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.calls: List[str] = []
+        self.content = content or json.dumps({
+            "scores": {
+                "relevance": score,
+                "correctness": score,
+                "completeness": score,
+                "tone": score,
+                "entity_accuracy": score,
+            },
+            "reasoning": "Performed the requested action",
+        })
+
+    async def _initialize_client(self) -> None:
+        self._client = object()
+
+    async def _call_api(self, prompt: str, system_prompt: str) -> Dict[str, Any]:
+        self.calls.append(prompt)
+        return {
+            "content": self.content,
+            "usage": {"prompt_tokens": 400, "completion_tokens": 100, "total_tokens": 500},
+        }
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """In-memory database with only the cache table."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[LLMEvaluationCacheEntry.__table__])
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(fake_redis, session_factory) -> LLMEvaluationCache:
+    return LLMEvaluationCache(
+        redis_client=fake_redis,
+        session_factory=session_factory,
+        ttl_seconds=3600,
+        redis_ttl_seconds=60,
+    )
+
+
+def _pipeline(cache, evaluator_a, evaluator_b, curator=None) -> LLMPipelineService:
+    service = LLMPipelineService(api_key="test", cache=cache)
+    service._evaluator_a = evaluator_a
+    service._evaluator_b = evaluator_b
+    service._curator = curator or FakeAdapter(model="fake/curator")
+    return service
+
+
+def _key(**overrides: Any) -> str:
+    request = {
+        "provider": "openrouter",
+        "model": "google/gemini",
+        "temperature": 0.0,
+        "max_tokens": 1024,
+        "system_prompt": "judge",
+        "prompt": "prompt",
+    }
+    request.update(overrides)
+    return evaluation_cache_key(**request)
+
+
+def test_cache_key_is_canonical_and_covers_request():
+    assert _key() == _key(temperature=0, max_tokens=1024.0)
+    assert len(_key()) == 64
+    for change in (
+        {"model": "openai/gpt"},
+        {"temperature": 0.2},
+        {"system_prompt": CURATOR_SYSTEM_PROMPT},
+        {"prompt": "prompt "},
+    ):
+        assert _key(**change) != _key()
+
+
+def test_prompt_version_tracks_system_prompt():
+    assert evaluation_prompt_version(DEFAULT_EVALUATION_SYSTEM_PROMPT) == \
+        evaluation_prompt_version(DEFAULT_EVALUATION_SYSTEM_PROMPT)
+    assert evaluation_prompt_version(DEFAULT_EVALUATION_SYSTEM_PROMPT) != \
+        evaluation_prompt_version(CURATOR_SYSTEM_PROMPT)
+
+
+@pytest.mark.asyncio
+async def test_postgres_hit_is_promoted_to_redis(cache, fake_redis):
+    cached = CachedEvaluation(result={"scores": {"relevance": 8.0}, "overall_score": 8.0},
+                              prompt_tokens=400, completion_tokens=100)
+    await cache.set("k1", cached, provider="openrouter", model="google/gemini", prompt_version="v1")
+
+    assert fake_redis.ttl[REDIS_KEY_PREFIX + "k1"] == 60
+    assert cached.cost_usd > 0
+
+    fake_redis.store.clear()
+    hit = await cache.get("k1")
+
+    assert hit is not None
+    assert hit.result["overall_score"] == 8.0
+    assert hit.total_tokens == 500
+    assert REDIS_KEY_PREFIX + "k1" in fake_redis.store
+    assert 0 < fake_redis.ttl[REDIS_KEY_PREFIX + "k1"] <= 60
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_not_served(cache, fake_redis, session_factory):
+    await cache.set("k1", CachedEvaluation(result={"overall_score": 5.0}),
+                    provider="openrouter", model="m", prompt_version="v1")
+    fake_redis.store.clear()
+    async with session_factory() as session:
+        entry = await session.get(LLMEvaluationCacheEntry, "k1")
+        entry.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        await session.commit()
+
+    assert await cache.get("k1") is None
+    assert await cache.purge_stale(prompt_versions=["v1"], models=["m"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_by_model_and_prompt_version(cache, fake_redis, session_factory):
+    for key, model, version in (("a", "m1", "v1"), ("b", "m1", "v2"), ("c", "m2", "v1")):
+        await cache.set(key, CachedEvaluation(result={"overall_score": 5.0}),
+                        provider="openrouter", model=model, prompt_version=version)
+
+    assert await cache.invalidate(prompt_version="v2") == 1
+    assert await cache.invalidate(model="m2") == 1
+
+    assert set(fake_redis.store) == {REDIS_KEY_PREFIX + "a"}
+    async with session_factory() as session:
+        keys = (await session.execute(select(LLMEvaluationCacheEntry.cache_key))).scalars().all()
+    assert keys == ["a"]
+
+    assert await cache.purge_stale(prompt_versions=["v1"], models=["m9"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_pipeline_serves_repeat_evaluations_from_cache(cache, monkeypatch):
+    recorded = []
+
+    async def record_hits(tenant_id, hits):
+        recorded.append((tenant_id, hits))
+
+    monkeypatch.setattr(cache, "record_hits", record_hits)
+    evaluator_a = FakeAdapter(model="fake/a")
+    evaluator_b = FakeAdapter(model="fake/b")
+    tenant_id = uuid4()
+
+    first = await _pipeline(cache, evaluator_a, evaluator_b).evaluate(
+        "what's the weather", "It's sunny", {"step_order": 1}, tenant_id=tenant_id
+    )
+    # A new service (e.g. another worker) and context that never reaches the prompt
+    second = await _pipeline(cache, evaluator_a, evaluator_b).evaluate(
+        "what's the weather", "It's sunny", {"step_order": 1, "asr_confidence": 0.7},
+        tenant_id=tenant_id,
+    )
+
+    assert len(evaluator_a.calls) == 1
+    assert len(evaluator_b.calls) == 1
+    assert first.cache_hits == 0
+    assert second.cache_hits == 2
+    assert second.to_dict() | {"latency_ms": 0, "evaluator_a_latency_ms": 0,
+                               "evaluator_b_latency_ms": 0, "cache_hits": 0} == \
+        first.to_dict() | {"latency_ms": 0, "evaluator_a_latency_ms": 0,
+                           "evaluator_b_latency_ms": 0}
+
+    [(logged_tenant, hits)] = recorded
+    assert logged_tenant == tenant_id
+    assert {hit.operation for hit in hits} == {"evaluator_a_cache_hit", "evaluator_b_cache_hit"}
+    assert all(hit.cached.total_tokens == 500 for hit in hits)
+
+    await _pipeline(cache, evaluator_a, evaluator_b).evaluate("what's the weather", "It's rainy")
+    assert len(evaluator_a.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_curator_calls_are_cached_separately(cache):
+    evaluator_a = FakeAdapter(score=9.0, model="fake/a")
+    evaluator_b = FakeAdapter(score=7.0, model="fake/b")
+    curator = FakeAdapter(score=8.0, model="fake/curator")
+
+    for _ in range(2):
+        result = await _pipeline(cache, evaluator_a, evaluator_b, curator).evaluate(
+            "play jazz", "Playing jazz"
+        )
+        assert result.consensus_type == "curator_resolved"
+
+    assert len(curator.calls) == 1
+    assert result.cache_hits == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_evaluations_are_not_cached(cache, fake_redis):
+    broken = FakeAdapter(content="not json", model="fake/a")
+    evaluator_b = FakeAdapter(model="fake/b")
+
+    for _ in range(2):
+        await _pipeline(cache, broken, evaluator_b).evaluate("play jazz", "Playing jazz")
+
+    assert len(broken.calls) == 2
+    assert len(evaluator_b.calls) == 1
+    assert len(fake_redis.store) == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_fails_open_when_backends_are_down():
+    class BrokenRedis:
+        async def get(self, key):
+            raise ConnectionError("redis down")
+
+        async def set(self, key, value, ttl=None):
+            raise ConnectionError("redis down")
+
+    def broken_sessions():
+        raise ConnectionError("database down")
+
+    cache = LLMEvaluationCache(redis_client=BrokenRedis(), session_factory=broken_sessions)
+    evaluator_a = FakeAdapter(model="fake/a")
+
+    for _ in range(2):
+        result = await _pipeline(cache, evaluator_a, FakeAdapter(model="fake/b")).evaluate(
+            "play jazz", "Playing jazz"
+        )
+
+    assert result.final_decision == "pass"
+    assert len(evaluator_a.calls) == 2
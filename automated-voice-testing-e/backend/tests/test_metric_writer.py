@@ -0,0 +1,168 @@
+"""
+Tests for the buffered metric writer.
+
+Validates size- and interval-triggered batch flushes, backpressure on a
+full queue, and that close() writes every queued point.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import AsyncGenerator, List
+
+import pytest
+import pytest_asyncio
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from models.base import Base
+from models.test_metric import TestMetric
+from models.test_metric_rollup import TestMetricDailyRollup, TestMetricHourlyRollup
+from services.metric_writer import MetricWriter
+from services.metrics_service import MetricsService
+
+METRIC_TABLES = [
+    TestMetric.__table__,
+    TestMetricHourlyRollup.__table__,
+    TestMetricDailyRollup.__table__,
+]
+
+BASE_TIME = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture()
+async def session_factory() -> AsyncGenerator[async_sessionmaker, None]:
+    """Provide a session factory over an in-memory metrics database."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=METRIC_TABLES)
+
+    yield async_sessionmaker(engine, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+class RecordingSessions:
+    """Session factory wrapper recording the size of each written batch."""
+
+    def __init__(self, factory: async_sessionmaker, gate: asyncio.Event | None = None):
+        self.factory = factory
+        self.gate = gate
+        self.batches: List[int] = []
+
+    @asynccontextmanager
+    async def __call__(self):
+        if self.gate is not None:
+            await self.gate.wait()
+        async with self.factory() as session:
+            before = await self._count(session)
+            yield session
+            self.batches.append(await self._count(session) - before)
+
+    @staticmethod
+    async def _count(session) -> int:
+        return (await session.execute(sa.select(sa.func.count()).select_from(TestMetric))).scalar_one()
+
+
+async def _record(writer: MetricWriter, index: int) -> None:
+    await writer.record_metric(
+        metric_type="response_time",
+        metric_value=float(index % 10),
+        dimensions={"aggregation": "raw", "execution_id": str(index)},
+        timestamp=BASE_TIME + timedelta(seconds=index),
+    )
+
+
+@pytest.mark.asyncio
+async def test_full_batches_are_written_without_waiting_for_interval(session_factory):
+    sessions = RecordingSessions(session_factory)
+    writer = MetricWriter(session_factory=sessions, max_batch_size=50, flush_interval_seconds=60)
+
+    for index in range(120):
+        await _record(writer, index)
+    for _ in range(100):
+        if writer.stats.written >= 100:
+            break
+        await asyncio.sleep(0.01)
+
+    assert sessions.batches[:2] == [50, 50]
+    assert await writer.close() == 20
+    assert writer.stats.written == 120
+
+    async with session_factory() as session:
+        results = await MetricsService(session).get_metrics(
+            metric_type="response_time",
+            start_time=BASE_TIME,
+            end_time=BASE_TIME + timedelta(hours=1),
+            granularity="hour",
+        )
+    assert results[0]["count"] == 120
+    assert results[0]["metric_value"] == pytest.approx(4.5)
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_written_after_flush_interval(session_factory):
+    sessions = RecordingSessions(session_factory)
+    writer = MetricWriter(session_factory=sessions, max_batch_size=500, flush_interval_seconds=0.05)
+
+    for index in range(3):
+        await _record(writer, index)
+    await asyncio.sleep(0.3)
+
+    assert sessions.batches == [3]
+    assert writer.pending == 0
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure(session_factory):
+    gate = asyncio.Event()
+    sessions = RecordingSessions(session_factory, gate=gate)
+    writer = MetricWriter(
+        session_factory=sessions, max_batch_size=5, flush_interval_seconds=0.01, max_queue_size=10,
+    )
+
+    for index in range(15):
+        await _record(writer, index)
+    blocked = asyncio.create_task(_record(writer, 15))
+    await asyncio.sleep(0.05)
+    assert not blocked.done()
+
+    gate.set()
+    await asyncio.wait_for(blocked, timeout=1)
+    await writer.close()
+    assert writer.stats.written == 16
+
+    with pytest.raises(RuntimeError):
+        await _record(writer, 16)
+
+
+@pytest.mark.asyncio
+async def test_failed_batches_are_counted_and_dropped():
+    @asynccontextmanager
+    async def broken_session():
+        raise ConnectionError("database unavailable")
+        yield  # pragma: no cover
+
+    writer = MetricWriter(session_factory=broken_session, max_batch_size=10, flush_interval_seconds=0.01)
+    for index in range(4):
+        await _record(writer, index)
+
+    assert await writer.close() == 0
+    assert writer.stats.failed == 4
+    assert writer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_record_metric_rejects_naive_timestamp():
+    writer = MetricWriter()
+
+    with pytest.raises(ValueError):
+        await writer.record_metric(
+            metric_type="response_time",
+            metric_value=1.0,
+            dimensions=None,
+            timestamp=datetime(2024, 5, 1, 12, 0),
+        )
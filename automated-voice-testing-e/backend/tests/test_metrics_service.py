@@ -18,8 +18,15 @@ from typing import AsyncGenerator
 
 from models.base import Base
 from models.test_metric import TestMetric
+from models.test_metric_rollup import TestMetricDailyRollup, TestMetricHourlyRollup
 from services.metrics_service import MetricsService
 
+METRIC_TABLES = [
+    TestMetric.__table__,
+    TestMetricHourlyRollup.__table__,
+    TestMetricDailyRollup.__table__,
+]
+
 
 @pytest_asyncio.fixture()
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -27,7 +34,7 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
     engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
 
     async with engine.begin() as connection:
-        await connection.run_sync(Base.metadata.create_all)
+        await connection.run_sync(Base.metadata.create_all, tables=METRIC_TABLES)
 
     session_factory = async_sessionmaker(engine, expire_on_commit=False)
     async with session_factory() as session:
@@ -35,7 +42,7 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
     async with engine.begin() as connection:
-        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.drop_all, tables=METRIC_TABLES)
     await engine.dispose()
 
 
@@ -200,3 +207,157 @@ async def test_get_metrics_rejects_unknown_granularity(db_session: AsyncSession)
             end_time=now,
             granularity="minute",
         )
+
+
+@pytest.mark.asyncio
+async def test_record_metric_maintains_hourly_and_daily_rollups(db_session: AsyncSession):
+    service = MetricsService(db_session)
+    base = datetime(2024, 3, 1, 10, 0, tzinfo=timezone.utc)
+
+    for minutes, value, execution_id in ((5, 1.5, "a"), (20, 0.5, "b"), (70, 2.0, "c")):
+        await service.record_metric(
+            metric_type="response_time",
+            metric_value=value,
+            dimensions={"suite_run_id": "run-1", "execution_id": execution_id},
+            timestamp=base + timedelta(minutes=minutes),
+        )
+
+    hourly = (await db_session.execute(
+        sa.select(TestMetricHourlyRollup).order_by(TestMetricHourlyRollup.bucket_start)
+    )).scalars().all()
+    assert [row.count for row in hourly] == [2, 1]
+    assert hourly[0].dimensions == {"suite_run_id": "run-1"}
+    assert hourly[0].value_sum == Decimal("2.00")
+    assert (hourly[0].value_min, hourly[0].value_max) == (Decimal("0.50"), Decimal("1.50"))
+
+    daily = (await db_session.execute(sa.select(TestMetricDailyRollup))).scalars().all()
+    assert len(daily) == 1
+    assert daily[0].count == 3
+    assert daily[0].sketch["bins"]
+
+
+@pytest.mark.asyncio
+async def test_rollup_rows_are_locked_in_full_key_order(db_session: AsyncSession):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    sa.event.listen(engine, "before_cursor_execute", capture)
+    try:
+        await MetricsService(db_session).record_metric(
+            metric_type="response_time",
+            metric_value=1.0,
+            dimensions={"suite_run_id": "run-1"},
+            timestamp=datetime(2024, 3, 1, 10, 0, tzinfo=timezone.utc),
+        )
+    finally:
+        sa.event.remove(engine, "before_cursor_execute", capture)
+
+    # Writers with the same metric type and bucket must not lock rows in differing order
+    locks = [statement for statement in statements if statement.startswith("SELECT") and "_rollups" in statement]
+    assert locks
+    for statement in locks:
+        order_by = [column.strip().split(".")[-1] for column in statement.rsplit("ORDER BY", 1)[1].split(",")]
+        assert order_by == ["metric_type", "bucket_start", "dimensions"]
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_stitches_rollups_with_raw_edges(db_session: AsyncSession):
+    service = MetricsService(db_session)
+    base = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+    values = {}
+    for offset_minutes in range(0, 3 * 24 * 60, 170):
+        timestamp = base + timedelta(minutes=offset_minutes)
+        value = float(offset_minutes % 7)
+        values[timestamp] = value
+        await service.record_metric(
+            metric_type="response_time",
+            metric_value=value,
+            dimensions={"aggregation": "raw", "execution_id": str(offset_minutes)},
+            timestamp=timestamp,
+        )
+
+    start = base + timedelta(hours=5, minutes=17)
+    end = base + timedelta(days=2, hours=20, minutes=41)
+    assert [source for source, _, _ in service._plan_segments(start, end, "day", None)] == [
+        "raw", "hour", "day", "hour", "raw",
+    ]
+
+    results = await service.get_metrics(
+        metric_type="response_time",
+        start_time=start,
+        end_time=end,
+        granularity="day",
+        dimensions={"aggregation": "raw"},
+    )
+
+    expected = {}
+    for timestamp, value in values.items():
+        if start <= timestamp < end:
+            day = timestamp.replace(hour=0, minute=0)
+            expected.setdefault(day, []).append(value)
+
+    assert [entry["timestamp"] for entry in results] == sorted(expected)
+    for entry in results:
+        day_values = expected[entry["timestamp"]]
+        assert entry["count"] == len(day_values)
+        assert entry["metric_value"] == pytest.approx(sum(day_values) / len(day_values), abs=0.01)
+        assert entry["min_value"] == min(day_values)
+        assert entry["max_value"] == max(day_values)
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_filters_on_execution_id_from_raw_points(db_session: AsyncSession):
+    service = MetricsService(db_session)
+    base = datetime(2024, 3, 1, 10, 0, tzinfo=timezone.utc)
+
+    for execution_id, value in (("a", 1.0), ("b", 3.0)):
+        await service.record_metric(
+            metric_type="execution_time",
+            metric_value=value,
+            dimensions={"execution_id": execution_id},
+            timestamp=base,
+        )
+
+    assert service._plan_segments(base, base + timedelta(hours=1), "hour", {"execution_id": "a"}) == [
+        ("raw", base, base + timedelta(hours=1)),
+    ]
+    results = await service.get_metrics(
+        metric_type="execution_time",
+        start_time=base,
+        end_time=base + timedelta(hours=1),
+        granularity="hour",
+        dimensions={"execution_id": "b"},
+    )
+
+    assert [(entry["metric_value"], entry["count"]) for entry in results] == [(3.0, 1)]
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_estimates_quantiles_from_rollup_sketches(db_session: AsyncSession):
+    service = MetricsService(db_session)
+    base = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+    for index in range(1, 101):
+        await service.record_metric(
+            metric_type="response_time",
+            metric_value=float(index),
+            dimensions={},
+            timestamp=base + timedelta(minutes=10 * index),
+        )
+
+    results = await service.get_metrics(
+        metric_type="response_time",
+        start_time=base,
+        end_time=base + timedelta(days=2),
+        granularity="day",
+        quantiles=[0.5, 0.95],
+    )
+
+    assert len(results) == 1
+    assert results[0]["count"] == 100
+    assert results[0]["quantiles"]["p50"] == pytest.approx(50.0, rel=0.02)
+    assert results[0]["quantiles"]["p95"] == pytest.approx(95.0, rel=0.02)
@@ -0,0 +1,203 @@
+"""
+Tests for ExpectedOutcome prefetching in MultiTurnExecutionService.
+
+Validates that a scenario execution loads the expected outcomes of all
+steps in one query, so validation never queries per step or per language
+variant (N+1 regression guard).
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.exc import MultipleResultsFound
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from models.base import Base
+from models.expected_outcome import ExpectedOutcome
+from models.human_validation import HumanValidation
+from models.multi_turn_execution import MultiTurnExecution, StepExecution
+from models.pattern_analysis_config import PatternAnalysisConfig
+from models.scenario_script import ScenarioScript, ScenarioStep
+from models.suite_run import SuiteRun
+from models.test_suite import TestSuite
+from models.user import User
+from models.validation_queue import ValidationQueue
+from models.validation_result import ValidationResult
+from services.multi_turn_execution_service import MultiTurnExecutionService
+
+
+@pytest_asyncio.fixture
+async def db_session():
+    """In-memory session with only the tables a scenario execution touches."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    tables = [
+        model.__table__ for model in (
+            User, TestSuite, SuiteRun, ScenarioScript, ScenarioStep, ExpectedOutcome,
+            MultiTurnExecution, StepExecution, ValidationResult, ValidationQueue,
+            HumanValidation, PatternAnalysisConfig,
+        )
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def test_user(db_session):
+    user = User(id=uuid4(), email="prefetch@example.com", username="prefetch", password_hash="x")
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+class StubHoundifyClient:
+    """Houndify client stub that answers every query with the utterance language."""
+
+    async def voice_query(self, audio_data, user_id, request_id, request_info):
+        lang_code = request_info["LanguageCode"]
+        return {
+            "AllResults": [
+                {
+                    "SpokenResponse": f"weather is sunny ({lang_code})",
+                    "CommandKind": "WeatherCommand",
+                    "ConversationState": {"lang": lang_code},
+                }
+            ]
+        }
+
+
+def _build_service() -> MultiTurnExecutionService:
+    service = MultiTurnExecutionService.__new__(MultiTurnExecutionService)
+    service.settings = SimpleNamespace(EXECUTION_VARIANT_CONCURRENCY=1)
+    service.tts_service = MagicMock()
+    service.tts_service.text_to_speech_async = AsyncMock(side_effect=lambda text, lang: text.encode())
+    service.tts_service.synthesize_pcm_async = AsyncMock(
+        side_effect=lambda text, lang, target_rate: SimpleNamespace(
+            audio_bytes=text.encode(), cache_hit=False, cache_source="generated"
+        )
+    )
+    service.houndify_client = StubHoundifyClient()
+    service._upload_audio_to_storage = AsyncMock(return_value="http://audio/step.mp3")
+    service._upload_response_audio_to_storage = AsyncMock(return_value=None)
+    for name in (
+        "_emit_execution_started", "_emit_step_started", "_emit_step_completed",
+        "_emit_execution_completed", "_emit_execution_failed", "_emit_progress",
+    ):
+        setattr(service, name, AsyncMock())
+    return service
+
+
+async def _create_script(db_session, user, step_count: int) -> ScenarioScript:
+    script = ScenarioScript(
+        id=uuid4(),
+        name=f"Weather {step_count}",
+        is_active=True,
+        approval_status="approved",
+        validation_mode="houndify",
+        tenant_id=user.id,
+    )
+    db_session.add(script)
+    for order in range(1, step_count + 1):
+        step = ScenarioStep(
+            id=uuid4(),
+            script_id=script.id,
+            step_order=order,
+            user_utterance=f"what's the weather {order}",
+            step_metadata={
+                "language_variants": [
+                    {"language_code": "en-US", "user_utterance": f"what's the weather {order}"},
+                    {"language_code": "fr-FR", "user_utterance": f"quel temps fait-il {order}"},
+                ]
+            },
+        )
+        db_session.add(step)
+        db_session.add(ExpectedOutcome(
+            tenant_id=user.id,
+            outcome_code=f"WEATHER_{step_count}_{order}",
+            name=f"Weather {order}",
+            scenario_step_id=step.id,
+            expected_response_content={"contains": ["sunny"]},
+        ))
+    await db_session.commit()
+    return script
+
+
+async def _count_outcome_queries(db_session, service, script, user) -> int:
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.lower())
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        execution = await service.execute_scenario(
+            db=db_session,
+            script_id=script.id,
+            suite_run_id=None,
+            tenant_id=user.id,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert execution.status == "completed"
+    return sum(
+        1 for statement in statements
+        if statement.startswith("select") and "from expected_outcomes" in statement
+    )
+
+
+@pytest.mark.asyncio
+async def test_expected_outcomes_loaded_once_per_execution(db_session, test_user):
+    service = _build_service()
+    small = await _create_script(db_session, test_user, step_count=1)
+    large = await _create_script(db_session, test_user, step_count=4)
+    db_session.expunge_all()
+
+    small_queries = await _count_outcome_queries(db_session, service, small, test_user)
+    db_session.expunge_all()
+    large_queries = await _count_outcome_queries(db_session, service, large, test_user)
+
+    # 4 steps x 2 languages validate 8 times, but outcomes come from one query
+    assert small_queries == 1
+    assert large_queries == 1
+
+
+@pytest.mark.asyncio
+async def test_validate_step_uses_prefetched_outcomes_without_querying():
+    service = _build_service()
+    step = SimpleNamespace(id=uuid4())
+    outcome = ExpectedOutcome(
+        id=uuid4(),
+        outcome_code="WEATHER",
+        expected_response_content={"contains": ["sunny"]},
+    )
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=AssertionError("validation must not query"))
+
+    result = await service._validate_step(
+        db, step, "It is sunny", "weather", None, None,
+        expected_outcomes={step.id: [outcome]},
+    )
+    assert result["passed"] is True
+    assert result["expected_outcome"] is outcome
+
+    result = await service._validate_step(
+        db, step, "It is sunny", "weather", None, None,
+        expected_outcomes={step.id: []},
+    )
+    assert result["method"] == "no_validation"
+
+    with pytest.raises(MultipleResultsFound):
+        await service._validate_step(
+            db, step, "It is sunny", "weather", None, None,
+            expected_outcomes={step.id: [outcome, outcome]},
+        )
@@ -0,0 +1,154 @@
+"""
+Tests for concurrent language variant fan-out in MultiTurnExecutionService.
+
+Validates that variants run with bounded concurrency, come back in
+deterministic order and report per-variant timings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from services.multi_turn_execution_service import MultiTurnExecutionService
+
+
+class StubHoundifyClient:
+    """Houndify client stub that records how many queries overlap."""
+
+    def __init__(self, delays: dict[str, float]) -> None:
+        self.delays = delays
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def voice_query(self, audio_data, user_id, request_id, request_info):
+        lang_code = request_info["LanguageCode"]
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(lang_code, 0.01))
+            if lang_code == "de-DE":
+                raise RuntimeError("houndify unavailable")
+            return {
+                "AllResults": [
+                    {
+                        "SpokenResponse": f"response {lang_code}",
+                        "ConversationState": {"lang": lang_code},
+                    }
+                ]
+            }
+        finally:
+            self.in_flight -= 1
+
+
+def _build_service(houndify_client, concurrency_setting: int = 4) -> MultiTurnExecutionService:
+    service = MultiTurnExecutionService.__new__(MultiTurnExecutionService)
+    service.settings = SimpleNamespace(EXECUTION_VARIANT_CONCURRENCY=concurrency_setting)
+    service.tts_service = MagicMock()
+    service.tts_service.text_to_speech_async = AsyncMock(side_effect=lambda text, lang: text.encode())
+    service.tts_service.synthesize_pcm_async = AsyncMock(
+        side_effect=lambda text, lang, target_rate: SimpleNamespace(
+            audio_bytes=text.encode(), cache_hit=False, cache_source="generated"
+        )
+    )
+    service.houndify_client = houndify_client
+    service._upload_audio_to_storage = AsyncMock(
+        side_effect=lambda audio, execution_id, step_order, lang: f"http://audio/{lang}.mp3"
+    )
+    return service
+
+
+def _variants() -> dict[str, str]:
+    return {
+        "en-US": "turn on the lights",
+        "fr-FR": "allume les lumières",
+        "es-ES": "enciende las luces",
+    }
+
+
+@pytest.mark.asyncio
+async def test_run_language_variants_preserves_order_and_caps_concurrency():
+    # The first variant is the slowest so completion order differs from input order
+    houndify = StubHoundifyClient({"en-US": 0.05, "fr-FR": 0.01, "es-ES": 0.02})
+    service = _build_service(houndify)
+    execution = SimpleNamespace(id=uuid4(), user_id="user-1")
+    step = SimpleNamespace(step_order=1)
+
+    runs = await service._run_language_variants(
+        execution=execution,
+        step=step,
+        language_variants=_variants(),
+        conversation_state={"ConversationStateId": "abc"},
+        noise_config={},
+        request_id="req_1",
+        concurrency=2,
+    )
+
+    assert list(runs.keys()) == ["en-US", "fr-FR", "es-ES"]
+    assert houndify.max_in_flight == 2
+    for lang_code, run in runs.items():
+        assert run["audio_url"] == f"http://audio/{lang_code}.mp3"
+        assert run["request_id"] == f"req_1_{lang_code}"
+        assert run["response"]["AllResults"][0]["ConversationState"] == {"lang": lang_code}
+        assert {"tts_ms", "upload_ms", "pcm_ms", "houndify_ms", "total_ms", "started_at_ms"} <= set(
+            run["timings"]
+        )
+
+
+@pytest.mark.asyncio
+async def test_run_language_variants_sequential_when_concurrency_is_one():
+    houndify = StubHoundifyClient({})
+    service = _build_service(houndify)
+
+    await service._run_language_variants(
+        execution=SimpleNamespace(id=uuid4(), user_id="user-1"),
+        step=SimpleNamespace(step_order=1),
+        language_variants=_variants(),
+        conversation_state=None,
+        noise_config={},
+        request_id="req_1",
+        concurrency=1,
+    )
+
+    assert houndify.max_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_run_language_variants_isolates_houndify_failures_and_upload_failures():
+    houndify = StubHoundifyClient({})
+    service = _build_service(houndify)
+    service._upload_audio_to_storage = AsyncMock(
+        side_effect=lambda audio, execution_id, step_order, lang: None if lang == "es-ES" else "http://audio"
+    )
+
+    runs = await service._run_language_variants(
+        execution=SimpleNamespace(id=uuid4(), user_id="user-1"),
+        step=SimpleNamespace(step_order=2),
+        language_variants={"en-US": "hello", "de-DE": "hallo", "es-ES": "hola"},
+        conversation_state=None,
+        noise_config={},
+        request_id="req_2",
+        concurrency=3,
+    )
+
+    assert "response" in runs["en-US"]
+    assert isinstance(runs["de-DE"]["error"], RuntimeError)
+    assert runs["es-ES"]["audio_url"] is None
+    assert "houndify_ms" not in runs["es-ES"]["timings"]
+
+
+def test_resolve_variant_concurrency_priority():
+    service = _build_service(StubHoundifyClient({}), concurrency_setting=3)
+
+    assert service._resolve_variant_concurrency(SimpleNamespace(script_metadata={})) == 3
+    assert service._resolve_variant_concurrency(
+        SimpleNamespace(script_metadata={"variant_concurrency": 6})
+    ) == 6
+    assert service._resolve_variant_concurrency(
+        SimpleNamespace(script_metadata={"variant_concurrency": 6}), 2
+    ) == 2
+    assert service._resolve_variant_concurrency(SimpleNamespace(script_metadata=None), 0) == 1
@@ -0,0 +1,113 @@
+"""
+Tests for the precomputed noise bank in NoiseProfileLibraryService.
+
+Validates reuse of noise loops across calls and instances, seeded
+reproducibility, SNR accuracy of the vectorised path and mmap loading.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from services import noise_profile_library_service as noise_module
+from services.noise_profile_library_service import NoiseProfileLibraryService
+
+
+@pytest.fixture(autouse=True)
+def empty_bank(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(noise_module, "_noise_bank", {})
+
+
+@pytest.fixture()
+def signal() -> np.ndarray:
+    t = np.arange(8000, dtype=np.float32) / 16000
+    return (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+def _count_syntheses(monkeypatch: pytest.MonkeyPatch) -> list:
+    calls: list = []
+    original = NoiseProfileLibraryService._synthesize_noise
+
+    def counting(self, *args, **kwargs):
+        calls.append(args[0])
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(NoiseProfileLibraryService, "_synthesize_noise", counting)
+    return calls
+
+
+def test_noise_loop_is_built_once_per_profile_and_rate(monkeypatch, signal):
+    calls = _count_syntheses(monkeypatch)
+    service = NoiseProfileLibraryService(bank_seconds=1.0)
+
+    for _ in range(3):
+        service.apply_noise(signal, "car_cabin_city", 10)
+    NoiseProfileLibraryService(bank_seconds=1.0).apply_noise(signal, "car_cabin_city", 10)
+    service.apply_noise(signal, "car_cabin_city", 10, sample_rate=8000)
+
+    assert calls == ["car_cabin_city", "car_cabin_city"]
+
+
+def test_seeded_noise_is_reproducible(signal):
+    service = NoiseProfileLibraryService(bank_seconds=1.0)
+
+    first = service.apply_noise(signal, "crowd_dense", 5, seed=7)
+    second = service.apply_noise(signal, "crowd_dense", 5, seed=7)
+    other = service.apply_noise(signal, "crowd_dense", 5, seed=8)
+
+    assert first.dtype == np.float32
+    np.testing.assert_array_equal(first, second)
+    assert not np.array_equal(first, other)
+
+
+@pytest.mark.parametrize("snr_db", [0.0, 10.0, 20.0])
+def test_apply_noise_hits_target_snr(signal, snr_db):
+    service = NoiseProfileLibraryService(bank_seconds=1.0)
+
+    noisy = service.apply_noise(signal, "road_highway", snr_db, seed=1)
+
+    noise = noisy - signal
+    measured = 10 * np.log10(np.mean(signal ** 2) / np.mean(noise ** 2))
+    assert measured == pytest.approx(snr_db, abs=0.01)
+
+
+def test_batch_matches_per_row_snr_and_handles_wraparound(signal):
+    # Signals longer than the loop must wrap around it
+    service = NoiseProfileLibraryService(bank_seconds=0.25)
+    batch = np.stack([signal, signal * 0.1, signal * 0.5])
+
+    noisy = service.apply_noise_batch(batch, "factory_heavy", [0.0, 10.0, 20.0], seed=3)
+
+    assert noisy.shape == batch.shape
+    for row, snr_db in zip(range(3), (0.0, 10.0, 20.0)):
+        noise = noisy[row] - batch[row]
+        measured = 10 * np.log10(np.mean(batch[row] ** 2) / np.mean(noise ** 2))
+        assert measured == pytest.approx(snr_db, abs=0.01)
+
+
+def test_generate_noise_is_peak_normalized():
+    service = NoiseProfileLibraryService(bank_seconds=1.0)
+
+    noise = service.generate_noise("hvac_office", 0.5, seed=2)
+
+    assert noise.dtype == np.float32
+    assert len(noise) == 8000
+    assert np.max(np.abs(noise)) == pytest.approx(1.0, abs=1e-5)
+
+
+def test_bank_dir_is_written_and_memory_mapped(tmp_path: Path, monkeypatch, signal):
+    service = NoiseProfileLibraryService(bank_seconds=1.0, bank_dir=tmp_path)
+    built = service.get_noise_bank("home_tv")
+    assert len(list(tmp_path.glob("home_tv_16000hz_*.npy"))) == 1
+
+    # A new process (empty in-memory bank) maps the saved loop instead of rebuilding it
+    monkeypatch.setattr(noise_module, "_noise_bank", {})
+    calls = _count_syntheses(monkeypatch)
+    loaded = NoiseProfileLibraryService(bank_seconds=1.0, bank_dir=tmp_path).get_noise_bank("home_tv")
+
+    assert calls == []
+    assert isinstance(loaded, np.memmap)
+    np.testing.assert_array_equal(loaded, built)
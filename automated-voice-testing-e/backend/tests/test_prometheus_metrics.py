@@ -24,6 +24,10 @@ def test_metrics_module_exposes_expected_instruments():
     assert isinstance(metrics_module.houndify_requests_total, Counter)
     assert isinstance(metrics_module.houndify_errors_total, Counter)
     assert isinstance(metrics_module.houndify_latency_seconds, Histogram)
+    assert isinstance(metrics_module.llm_admission_queue_depth, Gauge)
+    assert isinstance(metrics_module.llm_admission_wait_seconds, Histogram)
+    assert isinstance(metrics_module.llm_concurrency_limit, Gauge)
+    assert isinstance(metrics_module.llm_rate_limited_total, Counter)
 
     families = {family.name: family for family in metrics_module.registry.collect()}
 
@@ -36,6 +40,10 @@ def test_metrics_module_exposes_expected_instruments():
         "houndify_requests",
         "houndify_errors",
         "houndify_latency_seconds",
+        "llm_admission_queue_depth",
+        "llm_admission_wait_seconds",
+        "llm_concurrency_limit",
+        "llm_rate_limited",
     }
 
     assert families["test_executions"].type == "counter"
@@ -128,3 +136,8 @@ def test_metrics_module_exposes_expected_instruments():
         latency_family.documentation
         == "Latency distribution for Houndify requests in seconds."
     )
+
+    assert families["llm_admission_queue_depth"].type == "gauge"
+    assert families["llm_admission_wait_seconds"].type == "histogram"
+    assert families["llm_concurrency_limit"].type == "gauge"
+    assert families["llm_rate_limited"].type == "counter"
@@ -0,0 +1,55 @@
+"""
+Tests for the mergeable quantile sketch used by metric rollups.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from services.quantile_sketch import QuantileSketch
+
+
+def test_quantiles_within_relative_accuracy():
+    rng = random.Random(7)
+    values = sorted(rng.lognormvariate(5, 1) for _ in range(5000))
+    sketch = QuantileSketch(alpha=0.01)
+    sketch.update(values)
+
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+
+def test_merged_sketches_match_single_sketch():
+    left, right, combined = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for value in range(-50, 200):
+        (left if value % 2 else right).add(value)
+        combined.add(value)
+
+    left.merge(right)
+
+    assert left.count == combined.count
+    assert left.to_dict() == combined.to_dict()
+    assert left.quantile(0.0) == pytest.approx(-50, rel=0.02)
+    assert QuantileSketch.from_dict(left.to_dict()).quantile(0.5) == combined.quantile(0.5)
+
+
+def test_empty_and_mismatched_sketches():
+    assert QuantileSketch().quantile(0.5) is None
+    assert QuantileSketch.from_dict(None).count == 0
+
+    with pytest.raises(ValueError):
+        QuantileSketch(alpha=0.01).merge(QuantileSketch(alpha=0.05))
+
+
+def test_max_bins_collapses_lowest_buckets():
+    sketch = QuantileSketch(alpha=0.01, max_bins=50)
+    values = [1.0 * 1.1 ** exponent for exponent in range(200)]
+    sketch.update(values)
+
+    assert len(sketch.bins()) == 50
+    assert sketch.count == len(values)
+    assert sketch.quantile(0.99) == pytest.approx(values[int(0.99 * 199)], rel=0.02)
+    assert sketch.quantile(0.0) > values[0]
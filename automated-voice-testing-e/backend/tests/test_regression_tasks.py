@@ -63,7 +63,7 @@ def test_run_regression_suite_invokes_executor(monkeypatch: pytest.MonkeyPatch):
     executor_cls = MagicMock(return_value=executor_instance)
     monkeypatch.setattr(regression, "RegressionSuiteExecutor", executor_cls)
 
-    monkeypatch.setattr(regression.asyncio, "run", _run_sync)
+    monkeypatch.setattr(regression, "run_async", _run_sync)
 
     result = regression.run_regression_suite(trigger="nightly", metadata={"source": "cron"})
 
@@ -0,0 +1,109 @@
+"""
+Tests for FFT/overlap-add convolution and the cached RIR bank in
+RoomImpulseResponseService.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from services import room_impulse_response_service as rir_module
+from services.room_impulse_response_service import (
+    RoomImpulseResponseService,
+    choose_convolution_method,
+    convolve,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_bank(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(rir_module, "_rir_bank", {})
+
+
+@pytest.fixture()
+def service() -> RoomImpulseResponseService:
+    return RoomImpulseResponseService()
+
+
+@pytest.mark.parametrize("method", ["direct", "fft", "overlap_add", "auto"])
+@pytest.mark.parametrize("signal_len,kernel_len", [(1000, 37), (5000, 4000), (300, 2000), (1, 1)])
+def test_convolution_methods_match_numpy(method, signal_len, kernel_len):
+    rng = np.random.default_rng(0)
+    signal = rng.standard_normal(signal_len)
+    kernel = rng.standard_normal(kernel_len)
+
+    np.testing.assert_allclose(
+        convolve(signal, kernel, method),
+        np.convolve(signal, kernel, mode="full"),
+        rtol=1e-7,
+        atol=1e-9,
+    )
+
+
+def test_auto_method_selection():
+    assert choose_convolution_method(200, 100) == "direct"
+    assert choose_convolution_method(48000, 16000) == "fft"
+    assert choose_convolution_method(160000, 8000) == "overlap_add"
+
+
+def test_unknown_method_rejected():
+    with pytest.raises(ValueError):
+        convolve(np.ones(4), np.ones(2), "winograd")
+
+
+def test_apply_rir_matches_direct_convolution(service):
+    rng = np.random.default_rng(1)
+    signal = rng.standard_normal(16000).astype(np.float32)
+    rir = service.get_rir("living_room", 0.5)
+
+    fast = service.apply_rir(signal, rir)
+    direct = service.apply_rir(signal, rir, method="direct")
+
+    assert fast.dtype == np.float32
+    np.testing.assert_allclose(fast, direct, atol=1e-5)
+
+
+def test_rir_bank_returns_same_array_across_instances(service):
+    first = service.get_rir("hall")
+    second = RoomImpulseResponseService().get_rir("hall")
+
+    assert first is second
+    assert not first.flags.writeable
+    assert service.get_rir("hall", 0.5) is not first
+
+
+def test_generate_rir_is_reproducible_under_seed(service):
+    np.testing.assert_array_equal(
+        service.generate_rir("bathroom", 0.2, seed=5),
+        service.generate_rir("bathroom", 0.2, seed=5),
+    )
+
+
+def test_batch_matches_single_signal_path(service):
+    rng = np.random.default_rng(2)
+    signals = [rng.standard_normal(n).astype(np.float32) for n in (8000, 12000, 3000, 0)]
+    rir = service.get_rir("classroom", 0.4)
+
+    batched = service.apply_rir_batch(signals, rir)
+
+    assert [len(out) for out in batched] == [8000, 12000, 3000, 0]
+    for signal, out in zip(signals[:3], batched[:3]):
+        np.testing.assert_allclose(out, service.apply_rir(signal, rir, method="direct"), atol=1e-5)
+
+
+def test_apply_room_preset_uses_cached_rir(service, monkeypatch):
+    calls = []
+    original = RoomImpulseResponseService.generate_rir
+
+    def counting(self, *args, **kwargs):
+        calls.append(args[0])
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(RoomImpulseResponseService, "generate_rir", counting)
+    signals = [np.ones(1600, dtype=np.float32)] * 3
+
+    service.apply_room_preset(signals, "car_cabin")
+    service.apply_room_preset(signals, "car_cabin")
+
+    assert calls == ["car_cabin"]
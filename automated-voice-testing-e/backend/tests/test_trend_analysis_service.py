@@ -8,7 +8,6 @@ exposing analytics endpoints.
 from __future__ import annotations
 
 from datetime import date, datetime, timezone, timedelta
-from decimal import Decimal
 from typing import Any, AsyncGenerator, Optional
 from uuid import uuid4
 
@@ -21,6 +20,8 @@ from unittest.mock import AsyncMock
 from models.base import Base
 from models.defect import Defect
 from models.test_metric import TestMetric
+from models.test_metric_rollup import TestMetricDailyRollup, TestMetricHourlyRollup
+from services.metrics_service import MetricsService
 from services.trend_analysis_service import TrendAnalysisService
 from services.anomaly_detection_service import AnomalyDetectionService
 
@@ -52,6 +53,8 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
             await connection.run_sync(table.create)
         await connection.run_sync(Defect.__table__.create)
         await connection.run_sync(TestMetric.__table__.create)
+        await connection.run_sync(TestMetricHourlyRollup.__table__.create)
+        await connection.run_sync(TestMetricDailyRollup.__table__.create)
 
     session_factory = async_sessionmaker(engine, expire_on_commit=False)
     async with session_factory() as session:
@@ -59,6 +62,8 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
     async with engine.begin() as connection:
+        await connection.run_sync(TestMetricDailyRollup.__table__.drop)
+        await connection.run_sync(TestMetricHourlyRollup.__table__.drop)
         await connection.run_sync(TestMetric.__table__.drop)
         await connection.run_sync(Defect.__table__.drop)
         for table in ("test_runs", "test_cases", "users"):
@@ -84,20 +89,20 @@ def _metric(
     day: datetime,
     aggregation: str = "day",
     count: int = 1,
-) -> list[TestMetric]:
-    """Create a TestMetric row with optional duplication for counts."""
-    metrics = []
+) -> list[dict[str, Any]]:
+    """Create metric datapoints with optional duplication for counts."""
     dimensions = {"aggregation": aggregation}
-    for _ in range(count):
-        metrics.append(
-            TestMetric(
-                metric_type=metric_type,
-                metric_value=Decimal(str(value)),
-                dimensions=dimensions,
-                timestamp=day,
-            )
-        )
-    return metrics
+    return [
+        {"metric_type": metric_type, "metric_value": value, "dimensions": dimensions, "timestamp": day}
+        for _ in range(count)
+    ]
+
+
+async def _record(db_session: AsyncSession, metrics: list[dict[str, Any]]) -> None:
+    """Write datapoints through MetricsService so its rollups are maintained."""
+    service = MetricsService(db_session)
+    for metric in metrics:
+        await service.record_metric(**metric)
 
 
 @pytest.mark.asyncio
@@ -114,8 +119,7 @@ async def test_analyze_pass_rate_trend_returns_percentages(db_session: AsyncSess
         + _metric(metric_type="validation_pass", value=0.0, day=day_three, count=2)
         + _metric(metric_type="validation_pass", value=1.0, day=day_three, count=1)
     )
-    db_session.add_all(metrics)
-    await db_session.commit()
+    await _record(db_session, metrics)
 
     service = TrendAnalysisService(db_session)
 
@@ -261,8 +265,7 @@ async def test_analyze_performance_trend_returns_average_ms(db_session: AsyncSes
         + _metric(metric_type="response_time", value=1.0, day=day_two, count=1)
         + _metric(metric_type="response_time", value=0.9, day=day_three, count=1)
     )
-    db_session.add_all(metrics)
-    await db_session.commit()
+    await _record(db_session, metrics)
 
     service = TrendAnalysisService(db_session)
 
@@ -422,7 +425,7 @@ async def test_analyze_trends_with_anomalies(db_session: AsyncSession):
                 day=base + timedelta(days=idx),
             )
         )
-    db_session.add_all(pass_metrics + response_metrics)
+    await _record(db_session, pass_metrics + response_metrics)
 
     case_id = uuid4()
     defects = [
@@ -0,0 +1,166 @@
+"""
+Tests for the async TTSService API.
+
+Covers single-flight deduplication, the in-process LRU and the shared
+content-addressed cache without calling out to gTTS.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.tts_service import TTSService
+
+
+class CountingGenerator:
+    """Stand-in for gTTS that counts calls and can block until released."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, text: str, lang: str) -> bytes:
+        self.calls += 1
+        self.release.wait(timeout=5)
+        return f"{lang}:{text}".encode()
+
+
+@pytest.fixture()
+def generator(monkeypatch: pytest.MonkeyPatch) -> CountingGenerator:
+    counting = CountingGenerator()
+    monkeypatch.setattr(TTSService, "_generate_audio", lambda self, text, lang: counting(text, lang))
+    return counting
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_synthesis(tmp_path: Path, generator):
+    tts = TTSService(cache_dir=tmp_path)
+    generator.release.clear()
+
+    tasks = [asyncio.create_task(tts.synthesize_async("hello", "en")) for _ in range(5)]
+    await asyncio.sleep(0.05)
+    generator.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert generator.calls == 1
+    assert {result.audio_bytes for result in results} == {b"en:hello"}
+    assert sum(result.cache_source == "generated" for result in results) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_lookup_order_memory_then_disk(tmp_path: Path, generator):
+    tts = TTSService(cache_dir=tmp_path)
+
+    first = await tts.synthesize_async("hello", "en")
+    second = await tts.synthesize_async("hello", "en")
+    assert (first.cache_source, second.cache_source) == ("generated", "memory")
+    assert (tmp_path / f"{first.cache_key}.mp3").read_bytes() == b"en:hello"
+
+    # A fresh instance has an empty LRU but shares the disk cache
+    other = TTSService(cache_dir=tmp_path)
+    third = await other.synthesize_async("hello", "en")
+    assert third.cache_source == "disk"
+    assert third.cache_hit is True
+    assert generator.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_is_bounded(tmp_path: Path, generator):
+    tts = TTSService(cache_dir=tmp_path, memory_cache_size=2)
+
+    for text in ("one", "two", "three"):
+        await tts.synthesize_async(text, "en")
+
+    assert len(tts._memory_cache) == 2
+    assert tts._memory_get(tts._generate_cache_key("one", "en")) is None
+
+
+@pytest.mark.asyncio
+async def test_shared_store_is_content_addressed(tmp_path: Path, generator):
+    store = AsyncMock()
+    store.default_bucket = "audio"
+    store.download_by_key.return_value = None
+    tts = TTSService(cache_dir=tmp_path, shared_store=store, shared_store_bucket="audio")
+
+    result = await tts.synthesize_async("hello", "en")
+
+    expected_key = f"tts-cache/{result.cache_key}.mp3"
+    store.download_by_key.assert_awaited_once_with(expected_key, bucket="audio")
+    store.upload_audio.assert_awaited_once_with(b"en:hello", expected_key, bucket="audio")
+
+    # Another worker with a cold local cache is served from the shared store
+    store.download_by_key.return_value = b"shared-audio"
+    other = TTSService(cache_dir=tmp_path / "other", shared_store=store, shared_store_bucket="audio")
+    shared = await other.synthesize_async("hello", "en")
+    assert shared.cache_source == "shared"
+    assert shared.audio_bytes == b"shared-audio"
+    assert generator.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_async_rejects_empty_text(tmp_path: Path):
+    tts = TTSService(cache_dir=tmp_path)
+    with pytest.raises(ValueError):
+        await tts.synthesize_async("   ", "en")
+
+
+@pytest.fixture()
+def decoder(monkeypatch: pytest.MonkeyPatch) -> list:
+    calls: list = []
+
+    def fake_decode(mp3_bytes: bytes, target_rate: int, channels: int, sample_width: int) -> bytes:
+        calls.append((mp3_bytes, target_rate, channels, sample_width))
+        return b"pcm:" + mp3_bytes + f":{target_rate}".encode()
+
+    monkeypatch.setattr(TTSService, "_decode_pcm", staticmethod(fake_decode))
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_pcm_is_decoded_once_and_cached_next_to_mp3(tmp_path: Path, generator, decoder):
+    tts = TTSService(cache_dir=tmp_path)
+
+    cold = await tts.synthesize_pcm_async("hello", "en", target_rate=16000)
+    assert cold.cache_source == "generated"
+    assert cold.audio_bytes == b"pcm:en:hello:16000"
+    assert cold.sample_rate == 16000
+    assert cold.cache_path.parent == tmp_path
+    assert cold.cache_path.name.startswith(tts._generate_cache_key("hello", "en"))
+    assert cold.cache_path.read_bytes() == cold.audio_bytes
+
+    # A new worker process (empty LRU) reuses the decoded PCM from disk
+    warm = await TTSService(cache_dir=tmp_path).synthesize_pcm_async("hello", "en", target_rate=16000)
+    assert warm.cache_source == "disk"
+    assert warm.audio_bytes == cold.audio_bytes
+    assert len(decoder) == 1
+    assert generator.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_pcm_cache_is_keyed_by_format(tmp_path: Path, generator, decoder):
+    tts = TTSService(cache_dir=tmp_path)
+
+    narrow = await tts.synthesize_pcm_async("hello", "en", target_rate=8000)
+    wide = await tts.synthesize_pcm_async("hello", "en", target_rate=16000)
+
+    assert narrow.cache_key != wide.cache_key
+    assert [call[1] for call in decoder] == [8000, 16000]
+    # Both decodes share one MP3 synthesis
+    assert generator.calls == 1
+
+
+def test_sync_synthesize_pcm_uses_disk_cache(tmp_path: Path, generator, decoder):
+    tts = TTSService(cache_dir=tmp_path, memory_cache_size=0)
+
+    first = tts.synthesize_pcm("hello", "en")
+    second = tts.synthesize_pcm("hello", "en")
+
+    assert (first.cache_source, second.cache_source) == ("generated", "disk")
+    assert len(decoder) == 1
+    assert tts.clear_cache() == 2
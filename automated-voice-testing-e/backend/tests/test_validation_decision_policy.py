@@ -0,0 +1,222 @@
+"""
+Tests for the validation decision policy.
+
+Validates that hybrid validation skips the LLM when the deterministic
+Houndify result is conclusive (and never when no deterministic check is
+configured), that the pipeline only calls evaluator B when evaluator A is
+borderline, and that the path taken is recorded.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from models.expected_outcome import ExpectedOutcome
+from models.multi_turn_execution import MultiTurnExecution
+from services import llm_pipeline_service as pipeline_module
+from services import validation_service as validation_module
+from services.llm_pipeline_service import LLMPipelineService
+from services.llm_providers import EvaluationItem
+from services.llm_providers.base import BaseLLMAdapter
+from services.validation_decision_policy import (
+    DECISION_PATH_DETERMINISTIC_FAIL,
+    DECISION_PATH_DETERMINISTIC_PASS,
+    DECISION_PATH_DUAL_EVALUATOR,
+    DECISION_PATH_SINGLE_EVALUATOR,
+    DecisionPolicy,
+)
+from services.validation_service import ValidationService
+
+
+class ScoringProvider(BaseLLMAdapter):
+    """Provider scoring every criterion with the score given per response."""
+
+    provider_name = "stub"
+    default_model = "stub/judge"
+
+    def __init__(self, scores: Dict[str, float], default_score: float = 9.0, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.scores = scores
+        self.default_score = default_score
+        self.calls: List[str] = []
+
+    async def _initialize_client(self) -> None:
+        self._client = object()
+
+    async def _call_api(self, prompt: str, system_prompt: str) -> Dict[str, Any]:
+        ai_response = prompt.split("AI RESPONSE: ", 1)[1].split("\n", 1)[0]
+        self.calls.append(ai_response)
+        score = self.scores.get(ai_response, self.default_score)
+        criteria = ("relevance", "correctness", "completeness", "tone", "entity_accuracy")
+        return {
+            "content": json.dumps({"scores": dict.fromkeys(criteria, score), "reasoning": f"Scored {score}"}),
+            "usage": {"prompt_tokens": 400, "completion_tokens": 100},
+        }
+
+
+@pytest.fixture(autouse=True)
+def no_evaluation_cache(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(pipeline_module, "get_evaluation_cache", lambda: None)
+
+
+def _pipeline(scores: Dict[str, float], sequential: bool = True) -> LLMPipelineService:
+    service = LLMPipelineService(
+        api_key="test",
+        pass_threshold=0.8,
+        policy=DecisionPolicy(sequential_evaluators=sequential, borderline_margin=0.15),
+    )
+    service._evaluator_a = ScoringProvider(scores, model="stub/a")
+    service._evaluator_b = ScoringProvider(scores, model="stub/b")
+    service._curator = ScoringProvider(scores, model="stub/curator")
+    return service
+
+
+def test_deterministic_path_only_short_circuits_conclusive_hybrid_results():
+    policy = DecisionPolicy(min_asr_confidence=0.95)
+    conclusive = dict(
+        validation_mode='hybrid', entities_passed=True, asr_confidence=0.97, checks_configured=True,
+    )
+
+    assert policy.deterministic_path(
+        houndify_passed=False, command_kind_matched=False, **conclusive
+    ) == DECISION_PATH_DETERMINISTIC_FAIL
+    assert policy.deterministic_path(
+        houndify_passed=True, command_kind_matched=True, **conclusive
+    ) == DECISION_PATH_DETERMINISTIC_PASS
+
+    # Failing only on response content leaves the verdict to the LLM
+    assert policy.deterministic_path(
+        validation_mode='hybrid', houndify_passed=False, command_kind_matched=True,
+        entities_passed=True, asr_confidence=0.97, checks_configured=True,
+    ) is None
+    assert policy.deterministic_path(
+        validation_mode='hybrid', houndify_passed=True, command_kind_matched=True,
+        entities_passed=True, asr_confidence=0.9, checks_configured=True,
+    ) is None
+    assert policy.deterministic_path(
+        validation_mode='llm_ensemble', houndify_passed=False, command_kind_matched=False,
+        entities_passed=False, asr_confidence=0.97, checks_configured=True,
+    ) is None
+    # Houndify passes trivially with no CommandKind or entities to check
+    assert policy.deterministic_path(
+        validation_mode='hybrid', houndify_passed=True, command_kind_matched=True,
+        entities_passed=True, asr_confidence=0.99,
+    ) is None
+    assert DecisionPolicy(early_exit_enabled=False).deterministic_path(
+        houndify_passed=False, command_kind_matched=False, **conclusive
+    ) is None
+
+
+@pytest.mark.asyncio
+async def test_decisive_evaluator_a_skips_evaluator_b():
+    service = _pipeline({"Playing jazz": 10, "I don't know": 2})
+
+    passed = await service.evaluate("play jazz", "Playing jazz")
+    failed = await service.evaluate("play jazz", "I don't know")
+
+    assert service._evaluator_b.calls == []
+    assert service._curator.calls == []
+    assert (passed.final_decision, passed.decision_path) == ("pass", DECISION_PATH_SINGLE_EVALUATOR)
+    assert (failed.final_decision, failed.decision_path) == ("fail", DECISION_PATH_SINGLE_EVALUATOR)
+    assert passed.evaluator_b_scores is None
+    assert passed.confidence == "medium"
+
+
+@pytest.mark.asyncio
+async def test_borderline_evaluator_a_runs_evaluator_b():
+    service = _pipeline({"Playing jazz": 9})
+
+    result = await service.evaluate("play jazz", "Playing jazz")
+
+    assert service._evaluator_b.calls == ["Playing jazz"]
+    assert result.decision_path == DECISION_PATH_DUAL_EVALUATOR
+    assert result.final_decision == "pass"
+
+    parallel = _pipeline({"Playing jazz": 10}, sequential=False)
+    result = await parallel.evaluate("play jazz", "Playing jazz")
+    assert parallel._evaluator_b.calls == ["Playing jazz"]
+    assert result.decision_path == DECISION_PATH_DUAL_EVALUATOR
+
+
+@pytest.mark.asyncio
+async def test_batch_calls_evaluator_b_only_for_borderline_turns():
+    service = _pipeline({"r0": 10, "r1": 8, "r2": 1})
+    items = [EvaluationItem(f"q{index}", f"r{index}", {"step_order": index + 1}) for index in range(3)]
+
+    results = await service.evaluate_batch(items)
+
+    assert service._evaluator_b.calls == ["r1"]
+    assert [result.decision_path for result in results] == [
+        DECISION_PATH_SINGLE_EVALUATOR, DECISION_PATH_DUAL_EVALUATOR, DECISION_PATH_SINGLE_EVALUATOR,
+    ]
+    assert [result.final_decision for result in results] == ["pass", "pass", "fail"]
+
+
+async def _validate_hybrid(monkeypatch, expected_command_kind, llm_result=None):
+    """Validate a MusicCommand response (ASR 0.97) in hybrid mode with a stubbed LLM."""
+    monkeypatch.setattr(validation_module, "get_decision_policy", lambda: DecisionPolicy())
+    service = ValidationService()
+
+    execution = MagicMock(spec=MultiTurnExecution)
+    execution.id = uuid4()
+    execution.suite_run_id = uuid4()
+    execution.tenant_id = uuid4()
+    execution.get_all_response_entities = MagicMock(return_value={})
+    execution.get_all_context = MagicMock(return_value={
+        "houndify_response": {
+            "AllResults": [{
+                "CommandKind": "MusicCommand",
+                "ASRConfidence": 0.97,
+                "SpokenResponse": "Playing jazz",
+            }]
+        }
+    })
+    outcome = MagicMock(spec=ExpectedOutcome)
+    outcome.id = uuid4()
+    outcome.entities = {}
+    outcome.validation_rules = {}
+    outcome.expected_command_kind = expected_command_kind
+    outcome.expected_asr_confidence_min = 0.7
+    outcome.expected_response_content = None
+    outcome.forbidden_phrases = None
+
+    with patch.object(service, '_fetch_execution', AsyncMock(return_value=execution)), \
+            patch.object(service, '_fetch_expected_outcome', AsyncMock(return_value=outcome)), \
+            patch.object(service, '_resolve_transcript', return_value="play some jazz"), \
+            patch.object(service, '_run_llm_validation_task', AsyncMock(return_value=llm_result)) as llm_task:
+        result = await service.validate_voice_response(
+            execution_id=execution.id,
+            expected_outcome_id=outcome.id,
+            validation_mode='hybrid',
+        )
+    return result, llm_task
+
+
+@pytest.mark.asyncio
+async def test_hybrid_validation_skips_llm_on_command_kind_mismatch(monkeypatch):
+    result, llm_task = await _validate_hybrid(monkeypatch, expected_command_kind="WeatherCommand")
+
+    llm_task.assert_not_called()
+    assert result.decision_path == DECISION_PATH_DETERMINISTIC_FAIL
+    assert result.final_decision == 'fail'
+    assert result.review_status == 'auto_fail'
+    assert result.houndify_result['total_validation_latency_ms'] >= 0
+
+
+@pytest.mark.asyncio
+async def test_hybrid_validation_without_deterministic_checks_runs_llm(monkeypatch):
+    llm_result = MagicMock(final_decision='fail', final_score=0.2, decision_path=DECISION_PATH_SINGLE_EVALUATOR)
+
+    # No CommandKind or entities expected: high ASR confidence alone is not a pass
+    result, llm_task = await _validate_hybrid(
+        monkeypatch, expected_command_kind=None, llm_result=(False, llm_result, {}),
+    )
+
+    llm_task.assert_called_once()
+    assert result.decision_path == DECISION_PATH_SINGLE_EVALUATOR
+    assert result.final_decision != 'pass'
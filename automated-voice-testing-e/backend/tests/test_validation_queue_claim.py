@@ -0,0 +1,134 @@
+"""
+Tests for atomic claiming of validation queue tasks.
+
+Validates that claim_next locks with FOR UPDATE SKIP LOCKED in queries
+ordered by the pending index alone, hands out tasks in claim order
+(language match, priority, age) with optional batch claims, and hands out
+each task once across sequential claims.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from models.base import Base
+from models.validation_queue import ValidationQueue
+from services.validation_queue_service import MAX_CLAIM_BATCH_SIZE, ValidationQueueService
+
+CREATED = datetime(2026, 1, 1, 12, 0, 0)
+
+
+class RecordingStatsCache:
+    """Stats cache stand-in counting invalidations."""
+
+    def __init__(self):
+        self.invalidations = 0
+
+    async def invalidate(self):
+        self.invalidations += 1
+
+
+@pytest_asyncio.fixture()
+async def session_factory() -> AsyncGenerator[async_sessionmaker, None]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=[ValidationQueue.__table__])
+
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+async def _seed(session_factory, *items) -> list:
+    rows = [
+        ValidationQueue(
+            id=uuid.uuid4(),
+            validation_result_id=uuid.uuid4(),
+            priority=priority,
+            language_code=language,
+            status="pending",
+            created_at=CREATED + timedelta(minutes=minute),
+        )
+        for priority, language, minute in items
+    ]
+    async with session_factory() as db:
+        db.add_all(rows)
+        await db.commit()
+    return [row.id for row in rows]
+
+
+@pytest.mark.asyncio
+async def test_claim_next_locks_with_skip_locked():
+    statements = []
+
+    class RecordingSession:
+        async def execute(self, statement):
+            statements.append(statement)
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: []))
+
+    tasks = await ValidationQueueService().claim_next(
+        RecordingSession(), validator_id=uuid.uuid4(), language_code="es", limit=3
+    )
+
+    assert tasks == []
+    # Language matches first, then the rest of the batch; both in index order
+    matching, rest = (str(statement.compile(dialect=postgresql.dialect())) for statement in statements)
+    for sql in (matching, rest):
+        assert "FOR UPDATE OF validation_queue SKIP LOCKED" in sql
+        assert "ORDER BY validation_queue.priority ASC, validation_queue.created_at ASC" in sql
+        assert "LIMIT" in sql
+    assert "validation_queue.language_code LIKE" in matching
+    assert "LIKE" not in rest
+
+
+@pytest.mark.asyncio
+async def test_claim_next_prefers_language_then_priority_and_age(session_factory):
+    ids = await _seed(
+        session_factory,
+        (1, "en-US", 0),
+        (5, "es-MX", 2),
+        (5, "es-ES", 1),
+        (2, "fr-FR", 3),
+    )
+    validator_id = uuid.uuid4()
+    stats_cache = RecordingStatsCache()
+    service = ValidationQueueService(stats_cache=stats_cache)
+
+    async with session_factory() as db:
+        assert (await service.get_next_validation(db, validator_id, language_code="es")).id == ids[2]
+
+        # Two language matches, then the batch is filled in priority order
+        batch = await service.claim_next(db, validator_id, language_code="es", limit=3)
+        assert [task.id for task in batch] == [ids[2], ids[1], ids[0]]
+        assert all(task.status == "claimed" and task.claimed_by == validator_id for task in batch)
+
+        # Without matching languages left, priority order applies
+        (task,) = await service.claim_next(db, validator_id, language_code="es")
+        assert task.id == ids[3]
+        assert await service.claim_next(db, validator_id, limit=5) == []
+        assert await service.get_next_validation(db, validator_id) is None
+        assert stats_cache.invalidations == 2
+
+
+@pytest.mark.asyncio
+async def test_sequential_claims_hand_out_each_task_once(session_factory):
+    ids = await _seed(session_factory, *[(index % 3 + 1, "en-US", index) for index in range(20)])
+    service = ValidationQueueService(stats_cache=RecordingStatsCache())
+
+    claimed = []
+    async with session_factory() as db:
+        for _ in range(10):
+            tasks = await service.claim_next(db, uuid.uuid4(), limit=3)
+            claimed.extend(task.id for task in tasks)
+
+    assert sorted(claimed) == sorted(ids)
+    with pytest.raises(ValueError):
+        await service.claim_next(SimpleNamespace(), uuid.uuid4(), limit=MAX_CLAIM_BATCH_SIZE + 1)
@@ -0,0 +1,148 @@
+"""
+Tests for validation queue statistics.
+
+Validates that get_queue_stats runs a single grouped aggregation (tenant
+scoped by join, counts via FILTER), assembles the statistics from the
+groups, and is served from the shared cache until a queue transition.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from services.validation_queue_service import ValidationQueueService
+from services.validation_queue_stats_cache import (
+    GENERATION_KEY,
+    INVALIDATE_SCRIPT,
+    READ_SCRIPT,
+    ValidationQueueStatsCache,
+)
+
+
+def _group(status, priority, language, count, **aggregates):
+    values = dict.fromkeys((
+        'last_hour', 'last_24_hours', 'last_7_days',
+        'claim_seconds', 'claim_count',
+        'complete_seconds', 'complete_count',
+        'total_seconds', 'total_measured_count',
+    ))
+    values.update(aggregates)
+    return SimpleNamespace(status=status, priority=priority, language_code=language, count=count, **values)
+
+
+GROUPS = [
+    _group('pending', 1, 'en-US', 4),
+    _group('pending', 1, 'es-MX', 2),
+    _group('pending', 3, 'en-US', 1),
+    _group('pending', 3, None, 1),
+    _group('claimed', 2, 'en-US', 2, claim_seconds=60, claim_count=2),
+    _group(
+        'completed', 5, 'fr-FR', 3,
+        last_hour=1, last_24_hours=2, last_7_days=3,
+        claim_seconds=90, claim_count=3,
+        complete_seconds=300, complete_count=3,
+        total_seconds=390, total_measured_count=3,
+    ),
+]
+
+
+class RecordingSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return iter(self.rows)
+
+
+class FakeRedis:
+    """In-memory stand-in for RedisClient running the cache's scripts."""
+
+    def __init__(self):
+        self.values = {}
+
+    async def eval(self, script, keys, args):
+        if script == READ_SCRIPT:
+            generation = self.values.get(keys[0], '0')
+            return [generation, self.values.get(f"{args[0]}{generation}:{args[1]}")]
+        assert script == INVALIDATE_SCRIPT
+        self.values[keys[0]] = str(int(self.values.get(keys[0], '0')) + 1)
+        return int(self.values[keys[0]])
+
+    async def set(self, key, value, ttl=None):
+        self.values[key] = value
+        return True
+
+
+@pytest.mark.asyncio
+async def test_queue_stats_single_grouped_query():
+    db = RecordingSession(GROUPS)
+    tenant_id = uuid.uuid4()
+
+    stats = await ValidationQueueService(stats_cache=ValidationQueueStatsCache(FakeRedis()))._compute_queue_stats(
+        db, tenant_id=tenant_id
+    )
+
+    assert len(db.statements) == 1
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    assert "FILTER (WHERE" in sql
+    assert "JOIN validation_results" in sql
+    assert "EXISTS" not in sql
+
+    assert stats['pending_count'] == 8
+    assert stats['claimed_count'] == 2
+    assert stats['completed_count'] == 3
+    assert stats['total_count'] == 13
+    assert stats['priority_distribution'] == {1: 6, 3: 2}
+    assert list(stats['language_distribution'].items()) == [('en-US', 5), ('es-MX', 2)]
+    assert stats['throughput'] == {
+        'last_hour': 1, 'last_24_hours': 2, 'last_7_days': 3, 'avg_per_hour': 0.02,
+    }
+    assert stats['sla'] == {
+        'avg_time_to_claim_seconds': 30.0,
+        'avg_time_to_complete_seconds': 100.0,
+        'avg_total_time_seconds': 130.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_queue_stats_cached_until_transition():
+    redis = FakeRedis()
+    service = ValidationQueueService(stats_cache=ValidationQueueStatsCache(redis, ttl_seconds=5))
+    tenant_id = uuid.uuid4()
+
+    db = RecordingSession(GROUPS)
+    first = await service.get_queue_stats(db, tenant_id=tenant_id)
+    assert json.loads(json.dumps(first)) == await service.get_queue_stats(db, tenant_id=tenant_id)
+    assert len(db.statements) == 1
+
+    # Other tenants are cached separately
+    await service.get_queue_stats(db)
+    assert len(db.statements) == 2
+
+    await service.invalidate_stats_cache()
+    assert redis.values[GENERATION_KEY] == '1'
+    db.rows = GROUPS[:1]
+    assert (await service.get_queue_stats(db, tenant_id=tenant_id))['total_count'] == 4
+    assert len(db.statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_queue_stats_fall_back_to_database_without_redis():
+    class BrokenRedis:
+        async def eval(self, *args, **kwargs):
+            raise ConnectionError("redis down")
+
+    service = ValidationQueueService(stats_cache=ValidationQueueStatsCache(BrokenRedis()))
+    db = RecordingSession(GROUPS)
+
+    assert (await service.get_queue_stats(db))['total_count'] == 13
+    await service.invalidate_stats_cache()
+    assert (await service.get_queue_stats(db))['total_count'] == 13
+    assert len(db.statements) == 2
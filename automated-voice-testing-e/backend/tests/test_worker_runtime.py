@@ -0,0 +1,106 @@
+"""
+Tests for the per-process Celery worker runtime.
+
+Validates that tasks share one event loop and one set of services, and
+that the runtime shuts down cleanly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tasks import runtime as runtime_module
+from tasks.runtime import WorkerRuntime
+
+
+@pytest.fixture()
+def runtime():
+    worker_runtime = WorkerRuntime()
+    yield worker_runtime
+    if worker_runtime.is_running:
+        worker_runtime.loop.call_soon_threadsafe(worker_runtime.loop.stop)
+
+
+def test_consecutive_runs_share_one_event_loop(runtime):
+    async def current_loop():
+        await asyncio.sleep(0)
+        return asyncio.get_running_loop()
+
+    first = runtime.run(current_loop())
+    second = runtime.run(current_loop())
+
+    assert first is second is runtime.loop
+
+
+def test_loop_bound_state_survives_between_runs(runtime):
+    async def make_future():
+        return asyncio.get_running_loop().create_future()
+
+    async def resolve(future):
+        future.set_result("done")
+        return await future
+
+    # Would fail with "attached to a different loop" under asyncio.run()
+    future = runtime.run(make_future())
+    assert runtime.run(resolve(future)) == "done"
+
+
+def test_exceptions_propagate_to_caller(runtime):
+    async def boom():
+        raise ValueError("bad input")
+
+    with pytest.raises(ValueError, match="bad input"):
+        runtime.run(boom())
+
+
+def test_service_factory_called_once(runtime):
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return object()
+
+    first = runtime.get_service("svc", factory)
+    second = runtime.get_service("svc", factory)
+
+    assert first is second
+    assert len(calls) == 1
+
+
+def test_run_from_loop_thread_is_rejected(runtime):
+    async def nested():
+        return runtime.run(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError):
+        runtime.run(nested())
+
+
+def test_runtime_is_recreated_after_fork(monkeypatch):
+    monkeypatch.setitem(sys.modules, "api.database", SimpleNamespace(dispose_engine=AsyncMock()))
+    monkeypatch.setattr(runtime_module, "_runtime", None)
+    parent = runtime_module.get_worker_runtime()
+    assert runtime_module.get_worker_runtime() is parent
+
+    monkeypatch.setattr(parent, "pid", -1)
+    child = runtime_module.get_worker_runtime()
+
+    assert child is not parent
+    parent.loop.call_soon_threadsafe(parent.loop.stop)
+    runtime_module.shutdown_worker_runtime()
+
+
+def test_shutdown_disposes_engines_and_stops_loop(monkeypatch, runtime):
+    dispose = AsyncMock()
+    monkeypatch.setitem(sys.modules, "api.database", SimpleNamespace(dispose_engine=dispose))
+    runtime.get_service("svc", object)
+
+    runtime.shutdown(timeout=5)
+
+    dispose.assert_awaited_once()
+    assert not runtime.is_running
+    assert runtime._services == {}